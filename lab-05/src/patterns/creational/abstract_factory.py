@@ -3,8 +3,17 @@
 # Предоставляет интерфейс для создания семейств связанных или зависимых объектов
 # без указания их конкретных классов.
 
+import json
 from abc import ABC, abstractmethod
-from typing import List
+from collections import Counter
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from specialists.manager import Manager
+from specialists.developer import Developer
+from specialists.salesperson import Salesperson
+from organization.department import Department
+from organization.project import Project
+from .singleton import EMPLOYEE_COLUMNS, employee_row
 
 class CompanyFactory(ABC):
     """
@@ -12,6 +21,17 @@ class CompanyFactory(ABC):
     Гарантирует, что все компоненты (сотрудники, отделы) согласованы между собой.
     """
     
+    def __init__(self, verbose: bool = True):
+        """
+        Args:
+            verbose: Печатать сообщения о каждом созданном компоненте
+        """
+        self.verbose = verbose
+    
+    def _log(self, message: str) -> None:
+        if self.verbose:
+            print(message)
+    
     @abstractmethod
     def create_manager(self, emp_id: int, name: str, department: str,
                       base_salary: float, bonus: float) -> 'Manager':
@@ -55,12 +75,11 @@ class TechCompanyFactory(CompanyFactory):
         Создание менеджера ИТ-компании.
         ИТ-менеджеры обычно имеют высокий бонус за достижение целей.
         """
-        print(f"[TechCompanyFactory] Создание Tech-Manager: {name}")
+        self._log(f"[TechCompanyFactory] Создание Tech-Manager: {name}")
         # Бонус для tech-компании повышен на 50% (мотивирующий фактор)
         tech_bonus = bonus * 1.5
-        print(f"  Бонус увеличен до {tech_bonus} (ИТ-бонус: +50%)")
-        # return Manager(emp_id, name, department, base_salary, tech_bonus)
-        return f"Tech Manager({emp_id}, {name}, {department}, {base_salary}, {tech_bonus})"
+        self._log(f"  Бонус увеличен до {tech_bonus} (ИТ-бонус: +50%)")
+        return Manager(emp_id, name, department, base_salary, tech_bonus)
     
     def create_developer(self, emp_id: int, name: str, department: str,
                         base_salary: float, seniority: str,
@@ -69,13 +88,12 @@ class TechCompanyFactory(CompanyFactory):
         Создание разработчика ИТ-компании.
         Требует обязательно указать стек технологий (Python, Java, Go и т.д.)
         """
-        print(f"[TechCompanyFactory] Создание Tech-Developer: {name} ({seniority})")
+        self._log(f"[TechCompanyFactory] Создание Tech-Developer: {name} ({seniority})")
         # Для ИТ-компании обязателен стек технологий
         if not tech_stack:
             tech_stack = ['Python', 'Java']  # По умолчанию
-            print(f"  Стек по умолчанию: {tech_stack}")
-        # return Developer(emp_id, name, department, base_salary, seniority, tech_stack)
-        return f"Tech Developer({emp_id}, {name}, {department}, {base_salary}, {seniority}, {tech_stack})"
+            self._log(f"  Стек по умолчанию: {tech_stack}")
+        return Developer(emp_id, name, department, base_salary, seniority, tech_stack)
     
     def create_salesperson(self, emp_id: int, name: str, department: str,
                           base_salary: float, commission_rate: float) -> 'Salesperson':
@@ -83,24 +101,22 @@ class TechCompanyFactory(CompanyFactory):
         Создание продавца ИТ-компании (обычно продаёт программные решения).
         Комиссия зависит от выручки (выше, чем в обычных компаниях).
         """
-        print(f"[TechCompanyFactory] Создание Tech-Salesperson: {name}")
+        self._log(f"[TechCompanyFactory] Создание Tech-Salesperson: {name}")
         # Для ИТ-продавцов комиссия может быть выше (до 20%)
         tech_commission = min(commission_rate * 2, 0.20)
-        print(f"  Комиссия: {tech_commission*100}% (ИТ-комиссия)")
-        # return Salesperson(emp_id, name, department, base_salary, tech_commission)
-        return f"Tech Salesperson({emp_id}, {name}, {department}, {base_salary}, {tech_commission})"
+        self._log(f"  Комиссия: {tech_commission*100}% (ИТ-комиссия)")
+        return Salesperson(emp_id, name, department, base_salary, tech_commission)
     
     def create_department(self, name: str) -> 'Department':
         """
         Создание отдела ИТ-компании.
         Отделы обычно ориентированы на технологические функции.
         """
-        print(f"[TechCompanyFactory] Создание Tech-Department: {name}")
+        self._log(f"[TechCompanyFactory] Создание Tech-Department: {name}")
         # Типичные отделы: DEV, QA, DevOps, Data Science
         if name.upper() not in ['DEV', 'QA', 'DEVOPS', 'DATA_SCIENCE', 'SECURITY']:
-            print(f"  Совет: В ИТ-компаниях типичные отделы: DEV, QA, DevOps, Data Science")
-        # return Department(name)
-        return f"Tech Department({name})"
+            self._log(f"  Совет: В ИТ-компаниях типичные отделы: DEV, QA, DevOps, Data Science")
+        return Department(name)
     
     def create_project(self, project_id: int, name: str, description: str,
                       deadline: str) -> 'Project':
@@ -108,9 +124,8 @@ class TechCompanyFactory(CompanyFactory):
         Создание проекта ИТ-компании.
         Проекты обычно связаны с разработкой ПО, облачными системами и т.д.
         """
-        print(f"[TechCompanyFactory] Создание Tech-Project: {name}")
-        # return Project(project_id, name, description, deadline, status="planning")
-        return f"Tech Project({project_id}, {name}, {description}, {deadline})"
+        self._log(f"[TechCompanyFactory] Создание Tech-Project: {name}")
+        return Project(project_id, name, description, deadline, status="planning")
 
 
 class SalesCompanyFactory(CompanyFactory):
@@ -125,12 +140,11 @@ class SalesCompanyFactory(CompanyFactory):
         Создание менеджера Sales-компании.
         Sales-менеджеры получают бонусы за достижение плана продаж.
         """
-        print(f"[SalesCompanyFactory] Создание Sales-Manager: {name}")
+        self._log(f"[SalesCompanyFactory] Создание Sales-Manager: {name}")
         # Бонус для sales-компании зависит от плана продаж (может быть выше)
         sales_bonus = bonus * 2.0  # Высокий бонус мотивирует продажи
-        print(f"  Бонус увеличен до {sales_bonus} (Sales-бонус: +100%)")
-        # return Manager(emp_id, name, department, base_salary, sales_bonus)
-        return f"Sales Manager({emp_id}, {name}, {department}, {base_salary}, {sales_bonus})"
+        self._log(f"  Бонус увеличен до {sales_bonus} (Sales-бонус: +100%)")
+        return Manager(emp_id, name, department, base_salary, sales_bonus)
     
     def create_developer(self, emp_id: int, name: str, department: str,
                         base_salary: float, seniority: str,
@@ -139,11 +153,10 @@ class SalesCompanyFactory(CompanyFactory):
         Создание разработчика Sales-компании.
         В Sales-компаниях разработчики редки, но нужны для CRM систем и аналитики.
         """
-        print(f"[SalesCompanyFactory] Создание Sales-Developer: {name}")
+        self._log(f"[SalesCompanyFactory] Создание Sales-Developer: {name}")
         # Разработчики в Sales-компаниях работают с CRM, аналитикой
-        print(f"  Рекомендуемый стек: Python/SQL для работы с данными")
-        # return Developer(emp_id, name, department, base_salary, seniority, tech_stack)
-        return f"Sales Developer({emp_id}, {name}, {department}, {base_salary}, {seniority}, {tech_stack})"
+        self._log(f"  Рекомендуемый стек: Python/SQL для работы с данными")
+        return Developer(emp_id, name, department, base_salary, seniority, tech_stack)
     
     def create_salesperson(self, emp_id: int, name: str, department: str,
                           base_salary: float, commission_rate: float) -> 'Salesperson':
@@ -151,24 +164,22 @@ class SalesCompanyFactory(CompanyFactory):
         Создание продавца Sales-компании.
         Это главный кадровый ресурс в Sales-компаниях.
         """
-        print(f"[SalesCompanyFactory] Создание Sales-Salesperson: {name}")
+        self._log(f"[SalesCompanyFactory] Создание Sales-Salesperson: {name}")
         # Для Sales-компаний комиссия стандартная (10-15%)
         sales_commission = min(commission_rate, 0.15)
-        print(f"  Комиссия: {sales_commission*100}%")
-        # return Salesperson(emp_id, name, department, base_salary, sales_commission)
-        return f"Sales Salesperson({emp_id}, {name}, {department}, {base_salary}, {sales_commission})"
+        self._log(f"  Комиссия: {sales_commission*100}%")
+        return Salesperson(emp_id, name, department, base_salary, sales_commission)
     
     def create_department(self, name: str) -> 'Department':
         """
         Создание отдела Sales-компании.
         Отделы ориентированы на географические регионы и линии продуктов.
         """
-        print(f"[SalesCompanyFactory] Создание Sales-Department: {name}")
+        self._log(f"[SalesCompanyFactory] Создание Sales-Department: {name}")
         # Типичные отделы: SALES_EU, SALES_ASIA, SALES_AMERICAS
         if 'SALES' not in name.upper():
-            print(f"  Совет: В Sales-компаниях отделы обычно начинаются с SALES_")
-        # return Department(name)
-        return f"Sales Department({name})"
+            self._log(f"  Совет: В Sales-компаниях отделы обычно начинаются с SALES_")
+        return Department(name)
     
     def create_project(self, project_id: int, name: str, description: str,
                       deadline: str) -> 'Project':
@@ -176,63 +187,110 @@ class SalesCompanyFactory(CompanyFactory):
         Создание проекта Sales-компании.
         Проекты обычно связаны с открытием рынков, кампаниями по продажам.
         """
-        print(f"[SalesCompanyFactory] Создание Sales-Project: {name}")
-        # return Project(project_id, name, description, deadline, status="planning")
-        return f"Sales Project({project_id}, {name}, {description}, {deadline})"
+        self._log(f"[SalesCompanyFactory] Создание Sales-Project: {name}")
+        return Project(project_id, name, description, deadline, status="planning")
 
 
 class CompanyBuilder:
     """
     Упрощённый конструктор компании с использованием Abstract Factory.
+    
+    В потоковом режиме (задан sink) компоненты не накапливаются в
+    списках: каждый созданный компонент сразу передаётся в sink(kind,
+    component), поэтому генерация компании любого размера идёт в
+    постоянной памяти.
     """
     
-    def __init__(self, factory: CompanyFactory):
+    # Вид компонента -> список builder (ключ build())
+    KINDS = {
+        'manager': 'managers',
+        'developer': 'developers',
+        'salesperson': 'salespersons',
+        'department': 'departments',
+        'project': 'projects',
+    }
+    
+    def __init__(self, factory: CompanyFactory,
+                 sink: Optional[Callable[[str, Any], None]] = None):
         """
         Инициализация с выбранной фабрикой.
         
         Args:
             factory: Объект CompanyFactory для создания компонентов
+            sink: Приёмник компонентов (kind, component) - потоковый режим,
+                  например JsonLinesSink, SqliteSink или DepartmentSink
         """
         self.factory = factory
+        self.sink = sink
+        self.counts: Counter = Counter()
         self.managers = []
         self.developers = []
         self.salespersons = []
         self.departments = []
         self.projects = []
     
+    def _emit(self, kind: str, component: Any) -> None:
+        """Передать компонент в sink или сохранить в списке builder."""
+        self.counts[self.KINDS[kind]] += 1
+        if self.sink is not None:
+            self.sink(kind, component)
+        else:
+            getattr(self, self.KINDS[kind]).append(component)
+    
     def add_manager(self, emp_id: int, name: str, department: str,
                    base_salary: float, bonus: float) -> 'CompanyBuilder':
         """Добавление менеджера через фабрику."""
-        manager = self.factory.create_manager(emp_id, name, department, base_salary, bonus)
-        self.managers.append(manager)
+        self._emit('manager', self.factory.create_manager(emp_id, name, department, base_salary, bonus))
         return self
     
     def add_developer(self, emp_id: int, name: str, department: str,
                      base_salary: float, seniority: str,
                      tech_stack: List[str]) -> 'CompanyBuilder':
         """Добавление разработчика через фабрику."""
-        developer = self.factory.create_developer(emp_id, name, department, base_salary, seniority, tech_stack)
-        self.developers.append(developer)
+        self._emit('developer', self.factory.create_developer(emp_id, name, department, base_salary,
+                                                              seniority, tech_stack))
         return self
     
     def add_salesperson(self, emp_id: int, name: str, department: str,
                        base_salary: float, commission_rate: float) -> 'CompanyBuilder':
         """Добавление продавца через фабрику."""
-        salesperson = self.factory.create_salesperson(emp_id, name, department, base_salary, commission_rate)
-        self.salespersons.append(salesperson)
+        self._emit('salesperson', self.factory.create_salesperson(emp_id, name, department, base_salary,
+                                                                  commission_rate))
         return self
     
     def add_department(self, name: str) -> 'CompanyBuilder':
         """Добавление отдела через фабрику."""
-        department = self.factory.create_department(name)
-        self.departments.append(department)
+        self._emit('department', self.factory.create_department(name))
         return self
     
     def add_project(self, project_id: int, name: str, description: str,
                    deadline: str) -> 'CompanyBuilder':
         """Добавление проекта через фабрику."""
-        project = self.factory.create_project(project_id, name, description, deadline)
-        self.projects.append(project)
+        self._emit('project', self.factory.create_project(project_id, name, description, deadline))
+        return self
+    
+    def stream(self, specs: Iterable[Sequence[Any]]) -> Iterator[Tuple[str, Any]]:
+        """
+        Лениво создавать компоненты по описаниям.
+        
+        Описание - кортеж (kind, *аргументы create_<kind>), например
+        ('manager', 1, 'Alice', 'DEV', 5000, 1000). Генератор отдаёт пары
+        (kind, component) по мере создания и ничего не сохраняет.
+        
+        Raises:
+            ValueError: Если вид компонента неизвестен
+        """
+        creators = {kind: getattr(self.factory, f"create_{kind}") for kind in self.KINDS}
+        for kind, *args in specs:
+            creator = creators.get(kind)
+            if creator is None:
+                raise ValueError(f"Неизвестный вид компонента: '{kind}'. Доступные: {list(self.KINDS)}")
+            yield kind, creator(*args)
+    
+    def add_many(self, specs: Iterable[Sequence[Any]]) -> 'CompanyBuilder':
+        """Добавить компоненты по описаниям stream() (в sink, если он задан)."""
+        for kind, component in self.stream(specs):
+            self._emit(kind, component)
         return self
     
     def build(self) -> dict:
@@ -240,8 +298,12 @@ class CompanyBuilder:
         Построение объекта компании со всеми компонентами.
         
         Returns:
-            Словарь с компонентами компании
+            Словарь с компонентами компании; в потоковом режиме
+            компоненты уже переданы в sink, и вместо списков
+            возвращается их количество
         """
+        if self.sink is not None:
+            return {key: self.counts[key] for key in self.KINDS.values()}
         return {
             'managers': self.managers,
             'developers': self.developers,
@@ -249,3 +311,110 @@ class CompanyBuilder:
             'departments': self.departments,
             'projects': self.projects,
         }
+
+
+class JsonLinesSink:
+    """
+    Приёмник компонентов в файл JSON Lines.
+    
+    Каждая строка - to_dict() компонента с полем kind (у отдела - name).
+    """
+    
+    def __init__(self, path: str):
+        """
+        Args:
+            path: Путь к файлу (перезаписывается)
+        """
+        self.path = path
+        self._file = open(path, 'w', encoding='utf-8')
+        self._write = self._file.write
+    
+    def __call__(self, kind: str, component: Any) -> None:
+        record = {'name': component.name} if kind == 'department' else component.to_dict()
+        record['kind'] = kind
+        self._write(json.dumps(record, ensure_ascii=False) + "\n")
+    
+    def close(self) -> None:
+        """Закрыть файл."""
+        self._file.close()
+    
+    def __enter__(self) -> 'JsonLinesSink':
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+class SqliteSink:
+    """
+    Приёмник компонентов в таблицы DatabaseConnection.
+    
+    Компоненты копятся пачками по batch_size строк на таблицу и
+    записываются одним executemany; close() дописывает остаток.
+    """
+    
+    def __init__(self, db, batch_size: int = 10_000):
+        """
+        Args:
+            db: DatabaseConnection с созданными таблицами (create_tables)
+            batch_size: Строк в одной пачке
+        """
+        self.db = db
+        self.batch_size = batch_size
+        self._queries = {
+            'employees': f"INSERT INTO employees ({', '.join(EMPLOYEE_COLUMNS)}) "
+                         f"VALUES ({', '.join('?' * len(EMPLOYEE_COLUMNS))})",
+            'departments': "INSERT OR IGNORE INTO departments (name) VALUES (?)",
+            'projects': "INSERT INTO projects (id, name, description, status, deadline) "
+                        "VALUES (?, ?, ?, ?, ?)",
+        }
+        self._batches: Dict[str, list] = {table: [] for table in self._queries}
+    
+    def __call__(self, kind: str, component: Any) -> None:
+        if kind == 'department':
+            table, row = 'departments', (component.name,)
+        elif kind == 'project':
+            data = component.to_dict()
+            table, row = 'projects', (data['id'], data['name'], data['description'],
+                                      data['status'], data['deadline'])
+        else:
+            table, row = 'employees', employee_row(component)
+        batch = self._batches[table]
+        batch.append(row)
+        if len(batch) >= self.batch_size:
+            self._flush(table)
+    
+    def _flush(self, table: str) -> None:
+        batch = self._batches[table]
+        if batch:
+            self.db.executemany(self._queries[table], batch)
+            batch.clear()
+    
+    def close(self) -> None:
+        """Записать неполные пачки."""
+        for table in self._batches:
+            self._flush(table)
+    
+    def __enter__(self) -> 'SqliteSink':
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+class DepartmentSink:
+    """
+    Приёмник сотрудников в объект Department.
+    
+    Отделы и проекты пропускаются: отдел-приёмник задан заранее.
+    """
+    
+    def __init__(self, department: Department):
+        self.department = department
+    
+    def __call__(self, kind: str, component: Any) -> None:
+        if kind in ('manager', 'developer', 'salesperson'):
+            self.department.add_employee(component)
+    
+    def close(self) -> None:
+        pass
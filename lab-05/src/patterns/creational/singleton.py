@@ -3,8 +3,88 @@
 # Гарантирует, что класс имеет только один экземпляр и предоставляет
 # глобальную точку доступа к этому экземпляру.
 
+import json
 import sqlite3
-from typing import Optional
+from typing import Any, Iterable, Optional, Sequence
+
+# Схема БД: колонки подтипов сотрудников совпадают с ключами to_dict()
+# (tech_stack хранится как JSON), состав команд - в project_members
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS employees (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    department TEXT NOT NULL,
+    base_salary REAL NOT NULL,
+    type TEXT NOT NULL,
+    bonus REAL,
+    seniority TEXT,
+    tech_stack TEXT,
+    commission REAL,
+    sales_volume REAL
+);
+
+CREATE TABLE IF NOT EXISTS departments (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT UNIQUE NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS projects (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    description TEXT NOT NULL DEFAULT '',
+    status TEXT NOT NULL,
+    deadline TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS project_members (
+    project_id INTEGER NOT NULL REFERENCES projects(id) ON DELETE CASCADE,
+    employee_id INTEGER NOT NULL REFERENCES employees(id) ON DELETE RESTRICT,
+    PRIMARY KEY (project_id, employee_id)
+) WITHOUT ROWID;
+"""
+
+INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_employees_department ON employees(department);
+CREATE INDEX IF NOT EXISTS idx_employees_type ON employees(type);
+CREATE INDEX IF NOT EXISTS idx_employees_salary ON employees(base_salary);
+CREATE INDEX IF NOT EXISTS idx_project_members_employee ON project_members(employee_id);
+"""
+
+# Колонки, которых нет в БД, созданных прежней версией create_tables()
+MIGRATED_COLUMNS = {
+    "employees": {
+        "bonus": "REAL",
+        "seniority": "TEXT",
+        "tech_stack": "TEXT",
+        "commission": "REAL",
+        "sales_volume": "REAL",
+    },
+    "projects": {
+        "description": "TEXT NOT NULL DEFAULT ''",
+    },
+}
+
+EMPLOYEE_COLUMNS = ("id", "name", "department", "base_salary", "type",
+                    "bonus", "seniority", "tech_stack", "commission", "sales_volume")
+
+
+def employee_row(employee: Any) -> tuple:
+    """Строка таблицы employees (порядок EMPLOYEE_COLUMNS) из сотрудника."""
+    data = employee.to_dict()
+    if "tech_stack" in data:
+        data["tech_stack"] = json.dumps(data["tech_stack"], ensure_ascii=False)
+    return tuple(data.get(column) for column in EMPLOYEE_COLUMNS)
+
+
+def _add_missing_columns(connection: sqlite3.Connection) -> None:
+    """Добавляет в существующие таблицы недостающие колонки MIGRATED_COLUMNS."""
+    for table, columns in MIGRATED_COLUMNS.items():
+        existing = {row[1] for row in connection.execute(f"PRAGMA table_info({table})")}
+        for column, definition in columns.items():
+            if column not in existing:
+                connection.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+
+
 
 class DatabaseConnection:
     """
@@ -17,7 +97,7 @@ class DatabaseConnection:
     # Флаг инициализации (для потокобезопасности)
     _initialized: bool = False
     
-    def __new__(cls) -> 'DatabaseConnection':
+    def __new__(cls, *args, **kwargs) -> 'DatabaseConnection':
         """
         Переопределение __new__ для создания единственного экземпляра.
         При повторном вызове возвращает существующий экземпляр.
@@ -120,6 +200,27 @@ class DatabaseConnection:
             print(f"[DB ERROR] Ошибка выполнения обновления: {e}")
             raise
     
+    def executemany(self, query: str, rows: Iterable[Sequence[Any]]) -> int:
+        """
+        Выполнение запроса для многих строк одним commit.
+        
+        Args:
+            query: SQL запрос с параметрами
+            rows: Параметры для каждой строки
+            
+        Returns:
+            Количество затронутых строк
+        """
+        try:
+            cursor = self.connection.cursor()
+            cursor.executemany(query, rows)
+            self.connection.commit()
+            return cursor.rowcount
+        except sqlite3.Error as e:
+            self.connection.rollback()
+            print(f"[DB ERROR] Ошибка пакетного выполнения: {e}")
+            raise
+    
     def close_connection(self) -> None:
         """Закрытие подключения к БД."""
         if self.connection:
@@ -129,31 +230,17 @@ class DatabaseConnection:
             DatabaseConnection._initialized = False
     
     def create_tables(self) -> None:
-        """Создание таблиц для системы учета сотрудников."""
-        schema = """
-        CREATE TABLE IF NOT EXISTS employees (
-            id INTEGER PRIMARY KEY,
-            name TEXT NOT NULL,
-            department TEXT NOT NULL,
-            base_salary REAL NOT NULL,
-            type TEXT NOT NULL
-        );
-        
-        CREATE TABLE IF NOT EXISTS departments (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT UNIQUE NOT NULL
-        );
+        """
+        Создание таблиц и индексов для системы учета сотрудников.
         
-        CREATE TABLE IF NOT EXISTS projects (
-            id INTEGER PRIMARY KEY,
-            name TEXT NOT NULL,
-            status TEXT NOT NULL,
-            deadline TEXT NOT NULL
-        );
+        Повторный вызов безопасен: в БД старой схемы недостающие
+        колонки добавляются через ALTER TABLE.
         """
         try:
             cursor = self.connection.cursor()
-            cursor.executescript(schema)
+            cursor.executescript(SCHEMA)
+            _add_missing_columns(self.connection)
+            cursor.executescript(INDEXES)
             self.connection.commit()
             print("[DB] Таблицы созданы успешно")
         except sqlite3.Error as e:
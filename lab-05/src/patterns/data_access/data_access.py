@@ -1,11 +1,16 @@
 # Data Access Patterns (Паттерны доступа к данным)
 # =================================================
-# Repository, Unit of Work, Specification
+# Repository, Unit of Work, Specification, SQL-репозитории поверх DatabaseConnection
 
+import json
+import sqlite3
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional, TypeVar, Generic
+from contextlib import nullcontext
+from typing import List, Dict, Any, Iterable, Iterator, Optional, TypeVar, Generic
 from dataclasses import dataclass
 
+from ..creational.singleton import EMPLOYEE_COLUMNS, employee_row
+
 # ======================== SPECIFICATION (СПЕЦИФИКАЦИЯ) ========================
 
 class Specification(ABC):
@@ -76,6 +81,8 @@ class SalarySpecification(Specification):
     
     def get_sql(self) -> str:
         """SQL запрос для фильтрации по зарплате."""
+        if self.max_salary == float('inf'):
+            return f"WHERE base_salary >= {self.min_salary}"
         return f"WHERE base_salary BETWEEN {self.min_salary} AND {self.max_salary}"
 
 
@@ -369,6 +376,325 @@ class DepartmentRepository(Repository):
         return [dept for dept in self._departments.values() if spec.is_satisfied_by(dept)]
 
 
+# ======================== SQL REPOSITORY (РЕПОЗИТОРИЙ НА SQLITE) ========================
+
+def _spec_condition(spec: Specification) -> str:
+    """Условие спецификации без WHERE, в скобках (для склейки с другими условиями)."""
+    return f"({spec.get_sql().replace('WHERE', '').strip()})"
+
+
+def _salary_sql() -> str:
+    """
+    SQL-выражение итоговой зарплаты по колонкам таблицы employees.
+    
+    Повторяет calculate_salary() подклассов: оклад + бонус у менеджера,
+    оклад * коэффициент уровня у разработчика, оклад + продажи * комиссия
+    у продавца.
+    """
+    from specialists.developer import Developer
+    levels = " ".join(f"WHEN '{level}' THEN {multiplier}"
+                      for level, multiplier in Developer.LEVEL_MULTIPLIERS.items())
+    return ("CASE type "
+            "WHEN 'manager' THEN base_salary + COALESCE(bonus, 0) "
+            f"WHEN 'developer' THEN base_salary * (CASE seniority {levels} ELSE 1.0 END) "
+            "WHEN 'salesperson' THEN base_salary + COALESCE(sales_volume, 0) * COALESCE(commission, 0) "
+            "ELSE base_salary END")
+
+
+def _transaction(db):
+    """Транзакция DatabaseConnection, если она их поддерживает."""
+    transaction = getattr(db, 'transaction', None)
+    return transaction() if transaction is not None else nullcontext()
+
+
+class SqlEmployeeRepository(Repository):
+    """
+    Репозиторий сотрудников в таблице employees (DatabaseConnection).
+    
+    Manager/Developer/Salesperson хранятся с колонками подтипов и
+    восстанавливаются через EmployeeFactory. Выборки читаются страницами
+    по первичному ключу, агрегаты (ФОТ по отделам и т.п.) считает SQLite
+    по индексам, не загружая сотрудников в память.
+    """
+    
+    COLUMNS = ", ".join(EMPLOYEE_COLUMNS)
+    INSERT = f"INSERT INTO employees ({COLUMNS}) VALUES ({', '.join('?' * len(EMPLOYEE_COLUMNS))})"
+    UPDATE = (f"UPDATE employees SET {', '.join(f'{c} = ?' for c in EMPLOYEE_COLUMNS[1:])} "
+              "WHERE id = ?")
+    
+    def __init__(self, db, page_size: int = 500):
+        """
+        Args:
+            db: DatabaseConnection с созданными таблицами (create_tables)
+            page_size: Размер страницы для iter_all()
+        """
+        self.db = db
+        self.page_size = page_size
+    
+    @staticmethod
+    def _record(row: tuple) -> Dict[str, Any]:
+        """Строка таблицы -> словарь в формате to_dict() (без пустых колонок)."""
+        record = {column: value for column, value in zip(EMPLOYEE_COLUMNS, row) if value is not None}
+        if 'tech_stack' in record:
+            record['tech_stack'] = json.loads(record['tech_stack'])
+        return record
+    
+    @staticmethod
+    def _employee(record: Dict[str, Any]):
+        """Словарь to_dict() -> объект сотрудника."""
+        from factory import EmployeeFactory
+        data = dict(record)
+        return EmployeeFactory.create_employee(data.pop('type'), **data)
+    
+    # --- CRUD ---
+    
+    def add(self, employee) -> None:
+        """
+        Добавить сотрудника.
+        
+        Raises:
+            DuplicateIdError: Сотрудник с таким ID уже есть
+        """
+        from base.exceptions import DuplicateIdError
+        try:
+            self.db.execute_update(self.INSERT, employee_row(employee))
+        except sqlite3.IntegrityError as e:
+            raise DuplicateIdError(f"Сотрудник с ID {employee.id} уже существует") from e
+    
+    def add_many(self, employees: Iterable[Any]) -> int:
+        """Добавить сотрудников одним executemany (всё или ничего)."""
+        from base.exceptions import DuplicateIdError
+        try:
+            return self.db.executemany(self.INSERT, map(employee_row, employees))
+        except sqlite3.IntegrityError as e:
+            raise DuplicateIdError(f"Сотрудники не добавлены: {e}") from e
+    
+    def update(self, employee) -> None:
+        """
+        Сохранить изменения сотрудника.
+        
+        Raises:
+            EmployeeNotFoundError: Сотрудника нет в БД
+        """
+        from base.exceptions import EmployeeNotFoundError
+        row = employee_row(employee)
+        if not self.db.execute_update(self.UPDATE, row[1:] + row[:1]):
+            raise EmployeeNotFoundError(f"Сотрудник с ID {employee.id} не найден")
+    
+    def remove(self, emp_id: int) -> None:
+        """
+        Удалить сотрудника.
+        
+        Raises:
+            DependencyError: Сотрудник состоит в команде проекта
+        """
+        from base.exceptions import DependencyError
+        try:
+            self.db.execute_update("DELETE FROM employees WHERE id = ?", (emp_id,))
+        except sqlite3.IntegrityError as e:
+            raise DependencyError(f"Сотрудник {emp_id} назначен на проект") from e
+    
+    def find_by_id(self, emp_id: int) -> Optional[Any]:
+        """Найти сотрудника по ID."""
+        rows = self.db.execute_query(f"SELECT {self.COLUMNS} FROM employees WHERE id = ?", (emp_id,))
+        return self._employee(self._record(rows[0])) if rows else None
+    
+    def find_all(self) -> List[Any]:
+        """Получить всех сотрудников (для больших таблиц - iter_all())."""
+        return list(self.iter_all())
+    
+    def find_by_specification(self, spec: Specification) -> List[Any]:
+        """Найти сотрудников по спецификации (условие выполняется в SQL)."""
+        return list(self.iter_all(spec))
+    
+    def find_by_project(self, project_id: int) -> List[Any]:
+        """Команда проекта по таблице project_members."""
+        columns = ", ".join(f"e.{c}" for c in EMPLOYEE_COLUMNS)
+        rows = self.db.execute_query(
+            f"SELECT {columns} FROM project_members m JOIN employees e ON e.id = m.employee_id "
+            "WHERE m.project_id = ? ORDER BY e.id", (project_id,))
+        return [self._employee(self._record(row)) for row in rows]
+    
+    # --- Постраничное чтение ---
+    
+    def iter_all(self, spec: Optional[Specification] = None,
+                 page_size: Optional[int] = None) -> Iterator[Any]:
+        """
+        Лениво перебрать сотрудников (по возрастанию ID).
+        
+        Страница читается запросом "id > последний ID ... LIMIT page_size",
+        поэтому стоимость страницы не растёт с её номером, а в памяти
+        держится не больше одной страницы.
+        
+        Args:
+            spec: Спецификация; если её SQL не выполняется, фильтр
+                  применяется в Python через is_satisfied_by()
+            page_size: Размер страницы (по умолчанию self.page_size)
+        """
+        for record in self._iter_records(spec, page_size or self.page_size):
+            yield self._employee(record)
+    
+    def _iter_records(self, spec: Optional[Specification], page_size: int) -> Iterator[Dict[str, Any]]:
+        condition = f"{_spec_condition(spec)} AND " if spec is not None else ""
+        query = (f"SELECT {self.COLUMNS} FROM employees WHERE {condition}id > ? "
+                 "ORDER BY id LIMIT ?")
+        last_id = float('-inf')
+        while True:
+            try:
+                rows = self.db.execute_query(query, (last_id, page_size))
+            except sqlite3.OperationalError:
+                if not condition:
+                    raise
+                print(f"[SqlEmployeeRepository] SQL спецификации не выполнен, фильтр в Python: {spec.get_sql()}")
+                query = f"SELECT {self.COLUMNS} FROM employees WHERE id > ? ORDER BY id LIMIT ?"
+                condition = ""
+                continue
+            for row in rows:
+                record = self._record(row)
+                if condition or spec is None or spec.is_satisfied_by(record):
+                    yield record
+            if len(rows) < page_size:
+                return
+            last_id = rows[-1][0]
+    
+    # --- Агрегаты (в SQL) ---
+    
+    def __len__(self) -> int:
+        return self.db.execute_query("SELECT COUNT(*) FROM employees")[0][0]
+    
+    def count(self, spec: Optional[Specification] = None) -> int:
+        """Количество сотрудников, удовлетворяющих спецификации."""
+        if spec is None:
+            return len(self)
+        try:
+            return self.db.execute_query(
+                f"SELECT COUNT(*) FROM employees WHERE {_spec_condition(spec)}")[0][0]
+        except sqlite3.OperationalError:
+            return sum(1 for _ in self._iter_records(spec, self.page_size))
+    
+    def payroll_by_department(self) -> Dict[str, float]:
+        """Фонд оплаты труда по отделам: {отдел: сумма итоговых зарплат}."""
+        rows = self.db.execute_query(
+            f"SELECT department, SUM({_salary_sql()}) FROM employees "
+            "GROUP BY department ORDER BY department")
+        return dict(rows)
+    
+    def total_payroll(self) -> float:
+        """Фонд оплаты труда компании."""
+        return self.db.execute_query(f"SELECT COALESCE(SUM({_salary_sql()}), 0) FROM employees")[0][0]
+    
+    def headcount_by_type(self) -> Dict[str, int]:
+        """Количество сотрудников по типам: {'manager': 2, ...}."""
+        return dict(self.db.execute_query(
+            "SELECT type, COUNT(*) FROM employees GROUP BY type ORDER BY type"))
+    
+    def salary_range_by_department(self) -> Dict[str, tuple]:
+        """Оклады по отделам: {отдел: (минимум, среднее, максимум)}."""
+        rows = self.db.execute_query(
+            "SELECT department, MIN(base_salary), AVG(base_salary), MAX(base_salary) "
+            "FROM employees GROUP BY department ORDER BY department")
+        return {row[0]: tuple(row[1:]) for row in rows}
+
+
+class SqlProjectRepository(Repository):
+    """
+    Репозиторий проектов в таблицах projects и project_members.
+    
+    Команда хранится ссылками на employees: удаление проекта удаляет
+    его состав (ON DELETE CASCADE), а сотрудника из команды удалить
+    нельзя (ON DELETE RESTRICT).
+    """
+    
+    UPSERT = ("INSERT INTO projects (id, name, description, status, deadline) VALUES (?, ?, ?, ?, ?) "
+              "ON CONFLICT(id) DO UPDATE SET name = excluded.name, description = excluded.description, "
+              "status = excluded.status, deadline = excluded.deadline")
+    
+    def __init__(self, db, employees: Optional[SqlEmployeeRepository] = None):
+        """
+        Args:
+            db: DatabaseConnection с созданными таблицами (create_tables)
+            employees: Репозиторий сотрудников для загрузки команд
+        """
+        self.db = db
+        self.employees = employees or SqlEmployeeRepository(db)
+    
+    @staticmethod
+    def _project(row: tuple):
+        from organization.project import Project
+        return Project(*row)
+    
+    def add(self, project) -> None:
+        """
+        Сохранить проект и его команду (повторный вызов обновляет проект).
+        
+        Raises:
+            EmployeeNotFoundError: Участника команды нет в таблице employees
+        """
+        from base.exceptions import EmployeeNotFoundError
+        data = project.to_dict()
+        try:
+            with _transaction(self.db):
+                self.db.execute_update(self.UPSERT, (data['id'], data['name'], data['description'],
+                                                     data['status'], data['deadline']))
+                # Сначала новые участники, затем удаление выбывших: при ошибке
+                # прежняя команда сохраняется и без транзакции
+                team_ids = data['team_ids']
+                if team_ids:
+                    self.db.executemany(
+                        "INSERT OR IGNORE INTO project_members (project_id, employee_id) VALUES (?, ?)",
+                        [(project.id, emp_id) for emp_id in team_ids])
+                self.db.execute_update(
+                    "DELETE FROM project_members WHERE project_id = ? "
+                    f"AND employee_id NOT IN ({', '.join('?' * len(team_ids))})",
+                    (project.id, *team_ids))
+        except sqlite3.IntegrityError as e:
+            raise EmployeeNotFoundError(f"Команда проекта {project.id} ссылается на несохранённых сотрудников") from e
+    
+    def remove(self, project_id: int) -> None:
+        """Удалить проект вместе с составом команды."""
+        self.db.execute_update("DELETE FROM projects WHERE id = ?", (project_id,))
+    
+    def find_by_id(self, project_id: int) -> Optional[Any]:
+        """Найти проект по ID (с загруженной командой)."""
+        rows = self.db.execute_query(
+            "SELECT id, name, description, deadline, status FROM projects WHERE id = ?", (project_id,))
+        if not rows:
+            return None
+        project = self._project(rows[0])
+        for employee in self.employees.find_by_project(project_id):
+            project.add_team_member(employee)
+        return project
+    
+    def find_all(self) -> List[Any]:
+        """Получить все проекты с командами (два запроса на все проекты)."""
+        projects = {row[0]: self._project(row) for row in self.db.execute_query(
+            "SELECT id, name, description, deadline, status FROM projects ORDER BY id")}
+        columns = ", ".join(f"e.{c}" for c in EMPLOYEE_COLUMNS)
+        for row in self.db.execute_query(
+                f"SELECT m.project_id, {columns} FROM project_members m "
+                "JOIN employees e ON e.id = m.employee_id ORDER BY m.project_id, e.id"):
+            projects[row[0]].add_team_member(self.employees._employee(self.employees._record(row[1:])))
+        return list(projects.values())
+    
+    def find_by_specification(self, spec: Specification) -> List[Any]:
+        """Найти проекты по спецификации (проверка по to_dict() проекта)."""
+        return [p for p in self.find_all() if spec.is_satisfied_by(p.to_dict())]
+    
+    def project_ids_of(self, emp_id: int) -> List[int]:
+        """ID проектов, в командах которых состоит сотрудник."""
+        return [row[0] for row in self.db.execute_query(
+            "SELECT project_id FROM project_members WHERE employee_id = ? ORDER BY project_id", (emp_id,))]
+    
+    def budget_by_project(self) -> Dict[int, float]:
+        """Бюджет ФОТ по проектам: {ID проекта: сумма зарплат команды}."""
+        rows = self.db.execute_query(
+            f"SELECT p.id, COALESCE(SUM({_salary_sql()}), 0) FROM projects p "
+            "LEFT JOIN project_members m ON m.project_id = p.id "
+            "LEFT JOIN employees ON employees.id = m.employee_id "
+            "GROUP BY p.id ORDER BY p.id")
+        return dict(rows)
+
+
 # ======================== UNIT OF WORK (ЕДИНИЦА РАБОТЫ) ========================
 
 class UnitOfWork:
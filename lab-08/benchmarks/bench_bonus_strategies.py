@@ -0,0 +1,118 @@
+"""
+Бенчмарк расчёта зарплат со стратегиями бонуса: по одному против пакетного.
+
+Сотрудники по кругу получают стратегию за производительность, стаж,
+проекты или остаются без стратегии. Сценарии (сотрудников в секунду):
+  scalar    - calculate_total_salary(**params) на каждого сотрудника
+              (вывод стратегий перенаправляется в /dev/null)
+  dispatch  - calculate_total_salaries(): группировка по стратегиям и
+              calculate_bonus_many() на группу
+  own       - то же, но у каждого сотрудника свой экземпляр стратегии
+              (set_bonus_strategy(PerformanceBonusStrategy()) и т.п.)
+  many      - только calculate_bonus_many() по заранее собранным столбцам
+              групп (NumPy, если установлен)
+
+Перед печатью проверяется, что scalar, dispatch и own дали одинаковые суммы.
+
+ИСПОЛЬЗОВАНИЕ:
+    python benchmarks/bench_bonus_strategies.py --employees 1000000
+"""
+
+import argparse
+import contextlib
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from patterns.behavioral.behavioral import (
+    EmployeeWithStrategy, PerformanceBonusStrategy, ProjectBonusStrategy,
+    SeniorityBonusStrategy, calculate_total_salaries, np
+)
+
+STRATEGIES = (
+    (PerformanceBonusStrategy(), 'performance_rating'),
+    (SeniorityBonusStrategy(), 'years_of_service'),
+    (ProjectBonusStrategy(), 'projects_completed'),
+    (None, None),
+)
+
+
+def make_employees(count: int, own_instances: bool = False):
+    """Сотрудники и столбцы параметров всех стратегий."""
+    employees = []
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        for i in range(count):
+            employee = EmployeeWithStrategy(f"Employee {i}", 1000 + i % 5000)
+            strategy = STRATEGIES[i % 4][0]
+            if strategy is not None:
+                employee.set_bonus_strategy(type(strategy)() if own_instances else strategy)
+            employees.append(employee)
+    params = {
+        'performance_rating': [0.5 + (i % 16) / 10 for i in range(count)],
+        'years_of_service': [i % 15 for i in range(count)],
+        'projects_completed': [i % 9 for i in range(count)],
+    }
+    return employees, params
+
+
+def bench_scalar(employees, params):
+    totals = []
+    start = time.perf_counter()
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        for i, employee in enumerate(employees):
+            name = STRATEGIES[i % 4][1]
+            kwargs = {name: params[name][i]} if name else {}
+            totals.append(employee.calculate_total_salary(**kwargs))
+    return time.perf_counter() - start, totals
+
+
+def bench_dispatch(employees, params):
+    start = time.perf_counter()
+    totals = calculate_total_salaries(employees, params)
+    return time.perf_counter() - start, totals
+
+
+def bench_many(employees, params) -> float:
+    columns = []
+    for offset, (strategy, name) in enumerate(STRATEGIES[:3]):
+        bases = [e.base_salary for e in employees[offset::4]]
+        values = params[name][offset::4]
+        if np is not None:
+            bases, values = np.asarray(bases, dtype=float), np.asarray(values, dtype=float)
+        columns.append((strategy, bases, {name: values}))
+    start = time.perf_counter()
+    for strategy, bases, group_params in columns:
+        strategy.calculate_bonus_many(bases, group_params)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--employees', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    employees, params = make_employees(args.employees)
+    scalar_time, scalar_totals = bench_scalar(employees, params)
+    dispatch_time, dispatch_totals = bench_dispatch(employees, params)
+    own_time, own_totals = bench_dispatch(make_employees(args.employees, own_instances=True)[0], params)
+    if not list(dispatch_totals) == list(own_totals) == scalar_totals:
+        raise SystemExit("Пакетный расчёт разошёлся с calculate_total_salary()")
+    results = [
+        ('scalar', scalar_time),
+        ('dispatch', dispatch_time),
+        ('own', own_time),
+        ('many', bench_many(employees, params)),
+    ]
+
+    print(f"NumPy: {np.__version__ if np is not None else 'нет (списки)'}")
+    print(f"{'сценарий':<10} {'сотрудников':>12} {'время, с':>10} {'сотр./с':>14} {'ускорение':>10}")
+    for name, elapsed in results:
+        print(f"{name:<10} {args.employees:>12,} {elapsed:>10.3f} {args.employees / elapsed:>14,.0f} "
+              f"{scalar_time / elapsed:>9.1f}x")
+
+
+if __name__ == '__main__':
+    main()
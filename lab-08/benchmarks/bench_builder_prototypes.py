@@ -0,0 +1,79 @@
+"""
+Бенчмарк создания сотрудников: fluent-цепочка EmployeeDirector против прототипов.
+
+Сценарии (сотрудников в секунду, роли чередуются по кругу):
+  director    - build_junior_developer() и т.п.: reset() и все set_* на
+                каждого сотрудника (вывод builder перенаправляется)
+  build_many  - build_many(role, rows): копия проверенного шаблона и
+                проверка полей строки
+  iter_many   - iter_many(role, rows) с потоковым проходом, без списка
+
+ИСПОЛЬЗОВАНИЕ:
+    python benchmarks/bench_builder_prototypes.py --employees 1000000
+"""
+
+import argparse
+import contextlib
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from patterns.creational.builder import EmployeeBuilder, EmployeeDirector
+
+ROLES = ('junior_developer', 'senior_developer', 'sales_manager', 'sales_representative')
+
+
+def rows(count: int, start: int = 1):
+    return [(i, f"Employee {i}") for i in range(start, start + count)]
+
+
+def bench_director(count: int) -> float:
+    director = EmployeeDirector(EmployeeBuilder())
+    builders = [getattr(director, f"build_{role}") for role in ROLES]
+    per_role = count // len(ROLES)
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        start = time.perf_counter()
+        for index, build in enumerate(builders):
+            for emp_id, name in rows(per_role, index * per_role + 1):
+                build(emp_id, name)
+        return time.perf_counter() - start
+
+
+def bench_prototypes(count: int, streaming: bool) -> float:
+    director = EmployeeDirector(EmployeeBuilder())
+    per_role = count // len(ROLES)
+    data = [rows(per_role, index * per_role + 1) for index in range(len(ROLES))]
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        start = time.perf_counter()
+        for role, role_rows in zip(ROLES, data):
+            if streaming:
+                for _ in director.iter_many(role, role_rows):
+                    pass
+            else:
+                director.build_many(role, role_rows)
+        return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--employees', type=int, default=1_000_000)
+    parser.add_argument('--director-employees', type=int, default=20_000,
+                        help='сотрудников для fluent-цепочки (она медленная)')
+    args = parser.parse_args()
+
+    results = [
+        ('director', args.director_employees, bench_director(args.director_employees)),
+        ('build_many', args.employees, bench_prototypes(args.employees, streaming=False)),
+        ('iter_many', args.employees, bench_prototypes(args.employees, streaming=True)),
+    ]
+
+    print(f"{'сценарий':<12} {'сотрудников':>12} {'время, с':>10} {'сотр./с':>12}")
+    for name, count, elapsed in results:
+        print(f"{name:<12} {count:>12,} {elapsed:>10.3f} {count / elapsed:>12,.0f}")
+
+
+if __name__ == '__main__':
+    main()
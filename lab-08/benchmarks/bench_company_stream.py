@@ -0,0 +1,110 @@
+"""
+Бенчмарк генерации синтетической компании через CompanyBuilder.
+
+Описания сотрудников поступают из генератора; сценарии:
+  lists   - компоненты копятся в списках builder (build() возвращает их)
+  jsonl   - потоковый режим, JsonLinesSink
+  sqlite  - потоковый режим, SqliteSink (пачки executemany)
+
+Для каждого сценария печатается скорость на --employees сотрудниках и
+пиковая память Python (tracemalloc) на --memory-employees и вдвое
+большем числе: в потоковом режиме пик не растёт с размером компании.
+
+ИСПОЛЬЗОВАНИЕ:
+    python benchmarks/bench_company_stream.py --employees 1000000
+"""
+
+import argparse
+import contextlib
+import gc
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from patterns.creational.abstract_factory import (
+    CompanyBuilder, JsonLinesSink, SqliteSink, TechCompanyFactory
+)
+from patterns.creational.singleton import DatabaseConnection
+
+DEPARTMENTS = ('DEV', 'QA', 'DEVOPS', 'SECURITY')
+LEVELS = ('junior', 'middle', 'senior')
+
+
+def specs(count: int):
+    """Описания компонентов: отделы, затем сотрудники трёх видов по кругу."""
+    for name in DEPARTMENTS:
+        yield ('department', name)
+    for i in range(1, count + 1):
+        department = DEPARTMENTS[i % 4]
+        if i % 3 == 0:
+            yield ('manager', i, f"Employee {i}", department, 5000, 1000)
+        elif i % 3 == 1:
+            yield ('developer', i, f"Employee {i}", department, 4000, LEVELS[i % 3], ['Python', 'SQL'])
+        else:
+            yield ('salesperson', i, f"Employee {i}", department, 3000, 0.05)
+
+
+@contextlib.contextmanager
+def scenario(name: str, directory: str, run: int):
+    """Приёмник сценария (None для lists) на новом файле/БД."""
+    if name == 'lists':
+        yield None
+    elif name == 'jsonl':
+        with JsonLinesSink(os.path.join(directory, f"company_{run}.jsonl")) as sink:
+            yield sink
+    else:
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            db = DatabaseConnection.get_instance(os.path.join(directory, f"company_{run}.db"))
+            db.create_tables()
+        try:
+            with SqliteSink(db) as sink:
+                yield sink
+        finally:
+            with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+                db.close_connection()
+
+
+def generate(name: str, directory: str, count: int, run: int) -> float:
+    start = time.perf_counter()
+    with scenario(name, directory, run) as sink:
+        result = CompanyBuilder(TechCompanyFactory(verbose=False), sink).add_many(specs(count)).build()
+    elapsed = time.perf_counter() - start
+    del result
+    gc.collect()
+    return elapsed
+
+
+def peak_memory(name: str, directory: str, count: int, run: int) -> int:
+    gc.collect()
+    tracemalloc.start()
+    generate(name, directory, count, run)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--employees', type=int, default=1_000_000)
+    parser.add_argument('--memory-employees', type=int, default=50_000)
+    args = parser.parse_args()
+
+    n = args.memory_employees
+    print(f"{'сценарий':<8} {'сотрудников':>12} {'время, с':>10} {'сотр./с':>10} "
+          f"{f'пик {n:,}, МБ':>16} {f'пик {2 * n:,}, МБ':>16}")
+    with tempfile.TemporaryDirectory(prefix='bench_company_') as directory:
+        for run, name in enumerate(('lists', 'jsonl', 'sqlite')):
+            elapsed = generate(name, directory, args.employees, run * 3)
+            small = peak_memory(name, directory, n, run * 3 + 1)
+            large = peak_memory(name, directory, 2 * n, run * 3 + 2)
+            print(f"{name:<8} {args.employees:>12,} {elapsed:>10.2f} {args.employees / elapsed:>10,.0f} "
+                  f"{small / 2**20:>16.1f} {large / 2**20:>16.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,147 @@
+"""
+Бенчмарк вставки сотрудников в SQLite через DatabaseConnection.
+
+Сценарии (строк в секунду, каждый на новой БД во временном каталоге):
+  legacy      - одно подключение, журнал DELETE, synchronous=FULL,
+                commit после каждой строки (прежний DatabaseConnection)
+  per-row     - пул (WAL, synchronous=NORMAL), execute_update на строку
+  transaction - execute_update на строку внутри одного transaction()
+  executemany - insert_employees() одним executemany
+  threads     - --threads потоков пишут пачками по --batch строк
+
+ИСПОЛЬЗОВАНИЕ:
+    python benchmarks/bench_db_inserts.py --rows 20000 --threads 4
+"""
+
+import argparse
+import contextlib
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from patterns.creational.singleton import DatabaseConnection
+from specialists.ordinary_employee import OrdinaryEmployee
+
+INSERT = "INSERT INTO employees (id, name, department, base_salary, type) VALUES (?, ?, ?, ?, ?)"
+DEPARTMENTS = ('DEV', 'QA', 'SALES', 'HR')
+
+
+def rows(count: int, start: int = 1):
+    return [(i, f"Employee {i}", DEPARTMENTS[i % 4], 1000.0 + i % 500, 'employee')
+            for i in range(start, start + count)]
+
+
+@contextlib.contextmanager
+def database(directory: str, name: str):
+    """Новый экземпляр DatabaseConnection на файле name с созданными таблицами."""
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        db = DatabaseConnection.get_instance(os.path.join(directory, f"{name}.db"))
+        db.create_tables()
+    try:
+        yield db
+    finally:
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            db.close_connection()
+
+
+def bench_legacy(directory: str, count: int) -> float:
+    connection = sqlite3.connect(os.path.join(directory, "legacy.db"), check_same_thread=False)
+    connection.execute("PRAGMA synchronous = FULL")
+    connection.execute("CREATE TABLE employees (id INTEGER PRIMARY KEY, name TEXT NOT NULL, "
+                       "department TEXT NOT NULL, base_salary REAL NOT NULL, type TEXT NOT NULL)")
+    data = rows(count)
+    start = time.perf_counter()
+    for row in data:
+        connection.execute(INSERT, row)
+        connection.commit()
+    elapsed = time.perf_counter() - start
+    connection.close()
+    return elapsed
+
+
+def bench_per_row(directory: str, count: int) -> float:
+    with database(directory, "per_row") as db:
+        data = rows(count)
+        start = time.perf_counter()
+        for row in data:
+            db.execute_update(INSERT, row)
+        return time.perf_counter() - start
+
+
+def bench_transaction(directory: str, count: int) -> float:
+    with database(directory, "transaction") as db:
+        data = rows(count)
+        start = time.perf_counter()
+        with db.transaction():
+            for row in data:
+                db.execute_update(INSERT, row)
+        return time.perf_counter() - start
+
+
+def bench_executemany(directory: str, count: int) -> float:
+    with database(directory, "executemany") as db:
+        employees = [OrdinaryEmployee(*row[:4]) for row in rows(count)]
+        start = time.perf_counter()
+        db.insert_employees(employees)
+        return time.perf_counter() - start
+
+
+def bench_threads(directory: str, count: int, threads: int, batch: int) -> float:
+    errors = []
+    with database(directory, "threads") as db:
+        per_thread = count // threads
+
+        def writer(index: int) -> None:
+            data = rows(per_thread, start=index * per_thread + 1)
+            try:
+                for offset in range(0, len(data), batch):
+                    db.executemany(INSERT, data[offset:offset + batch])
+            except sqlite3.Error as e:
+                errors.append(e)
+
+        workers = [threading.Thread(target=writer, args=(i,)) for i in range(threads)]
+        start = time.perf_counter()
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+        elapsed = time.perf_counter() - start
+        written = db.execute_query("SELECT COUNT(*) FROM employees")[0][0]
+    if errors or written != per_thread * threads:
+        raise RuntimeError(f"потоки: записано {written}, ошибок {len(errors)}: {errors[:1]}")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, default=20_000)
+    parser.add_argument('--legacy-rows', type=int, default=2_000,
+                        help='строк для legacy и per-row (commit на строку медленный)')
+    parser.add_argument('--threads', type=int, default=4)
+    parser.add_argument('--batch', type=int, default=500)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix='bench_db_') as directory:
+        results = [
+            ('legacy', args.legacy_rows, bench_legacy(directory, args.legacy_rows)),
+            ('per-row', args.legacy_rows, bench_per_row(directory, args.legacy_rows)),
+            ('transaction', args.rows, bench_transaction(directory, args.rows)),
+            ('executemany', args.rows, bench_executemany(directory, args.rows)),
+            (f'threads x{args.threads}', args.rows,
+             bench_threads(directory, args.rows, args.threads, args.batch)),
+        ]
+
+    print(f"{'сценарий':<14} {'строк':>8} {'время, с':>10} {'строк/с':>12}")
+    for name, count, elapsed in results:
+        print(f"{name:<14} {count:>8} {elapsed:>10.3f} {count / elapsed:>12,.0f}")
+
+
+if __name__ == '__main__':
+    main()
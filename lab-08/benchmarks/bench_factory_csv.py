@@ -0,0 +1,134 @@
+"""
+Бенчмарк загрузки сотрудников из CSV через EmployeeFactoryManager.
+
+Генерирует CSV (разделитель ';', колонки как в to_dict()) со смесью
+менеджеров, разработчиков, продавцов и штатных сотрудников и создаёт
+объекты тремя способами (сотрудников в секунду, с разбором CSV; объекты
+удерживаются в памяти, как при реальной загрузке):
+  per-row     - create_employee() на каждую строку, с выводом фабрик
+                (в /dev/null), как до пакетного API
+  create_many - строки заранее разложены по типам, create_many() на тип
+  records     - create_from_records() по смешанным записям (verbose=False)
+  records-gc  - то же с pause_gc=True (сборщик мусора выключен на создание)
+  parse       - только разбор CSV (доля чтения в сценариях выше)
+
+ИСПОЛЬЗОВАНИЕ:
+    python benchmarks/bench_factory_csv.py --employees 1000000
+"""
+
+import argparse
+import contextlib
+import csv
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from patterns.creational.factory_method import EmployeeFactoryManager
+
+COLUMNS = ('type', 'id', 'name', 'department', 'base_salary',
+           'bonus', 'seniority', 'tech_stack', 'commission', 'sales_volume')
+TYPES = ('manager', 'developer', 'salesperson', 'employee')
+LEVELS = ('junior', 'middle', 'senior')
+
+
+def write_csv(path: str, count: int) -> None:
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f, delimiter=';')
+        writer.writerow(COLUMNS)
+        for i in range(1, count + 1):
+            emp_type = TYPES[i % 4]
+            writer.writerow((emp_type, i, f"Employee {i}", f"D{i % 50}", 1000 + i % 500,
+                             i % 300 if emp_type == 'manager' else '',
+                             LEVELS[i % 3] if emp_type == 'developer' else '',
+                             'Python|SQL' if emp_type == 'developer' else '',
+                             0.05 if emp_type == 'salesperson' else '',
+                             i % 10_000 if emp_type == 'salesperson' else ''))
+
+
+def read_records(path: str):
+    """Записи CSV в формате to_dict(): числа разобраны, пустые поля пропущены."""
+    with open(path, newline='', encoding='utf-8') as f:
+        reader = csv.reader(f, delimiter=';')
+        next(reader)
+        for emp_type, emp_id, name, department, salary, bonus, seniority, stack, commission, sales in reader:
+            record = {'type': emp_type, 'id': int(emp_id), 'name': name,
+                      'department': department, 'base_salary': float(salary)}
+            if bonus:
+                record['bonus'] = float(bonus)
+            if seniority:
+                record['seniority'] = seniority
+                record['tech_stack'] = stack.split('|')
+            if commission:
+                record['commission'] = float(commission)
+                record['sales_volume'] = float(sales)
+            yield record
+
+
+def bench_parse(path: str) -> float:
+    start = time.perf_counter()
+    for _ in read_records(path):
+        pass
+    return time.perf_counter() - start
+
+
+def bench_per_row(path: str) -> float:
+    manager = EmployeeFactoryManager()
+    employees = []
+    start = time.perf_counter()
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        for record in read_records(path):
+            emp_type = record.pop('type')
+            employees.append(manager.create_employee(emp_type, record.pop('id'), record.pop('name'),
+                                                     record.pop('department'), record.pop('base_salary'),
+                                                     **record))
+    return time.perf_counter() - start
+
+
+def bench_create_many(path: str) -> float:
+    manager = EmployeeFactoryManager(verbose=False)
+    start = time.perf_counter()
+    groups = {emp_type: [] for emp_type in TYPES}
+    for record in read_records(path):
+        groups[record['type']].append(record)
+    for emp_type, records in groups.items():
+        manager.create_many(emp_type, records)
+    return time.perf_counter() - start
+
+
+def bench_records(path: str, pause_gc: bool = False) -> float:
+    manager = EmployeeFactoryManager(verbose=False)
+    start = time.perf_counter()
+    manager.create_from_records(read_records(path), pause_gc=pause_gc)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--employees', type=int, default=1_000_000)
+    parser.add_argument('--per-row-employees', type=int, default=100_000,
+                        help='сотрудников для построчного создания с выводом')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix='bench_factory_') as directory:
+        small, large = os.path.join(directory, 'small.csv'), os.path.join(directory, 'large.csv')
+        write_csv(small, args.per_row_employees)
+        write_csv(large, args.employees)
+        results = [
+            ('per-row', args.per_row_employees, bench_per_row(small)),
+            ('create_many', args.employees, bench_create_many(large)),
+            ('records', args.employees, bench_records(large)),
+            ('records-gc', args.employees, bench_records(large, pause_gc=True)),
+            ('parse', args.employees, bench_parse(large)),
+        ]
+
+    print(f"{'сценарий':<12} {'сотрудников':>12} {'время, с':>10} {'сотр./с':>12}")
+    for name, count, elapsed in results:
+        print(f"{name:<12} {count:>12,} {elapsed:>10.3f} {count / elapsed:>12,.0f}")
+
+
+if __name__ == '__main__':
+    main()
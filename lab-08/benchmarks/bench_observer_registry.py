@@ -0,0 +1,101 @@
+"""
+Бенчмарк общего ObserverRegistry против списков наблюдателей в каждом Subject.
+
+Строит N сотрудников (EmployeeSalarySubject) и подписывает K
+наблюдателей двумя способами: attach() к каждому объекту и один раз в
+ObserverRegistry (плюс фильтрованные подписки по сотрудникам и отделу).
+Память объектов меряется tracemalloc, пропускная способность - по
+изменению зарплаты всех сотрудников. Вывод подписок перенаправляется.
+
+ИСПОЛЬЗОВАНИЕ:
+    python benchmarks/bench_observer_registry.py --subjects 1000000 --observers 3
+"""
+
+import argparse
+import contextlib
+import gc
+import os
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from patterns.behavioral.behavioral import EmployeeSalarySubject, Observer, ObserverRegistry
+
+DEPARTMENTS = ('DEV', 'QA', 'SALES', 'HR')
+
+
+class CountingObserver(Observer):
+    """Наблюдатель без вывода: считает события."""
+
+    def __init__(self):
+        self.count = 0
+
+    def update(self, subject, event_data):
+        self.count += 1
+
+
+def build(subjects: int, observers, registry=None):
+    """Создаёт сотрудников; без реестра подписывает наблюдателей на каждого."""
+    employees = []
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        for i in range(subjects):
+            employee = EmployeeSalarySubject(i, f"Emp {i}", 1000.0, DEPARTMENTS[i % 4], registry)
+            if registry is None:
+                for observer in observers:
+                    employee.attach(observer)
+            employees.append(employee)
+    return employees
+
+
+def measure(label: str, subjects: int, observers, registry=None) -> None:
+    gc.collect()
+    tracemalloc.start()
+    employees = build(subjects, observers, registry)
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        start = time.perf_counter()
+        for employee in employees:
+            employee.salary = 1100.0
+        elapsed = time.perf_counter() - start
+
+    delivered = sum(observer.count for observer in observers)
+    print(f"{label:<28} память {memory / 2**20:>8.1f} МБ ({memory / subjects:>5.0f} Б/объект)  "
+          f"изменение всех: {elapsed:>6.2f} с ({subjects / elapsed:>9,.0f}/с)  доставлено: {delivered:,}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--subjects', type=int, default=1_000_000)
+    parser.add_argument('--observers', type=int, default=3)
+    parser.add_argument('--filtered', type=int, default=1000,
+                        help='подписок на отдельных сотрудников в варианте с фильтрами')
+    args = parser.parse_args()
+    print(f"Сотрудников: {args.subjects:,}, наблюдателей: {args.observers}")
+
+    measure("attach() к каждому", args.subjects,
+            [CountingObserver() for _ in range(args.observers)])
+
+    observers = [CountingObserver() for _ in range(args.observers)]
+    registry = ObserverRegistry()
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        for observer in observers:
+            registry.subscribe(observer, 'salary_changed')
+    measure("ObserverRegistry", args.subjects, observers, registry)
+
+    observers = [CountingObserver() for _ in range(3)]
+    registry = ObserverRegistry()
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        registry.subscribe(observers[0], 'salary_changed', department='DEV')
+        registry.subscribe(observers[1], 'salary_changed', min_change=500)
+        for emp_id in range(0, args.subjects, max(1, args.subjects // args.filtered)):
+            registry.subscribe(observers[2], 'salary_changed', employee_id=emp_id)
+    measure("Registry с фильтрами", args.subjects, observers, registry)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,375 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+ЛР№8: Хранилище аудита на диске (SegmentedAuditStore, AppendOnlyLog)
+===================================================================
+
+Модуль содержит тесты для проверки:
+- Ограниченного кольца последних записей в памяти
+- Ротации сегментов и индексированных запросов по сотруднику и времени
+- Чтения индекса закрытого сегмента один раз на все запросы
+- Открытия по сводкам сегментов и ограниченной памяти на закрытый сегмент
+- Восстановления после перезапуска и аварийного завершения
+- Ошибки записи в закрытое хранилище
+- fsync пачками
+- Записи LoggingObserver в файл и AuditObserver в хранилище
+
+Для запуска:
+    pytest test_audit_store_lr8.py -v
+"""
+
+import pytest
+import sys
+import os
+import json
+
+# Добавляем path для импорта из src
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+try:
+    from patterns.behavioral.audit_store import SegmentedAuditStore, AppendOnlyLog
+    from patterns.behavioral.behavioral import (
+        AuditObserver, LoggingObserver, NotificationSystem
+    )
+except ImportError as e:
+    pytest.skip(f"Cannot import classes: {e}", allow_module_level=True)
+
+
+def make_event(number, employee_id=None):
+    """Событие изменения зарплаты с timestamp по номеру (минуты от полуночи)."""
+    return {
+        'event': 'salary_changed',
+        'employee_id': employee_id if employee_id is not None else number % 10,
+        'employee_name': f"Employee {number % 10}",
+        'old_salary': 1000.0,
+        'new_salary': 1000.0 + number,
+        'change': float(number),
+        'timestamp': f"2024-01-01T{number // 60:02d}:{number % 60:02d}:00",
+    }
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Хранилище на 100 записей в сегменте с кольцом на 20 записей."""
+    store = SegmentedAuditStore(str(tmp_path / 'audit'), segment_max_entries=100, ring_size=20)
+    yield store
+    store.close()
+
+
+class TestSegmentedAuditStore:
+    """
+    Тесты сегментированного хранилища аудита.
+    """
+
+    def test_ring_is_bounded_and_segments_rotate(self, store):
+        """
+        Тест: в памяти только последние записи, на диске - все.
+
+        Arrange: хранилище на 100 записей в сегменте
+        Act: 450 записей
+        Assert: кольцо из 20 последних, 5 сегментов, 4 индекса
+        """
+        # Arrange
+        events = [make_event(n) for n in range(450)]
+
+        # Act
+        assert store.append_many(events) == 450
+
+        # Assert
+        assert list(store.recent) == events[-20:]
+        assert len(store) == 450
+        assert store.segment_count == 5
+        assert len([name for name in os.listdir(store.directory) if name.endswith('.idx')]) == 4
+        assert list(store.query()) == events
+
+    def test_query_by_employee_and_time(self, store):
+        """
+        Тест: запросы по сотруднику, интервалу времени и вместе.
+        """
+        events = [make_event(n) for n in range(450)]
+        store.append_many(events)
+
+        assert list(store.query(employee_id=3)) == [e for e in events if e['employee_id'] == 3]
+        assert list(store.query(since="2024-01-01T02:00:00", until="2024-01-01T03:00:00")) == events[120:180]
+        assert list(store.query(employee_id=7, since="2024-01-01T06:00:00")) == \
+            [e for e in events[360:] if e['employee_id'] == 7]
+        assert list(store.query(employee_id=42)) == []
+
+    def test_query_skips_unrelated_segments(self, store):
+        """
+        Тест: запрос не читает сегменты вне интервала и без сотрудника.
+
+        Arrange: 3 сегмента, сотрудник 99 только в последнем
+        Act: порча данных первого сегмента
+        Assert: запросы по сотруднику 99 и по позднему интервалу работают
+        """
+        # Arrange
+        events = [make_event(n) for n in range(250)]
+        events[220] = make_event(220, employee_id=99)
+        store.append_many(events)
+
+        # Act
+        with open(os.path.join(store.directory, 'segment-000001.jsonl'), 'wb') as f:
+            f.write(b'not json\n' * 100)
+
+        # Assert
+        assert list(store.query(employee_id=99)) == [events[220]]
+        assert list(store.query(since="2024-01-01T03:00:00")) == events[180:]
+
+    def test_segment_index_read_once(self, store, monkeypatch):
+        """
+        Тест: индекс закрытого сегмента разбирается один раз на все запросы.
+
+        Arrange: 5 сегментов, сотрудник 99 только в третьем
+        Act: запросы по разным сотрудникам
+        Assert: индексы без сотрудника 99 не читаются, повторно не читается ни один
+        """
+        # Arrange
+        events = [make_event(n) for n in range(450)]
+        events[250] = make_event(250, employee_id=99)
+        store.append_many(events)
+        loads = []
+        real_load = json.load
+        monkeypatch.setattr(json, 'load', lambda f, **kw: loads.append(f.name) or real_load(f, **kw))
+
+        # Act
+        assert list(store.query(employee_id=99)) == [events[250]]
+        first = list(loads)
+        for employee_id in range(10):
+            assert list(store.query(employee_id=employee_id)) == \
+                [e for e in events if e['employee_id'] == employee_id]
+
+        # Assert
+        assert [os.path.basename(name) for name in first] == ['segment-000003.idx']
+        assert sorted(loads) == sorted(set(loads)) and len(loads) == 4
+
+    def test_reopen_reads_only_summaries(self, tmp_path, monkeypatch):
+        """
+        Тест: при открытии читаются сводки сегментов, а не их индексы.
+
+        Arrange: 4 закрытых сегмента на диске
+        Act: повторное открытие и запрос по сотруднику
+        Assert: при открытии не разобран ни один .idx, запрос читает индексы
+        """
+        # Arrange
+        directory = str(tmp_path / 'audit')
+        events = [make_event(n) for n in range(450)]
+        with SegmentedAuditStore(directory, segment_max_entries=100) as store:
+            store.append_many(events)
+        loads = []
+        real_load = json.load
+        monkeypatch.setattr(json, 'load', lambda f, **kw: loads.append(f.name) or real_load(f, **kw))
+
+        # Act
+        with SegmentedAuditStore(directory, segment_max_entries=100) as store:
+            opened = [os.path.basename(name) for name in loads]
+            found = list(store.query(employee_id=4))
+
+        # Assert
+        assert opened == [f'segment-00000{n}.meta' for n in range(1, 5)]
+        assert found == [e for e in events if e['employee_id'] == 4]
+
+    def test_missing_summary_is_rebuilt(self, tmp_path):
+        """
+        Тест: сегмент без сводки (старый формат) переиндексируется при открытии.
+        """
+        directory = str(tmp_path / 'audit')
+        events = [make_event(n) for n in range(250)]
+        with SegmentedAuditStore(directory, segment_max_entries=100) as store:
+            store.append_many(events)
+        os.remove(os.path.join(directory, 'segment-000001.meta'))
+
+        with SegmentedAuditStore(directory, segment_max_entries=100) as store:
+            assert list(store.query(employee_id=2)) == [e for e in events if e['employee_id'] == 2]
+        assert os.path.exists(os.path.join(directory, 'segment-000001.meta'))
+
+    def test_sealed_segment_memory_is_bounded(self, tmp_path):
+        """
+        Тест: закрытый сегмент хранит фильтр ограниченного размера, а не все id.
+
+        Arrange: сегменты по 20000 записей с разными сотрудниками
+        Act: ротация
+        Assert: индекс выгружен, фильтр не больше 64 КиБ и находит всех сотрудников
+        """
+        # Arrange
+        store = SegmentedAuditStore(str(tmp_path / 'audit'), segment_max_entries=20000, ring_size=0)
+
+        # Act
+        store.append_many({'employee_id': n} for n in range(40001))
+
+        # Assert
+        for segment in store._sealed:
+            assert segment.employees is None
+            assert len(segment.filter.data) <= 64 * 1024
+        assert all(store._sealed[1].may_contain(n) for n in range(20000, 40000))
+        assert sum(store._sealed[0].may_contain(n) for n in range(20000, 40000)) < 400
+        store.close()
+
+    def test_append_after_close_fails(self, tmp_path):
+        """
+        Тест: запись и sync() после close() - понятная ошибка.
+        """
+        store = SegmentedAuditStore(str(tmp_path / 'audit'))
+        store.append(make_event(1))
+        store.close()
+
+        with pytest.raises(RuntimeError, match="закрыто"):
+            store.append_many([make_event(2)])
+        with pytest.raises(RuntimeError, match="закрыто"):
+            store.sync()
+        assert list(store.query()) == [make_event(1)]
+
+    def test_reopen_restores_index_and_ring(self, tmp_path):
+        """
+        Тест: после перезапуска запросы и кольцо видят прежние записи.
+        """
+        directory = str(tmp_path / 'audit')
+        events = [make_event(n) for n in range(250)]
+        with SegmentedAuditStore(directory, segment_max_entries=100, ring_size=20) as store:
+            store.append_many(events[:150])
+        with SegmentedAuditStore(directory, segment_max_entries=100, ring_size=20) as store:
+            assert list(store.recent) == events[130:150]
+            store.append_many(events[150:])
+            assert store.segment_count == 3
+            assert list(store.query(employee_id=5)) == [e for e in events if e['employee_id'] == 5]
+
+    def test_recovery_after_crash(self, tmp_path):
+        """
+        Тест: недописанная строка активного сегмента обрезается при открытии.
+
+        Arrange: хранилище без close() и обрывок строки в конце сегмента
+        Act: повторное открытие и запись
+        Assert: все целые записи на месте, новые дописаны корректно
+        """
+        # Arrange
+        directory = str(tmp_path / 'audit')
+        events = [make_event(n) for n in range(130)]
+        crashed = SegmentedAuditStore(directory, segment_max_entries=100)
+        crashed.append_many(events[:120])
+        crashed.sync()
+        with open(os.path.join(directory, 'segment-000002.jsonl'), 'ab') as f:
+            f.write(b'{"event": "salary_ch')
+
+        # Act
+        with SegmentedAuditStore(directory, segment_max_entries=100) as store:
+            store.append_many(events[120:])
+
+            # Assert
+            assert len(store) == 130
+            assert list(store.query()) == events
+            assert list(store.query(employee_id=1)) == [e for e in events if e['employee_id'] == 1]
+
+    def test_fsync_is_batched(self, tmp_path, monkeypatch):
+        """
+        Тест: fsync раз в fsync_every записей, а не на каждую запись.
+        """
+        calls = []
+        real_fsync = os.fsync
+        monkeypatch.setattr(os, 'fsync', lambda fd: calls.append(fd) or real_fsync(fd))
+        store = SegmentedAuditStore(str(tmp_path / 'audit'), fsync_every=1000, fsync_interval=None)
+
+        store.append_many(make_event(n) for n in range(2500))
+        assert len(calls) == 2
+        store.close()
+        assert len(calls) == 3
+
+    def test_max_segments_removes_oldest(self, tmp_path):
+        """
+        Тест: max_segments ограничивает число сегментов на диске.
+        """
+        store = SegmentedAuditStore(str(tmp_path / 'audit'), segment_max_entries=100, max_segments=2)
+        events = [make_event(n) for n in range(450)]
+
+        store.append_many(events)
+
+        assert store.segment_count == 2
+        assert list(store.query()) == events[300:]
+        store.close()
+
+
+class TestAppendOnlyLog:
+    """
+    Тесты текстового лога с ротацией.
+    """
+
+    def test_rotation_by_size(self, tmp_path):
+        """
+        Тест: при превышении max_bytes файл переименовывается в .1, .2, ...
+        """
+        path = str(tmp_path / 'salary.log')
+        log = AppendOnlyLog(path, max_bytes=100, backups=2)
+
+        for n in range(10):
+            log.write_lines([f"line {n:02d} " + "x" * 30])
+        log.close()
+
+        assert sorted(os.listdir(tmp_path)) == ['salary.log', 'salary.log.3', 'salary.log.4']
+        with open(path, encoding='utf-8') as f:
+            assert f.read().splitlines()[-1].startswith("line 09")
+
+
+class TestObserversWithStore:
+    """
+    Тесты наблюдателей поверх хранилища.
+    """
+
+    def test_audit_observer_with_store(self, tmp_path):
+        """
+        Тест: AuditObserver пишет в хранилище и отвечает на запросы.
+
+        Arrange: система уведомлений с AuditObserver и хранилищем
+        Act: 3 изменения зарплат двух сотрудников
+        Assert: записи на диске, запрос по сотруднику
+        """
+        # Arrange
+        store = SegmentedAuditStore(str(tmp_path / 'audit'), ring_size=2)
+        audit = AuditObserver(store)
+        system = NotificationSystem()
+        system.register_observer(audit)
+        system.add_employee(1, "Alice", 1000.0)
+        system.add_employee(2, "Bob", 1000.0)
+
+        # Act
+        system.update_salary(1, 1100.0)
+        system.update_salary(2, 1200.0)
+        system.update_salary(1, 1300.0)
+        audit.close()
+
+        # Assert
+        assert [e['new_salary'] for e in audit.audit_log] == [1200.0, 1300.0]
+        assert audit.total == 3
+        assert [e['new_salary'] for e in audit.query(employee_id=1)] == [1100.0, 1300.0]
+        with open(os.path.join(store.directory, 'segment-000001.jsonl'), encoding='utf-8') as f:
+            assert [json.loads(line)['employee_id'] for line in f] == [1, 2, 1]
+
+    def test_audit_observer_without_store_is_bounded(self):
+        """
+        Тест: без хранилища AuditObserver хранит только ring_size записей.
+        """
+        audit = AuditObserver(ring_size=5)
+
+        audit.update_batch([(None, make_event(n)) for n in range(50)])
+
+        assert len(audit.audit_log) == 5
+        assert audit.total == 50
+        assert [e['change'] for e in audit.query(employee_id=9)] == [49.0]
+
+    def test_logging_observer_writes_file(self, tmp_path):
+        """
+        Тест: LoggingObserver пишет строки в log_file.
+        """
+        log_file = tmp_path / 'salary_changes.log'
+        observer = LoggingObserver(str(log_file), ring_size=3)
+
+        observer.update(None, make_event(1))
+        observer.update_batch([(None, make_event(n)) for n in range(2, 6)])
+        observer.close()
+
+        lines = log_file.read_text(encoding='utf-8').splitlines()
+        assert len(lines) == 5
+        assert lines[-3:] == list(observer.log_entries)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+ЛР№8: Пакетный расчёт бонусов по стратегиям
+===========================================
+
+Модуль содержит тесты для проверки:
+- Совпадения calculate_bonus_many() с calculate_bonus()
+- Параметров-столбцов, одиночных значений и значений по умолчанию
+- Группировки сотрудников по стратегиям в calculate_total_salaries()
+- Раздельного расчёта подклассов стратегий со своим состоянием
+- Расчёта списками без NumPy
+
+Для запуска:
+    pytest test_bonus_strategies_lr8.py -v
+"""
+
+import pytest
+import sys
+import os
+
+# Добавляем path для импорта из src
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+try:
+    from patterns.behavioral import behavioral
+    from patterns.behavioral.behavioral import (
+        BonusStrategy, EmployeeWithStrategy, PerformanceBonusStrategy,
+        ProjectBonusStrategy, SeniorityBonusStrategy, calculate_total_salaries
+    )
+except ImportError as e:
+    pytest.skip(f"Cannot import classes: {e}", allow_module_level=True)
+
+
+BASES = [0, 1000, 1234.56, 3000.1, 99999.99]
+CASES = [
+    (PerformanceBonusStrategy(), 'performance_rating', [0.5, 1.0, 1.1, 1.37, 2.0]),
+    (SeniorityBonusStrategy(), 'years_of_service', [0, 1, 7, 10, 25]),
+    (ProjectBonusStrategy(), 'projects_completed', [0, 1, 3, 6, 9]),
+]
+
+
+@pytest.fixture(params=[True, False], ids=["numpy", "lists"])
+def numpy_mode(request, monkeypatch):
+    """Расчёт с NumPy (если установлен) и без него."""
+    if request.param and behavioral.np is None:
+        pytest.skip("NumPy не установлен")
+    if not request.param:
+        monkeypatch.setattr(behavioral, 'np', None)
+    return request.param
+
+
+class FlatBonusStrategy(BonusStrategy):
+    """Стратегия без собственного пакетного расчёта."""
+
+    def calculate_bonus(self, base_salary: float, amount: float = 10) -> float:
+        return amount
+
+    def get_description(self) -> str:
+        return "Фиксированный бонус"
+
+
+class ScaledSeniorityStrategy(SeniorityBonusStrategy):
+    """Подкласс стандартной стратегии с собственным параметром."""
+
+    def __init__(self, k: float):
+        self.k = k
+
+    def calculate_bonus(self, base_salary: float, years_of_service: int = 0) -> float:
+        return self.k * super().calculate_bonus(base_salary, years_of_service)
+
+    def calculate_bonus_many(self, base_salaries, params=None):
+        return [self.k * bonus for bonus in super().calculate_bonus_many(base_salaries, params)]
+
+
+def staff():
+    """Сотрудники со всеми стратегиями и без стратегии, по кругу."""
+    strategies = [case[0] for case in CASES] + [FlatBonusStrategy(), None]
+    employees = []
+    for i in range(20):
+        employee = EmployeeWithStrategy(f"E{i}", BASES[i % 5] + i)
+        if strategies[i % 5] is not None:
+            employee.set_bonus_strategy(strategies[i % 5])
+        employees.append(employee)
+    return employees
+
+
+class TestCalculateBonusMany:
+    """
+    Тесты пакетного расчёта одной стратегии.
+    """
+
+    @pytest.mark.parametrize("strategy, name, values", CASES, ids=[case[1] for case in CASES])
+    def test_same_as_scalar(self, numpy_mode, capsys, strategy, name, values):
+        """
+        Тест: calculate_bonus_many() совпадает с calculate_bonus() для каждой пары.
+
+        Arrange: все сочетания зарплат и значений параметра
+        Act: пакетный и построчный расчёт
+        Assert: результаты равны точно, пакетный расчёт ничего не печатает
+        """
+        # Arrange
+        bases = [base for base in BASES for _ in values]
+        column = values * len(BASES)
+        expected = [strategy.calculate_bonus(base, **{name: value}) for base, value in zip(bases, column)]
+        capsys.readouterr()
+
+        # Act
+        bonuses = strategy.calculate_bonus_many(bases, {name: column})
+
+        # Assert
+        assert list(bonuses) == expected
+        assert capsys.readouterr().out == ""
+
+    def test_scalar_and_default_params(self, numpy_mode):
+        """
+        Тест: одно значение применяется ко всем, отсутствующий параметр - по умолчанию.
+        """
+        strategy = SeniorityBonusStrategy()
+
+        assert list(strategy.calculate_bonus_many([1000.0, 2000.0], {'years_of_service': 3})) == [60.0, 120.0]
+        assert list(strategy.calculate_bonus_many([1000.0, 2000.0])) == [0.0, 0.0]
+        assert list(PerformanceBonusStrategy().calculate_bonus_many([1000.0], {})) == [0.0]
+
+    def test_length_mismatch(self, numpy_mode):
+        """
+        Тест: столбец параметра другой длины отклоняется.
+        """
+        with pytest.raises(ValueError, match="'projects_completed': 1 значений, ожидалось 2"):
+            ProjectBonusStrategy().calculate_bonus_many([1000, 2000], {'projects_completed': [1]})
+
+    def test_default_implementation(self, numpy_mode):
+        """
+        Тест: стратегия без своего пакетного расчёта получает только свои параметры.
+        """
+        bonuses = FlatBonusStrategy().calculate_bonus_many(
+            [1000, 2000], {'amount': [5, 6], 'years_of_service': [1, 2]})
+
+        assert list(bonuses) == [5, 6]
+
+
+class TestCalculateTotalSalaries:
+    """
+    Тесты пакетного расчёта полных зарплат.
+    """
+
+    def test_same_as_employee_calculation(self, numpy_mode, capsys):
+        """
+        Тест: calculate_total_salaries() совпадает с calculate_total_salary().
+
+        Arrange: 20 сотрудников пяти видов и столбцы всех параметров
+        Act: пакетный и построчный расчёт
+        Assert: суммы равны точно и идут в порядке сотрудников
+        """
+        # Arrange
+        employees = staff()
+        params = {name: [values[i % 5] for i in range(20)] for _, name, values in CASES}
+        params['amount'] = list(range(20))
+        expected = []
+        for i, employee in enumerate(employees):
+            accepted = {'amount'} if isinstance(employee.strategy, FlatBonusStrategy) else {
+                name for strategy, name, _ in CASES if strategy is employee.strategy}
+            expected.append(employee.calculate_total_salary(
+                **{name: params[name][i] for name in accepted}))
+        capsys.readouterr()
+
+        # Act
+        totals = calculate_total_salaries(employees, params)
+
+        # Assert
+        assert list(totals) == expected
+        assert capsys.readouterr().out == ""
+
+    def test_each_strategy_called_once(self, numpy_mode, monkeypatch):
+        """
+        Тест: каждая стратегия считает свою группу одним вызовом.
+        """
+        calls = []
+        many = SeniorityBonusStrategy.calculate_bonus_many
+        monkeypatch.setattr(SeniorityBonusStrategy, 'calculate_bonus_many',
+                            lambda self, bases, params=None: (calls.append(len(bases)),
+                                                              many(self, bases, params))[1])
+
+        calculate_total_salaries(staff(), {'years_of_service': 5})
+
+        assert calls == [4]
+
+    def test_own_instance_per_employee(self, numpy_mode, monkeypatch):
+        """
+        Тест: свой экземпляр стратегии у каждого сотрудника.
+
+        Arrange: 3000 сотрудников, у каждого новый экземпляр стандартной
+                 или пользовательской стратегии
+        Act: calculate_total_salaries()
+        Assert: стандартные стратегии считаются одним вызовом на класс,
+                суммы совпадают с calculate_total_salary()
+        """
+        # Arrange
+        classes = [PerformanceBonusStrategy, SeniorityBonusStrategy, ProjectBonusStrategy, FlatBonusStrategy]
+        employees = []
+        for i in range(3000):
+            employee = EmployeeWithStrategy(f"E{i}", 1000 + i)
+            employee.set_bonus_strategy(classes[i % 4]())
+            employees.append(employee)
+        params = {'performance_rating': 1.5, 'years_of_service': 4, 'projects_completed': 2, 'amount': 7}
+        names = ['performance_rating', 'years_of_service', 'projects_completed', 'amount']
+        expected = [e.strategy.calculate_bonus(e.base_salary, **{names[i % 4]: params[names[i % 4]]})
+                    + e.base_salary for i, e in enumerate(employees)]
+        calls = []
+        many = SeniorityBonusStrategy.calculate_bonus_many
+        monkeypatch.setattr(SeniorityBonusStrategy, 'calculate_bonus_many',
+                            lambda self, bases, params=None: (calls.append(len(bases)),
+                                                              many(self, bases, params))[1])
+
+        # Act
+        totals = calculate_total_salaries(employees, params)
+
+        # Assert
+        assert calls == [750]
+        assert list(totals) == expected
+
+    def test_stateful_subclass_not_merged(self, numpy_mode, capsys):
+        """
+        Тест: экземпляры подкласса со своим состоянием считаются каждый своим объектом.
+
+        Arrange: два сотрудника с ScaledSeniorityStrategy(k=1) и (k=10)
+        Act: calculate_total_salaries()
+        Assert: суммы совпадают с calculate_total_salary()
+        """
+        # Arrange
+        employees = []
+        for k in (1, 10):
+            employee = EmployeeWithStrategy(f"K{k}", 1000)
+            employee.set_bonus_strategy(ScaledSeniorityStrategy(k))
+            employees.append(employee)
+        expected = [e.calculate_total_salary(years_of_service=5) for e in employees]
+
+        # Act
+        totals = calculate_total_salaries(employees, {'years_of_service': 5})
+
+        # Assert
+        assert expected == [1100.0, 2000.0]
+        assert list(totals) == expected
+
+    def test_without_strategies(self, numpy_mode):
+        """
+        Тест: сотрудники без стратегии получают базовую зарплату.
+        """
+        employees = [EmployeeWithStrategy("Ann", 1000), EmployeeWithStrategy("Bob", 2000.5)]
+
+        assert list(calculate_total_salaries(employees)) == [1000, 2000.5]
+        assert list(calculate_total_salaries([])) == []
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+ЛР№8: Реестр прототипов в EmployeeDirector
+==========================================
+
+Модуль содержит тесты для проверки:
+- Совпадения build_many() с fluent-цепочкой директора
+- Кэширования проверенных шаблонов ролей
+- Проверки полей строк и собственных прототипов
+- Стандартных ролей директора из ROLES и копий шаблонов
+
+Для запуска:
+    pytest test_builder_prototypes_lr8.py -v
+"""
+
+import pytest
+import sys
+import os
+
+# Добавляем path для импорта из src
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+try:
+    from patterns.creational.builder import EmployeeBuilder, EmployeeDirector
+except ImportError as e:
+    pytest.skip(f"Cannot import classes: {e}", allow_module_level=True)
+
+
+@pytest.fixture
+def director():
+    """Директор с новым builder."""
+    return EmployeeDirector(EmployeeBuilder())
+
+
+class TestPrototypeBuild:
+    """
+    Тесты пакетной сборки по прототипу.
+    """
+
+    @pytest.mark.parametrize("role", EmployeeDirector.ROLES)
+    def test_same_as_director_chain(self, director, role):
+        """
+        Тест: build_many() строит то же, что build_<role>().
+
+        Arrange: сотрудник, построенный fluent-цепочкой
+        Act: тот же сотрудник по прототипу
+        Assert: словари и порядок ключей совпадают
+        """
+        # Arrange
+        expected = getattr(director, f"build_{role}")(7, " Alice ", "R&D")
+
+        # Act
+        built = director.build_many(role, [(7, " Alice ", "R&D")])
+
+        # Assert
+        assert built == [expected]
+        assert list(built[0]) == list(expected)
+
+    def test_template_built_once(self, director, monkeypatch):
+        """
+        Тест: шаблон роли строится через builder один раз.
+        """
+        calls = []
+        build = director.builder.build
+        monkeypatch.setattr(director.builder, 'build', lambda: (calls.append(1), build())[1])
+
+        director.build_many("sales_manager", [(1, "A"), (2, "B")])
+        director.build_many("sales_manager", [(3, "C")])
+
+        assert len(calls) == 1
+
+    def test_rows_override_fields(self, director):
+        """
+        Тест: поля строки заменяют поля шаблона, шаблон не меняется.
+        """
+        first, second = director.build_many("junior_developer", [
+            {'id': 1, 'name': "Ann", 'base_salary': 3500},
+            {'id': 2, 'name': "Bob", 'tech_stack': ["Go"]},
+        ])
+        first['tech_stack'].append("Rust")
+
+        assert (first['base_salary'], second['base_salary']) == (3500, 3000)
+        assert second['tech_stack'] == ["Go"]
+        assert director.get_prototype("junior_developer")['tech_stack'] == ["Python", "Git"]
+
+    def test_get_prototype_returns_copy(self, director):
+        """
+        Тест: изменение полученного шаблона не меняет кэш директора.
+        """
+        prototype = director.get_prototype("senior_developer")
+        prototype['base_salary'] = 1
+        prototype['tech_stack'].append("Rust")
+
+        employee = director.build_many("senior_developer", [(1, "Ann")])[0]
+
+        assert employee['base_salary'] == 8000
+        assert "Rust" not in employee['tech_stack']
+        assert director.get_prototype("senior_developer") == dict(employee, id=None, name=None)
+
+    def test_director_methods_follow_roles(self, director, monkeypatch):
+        """
+        Тест: build_<role>() берут настройки из ROLES, отдел по умолчанию - отдел роли.
+        """
+        monkeypatch.setitem(EmployeeDirector.ROLES, "sales_manager",
+                            ("SALES_EU", lambda b: b.set_base_salary(4500).as_manager(bonus=100)))
+
+        manager = director.build_sales_manager(1, "Ann")
+        senior = director.build_senior_developer(2, "Bob", tech_stack=["Go"])
+
+        assert (manager['department'], manager['base_salary'], manager['bonus']) == ("SALES_EU", 4500, 100)
+        assert (senior['department'], senior['tech_stack']) == ("DEV", ["Go"])
+        assert director.build_senior_developer(3, "Eve")['tech_stack'] == [
+            "Python", "Java", "SQL", "Docker", "Kubernetes"]
+
+    def test_iter_many_is_lazy(self, director):
+        """
+        Тест: iter_many() не читает строки раньше времени.
+        """
+        def rows():
+            yield (1, "Ann")
+            raise AssertionError("вторая строка прочитана заранее")
+
+        assert next(director.iter_many("sales_representative", rows()))['id'] == 1
+
+
+class TestPrototypeValidation:
+    """
+    Тесты проверки строк и прототипов.
+    """
+
+    @pytest.mark.parametrize("row, message", [
+        ((0, "Ann"), "ID должен быть положительным"),
+        ((1, "  "), "Имя не может быть пустым"),
+        ({'id': 1}, "Имя не установлено"),
+        ({'id': 1, 'name': "Ann", 'bonus': 10}, "не относится к роли"),
+        ({'id': 1, 'name': "Ann", 'seniority': "guru"}, "Неверный уровень"),
+        ((1, "Ann", "DEV", 5000), "больше 3 полей"),
+    ])
+    def test_invalid_rows(self, director, row, message):
+        """
+        Тест: строка с неверными полями отклоняется с сообщением builder.
+        """
+        with pytest.raises(ValueError, match=message):
+            director.build_many("junior_developer", [row])
+
+    def test_unknown_role(self, director):
+        """
+        Тест: неизвестная роль отклоняется.
+        """
+        with pytest.raises(ValueError, match="Неизвестная роль"):
+            director.build_many("ceo", [(1, "Ann")])
+
+    def test_register_prototype(self, director):
+        """
+        Тест: собственный прототип проверяется при регистрации.
+        """
+        director.register_prototype("intern", {'type': "employee", 'department': " HR ", 'base_salary': 100})
+
+        assert director.build_many("intern", [(1, "Ann")]) == [
+            {'type': "employee", 'id': 1, 'name': "Ann", 'department': "HR", 'base_salary': 100}]
+        with pytest.raises(ValueError, match="commission_rate"):
+            director.register_prototype("seller", {'type': "salesperson", 'department': "S", 'base_salary': 1})
+        with pytest.raises(ValueError, match="Комиссия"):
+            director.register_prototype("seller", {'type': "salesperson", 'department': "S",
+                                                   'base_salary': 1, 'commission_rate': 2})
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
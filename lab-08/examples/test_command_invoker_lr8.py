@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+ЛР№8: Команды над моделью Company и журнал CommandInvoker
+========================================================
+
+Модуль содержит тесты для проверки:
+- Команд найма, увольнения, изменения зарплаты и повышения
+- Атомарного MacroCommand
+- Ограниченного журнала undo/redo
+- Перехода по журналу через снимки (goto)
+- Выбора между снимком и пошаговым переходом по стоимости
+
+Для запуска:
+    pytest test_command_invoker_lr8.py -v
+"""
+
+import pytest
+import sys
+import os
+
+# Добавляем path для импорта из src
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+try:
+    import patterns.behavioral.behavioral as behavioral
+    from patterns.behavioral.behavioral import (
+        Command, CommandInvoker, HireEmployeeCommand, FireEmployeeCommand,
+        UpdateSalaryCommand, PromoteEmployeeCommand, MacroCommand
+    )
+    from organization.company import Company
+    from organization.department import Department
+    from organization.project import Project
+    from specialists.developer import Developer
+    from specialists.ordinary_employee import OrdinaryEmployee
+    from base.exceptions import DependencyError, DuplicateIdError, EmployeeNotFoundError
+except ImportError as e:
+    pytest.skip(f"Cannot import classes: {e}", allow_module_level=True)
+
+
+@pytest.fixture
+def company():
+    """Компания с отделами DEV (разработчик ID 1) и QA (сотрудник ID 2)."""
+    company = Company("TestCorp")
+    dev, qa = Department("DEV"), Department("QA")
+    dev.add_employee(Developer(1, "Alice", "DEV", 5000, "junior", ["Python"]))
+    qa.add_employee(OrdinaryEmployee(2, "Bob", "QA", 3000))
+    company.add_department(dev)
+    company.add_department(qa)
+    return company
+
+
+def salaries(company):
+    return {e.id: e.base_salary for e in company.get_all_employees()}
+
+
+class TestCompanyCommands:
+    """
+    Тесты команд над Company/Department.
+    """
+
+    def test_hire_undo_redo(self, company):
+        """
+        Тест: найм меняет компанию, undo и redo работают.
+
+        Arrange: invoker и новый сотрудник
+        Act: найм, откат, повтор
+        Assert: сотрудник в отделе только после найма и повтора
+        """
+        # Arrange
+        invoker = CommandInvoker(company)
+        carol = OrdinaryEmployee(3, "Carol", "QA", 2500)
+
+        # Act / Assert
+        invoker.execute_command(HireEmployeeCommand(company, carol))
+        assert company.find_employee_by_id(3) is carol
+
+        invoker.undo()
+        assert company.find_employee_by_id(3) is None
+
+        invoker.redo()
+        assert company.find_employee_by_id(3) is carol
+        assert invoker.get_history() == ["Найм Carol"]
+
+    def test_hire_duplicate_id_fails(self, company):
+        """
+        Тест: найм с занятым ID отклоняется и не попадает в историю.
+        """
+        invoker = CommandInvoker(company)
+
+        with pytest.raises(DuplicateIdError):
+            invoker.execute_command(HireEmployeeCommand(company, OrdinaryEmployee(1, "Eve", "QA", 1)))
+
+        assert invoker.get_history() == []
+        assert len(company.get_all_employees()) == 2
+
+    def test_fire_respects_project_dependency(self, company):
+        """
+        Тест: увольнение участника проекта запрещено, иначе откатываемо.
+        """
+        invoker = CommandInvoker(company)
+        project = Project(1, "Apollo", "test", "2030-12-31")
+        project.add_team_member(company.find_employee_by_id(1))
+        company.add_project(project)
+
+        with pytest.raises(DependencyError):
+            invoker.execute_command(FireEmployeeCommand(company, 1))
+
+        invoker.execute_command(FireEmployeeCommand(company, 2))
+        assert company.find_employee_by_id(2) is None
+        invoker.undo()
+        assert company.find_employee_by_id(2).name == "Bob"
+
+    def test_salary_and_promotion(self, company):
+        """
+        Тест: изменение зарплаты и повышение откатываются полностью.
+        """
+        invoker = CommandInvoker(company)
+        alice = company.find_employee_by_id(1)
+
+        invoker.execute_command(UpdateSalaryCommand(company, 1, 6000))
+        invoker.execute_command(PromoteEmployeeCommand(company, 1, 1000, new_position="middle"))
+        assert (alice.base_salary, alice.seniority_level) == (7000, "middle")
+
+        invoker.undo()
+        assert (alice.base_salary, alice.seniority_level) == (6000, "junior")
+        invoker.undo()
+        assert alice.base_salary == 5000
+
+        with pytest.raises(ValueError):
+            invoker.execute_command(PromoteEmployeeCommand(company, 2, 100, new_position="senior"))
+        with pytest.raises(EmployeeNotFoundError):
+            invoker.execute_command(UpdateSalaryCommand(company, 99, 1))
+
+
+class TestMacroCommand:
+    """
+    Тесты атомарного пакета команд.
+    """
+
+    def test_macro_is_atomic(self, company):
+        """
+        Тест: ошибка в пакете откатывает уже выполненные команды.
+
+        Arrange: пакет из найма, изменения зарплаты и ошибочной команды
+        Act: выполнение пакета
+        Assert: исключение, компания и история без изменений
+        """
+        # Arrange
+        invoker = CommandInvoker(company)
+        before = salaries(company)
+        macro = MacroCommand([
+            HireEmployeeCommand(company, OrdinaryEmployee(3, "Carol", "QA", 2500)),
+            UpdateSalaryCommand(company, 1, 9000),
+            UpdateSalaryCommand(company, 99, 1),
+        ])
+
+        # Act
+        with pytest.raises(EmployeeNotFoundError):
+            invoker.execute_command(macro)
+
+        # Assert
+        assert salaries(company) == before
+        assert invoker.get_history() == []
+
+    def test_macro_undo_is_one_step(self, company):
+        """
+        Тест: выполненный пакет откатывается и повторяется одной командой.
+        """
+        invoker = CommandInvoker(company)
+        before = salaries(company)
+        invoker.execute_command(MacroCommand([
+            HireEmployeeCommand(company, OrdinaryEmployee(3, "Carol", "QA", 2500)),
+            UpdateSalaryCommand(company, 3, 2700),
+            UpdateSalaryCommand(company, 2, 3100),
+        ], description="Реорганизация QA"))
+        after = salaries(company)
+
+        invoker.undo()
+        assert salaries(company) == before
+        invoker.redo()
+        assert salaries(company) == after
+        assert invoker.get_history() == ["Реорганизация QA"]
+
+
+class TestInvokerHistory:
+    """
+    Тесты журнала CommandInvoker.
+    """
+
+    def test_history_is_bounded(self, company):
+        """
+        Тест: журнал хранит не больше max_history записей.
+        """
+        invoker = CommandInvoker(company, max_history=10)
+
+        for salary in range(1, 26):
+            invoker.execute_command(UpdateSalaryCommand(company, 2, salary))
+        for _ in range(12):
+            invoker.undo()
+
+        assert (invoker.first_position, invoker.position) == (15, 15)
+        assert company.find_employee_by_id(2).base_salary == 15
+
+    def test_history_does_not_keep_commands(self, company):
+        """
+        Тест: в журнале операции, а не объекты команд.
+        """
+        invoker = CommandInvoker(company)
+
+        invoker.execute_command(UpdateSalaryCommand(company, 2, 100))
+
+        assert not any(isinstance(item, Command) for entry in invoker._log
+                       for ops in entry[1:] for op in ops for item in op)
+
+    def test_new_command_discards_redo(self, company):
+        """
+        Тест: новая команда после отката отменяет ветку повтора.
+        """
+        invoker = CommandInvoker(company)
+        invoker.execute_command(UpdateSalaryCommand(company, 2, 100))
+        invoker.execute_command(UpdateSalaryCommand(company, 2, 200))
+        invoker.undo()
+
+        invoker.execute_command(UpdateSalaryCommand(company, 2, 300))
+        invoker.redo()
+
+        assert company.find_employee_by_id(2).base_salary == 300
+        assert invoker.last_position == 2
+
+    def test_command_without_journal(self):
+        """
+        Тест: команда без journal() хранится целиком и откатывается сама.
+        """
+        class CounterCommand(Command):
+            def __init__(self, state):
+                self.state = state
+
+            def execute(self):
+                self.state['value'] += 1
+
+            def undo(self):
+                self.state['value'] -= 1
+
+            def get_description(self):
+                return "Счётчик"
+
+        state = {'value': 0}
+        invoker = CommandInvoker()
+        invoker.execute_command(CounterCommand(state))
+        invoker.execute_command(CounterCommand(state))
+        invoker.undo()
+        assert state['value'] == 1
+        invoker.redo()
+        assert state['value'] == 2
+
+
+class TestCheckpoints:
+    """
+    Тесты перехода по журналу через снимки.
+    """
+
+    def test_goto_uses_checkpoint(self, company, monkeypatch):
+        """
+        Тест: далёкий откат восстанавливает снимок, а не откатывает всё.
+
+        Arrange: 1000 изменений зарплаты, снимок раз в 100 команд
+        Act: goto(50) и goto(1000)
+        Assert: зарплаты верные, применено не больше 100 записей журнала
+        """
+        # Arrange
+        invoker = CommandInvoker(company, max_history=5000, checkpoint_every=100)
+        for salary in range(1, 1001):
+            invoker.execute_command(UpdateSalaryCommand(company, 2, salary))
+        applied = []
+        original = behavioral._apply_operations
+        monkeypatch.setattr(behavioral, '_apply_operations', lambda ops: (applied.append(ops), original(ops)))
+
+        # Act / Assert
+        invoker.goto(50)
+        assert company.find_employee_by_id(2).base_salary == 50
+        assert len(applied) == 50
+
+        applied.clear()
+        invoker.goto(1000)
+        assert company.find_employee_by_id(2).base_salary == 1000
+        assert len(applied) == 100
+
+    def test_goto_steps_when_restore_is_costlier(self, company, monkeypatch):
+        """
+        Тест: в большой компании близкий переход идёт по шагам, а не через снимок.
+
+        Arrange: компания на 2000 сотрудников, 300 команд, снимок раз в 100
+        Act: goto(150) с позиции 298
+        Assert: снимок не восстанавливался, применено 148 записей журнала
+        """
+        # Arrange
+        for emp_id in range(3, 2003):
+            company.get_departments()[1].add_employee(OrdinaryEmployee(emp_id, f"E{emp_id}", "QA", 1000))
+        invoker = CommandInvoker(company, checkpoint_every=100)
+        for salary in range(1, 301):
+            invoker.execute_command(UpdateSalaryCommand(company, 2, salary))
+        invoker.goto(298)
+        applied, restored = [], []
+        original = behavioral._apply_operations
+        monkeypatch.setattr(behavioral, '_apply_operations', lambda ops: (applied.append(ops), original(ops)))
+        monkeypatch.setattr(CommandInvoker, '_restore', staticmethod(restored.append))
+
+        # Act
+        invoker.goto(150)
+
+        # Assert
+        assert restored == []
+        assert len(applied) == 148
+        assert company.find_employee_by_id(2).base_salary == 150
+
+    def test_goto_restores_hired_employee_state(self, company):
+        """
+        Тест: после снимка повтор найма восстанавливает состояние на момент найма.
+        """
+        invoker = CommandInvoker(company, checkpoint_every=2)
+        carol = OrdinaryEmployee(3, "Carol", "QA", 100)
+        invoker.execute_command(HireEmployeeCommand(company, carol))
+        invoker.execute_command(UpdateSalaryCommand(company, 3, 200))
+        invoker.execute_command(UpdateSalaryCommand(company, 3, 300))
+        invoker.execute_command(FireEmployeeCommand(company, 3))
+
+        invoker.goto(1)
+        assert company.find_employee_by_id(3).base_salary == 100
+        invoker.goto(3)
+        assert company.find_employee_by_id(3).base_salary == 300
+        invoker.goto(0)
+        assert company.find_employee_by_id(3) is None
+        invoker.goto(4)
+        assert company.find_employee_by_id(3) is None
+
+        with pytest.raises(ValueError):
+            invoker.goto(5)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
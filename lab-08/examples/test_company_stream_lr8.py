@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+ЛР№8: Потоковая генерация компании в CompanyBuilder
+===================================================
+
+Модуль содержит тесты для проверки:
+- Создания реальных объектов абстрактными фабриками
+- Ленивого stream() и пакетного add_many()
+- Потокового режима с приёмниками JSON Lines, SQLite и Department
+- Отключаемого вывода фабрик
+
+Для запуска:
+    pytest test_company_stream_lr8.py -v
+"""
+
+import json
+import pytest
+import sys
+import os
+
+# Добавляем path для импорта из src
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+try:
+    from patterns.creational.abstract_factory import (
+        CompanyBuilder, DepartmentSink, JsonLinesSink, SalesCompanyFactory,
+        SqliteSink, TechCompanyFactory
+    )
+    from patterns.creational.singleton import DatabaseConnection
+    from organization.department import Department
+    from organization.project import Project
+    from specialists.developer import Developer
+    from specialists.manager import Manager
+    from specialists.salesperson import Salesperson
+except ImportError as e:
+    pytest.skip(f"Cannot import classes: {e}", allow_module_level=True)
+
+
+def specs():
+    """Описания компонентов небольшой компании."""
+    return [
+        ('department', "DEV"),
+        ('manager', 1, "Alice", "DEV", 5000, 1000),
+        ('developer', 2, "Bob", "DEV", 4000, "senior", ["Python"]),
+        ('salesperson', 3, "Carol", "DEV", 3000, 0.05),
+        ('project', 10, "Portal", "Client portal", "2026-12-31"),
+    ]
+
+
+COUNTS = {'managers': 1, 'developers': 1, 'salespersons': 1, 'departments': 1, 'projects': 1}
+
+
+@pytest.fixture
+def db(tmp_path):
+    """Новый экземпляр DatabaseConnection с созданной схемой."""
+    db = DatabaseConnection.get_instance(str(tmp_path / 'company.db'), pool_size=2)
+    db.create_tables()
+    yield db
+    db.close_connection()
+
+
+class TestFactories:
+    """
+    Тесты объектов, создаваемых фабриками.
+    """
+
+    def test_tech_factory_objects(self):
+        """
+        Тест: ИТ-фабрика создаёт объекты с правилами ИТ-компании.
+        """
+        factory = TechCompanyFactory(verbose=False)
+
+        manager = factory.create_manager(1, "Alice", "DEV", 5000, 1000)
+        seller = factory.create_salesperson(2, "Carol", "DEV", 3000, 0.05)
+        project = factory.create_project(3, "Portal", "Client portal", "2026-12-31")
+
+        assert isinstance(manager, Manager) and manager.bonus == 1500
+        assert isinstance(seller, Salesperson) and seller.commission_rate == pytest.approx(0.1)
+        assert isinstance(project, Project) and project.status == "planning"
+        assert isinstance(factory.create_department("DEV"), Department)
+
+    def test_sales_factory_objects(self):
+        """
+        Тест: Sales-фабрика удваивает бонус и ограничивает комиссию.
+        """
+        factory = SalesCompanyFactory(verbose=False)
+
+        manager = factory.create_manager(1, "Alice", "SALES_EU", 5000, 1000)
+        seller = factory.create_salesperson(2, "Carol", "SALES_EU", 3000, 0.3)
+
+        assert manager.bonus == 2000
+        assert seller.commission_rate == 0.15
+
+    def test_verbose_output(self, capsys):
+        """
+        Тест: по умолчанию фабрика печатает сообщения, с verbose=False - нет.
+        """
+        TechCompanyFactory().create_developer(1, "Bob", "DEV", 4000, "junior", [])
+        verbose = capsys.readouterr().out
+
+        CompanyBuilder(TechCompanyFactory(verbose=False)).add_many(specs()).build()
+
+        assert "Создание Tech-Developer: Bob" in verbose
+        assert "Стек по умолчанию" in verbose
+        assert capsys.readouterr().out == ""
+
+
+class TestStream:
+    """
+    Тесты stream() и add_many().
+    """
+
+    def test_add_many_fills_lists(self):
+        """
+        Тест: без приёмника add_many() заполняет списки build().
+
+        Arrange: описания пяти компонентов
+        Act: add_many() и build()
+        Assert: в каждом списке по одному объекту нужного класса
+        """
+        # Arrange
+        builder = CompanyBuilder(TechCompanyFactory(verbose=False))
+
+        # Act
+        company = builder.add_many(specs()).build()
+
+        # Assert
+        assert {key: len(items) for key, items in company.items()} == COUNTS
+        assert isinstance(company['developers'][0], Developer)
+        assert builder.counts == COUNTS
+
+    def test_stream_is_lazy(self):
+        """
+        Тест: stream() не читает описания раньше времени и не хранит компоненты.
+        """
+        def lazy_specs():
+            yield ('manager', 1, "Alice", "DEV", 5000, 1000)
+            raise AssertionError("второе описание прочитано заранее")
+
+        builder = CompanyBuilder(TechCompanyFactory(verbose=False))
+
+        kind, manager = next(builder.stream(lazy_specs()))
+
+        assert kind == 'manager' and manager.name == "Alice"
+        assert builder.managers == [] and not builder.counts
+
+    def test_unknown_kind(self):
+        """
+        Тест: неизвестный вид компонента отклоняется.
+        """
+        builder = CompanyBuilder(TechCompanyFactory(verbose=False))
+
+        with pytest.raises(ValueError, match="Неизвестный вид компонента: 'ceo'"):
+            builder.add_many([('ceo', 1, "Ann")])
+
+
+class TestSinks:
+    """
+    Тесты потокового режима с приёмниками.
+    """
+
+    def test_sink_receives_components(self):
+        """
+        Тест: с приёмником списки пусты, а build() возвращает количество.
+        """
+        received = []
+        builder = CompanyBuilder(TechCompanyFactory(verbose=False),
+                                 lambda kind, component: received.append(kind))
+
+        company = builder.add_many(specs()).add_manager(4, "Dan", "DEV", 4000, 0).build()
+
+        assert received == ['department', 'manager', 'developer', 'salesperson', 'project', 'manager']
+        assert company == dict(COUNTS, managers=2)
+        assert builder.managers == []
+
+    def test_json_lines_sink(self, tmp_path):
+        """
+        Тест: JsonLinesSink пишет по строке JSON на компонент.
+        """
+        path = tmp_path / 'company.jsonl'
+
+        with JsonLinesSink(str(path)) as sink:
+            CompanyBuilder(TechCompanyFactory(verbose=False), sink).add_many(specs()).build()
+
+        records = [json.loads(line) for line in path.read_text(encoding='utf-8').splitlines()]
+        assert [r['kind'] for r in records] == [s[0] for s in specs()]
+        assert records[0] == {'name': "DEV", 'kind': 'department'}
+        assert records[2]['tech_stack'] == ["Python"] and records[2]['type'] == 'developer'
+
+    def test_sqlite_sink(self, db):
+        """
+        Тест: SqliteSink записывает компоненты пачками, остаток - при close().
+
+        Arrange: приёмник с пачкой в 2 строки
+        Act: генерация компании, затем close()
+        Assert: все сотрудники, отдел и проект в таблицах
+        """
+        # Arrange
+        sink = SqliteSink(db, batch_size=2)
+        builder = CompanyBuilder(TechCompanyFactory(verbose=False), sink)
+
+        # Act
+        builder.add_many(specs()).add_department("DEV")
+        saved_before_close = db.execute_query("SELECT COUNT(*) FROM employees")[0][0]
+        sink.close()
+
+        # Assert
+        assert saved_before_close == 2
+        assert db.execute_query("SELECT id, type, seniority FROM employees ORDER BY id") == [
+            (1, 'manager', None), (2, 'developer', 'senior'), (3, 'salesperson', None)]
+        assert db.execute_query("SELECT name FROM departments") == [("DEV",)]
+        assert db.execute_query("SELECT id, status FROM projects") == [(10, "planning")]
+
+    def test_department_sink(self):
+        """
+        Тест: DepartmentSink добавляет в отдел только сотрудников.
+        """
+        department = Department("DEV")
+
+        CompanyBuilder(TechCompanyFactory(verbose=False), DepartmentSink(department)).add_many(specs())
+
+        assert [e.id for e in department] == [1, 2, 3]
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
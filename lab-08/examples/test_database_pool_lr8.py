@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+ЛР№8: Пул подключений SQLite в DatabaseConnection
+================================================
+
+Модуль содержит тесты для проверки:
+- Singleton поверх пула подключений
+- WAL и подключений по потокам
+- Закрытия пула при занятых подключениях и предела закреплений
+- Транзакций (commit, rollback, вложенные savepoint)
+- Пакетной вставки executemany для моделей
+
+Для запуска:
+    pytest test_database_pool_lr8.py -v
+"""
+
+import pytest
+import sqlite3
+import sys
+import os
+import threading
+
+# Добавляем path для импорта из src
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+try:
+    from patterns.creational.singleton import DatabaseConnection, ConnectionPool
+    from organization.department import Department
+    from organization.project import Project
+    from specialists.developer import Developer
+    from specialists.manager import Manager
+except ImportError as e:
+    pytest.skip(f"Cannot import classes: {e}", allow_module_level=True)
+
+
+INSERT_DEPARTMENT = "INSERT INTO departments (name) VALUES (?)"
+
+
+@pytest.fixture
+def db(tmp_path):
+    """Новый экземпляр DatabaseConnection на временной БД."""
+    db = DatabaseConnection.get_instance(str(tmp_path / 'company.db'), pool_size=4, timeout=2.0)
+    db.create_tables()
+    yield db
+    db.close_connection()
+
+
+def department_names(db):
+    return [row[0] for row in db.execute_query("SELECT name FROM departments ORDER BY name")]
+
+
+class TestSingletonPool:
+    """
+    Тесты Singleton и пула подключений.
+    """
+
+    def test_single_instance(self, db):
+        """
+        Тест: все точки доступа возвращают один экземпляр.
+        """
+        assert DatabaseConnection() is db
+        assert DatabaseConnection.get_instance() is db
+
+    def test_wal_and_pragmas(self, db):
+        """
+        Тест: подключения открыты с WAL и foreign_keys.
+        """
+        assert db.execute_query("PRAGMA journal_mode") == [('wal',)]
+        assert db.execute_query("PRAGMA foreign_keys") == [(1,)]
+
+    def test_connection_per_thread(self, db):
+        """
+        Тест: у потоков разные подключения, в потоке - одно.
+
+        Arrange: подключение главного потока
+        Act: получение подключения в другом потоке
+        Assert: подключения различаются
+        """
+        # Arrange
+        main = db.get_connection()
+        assert db.get_connection() is main
+        other = []
+
+        # Act
+        thread = threading.Thread(target=lambda: other.append(db.get_connection()))
+        thread.start()
+        thread.join()
+
+        # Assert
+        assert other[0] is not main
+
+    def test_pinned_connection_returned_on_thread_exit(self, tmp_path):
+        """
+        Тест: закреплённое подключение возвращается в пул после завершения потока.
+        """
+        pool = ConnectionPool(str(tmp_path / 'pool.db'), max_size=1, timeout=0.5)
+
+        for _ in range(3):
+            thread = threading.Thread(target=pool.bind)
+            thread.start()
+            thread.join()
+
+        assert pool.size == 1
+        pool.close_all()
+
+    def test_pool_timeout(self, tmp_path):
+        """
+        Тест: если все подключения заняты, acquire() ждёт и падает по таймауту.
+        """
+        pool = ConnectionPool(str(tmp_path / 'pool.db'), max_size=1, timeout=0.05)
+        pool.acquire()
+        errors = []
+
+        def worker():
+            try:
+                pool.acquire()
+            except RuntimeError as e:
+                errors.append(e)
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+        pool.close_all()
+
+        assert len(errors) == 1
+
+    def test_close_all_waits_for_busy_connection(self, tmp_path):
+        """
+        Тест: close_all() не закрывает подключение, занятое другим потоком.
+
+        Arrange: поток держит подключение, ещё одно свободно
+        Act: close_all() из главного потока
+        Assert: занятое подключение работает и закрывается при возврате
+        """
+        # Arrange
+        pool = ConnectionPool(str(tmp_path / 'pool.db'), max_size=2)
+        taken, closed = threading.Event(), threading.Event()
+        results = []
+
+        def worker():
+            with pool.connection() as connection:
+                taken.set()
+                closed.wait(5)
+                results.append(connection.execute("SELECT 1").fetchone())
+            try:
+                connection.execute("SELECT 1")
+            except sqlite3.ProgrammingError:
+                results.append("closed")
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        taken.wait(5)
+        with pool.connection() as idle:
+            pass
+
+        # Act
+        pool.close_all()
+        closed.set()
+        thread.join()
+
+        # Assert
+        assert results == [(1,), "closed"]
+        assert pool.size == 0
+        with pytest.raises(RuntimeError, match="закрыт"):
+            pool.acquire()
+        with pytest.raises(sqlite3.ProgrammingError):
+            idle.execute("SELECT 1")
+
+    def test_close_all_closes_own_pinned_connection(self, tmp_path):
+        """
+        Тест: закреплённое за текущим потоком подключение закрывается сразу.
+        """
+        pool = ConnectionPool(str(tmp_path / 'pool.db'), max_size=1)
+        connection = pool.bind()
+
+        pool.close_all()
+
+        assert pool.size == 0
+        with pytest.raises(sqlite3.ProgrammingError):
+            connection.execute("SELECT 1")
+
+    def test_all_connections_pinned(self, tmp_path):
+        """
+        Тест: если все подключения закреплены за живыми потоками, ошибка сразу и понятная.
+        """
+        pool = ConnectionPool(str(tmp_path / 'pool.db'), max_size=2, timeout=5)
+        pinned, finish = threading.Barrier(3), threading.Event()
+
+        def holder():
+            pool.bind()
+            pinned.wait()
+            finish.wait(5)
+
+        threads = [threading.Thread(target=holder) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        pinned.wait()
+
+        with pytest.raises(RuntimeError, match="закреплено 2 из 2"):
+            pool.bind()
+
+        finish.set()
+        for thread in threads:
+            thread.join()
+        assert pool.bind() is not None
+        pool.close_all()
+
+
+class TestTransactions:
+    """
+    Тесты явных транзакций.
+    """
+
+    def test_commit(self, db):
+        """
+        Тест: изменения внутри transaction() фиксируются вместе.
+        """
+        with db.transaction():
+            db.execute_update(INSERT_DEPARTMENT, ("DEV",))
+            db.execute_update(INSERT_DEPARTMENT, ("QA",))
+
+        assert department_names(db) == ["DEV", "QA"]
+
+    def test_rollback_on_error(self, db):
+        """
+        Тест: исключение откатывает всю транзакцию.
+        """
+        with pytest.raises(sqlite3.IntegrityError):
+            with db.transaction():
+                db.execute_update(INSERT_DEPARTMENT, ("DEV",))
+                db.execute_update(INSERT_DEPARTMENT, ("DEV",))
+
+        assert department_names(db) == []
+
+    def test_nested_savepoint(self, db):
+        """
+        Тест: откат вложенной транзакции не затрагивает внешнюю.
+
+        Arrange: внешняя транзакция с отделом DEV
+        Act: вложенная транзакция с ошибкой
+        Assert: зафиксирован только DEV
+        """
+        # Arrange / Act
+        with db.transaction():
+            db.execute_update(INSERT_DEPARTMENT, ("DEV",))
+            with pytest.raises(ValueError):
+                with db.transaction():
+                    db.execute_update(INSERT_DEPARTMENT, ("QA",))
+                    raise ValueError("отмена")
+
+        # Assert
+        assert department_names(db) == ["DEV"]
+
+    def test_concurrent_writers(self, db):
+        """
+        Тест: параллельные пишущие потоки не получают "database is locked".
+        """
+        errors = []
+
+        def writer(index):
+            try:
+                for batch in range(5):
+                    with db.transaction():
+                        for n in range(20):
+                            db.execute_update(INSERT_DEPARTMENT, (f"D{index}-{batch}-{n}",))
+            except sqlite3.Error as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=writer, args=(i,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert db.execute_query("SELECT COUNT(*) FROM departments") == [(400,)]
+
+
+class TestBulkInsert:
+    """
+    Тесты пакетной вставки.
+    """
+
+    def test_insert_models(self, db):
+        """
+        Тест: insert_* записывают сотрудников, отделы и проекты.
+        """
+        employees = [Manager(1, "Alice", "DEV", 5000, 1000),
+                     Developer(2, "Bob", "DEV", 4000, "senior", ["Python"])]
+
+        assert db.insert_employees(employees) == 2
+        assert db.insert_departments([Department("DEV"), "QA"]) == 2
+        assert db.insert_projects([Project(1, "Apollo", "test", "2030-12-31", "active")]) == 1
+
+        assert db.execute_query("SELECT id, type FROM employees ORDER BY id") == \
+            [(1, 'manager'), (2, 'developer')]
+        assert department_names(db) == ["DEV", "QA"]
+        assert db.execute_query("SELECT deadline FROM projects") == [("2030-12-31",)]
+
+    def test_executemany_is_atomic(self, db):
+        """
+        Тест: ошибка в executemany откатывает весь пакет.
+        """
+        with pytest.raises(sqlite3.IntegrityError):
+            db.executemany(INSERT_DEPARTMENT, [("DEV",), ("QA",), ("DEV",)])
+
+        assert department_names(db) == []
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+ЛР№8: Пакетное создание сотрудников в EmployeeFactoryManager
+============================================================
+
+Модуль содержит тесты для проверки:
+- Создания объектов сотрудников конкретными фабриками
+- Пакетного create_many() по одному типу
+- create_from_records() с группировкой по типу
+- Паузы сборщика мусора только по запросу (pause_gc)
+- Отключаемого вывода фабрик
+
+Для запуска:
+    pytest test_factory_bulk_lr8.py -v
+"""
+
+import gc
+import pytest
+import sys
+import os
+
+# Добавляем path для импорта из src
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+try:
+    from patterns.creational.factory_method import (
+        EmployeeFactory, EmployeeFactoryManager, ManagerFactory
+    )
+    from specialists.developer import Developer
+    from specialists.manager import Manager
+    from specialists.ordinary_employee import OrdinaryEmployee
+    from specialists.salesperson import Salesperson
+except ImportError as e:
+    pytest.skip(f"Cannot import classes: {e}", allow_module_level=True)
+
+
+def records():
+    """Смешанные записи в формате to_dict()."""
+    return [
+        Manager(1, "Alice", "DEV", 5000, 1000).to_dict(),
+        Developer(2, "Bob", "DEV", 4000, "senior", ["Python"]).to_dict(),
+        Salesperson(3, "Carol", "SALES", 3000, 0.1, 20000).to_dict(),
+        OrdinaryEmployee(4, "Dave", "QA", 2000).to_dict(),
+        Manager(5, "Eve", "QA", 4500, 500).to_dict(),
+    ]
+
+
+class TestConcreteFactories:
+    """
+    Тесты конкретных фабрик.
+    """
+
+    def test_create_employee_returns_objects(self):
+        """
+        Тест: create_employee() создаёт объекты сотрудников.
+        """
+        manager = EmployeeFactoryManager(verbose=False)
+
+        dev = manager.create_employee("developer", 1, "Bob", "DEV", 4000,
+                                      seniority="middle", tech_stack=["Go"])
+        seller = manager.create_employee("salesperson", 2, "Carol", "SALES", 3000,
+                                         commission_rate=0.1, sales_volume=1000)
+
+        assert isinstance(dev, Developer) and dev.calculate_salary() == 6000
+        assert isinstance(seller, Salesperson) and seller.calculate_salary() == 3100
+
+    def test_create_many_matches_create_employee(self):
+        """
+        Тест: пакетное создание даёт те же объекты, что и построчное.
+        """
+        manager = EmployeeFactoryManager(verbose=False)
+        rows = [r for r in records() if r['type'] == 'manager']
+
+        batch = manager.create_many("manager", rows)
+        single = [manager.create_employee("manager", r['id'], r['name'], r['department'],
+                                          r['base_salary'], bonus=r['bonus']) for r in rows]
+
+        assert [e.to_dict() for e in batch] == [e.to_dict() for e in single] == rows
+
+    def test_default_create_many_for_custom_factory(self):
+        """
+        Тест: фабрика без своего create_many() создаёт пачку через create_employee().
+        """
+        class InternFactory(EmployeeFactory):
+            def create_employee(self, emp_id, name, department, base_salary, **kwargs):
+                return OrdinaryEmployee(emp_id, name, department, base_salary * kwargs.get('rate', 1))
+
+            def get_employee_type(self):
+                return "intern"
+
+        manager = EmployeeFactoryManager(verbose=False)
+        manager.register_factory("intern", InternFactory())
+
+        interns = manager.create_many("intern", [
+            {'type': "intern", 'id': 1, 'name': "Ann", 'department': "QA", 'base_salary': 100, 'rate': 0.5}])
+
+        assert interns[0].base_salary == 50
+
+
+class TestCreateFromRecords:
+    """
+    Тесты создания из смешанных записей.
+    """
+
+    def test_groups_by_type_and_keeps_order(self, monkeypatch):
+        """
+        Тест: каждая фабрика вызывается один раз, порядок записей сохраняется.
+
+        Arrange: 5 записей четырёх типов, счётчик вызовов ManagerFactory
+        Act: create_from_records()
+        Assert: объекты в порядке записей, менеджеры созданы одной пачкой
+        """
+        # Arrange
+        manager = EmployeeFactoryManager(verbose=False)
+        calls = []
+        create_many = ManagerFactory.create_many
+        monkeypatch.setattr(ManagerFactory, 'create_many',
+                            lambda self, rows: (calls.append(len(rows)), create_many(self, rows))[1])
+
+        # Act
+        employees = manager.create_from_records(iter(records()))
+
+        # Assert
+        assert [e.to_dict() for e in employees] == records()
+        assert calls == [2]
+
+    def test_unknown_type_creates_nothing(self, monkeypatch):
+        """
+        Тест: незарегистрированный тип отклоняется до создания объектов.
+        """
+        manager = EmployeeFactoryManager(verbose=False)
+        monkeypatch.setattr(ManagerFactory, 'create_many',
+                            lambda self, rows: pytest.fail("фабрика вызвана до проверки типов"))
+
+        with pytest.raises(ValueError, match="ceo"):
+            manager.create_from_records(records() + [{'type': "ceo", 'id': 9}])
+
+    def test_gc_state_restored(self):
+        """
+        Тест: сборщик мусора снова включён после загрузки и после ошибки.
+        """
+        manager = EmployeeFactoryManager(verbose=False)
+
+        manager.create_from_records(records(), pause_gc=True)
+        with pytest.raises(ValueError):
+            manager.create_from_records([{'type': "developer", 'id': 1, 'name': "Bob", 'department': "DEV",
+                                          'base_salary': 1, 'seniority': "guru"}], pause_gc=True)
+
+        assert gc.isenabled()
+
+    @pytest.mark.parametrize("pause_gc", [False, True])
+    def test_gc_enabled_while_reading_records(self, pause_gc, monkeypatch):
+        """
+        Тест: записи вызывающего читаются при включённом сборщике; пауза - только по запросу.
+
+        Arrange: генератор записей и фабрика, запоминающие состояние сборщика
+        Act: create_from_records() и create_many()
+        Assert: при чтении сборщик включён, при создании выключен только с pause_gc
+        """
+        # Arrange
+        manager = EmployeeFactoryManager(verbose=False)
+        reading, creating = [], []
+        create_many = ManagerFactory.create_many
+        monkeypatch.setattr(ManagerFactory, 'create_many',
+                            lambda self, rows: (creating.append(gc.isenabled()), create_many(self, rows))[1])
+
+        def tracked():
+            for record in records():
+                reading.append(gc.isenabled())
+                yield record
+
+        # Act
+        manager.create_from_records(tracked(), pause_gc=pause_gc)
+        manager.create_many("manager", (r for r in tracked() if r['type'] == "manager"), pause_gc=pause_gc)
+
+        # Assert
+        assert all(reading)
+        assert creating == [not pause_gc] * 2
+        assert gc.isenabled()
+
+
+class TestLogging:
+    """
+    Тесты отключаемого вывода фабрик.
+    """
+
+    def test_verbose_output(self, capsys):
+        """
+        Тест: с verbose выводится строка на сотрудника и итог пачки, без него - ничего.
+        """
+        EmployeeFactoryManager().create_employee("employee", 1, "Ann", "QA", 100)
+        EmployeeFactoryManager().create_many("employee", records()[3:4])
+        verbose = capsys.readouterr().out
+
+        quiet_manager = EmployeeFactoryManager(verbose=False)
+        quiet_manager.create_employee("employee", 1, "Ann", "QA", 100)
+        quiet_manager.create_from_records(records())
+
+        assert "Создание OrdinaryEmployee: Ann" in verbose
+        assert "Создано employee: 1" in verbose
+        assert capsys.readouterr().out == ""
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,379 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+ЛР№8: Асинхронная доставка уведомлений Observer
+==============================================
+
+Модуль содержит тесты для проверки:
+- Синхронной доставки по умолчанию
+- Асинхронной доставки через QueuedDispatcher
+- Доставки пачками (batch_size / update_batch)
+- Backpressure на ограниченной очереди и барьера flush()
+- Доставки всем адресатам или никому, публикации из update()
+- Остановки каналов при отписке
+- Индексации зарплат в NotificationSystem
+
+Для запуска:
+    pytest test_notification_dispatch_lr8.py -v
+"""
+
+import pytest
+import queue
+import sys
+import os
+import threading
+
+# Добавляем path для импорта из src
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+try:
+    from patterns.behavioral.behavioral import (
+        Observer, EmployeeSalarySubject, QueuedDispatcher, NotificationSystem,
+        LoggingObserver, AuditObserver, EmailNotificationObserver, ObserverRegistry
+    )
+except ImportError as e:
+    pytest.skip(f"Cannot import classes: {e}", allow_module_level=True)
+
+
+class RecordingObserver(Observer):
+    """Наблюдатель для тестов: запоминает события и пачки."""
+
+    def __init__(self, batch_size: int = 1, gate: threading.Event = None):
+        self.batch_size = batch_size
+        self.gate = gate
+        self.events = []
+        self.batches = []
+
+    def update(self, subject, event_data):
+        if self.gate is not None:
+            self.gate.wait(5)
+        self.events.append(event_data['new_salary'])
+
+    def update_batch(self, events):
+        self.batches.append(len(events))
+        super().update_batch(events)
+
+
+class FailingObserver(Observer):
+    """Наблюдатель, падающий на каждом событии."""
+
+    def update(self, subject, event_data):
+        raise ValueError("сбой наблюдателя")
+
+
+class RepublishingObserver(RecordingObserver):
+    """Наблюдатель, который из update() меняет зарплату наблюдаемого сотрудника."""
+
+    def update(self, subject, event_data):
+        super().update(subject, event_data)
+        if event_data['new_salary'] < 100:
+            subject.salary = event_data['new_salary'] + 100
+            subject.salary = event_data['new_salary'] + 200
+
+
+class TestSynchronousDelivery:
+    """
+    Тесты синхронной доставки (поведение по умолчанию).
+    """
+
+    def test_sync_delivery_is_inline(self):
+        """
+        Тест: без диспетчера наблюдатель получает событие сразу.
+
+        Arrange: сотрудник с наблюдателем
+        Act: изменение зарплаты
+        Assert: событие уже доставлено
+        """
+        # Arrange
+        employee = EmployeeSalarySubject(1, "Alice", 1000)
+        observer = RecordingObserver(batch_size=10)
+        employee.attach(observer)
+
+        # Act
+        employee.salary = 1100
+
+        # Assert
+        assert observer.events == [1100]
+        assert observer.batches == []
+
+
+class TestQueuedDispatcher:
+    """
+    Тесты асинхронной доставки через QueuedDispatcher.
+    """
+
+    def test_notify_does_not_wait_for_observer(self):
+        """
+        Тест: notify() возвращается, пока наблюдатель занят.
+
+        Arrange: наблюдатель, заблокированный на событии
+        Act: два изменения зарплаты
+        Assert: доставка завершается только после разблокировки
+        """
+        # Arrange
+        gate = threading.Event()
+        observer = RecordingObserver(gate=gate)
+        with QueuedDispatcher() as dispatcher:
+            employee = EmployeeSalarySubject(1, "Alice", 1000)
+            employee.set_dispatcher(dispatcher)
+            employee.attach(observer)
+
+            # Act
+            employee.salary = 1100
+            employee.salary = 1200
+
+            # Assert
+            assert observer.events == []
+            assert dispatcher.flush(timeout=0.05) is False
+            gate.set()
+            assert dispatcher.flush(timeout=5) is True
+            assert observer.events == [1100, 1200]
+
+    def test_batches_preserve_order(self):
+        """
+        Тест: наблюдатель с batch_size получает пачки по порядку.
+
+        Arrange: наблюдатель с batch_size=10
+        Act: 95 изменений и flush()
+        Assert: все события по порядку, пачки не больше 10
+        """
+        # Arrange
+        observer = RecordingObserver(batch_size=10)
+        with QueuedDispatcher() as dispatcher:
+            employee = EmployeeSalarySubject(1, "Alice", 0)
+            employee.set_dispatcher(dispatcher)
+            employee.attach(observer)
+
+            # Act
+            for salary in range(1, 96):
+                employee.salary = salary
+            dispatcher.flush()
+
+        # Assert
+        assert observer.events == list(range(1, 96))
+        assert sum(observer.batches) == 95
+        assert max(observer.batches) <= 10
+
+    def test_backpressure_on_full_queue(self):
+        """
+        Тест: при заполненной очереди публикация ждёт, затем queue.Full.
+
+        Arrange: очередь на 2 события, заблокированный наблюдатель
+        Act: публикация сверх ёмкости
+        Assert: queue.Full после put_timeout
+        """
+        # Arrange
+        gate = threading.Event()
+        observer = RecordingObserver(gate=gate)
+        dispatcher = QueuedDispatcher(capacity=2, put_timeout=0.05)
+        employee = EmployeeSalarySubject(1, "Alice", 0)
+        employee.set_dispatcher(dispatcher)
+        employee.attach(observer)
+
+        # Act / Assert
+        with pytest.raises(queue.Full):
+            for salary in range(1, 10):
+                employee.salary = salary
+
+        gate.set()
+        dispatcher.close()
+        assert observer.events == [1, 2, 3]
+
+    def test_observer_errors_are_collected(self):
+        """
+        Тест: ошибка наблюдателя не останавливает доставку остальным.
+
+        Arrange: падающий и обычный наблюдатели
+        Act: два изменения зарплаты
+        Assert: ошибки в errors, обычный наблюдатель получил всё
+        """
+        # Arrange
+        failing, observer = FailingObserver(), RecordingObserver()
+        with QueuedDispatcher() as dispatcher:
+            employee = EmployeeSalarySubject(1, "Alice", 0)
+            employee.set_dispatcher(dispatcher)
+            employee.attach(failing)
+            employee.attach(observer)
+
+            # Act
+            employee.salary = 1
+            employee.salary = 2
+            dispatcher.flush()
+
+        # Assert
+        assert observer.events == [1, 2]
+        assert len(dispatcher.errors) == 2
+        assert dispatcher.errors[0][0] is failing
+
+    def test_full_queue_delivers_to_nobody(self):
+        """
+        Тест: при queue.Full событие не попадает ни в одну очередь.
+
+        Arrange: быстрый и заблокированный наблюдатели, очередь на 1 событие
+        Act: публикация сверх ёмкости заблокированного наблюдателя
+        Assert: queue.Full, быстрый наблюдатель не получил лишнего события
+        """
+        # Arrange
+        gate = threading.Event()
+        slow = RecordingObserver(gate=gate)
+        fast = RecordingObserver()
+        dispatcher = QueuedDispatcher(capacity=1, put_timeout=0.05)
+        employee = EmployeeSalarySubject(1, "Alice", 0)
+        employee.set_dispatcher(dispatcher)
+        employee.attach(fast)
+        employee.attach(slow)
+
+        # Act
+        with pytest.raises(queue.Full):
+            for salary in range(1, 10):
+                employee.salary = salary
+
+        # Assert
+        gate.set()
+        dispatcher.close()
+        assert slow.events == [1, 2]
+        assert fast.events == [1, 2]
+
+    def test_publish_from_observer_does_not_deadlock(self):
+        """
+        Тест: публикация из update() в свою заполненную очередь не ждёт.
+
+        Arrange: наблюдатель, дважды меняющий зарплату в update(), очередь на 1 событие
+        Act: изменение зарплаты
+        Assert: первое повторное событие доставлено, второе - queue.Full в errors
+        """
+        # Arrange
+        observer = RepublishingObserver()
+        dispatcher = QueuedDispatcher(capacity=1)
+        employee = EmployeeSalarySubject(1, "Alice", 0)
+        employee.set_dispatcher(dispatcher)
+        employee.attach(observer)
+
+        # Act
+        employee.salary = 1
+        delivered = dispatcher.flush(timeout=5)
+
+        # Assert
+        assert delivered
+        assert observer.events == [1, 101]
+        assert [type(error) for _, error in dispatcher.errors] == [queue.Full]
+        dispatcher.close()
+
+    def test_detach_stops_channel(self):
+        """
+        Тест: после detach() поток наблюдателя доставляет остаток и завершается.
+        """
+        gate = threading.Event()
+        observer = RecordingObserver(gate=gate)
+        dispatcher = QueuedDispatcher()
+        employee = EmployeeSalarySubject(1, "Alice", 0)
+        employee.set_dispatcher(dispatcher)
+        employee.attach(observer)
+        employee.salary = 1
+        thread = dispatcher._channels[id(observer)]._thread
+
+        employee.detach(observer)
+        gate.set()
+        thread.join(5)
+
+        assert not thread.is_alive()
+        assert dispatcher._channels == {}
+        assert observer.events == [1]
+
+    def test_reattach_reuses_stopping_channel(self):
+        """
+        Тест: повторная подписка до остановки канала сохраняет порядок доставки.
+        """
+        gate = threading.Event()
+        observer = RecordingObserver(gate=gate)
+        with QueuedDispatcher() as dispatcher:
+            employee = EmployeeSalarySubject(1, "Alice", 0)
+            employee.set_dispatcher(dispatcher)
+            employee.attach(observer)
+            employee.salary = 1
+            channel = dispatcher._channels[id(observer)]
+
+            employee.detach(observer)
+            employee.attach(observer)
+            employee.salary = 2
+            gate.set()
+            dispatcher.flush(timeout=5)
+
+            assert dispatcher._channels[id(observer)] is channel
+            assert observer.events == [1, 2]
+
+    def test_registry_unsubscribe_stops_channel(self):
+        """
+        Тест: канал останавливается после отмены последней подписки наблюдателя.
+        """
+        dispatcher = QueuedDispatcher()
+        registry = ObserverRegistry(dispatcher)
+        observer = RecordingObserver()
+        by_type = registry.subscribe(observer, 'salary_changed')
+        everything = registry.subscribe(observer)
+        EmployeeSalarySubject(1, "Alice", 0, registry=registry).salary = 1
+        thread = dispatcher._channels[id(observer)]._thread
+
+        by_type.cancel()
+        assert thread.is_alive()
+        everything.cancel()
+        thread.join(5)
+
+        assert not thread.is_alive()
+        assert observer.events == [1]
+
+    def test_dispatch_after_close_fails(self):
+        """
+        Тест: закрытый диспетчер не принимает события.
+        """
+        dispatcher = QueuedDispatcher()
+        employee = EmployeeSalarySubject(1, "Alice", 0)
+        employee.set_dispatcher(dispatcher)
+        employee.attach(RecordingObserver())
+        dispatcher.close()
+
+        with pytest.raises(RuntimeError):
+            employee.salary = 1
+
+
+class TestNotificationSystemIndexation:
+    """
+    Тесты индексации зарплат в NotificationSystem.
+    """
+
+    @pytest.mark.parametrize("dispatcher", [None, "queued"])
+    def test_index_salaries(self, dispatcher, tmp_path):
+        """
+        Тест: индексация доставляет события всем наблюдателям.
+
+        Arrange: система с 250 сотрудниками и тремя наблюдателями
+        Act: индексация на 10% и flush()
+        Assert: лог и аудит содержат все изменения
+        """
+        # Arrange
+        system = NotificationSystem(QueuedDispatcher() if dispatcher else None)
+        log_file = tmp_path / 'salary_changes.log'
+        logging_observer, audit_observer = LoggingObserver(str(log_file)), AuditObserver()
+        for observer in (EmailNotificationObserver(), logging_observer, audit_observer):
+            system.register_observer(observer)
+        for emp_id in range(1, 251):
+            system.add_employee(emp_id, f"Employee {emp_id}", 1000.0)
+
+        # Act
+        changed = system.index_salaries(10)
+        assert system.flush(timeout=5)
+
+        # Assert
+        assert changed == 250
+        assert len(logging_observer.log_entries) == 250
+        assert [e['employee_id'] for e in audit_observer.audit_log] == list(range(1, 251))
+        assert system.employees[1].salary == 1100.0
+        logging_observer.close()
+        assert log_file.read_text(encoding='utf-8').splitlines() == list(logging_observer.log_entries)
+        if system.dispatcher:
+            system.dispatcher.close()
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+ЛР№8: Общий реестр наблюдателей (ObserverRegistry)
+==================================================
+
+Модуль содержит тесты для проверки:
+- Подписки один раз на все события без списков в объектах
+- Фильтров по сотруднику, отделу, порогу изменения и предикату
+- Отмены подписок
+- NotificationSystem поверх реестра
+
+Для запуска:
+    pytest test_observer_registry_lr8.py -v
+"""
+
+import pytest
+import sys
+import os
+
+# Добавляем path для импорта из src
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+try:
+    from patterns.behavioral.behavioral import (
+        Observer, EmployeeSalarySubject, ObserverRegistry, QueuedDispatcher,
+        NotificationSystem, AuditObserver
+    )
+except ImportError as e:
+    pytest.skip(f"Cannot import classes: {e}", allow_module_level=True)
+
+
+class RecordingObserver(Observer):
+    """Наблюдатель для тестов: запоминает ID сотрудников из событий."""
+
+    def __init__(self):
+        self.employee_ids = []
+
+    def update(self, subject, event_data):
+        self.employee_ids.append(event_data['employee_id'])
+
+
+def make_employees(registry, count=4):
+    departments = ['DEV', 'QA']
+    return [EmployeeSalarySubject(i, f"Employee {i}", 1000.0, departments[i % 2], registry)
+            for i in range(1, count + 1)]
+
+
+class TestGlobalSubscription:
+    """
+    Тесты подписки на все события.
+    """
+
+    def test_one_subscription_for_all_subjects(self):
+        """
+        Тест: одна подписка получает события всех сотрудников.
+
+        Arrange: реестр с одним наблюдателем, 4 сотрудника
+        Act: изменение зарплаты каждого
+        Assert: 4 события, у объектов нет списков наблюдателей
+        """
+        # Arrange
+        registry = ObserverRegistry()
+        observer = RecordingObserver()
+        registry.subscribe(observer, 'salary_changed')
+        employees = make_employees(registry)
+
+        # Act
+        for employee in employees:
+            employee.salary = 2000.0
+
+        # Assert
+        assert observer.employee_ids == [1, 2, 3, 4]
+        assert all(employee._observers is None for employee in employees)
+        assert not hasattr(employees[0], '__dict__')
+
+    def test_other_event_type_not_delivered(self):
+        """
+        Тест: подписка на другой тип события не срабатывает.
+        """
+        registry = ObserverRegistry()
+        observer = RecordingObserver()
+        registry.subscribe(observer, 'employee_hired')
+        employee = make_employees(registry, 1)[0]
+
+        employee.salary = 2000.0
+
+        assert observer.employee_ids == []
+
+    def test_duplicate_subscription_delivers_once(self):
+        """
+        Тест: повторная и пересекающаяся подписки не дублируют доставку.
+        """
+        registry = ObserverRegistry()
+        observer = RecordingObserver()
+        first = registry.subscribe(observer, 'salary_changed')
+        assert registry.subscribe(observer, 'salary_changed') is first
+        registry.subscribe(observer, 'salary_changed', employee_id=1)
+        registry.subscribe(observer)
+        employee = make_employees(registry, 1)[0]
+
+        employee.salary = 2000.0
+
+        assert observer.employee_ids == [1]
+        assert len(registry) == 3
+
+    def test_subscribe_during_cache_fill(self):
+        """
+        Тест: подписка во время заполнения кэша не теряется.
+
+        Arrange: подписка другого наблюдателя между расчётом и записью кэша
+        Act: следующее событие
+        Assert: событие получают оба наблюдателя
+        """
+        # Arrange
+        registry = ObserverRegistry()
+        first, second = RecordingObserver(), RecordingObserver()
+        registry.subscribe(first, 'salary_changed')
+        resolve = registry._resolve_unfiltered
+
+        def resolve_then_subscribe(event_type):
+            observers = resolve(event_type)
+            registry.subscribe(second, 'salary_changed')
+            return observers
+
+        registry._resolve_unfiltered = resolve_then_subscribe
+        employee = make_employees(registry, 1)[0]
+        employee.salary = 2000.0
+        registry._resolve_unfiltered = resolve
+
+        # Act
+        employee.salary = 3000.0
+
+        # Assert
+        assert first.employee_ids == [1, 1]
+        assert second.employee_ids == [1]
+
+
+class TestFilteredSubscription:
+    """
+    Тесты подписок с фильтрами.
+    """
+
+    def test_filters(self):
+        """
+        Тест: фильтры по сотруднику, отделу, порогу и предикату.
+
+        Arrange: четыре наблюдателя с разными фильтрами
+        Act: изменения зарплат на 100 (ID 1-2) и на 1000 (ID 3-4)
+        Assert: каждый получил только подходящие события
+        """
+        # Arrange
+        registry = ObserverRegistry()
+        by_id, by_dept, by_change, by_predicate = (RecordingObserver() for _ in range(4))
+        registry.subscribe(by_id, 'salary_changed', employee_id=3)
+        registry.subscribe(by_dept, 'salary_changed', department='QA')
+        registry.subscribe(by_change, 'salary_changed', min_change=500)
+        registry.subscribe(by_predicate, 'salary_changed',
+                           predicate=lambda event: event['new_salary'] > 1500)
+        employees = make_employees(registry)
+
+        # Act
+        employees[0].salary = 1100.0
+        employees[1].salary = 1100.0
+        employees[2].salary = 2000.0
+        employees[3].salary = 2000.0
+
+        # Assert
+        assert by_id.employee_ids == [3]
+        assert by_dept.employee_ids == [1, 3]
+        assert by_change.employee_ids == [3, 4]
+        assert by_predicate.employee_ids == [3, 4]
+
+    def test_employee_and_department_filters_combined(self):
+        """
+        Тест: employee_id вместе с department проверяет оба условия.
+        """
+        registry = ObserverRegistry()
+        observer = RecordingObserver()
+        registry.subscribe(observer, 'salary_changed', employee_id=1, department='QA')
+        employee = make_employees(registry, 1)[0]  # ID 1 в отделе QA
+
+        employee.salary = 2000.0
+
+        assert observer.employee_ids == [1]
+        employee.department = 'DEV'
+        employee.salary = 3000.0
+        assert observer.employee_ids == [1]
+
+
+class TestUnsubscribe:
+    """
+    Тесты отмены подписок.
+    """
+
+    def test_cancel_and_unsubscribe_observer(self):
+        """
+        Тест: cancel() и unsubscribe_observer() прекращают доставку.
+        """
+        registry = ObserverRegistry()
+        observer = RecordingObserver()
+        subscription = registry.subscribe(observer, 'salary_changed')
+        registry.subscribe(observer, 'salary_changed', department='DEV')
+        employee = make_employees(registry, 2)[1]  # отдел DEV
+
+        assert subscription.cancel() is True
+        assert subscription.cancel() is False
+        employee.salary = 2000.0
+        assert observer.employee_ids == [2]
+
+        assert registry.unsubscribe_observer(observer) == 1
+        employee.salary = 3000.0
+        assert observer.employee_ids == [2]
+        assert len(registry) == 0
+
+
+class TestRegistryIntegration:
+    """
+    Тесты реестра с диспетчером и NotificationSystem.
+    """
+
+    def test_registry_with_queued_dispatcher(self):
+        """
+        Тест: реестр доставляет события через QueuedDispatcher.
+        """
+        observer = RecordingObserver()
+        with QueuedDispatcher() as dispatcher:
+            registry = ObserverRegistry(dispatcher)
+            registry.subscribe(observer, 'salary_changed')
+            for employee in make_employees(registry):
+                employee.salary = 2000.0
+            assert dispatcher.flush(timeout=5)
+
+        assert observer.employee_ids == [1, 2, 3, 4]
+
+    def test_observer_registered_after_employees(self):
+        """
+        Тест: наблюдатель, зарегистрированный позже, получает события всех сотрудников.
+        """
+        system = NotificationSystem()
+        system.add_employee(1, "Alice", 1000.0, department='DEV')
+        system.add_employee(2, "Bob", 1000.0, department='QA')
+        audit = AuditObserver()
+        system.register_observer(audit, 'salary_changed', department='QA')
+
+        system.update_salary(1, 1500.0)
+        system.update_salary(2, 1500.0)
+
+        assert [entry['employee_id'] for entry in audit.audit_log] == [2]
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -285,9 +285,9 @@ class PatternDemonstration:
             print("   - Возможность повтора (Redo)\n")
             
             print("Пример:")
-            print("   invoker = CommandInvoker()")
-            print("   invoker.execute(HireEmployeeCommand('John', 'DEV', 4000))")
-            print("   invoker.execute(UpdateSalaryCommand('John', 4000, 4500))")
+            print("   invoker = CommandInvoker(company)")
+            print("   invoker.execute_command(HireEmployeeCommand(company, john))  # john: ID 7, оклад 4000")
+            print("   invoker.execute_command(UpdateSalaryCommand(company, 7, 4500))")
             print("   invoker.undo()  # Откат зарплаты до 4000")
             print("   invoker.redo()  # Повтор, зарплата снова 4500\n")
             
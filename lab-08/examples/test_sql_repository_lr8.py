@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+ЛР№8: Схема БД с индексами и SQL-репозитории
+===========================================
+
+Модуль содержит тесты для проверки:
+- Хранения Manager/Developer/Salesperson с колонками подтипов
+- Постраничного (keyset) чтения и спецификаций в SQL
+- Агрегатов в SQL (ФОТ по отделам, бюджет проектов)
+- Таблицы project_members и миграции старой схемы
+
+Для запуска:
+    pytest test_sql_repository_lr8.py -v
+"""
+
+import pytest
+import sqlite3
+import sys
+import os
+
+# Добавляем path для импорта из src
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+try:
+    from patterns.creational.singleton import DatabaseConnection
+    from patterns.data_access.data_access import (
+        SqlEmployeeRepository, SqlProjectRepository, Specification,
+        DepartmentSpecification, SalarySpecification, SkillSpecification
+    )
+    from organization.project import Project
+    from specialists.developer import Developer
+    from specialists.manager import Manager
+    from specialists.ordinary_employee import OrdinaryEmployee
+    from specialists.salesperson import Salesperson
+    from base.exceptions import DependencyError, DuplicateIdError, EmployeeNotFoundError
+except ImportError as e:
+    pytest.skip(f"Cannot import classes: {e}", allow_module_level=True)
+
+
+def staff():
+    return [
+        Manager(1, "Alice", "DEV", 5000, 1000),
+        Developer(2, "Bob", "DEV", 4000, "senior", ["Python", "SQL"]),
+        Salesperson(3, "Carol", "SALES", 3000, 0.1, 20000),
+        Developer(4, "Dave", "QA", 2000, "middle", ["Java"]),
+        OrdinaryEmployee(5, "Eve", "QA", 1500),
+    ]
+
+
+@pytest.fixture
+def db(tmp_path):
+    """Новый экземпляр DatabaseConnection с созданной схемой."""
+    db = DatabaseConnection.get_instance(str(tmp_path / 'company.db'), pool_size=2)
+    db.create_tables()
+    yield db
+    db.close_connection()
+
+
+@pytest.fixture
+def employees(db):
+    """Репозиторий сотрудников с пятью сотрудниками разных типов."""
+    repo = SqlEmployeeRepository(db, page_size=2)
+    repo.add_many(staff())
+    return repo
+
+
+class TestSchema:
+    """
+    Тесты схемы и миграции.
+    """
+
+    def test_indexes_used(self, db):
+        """
+        Тест: фильтр по отделу и поиск проектов сотрудника идут по индексам.
+        """
+        plans = [db.execute_query("EXPLAIN QUERY PLAN " + query, params)[0][3] for query, params in (
+            ("SELECT id FROM employees WHERE department = ?", ("DEV",)),
+            ("SELECT id FROM employees WHERE type = ?", ("manager",)),
+            ("SELECT id FROM employees WHERE base_salary > ?", (1000,)),
+            ("SELECT project_id FROM project_members WHERE employee_id = ?", (1,)),
+        )]
+
+        assert all("USING" in plan and "INDEX" in plan for plan in plans)
+
+    def test_old_schema_migrated(self, tmp_path):
+        """
+        Тест: create_tables() добавляет колонки в БД прежней схемы.
+
+        Arrange: БД со старыми таблицами employees и projects
+        Act: create_tables() дважды
+        Assert: старые строки читаются, новые колонки доступны
+        """
+        # Arrange
+        path = str(tmp_path / 'old.db')
+        connection = sqlite3.connect(path)
+        connection.executescript(
+            "CREATE TABLE employees (id INTEGER PRIMARY KEY, name TEXT NOT NULL, "
+            "department TEXT NOT NULL, base_salary REAL NOT NULL, type TEXT NOT NULL);"
+            "CREATE TABLE projects (id INTEGER PRIMARY KEY, name TEXT NOT NULL, "
+            "status TEXT NOT NULL, deadline TEXT NOT NULL);"
+            "INSERT INTO employees VALUES (7, 'Old', 'HR', 100, 'employee');")
+        connection.close()
+        db = DatabaseConnection.get_instance(path)
+
+        # Act
+        db.create_tables()
+        db.create_tables()
+
+        # Assert
+        repo = SqlEmployeeRepository(db)
+        repo.add(Manager(1, "Alice", "DEV", 5000, 1000))
+        assert [e.to_dict()['type'] for e in repo.find_all()] == ['manager', 'employee']
+        assert db.execute_query("SELECT description FROM projects") == []
+        db.close_connection()
+
+
+class TestSqlEmployeeRepository:
+    """
+    Тесты репозитория сотрудников.
+    """
+
+    def test_subtypes_round_trip(self, employees):
+        """
+        Тест: сотрудники восстанавливаются с полями своего подтипа.
+        """
+        assert [e.to_dict() for e in employees.find_all()] == [e.to_dict() for e in staff()]
+        assert employees.find_by_id(99) is None
+
+    def test_duplicate_id(self, employees):
+        """
+        Тест: повторный ID отклоняется, пакет с дубликатом не пишется целиком.
+        """
+        with pytest.raises(DuplicateIdError):
+            employees.add(OrdinaryEmployee(1, "Copy", "QA", 1))
+        with pytest.raises(DuplicateIdError):
+            employees.add_many([OrdinaryEmployee(6, "New", "QA", 1), OrdinaryEmployee(2, "Copy", "QA", 1)])
+
+        assert len(employees) == 5
+
+    def test_update(self, employees):
+        """
+        Тест: update() сохраняет изменённые поля подтипа.
+        """
+        bob = employees.find_by_id(2)
+        bob.seniority_level = "middle"
+        bob.add_skill("Go")
+
+        employees.update(bob)
+
+        assert employees.find_by_id(2).to_dict() == bob.to_dict()
+        with pytest.raises(EmployeeNotFoundError):
+            employees.update(OrdinaryEmployee(99, "Ghost", "QA", 1))
+
+    def test_iter_all_is_paged(self, employees, monkeypatch):
+        """
+        Тест: iter_all() читает страницами по page_size и лениво.
+
+        Arrange: 5 сотрудников, страница 2, счётчик запросов
+        Act: первый элемент, затем полный перебор
+        Assert: сначала 1 запрос, всего 3 запроса
+        """
+        # Arrange
+        queries = []
+        execute_query = employees.db.execute_query
+        monkeypatch.setattr(employees.db, 'execute_query',
+                            lambda query, params=(): (queries.append(query), execute_query(query, params))[1])
+
+        # Act
+        iterator = employees.iter_all()
+        first = next(iterator)
+        assert len(queries) == 1
+        rest = list(iterator)
+
+        # Assert
+        assert [first.id] + [e.id for e in rest] == [1, 2, 3, 4, 5]
+        assert len(queries) == 3
+
+    def test_specifications_in_sql(self, employees):
+        """
+        Тест: спецификации и их комбинации выполняются в SQL.
+        """
+        dev = DepartmentSpecification("DEV")
+
+        assert [e.id for e in employees.find_by_specification(SalarySpecification(2500))] == [1, 2, 3]
+        assert [e.id for e in employees.find_by_specification(
+            SkillSpecification("Java").or_spec(dev))] == [1, 2, 4]
+        assert [e.id for e in employees.iter_all(dev.not_spec(), page_size=1)] == [3, 4, 5]
+        assert employees.count(dev) == 2
+
+    def test_specification_fallback(self, employees):
+        """
+        Тест: спецификация без корректного SQL фильтруется в Python.
+        """
+        class NameSpecification(Specification):
+            def is_satisfied_by(self, candidate):
+                return candidate['name'].startswith('D')
+
+            def get_sql(self):
+                return "WHERE name STARTS WITH 'D'"
+
+        assert [e.name for e in employees.find_by_specification(NameSpecification())] == ["Dave"]
+
+    def test_payroll_matches_calculate_salary(self, employees):
+        """
+        Тест: ФОТ по отделам в SQL совпадает с calculate_salary().
+        """
+        expected = {}
+        for employee in staff():
+            expected[employee.department] = expected.get(employee.department, 0) + employee.calculate_salary()
+
+        assert employees.payroll_by_department() == pytest.approx(expected)
+        assert employees.total_payroll() == pytest.approx(sum(expected.values()))
+        assert employees.headcount_by_type() == {'developer': 2, 'employee': 1, 'manager': 1, 'salesperson': 1}
+        assert employees.salary_range_by_department()['QA'] == (1500, 1750, 2000)
+
+
+class TestSqlProjectRepository:
+    """
+    Тесты репозитория проектов и таблицы project_members.
+    """
+
+    def test_project_team_round_trip(self, employees):
+        """
+        Тест: проект сохраняется и загружается вместе с командой.
+
+        Arrange: проект с двумя участниками
+        Act: сохранение, затем замена участника
+        Assert: команда и бюджет соответствуют последнему сохранению
+        """
+        # Arrange
+        projects = SqlProjectRepository(employees.db, employees)
+        project = Project(1, "Apollo", "Запуск", "2030-12-31", "active")
+        project.add_team_member(employees.find_by_id(1))
+        project.add_team_member(employees.find_by_id(2))
+
+        # Act
+        projects.add(project)
+        project.remove_team_member(1)
+        project.add_team_member(employees.find_by_id(3))
+        projects.add(project)
+
+        # Assert
+        loaded = projects.find_by_id(1)
+        assert (loaded.description, loaded.status) == ("Запуск", "active")
+        assert [e.id for e in loaded.get_team()] == [2, 3]
+        assert projects.budget_by_project() == {1: pytest.approx(project.calculate_total_salary())}
+        assert projects.project_ids_of(3) == [1]
+
+    def test_unknown_member_keeps_team(self, employees):
+        """
+        Тест: участник, которого нет в БД, отклоняется, прежняя команда сохраняется.
+        """
+        projects = SqlProjectRepository(employees.db, employees)
+        project = Project(1, "Apollo", "test", "2030-12-31")
+        project.add_team_member(employees.find_by_id(1))
+        projects.add(project)
+
+        project.add_team_member(OrdinaryEmployee(99, "Ghost", "QA", 1))
+        with pytest.raises(EmployeeNotFoundError):
+            projects.add(project)
+
+        assert [e.id for e in projects.find_by_id(1).get_team()] == [1]
+
+    def test_member_removal_restricted(self, employees):
+        """
+        Тест: участника проекта нельзя удалить, удаление проекта снимает запрет.
+        """
+        projects = SqlProjectRepository(employees.db, employees)
+        project = Project(1, "Apollo", "test", "2030-12-31")
+        project.add_team_member(employees.find_by_id(5))
+        projects.add(project)
+
+        with pytest.raises(DependencyError):
+            employees.remove(5)
+
+        projects.remove(1)
+        employees.remove(5)
+        assert employees.find_by_id(5) is None
+        assert projects.find_all() == []
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -46,6 +46,16 @@ class Department:
         """Возвращает список всех сотрудников отдела."""
         return self.__employees
 
+    def replace_employees(self, employees: List[AbstractEmployee]) -> None:
+        """
+        Заменяет состав отдела целиком (восстановление из снимка).
+
+        :raises TypeError: Если в списке есть объект, не являющийся сотрудником.
+        """
+        if not all(isinstance(e, AbstractEmployee) for e in employees):
+            raise TypeError("В отдел можно добавлять только наследников AbstractEmployee")
+        self.__employees = list(employees)
+
     def calculate_total_salary(self) -> float:
         """
         Рассчитывает общий фонд оплаты труда (ФОТ) отдела.
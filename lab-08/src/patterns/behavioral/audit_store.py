@@ -0,0 +1,550 @@
+# Audit Store (Хранилище аудита)
+# ============================================
+# Журналы наблюдателей Observer на диске с ограниченной памятью:
+# SegmentedAuditStore (сегменты JSON Lines с индексом) и AppendOnlyLog
+# (текстовый лог с ротацией). Оба пишут только в конец файла и делают
+# fsync пачками: раз в fsync_every записей или fsync_interval секунд.
+
+import base64
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict, deque
+from datetime import datetime
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+TimeBound = Union[datetime, str, None]
+
+
+def iso_bound(value: TimeBound) -> Optional[str]:
+    """Граница интервала как строка ISO (timestamp событий сравниваются строками)."""
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def in_range(record: Dict[str, Any], since: Optional[str], until: Optional[str]) -> bool:
+    """Попадает ли timestamp записи в [since, until); без timestamp - только без границ."""
+    timestamp = record.get('timestamp')
+    if since is not None and (timestamp is None or timestamp < since):
+        return False
+    return until is None or (timestamp is not None and timestamp < until)
+
+
+class _BatchedFile:
+    """Файл только на дозапись с fsync пачками."""
+
+    def __init__(self, path: str, fsync_every: int, fsync_interval: Optional[float]):
+        self.path = path
+        self._file = open(path, 'ab')
+        self.size = self._file.tell()
+        self._fsync_every = fsync_every
+        self._fsync_interval = fsync_interval
+        self._pending = 0
+        self._last_sync = time.monotonic()
+
+    def write(self, data: bytes, records: int = 1) -> int:
+        """Дописывает data; возвращает смещение начала записи в файле."""
+        offset = self.size
+        self._file.write(data)
+        self.size += len(data)
+        self._pending += records
+        if self._pending >= self._fsync_every or (
+                self._fsync_interval is not None
+                and time.monotonic() - self._last_sync >= self._fsync_interval):
+            self.sync()
+        return offset
+
+    def flush(self) -> None:
+        """Сбросить буфер в ОС (без fsync), чтобы данные видели читатели."""
+        self._file.flush()
+
+    def sync(self) -> None:
+        """Сбросить буфер и дождаться записи на диск."""
+        if self._pending:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._pending = 0
+        self._last_sync = time.monotonic()
+
+    def close(self) -> None:
+        self.sync()
+        self._file.close()
+
+
+class _BloomFilter:
+    """
+    Фильтр Блума по employee_id закрытого сегмента.
+
+    Размер выбирается при закрытии сегмента (около 10 бит на сотрудника,
+    не больше MAX_BITS) и дальше не меняется; ложные срабатывания
+    возможны (~1%), пропуски - нет. Хэш не зависит от PYTHONHASHSEED,
+    поэтому фильтр сохраняется на диск.
+    """
+
+    MIN_BITS = 1024
+    MAX_BITS = 1 << 19  # 64 КиБ на сегмент
+    HASHES = 7
+
+    def __init__(self, bits: int, data: Optional[bytes] = None):
+        self.bits = bits
+        self.data = bytearray(data) if data is not None else bytearray(bits // 8)
+
+    @classmethod
+    def for_keys(cls, keys: Iterable[Any], count: int) -> '_BloomFilter':
+        bits = cls.MIN_BITS
+        while bits < count * 10 and bits < cls.MAX_BITS:
+            bits <<= 1
+        bloom = cls(bits)
+        for key in keys:
+            bloom.add(key)
+        return bloom
+
+    def _positions(self, key: Any) -> Iterator[int]:
+        # repr различает 1 и "1", как и сравнение id в индексе; равные числа (1, 1.0, True) совпадают
+        if isinstance(key, (bool, float)) and float(key).is_integer():
+            key = int(key)
+        digest = hashlib.blake2b(repr(key).encode('utf-8'), digest_size=8).digest()
+        h1, h2 = int.from_bytes(digest[:4], 'little'), int.from_bytes(digest[4:], 'little') | 1
+        for i in range(self.HASHES):
+            yield (h1 + i * h2) % self.bits
+
+    def add(self, key: Any) -> None:
+        for position in self._positions(key):
+            self.data[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, key: Any) -> bool:
+        return all(self.data[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'bits': self.bits, 'data': base64.b64encode(bytes(self.data)).decode('ascii')}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> '_BloomFilter':
+        return cls(data['bits'], base64.b64decode(data['data']))
+
+
+class _Segment:
+    """
+    Сегмент аудит-лога: границы по времени и индекс смещений строк
+    по employee_id. Для закрытых сегментов в памяти остаются только
+    границы и фильтр Блума по employee_id фиксированного размера,
+    смещения читаются из файла индекса.
+    """
+
+    def __init__(self, number: int):
+        self.number = number
+        self.count = 0
+        self.min_ts: Optional[str] = None
+        self.max_ts: Optional[str] = None
+        self.employees: Optional[Dict[Any, List[int]]] = {}
+        self.filter: Optional[_BloomFilter] = None
+
+    def add(self, record: Dict[str, Any], offset: int) -> None:
+        self.count += 1
+        timestamp = record.get('timestamp')
+        if timestamp is not None:
+            if self.min_ts is None or timestamp < self.min_ts:
+                self.min_ts = timestamp
+            if self.max_ts is None or timestamp > self.max_ts:
+                self.max_ts = timestamp
+        employee_id = record.get('employee_id')
+        if employee_id is not None:
+            self.employees.setdefault(employee_id, []).append(offset)
+
+    def unload(self) -> None:
+        """Заменить индекс в памяти фильтром по employee_id."""
+        self.filter = _BloomFilter.for_keys(self.employees, len(self.employees))
+        self.employees = None
+
+    def may_contain(self, employee_id: Any) -> bool:
+        if self.employees is not None:
+            return employee_id in self.employees
+        return employee_id in self.filter
+
+    def overlaps(self, since: Optional[str], until: Optional[str]) -> bool:
+        if since is None and until is None:
+            return True
+        if self.min_ts is None:
+            return False
+        return ((since is None or self.max_ts >= since)
+                and (until is None or self.min_ts < until))
+
+    def to_index(self) -> Dict[str, Any]:
+        # Пары [id, смещения] вместо словаря: JSON сохраняет тип id
+        return {'count': self.count, 'min_ts': self.min_ts, 'max_ts': self.max_ts,
+                'employees': [[emp_id, offsets] for emp_id, offsets in self.employees.items()]}
+
+    def to_meta(self) -> Dict[str, Any]:
+        return {'count': self.count, 'min_ts': self.min_ts, 'max_ts': self.max_ts,
+                'filter': self.filter.to_dict()}
+
+    @classmethod
+    def from_meta(cls, number: int, meta: Dict[str, Any]) -> '_Segment':
+        segment = cls(number)
+        segment.count, segment.min_ts, segment.max_ts = meta['count'], meta['min_ts'], meta['max_ts']
+        segment.filter = _BloomFilter.from_dict(meta['filter'])
+        segment.employees = None
+        return segment
+
+
+class SegmentedAuditStore:
+    """
+    Аудит-лог только на дозапись, разбитый на сегменты.
+
+    Записи (словари событий) пишутся строками JSON в файлы
+    segment-NNNNNN.jsonl; сегмент закрывается после segment_max_entries
+    записей, и рядом сохраняются его индекс segment-NNNNNN.idx
+    (смещения строк по employee_id) и сводка segment-NNNNNN.meta
+    (количество, границы timestamp, фильтр Блума по employee_id).
+
+    В памяти хранятся только кольцо последних ring_size записей
+    (recent), индекс активного сегмента, разобранные индексы
+    INDEX_CACHE_SIZE последних запрошенных сегментов и сводки закрытых
+    сегментов (не больше 64 КиБ фильтра на сегмент, с max_segments -
+    ограниченное число). При открытии читаются только сводки.
+    query() пропускает сегменты вне интервала времени и сегменты, фильтр
+    которых исключает сотрудника, а внутри сегмента читает только строки
+    из индекса.
+
+    При открытии существующего каталога последний сегмент
+    переиндексируется (и обрезается недописанная строка), так что
+    хранилище переживает аварийное завершение процесса.
+    """
+
+    SEGMENT_RE = re.compile(r'^segment-(\d{6})\.jsonl$')
+    INDEX_CACHE_SIZE = 8  # разобранных индексов закрытых сегментов в памяти
+
+    def __init__(self, directory: str, segment_max_entries: int = 100_000,
+                 ring_size: int = 1000, fsync_every: int = 1000,
+                 fsync_interval: Optional[float] = 1.0,
+                 max_segments: Optional[int] = None):
+        """
+        Args:
+            directory: Каталог сегментов (создаётся при необходимости)
+            segment_max_entries: Записей в сегменте до ротации
+            ring_size: Размер кольца последних записей в памяти
+            fsync_every: fsync после стольких записей
+            fsync_interval: fsync не реже чем раз в столько секунд (None - только по счётчику)
+            max_segments: Хранить не больше сегментов (старые удаляются; None - все)
+        """
+        if segment_max_entries < 1 or ring_size < 0:
+            raise ValueError("segment_max_entries должен быть положительным, ring_size - неотрицательным")
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.segment_max_entries = segment_max_entries
+        self.max_segments = max_segments
+        self.recent: Deque[Dict[str, Any]] = deque(maxlen=ring_size)
+        self._fsync_every = fsync_every
+        self._fsync_interval = fsync_interval
+        self._sealed: List[_Segment] = []
+        self._active: Optional[_Segment] = None
+        self._file: Optional[_BatchedFile] = None
+        self._index_cache: 'OrderedDict[int, Dict[Any, List[int]]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._open()
+
+    # ----- файлы -----
+
+    def _path(self, number: int, suffix: str = '.jsonl') -> str:
+        return os.path.join(self.directory, f"segment-{number:06d}{suffix}")
+
+    def _open(self) -> None:
+        """Загрузка закрытых сегментов и восстановление последнего."""
+        numbers = sorted(int(match.group(1)) for match in map(self.SEGMENT_RE.match, os.listdir(self.directory))
+                         if match)
+        for position, number in enumerate(numbers):
+            is_last = position == len(numbers) - 1
+            index_path, meta_path = self._path(number, '.idx'), self._path(number, '.meta')
+            if not is_last and os.path.exists(meta_path) and os.path.exists(index_path):
+                with open(meta_path, encoding='utf-8') as f:
+                    self._sealed.append(_Segment.from_meta(number, json.load(f)))
+                continue
+            segment = self._rebuild(number)  # активный сегмент или сегмент без сводки
+            if is_last and segment.count < self.segment_max_entries:
+                for path in (index_path, meta_path):
+                    if os.path.exists(path):
+                        os.remove(path)  # сегмент снова активен, индекс устареет
+                self._active = segment
+            else:
+                self._seal(segment)
+        if self._active is None:
+            self._active = _Segment(numbers[-1] + 1 if numbers else 1)
+        self._file = _BatchedFile(self._path(self._active.number), self._fsync_every, self._fsync_interval)
+        for record in self._tail(self.recent.maxlen):
+            self.recent.append(record)
+
+    def _rebuild(self, number: int) -> _Segment:
+        """Индексация сегмента по содержимому; недописанная последняя строка обрезается."""
+        segment = _Segment(number)
+        path = self._path(number)
+        offset = 0
+        with open(path, 'rb') as f:
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break
+                try:
+                    segment.add(json.loads(line), offset)
+                except ValueError:
+                    pass  # повреждённая строка остаётся в файле, но не индексируется
+                offset += len(line)
+        if offset != os.path.getsize(path):
+            with open(path, 'r+b') as f:
+                f.truncate(offset)
+        return segment
+
+    def _write_json(self, number: int, suffix: str, data: Dict[str, Any]) -> None:
+        path = self._path(number, suffix)
+        with open(path + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(path + '.tmp', path)
+
+    def _seal(self, segment: _Segment) -> None:
+        """Сохранить индекс и сводку сегмента и выгрузить индекс из памяти."""
+        self._write_json(segment.number, '.idx', segment.to_index())
+        segment.unload()
+        # сводка пишется после индекса: её наличие означает, что индекс полный
+        self._write_json(segment.number, '.meta', segment.to_meta())
+        self._sealed.append(segment)
+
+    def _rotate(self) -> None:
+        self._file.close()
+        self._seal(self._active)
+        self._active = _Segment(self._active.number + 1)
+        self._file = _BatchedFile(self._path(self._active.number), self._fsync_every, self._fsync_interval)
+        if self.max_segments is not None:
+            while self._sealed and len(self._sealed) + 1 > self.max_segments:
+                oldest = self._sealed.pop(0)
+                self._index_cache.pop(oldest.number, None)
+                for suffix in ('.jsonl', '.idx', '.meta'):
+                    path = self._path(oldest.number, suffix)
+                    if os.path.exists(path):
+                        os.remove(path)
+
+    def _load_offsets(self, segment: _Segment, employee_id: Any) -> List[int]:
+        """
+        Смещения строк сотрудника в закрытом сегменте. Сегменты без
+        сотрудника отсекаются фильтром без чтения индекса;
+        разобранные индексы последних запрошенных сегментов кэшируются.
+        """
+        if not segment.may_contain(employee_id):
+            return []
+        with self._lock:
+            employees = self._index_cache.get(segment.number)
+            if employees is not None:
+                self._index_cache.move_to_end(segment.number)
+        if employees is None:
+            with open(self._path(segment.number, '.idx'), encoding='utf-8') as f:
+                employees = {emp_id: offsets for emp_id, offsets in json.load(f)['employees']}
+            with self._lock:
+                self._index_cache[segment.number] = employees
+                while len(self._index_cache) > self.INDEX_CACHE_SIZE:
+                    self._index_cache.popitem(last=False)
+        return employees.get(employee_id, [])
+
+    def _check_open(self) -> None:
+        if self._file is None:
+            raise RuntimeError("Хранилище аудита закрыто")
+
+    def _tail(self, count: int) -> List[Dict[str, Any]]:
+        """Последние count записей с диска (для кольца после перезапуска)."""
+        chunks = []
+        needed = count
+        for segment in reversed(self._sealed + [self._active]):
+            if needed <= 0:
+                break
+            chunk = deque(self._scan(segment, None, None, None), maxlen=needed)
+            chunks.append(chunk)
+            needed -= len(chunk)
+        return [record for chunk in reversed(chunks) for record in chunk]
+
+    # ----- запись -----
+
+    def append(self, record: Dict[str, Any]) -> None:
+        """Добавить запись."""
+        self.append_many((record,))
+
+    def append_many(self, records: Iterable[Dict[str, Any]]) -> int:
+        """Добавить записи; возвращает их количество."""
+        written = 0
+        with self._lock:
+            self._check_open()
+            for record in records:
+                if self._active.count >= self.segment_max_entries:
+                    self._rotate()
+                line = json.dumps(record, ensure_ascii=False, default=str).encode('utf-8') + b'\n'
+                self._active.add(record, self._file.write(line))
+                self.recent.append(record)
+                written += 1
+        return written
+
+    def sync(self) -> None:
+        """Принудительный fsync активного сегмента."""
+        with self._lock:
+            self._check_open()
+            self._file.sync()
+
+    def close(self) -> None:
+        """fsync и закрытие файла; индекс активного сегмента сохраняется."""
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.close()
+            self._file = None
+            self._write_json(self._active.number, '.idx', self._active.to_index())
+
+    def __enter__(self) -> 'SegmentedAuditStore':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return sum(segment.count for segment in self._sealed) + self._active.count
+
+    @property
+    def segment_count(self) -> int:
+        """Количество сегментов на диске (с активным)."""
+        return len(self._sealed) + 1
+
+    # ----- чтение -----
+
+    def query(self, employee_id: Any = None, since: TimeBound = None,
+              until: TimeBound = None) -> Iterator[Dict[str, Any]]:
+        """
+        Записи в порядке добавления с фильтром по сотруднику и времени.
+
+        Args:
+            employee_id: Только записи этого сотрудника (None - все)
+            since: Начало интервала по timestamp, включительно
+            until: Конец интервала по timestamp, не включительно
+
+        Returns:
+            Итератор записей; читает диск по мере перебора
+        """
+        since, until = iso_bound(since), iso_bound(until)
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+            segments = list(self._sealed)
+            active = self._active
+            # снимок активного сегмента: дописанное после запроса не читается
+            active_offsets = None
+            if employee_id is not None:
+                active_offsets = list(active.employees.get(employee_id, ()))
+            active_snapshot = (active, self._file.size if self._file is not None else None, active_offsets)
+        return self._query(segments, active_snapshot, employee_id, since, until)
+
+    def _query(self, segments: List[_Segment], active_snapshot: Tuple[_Segment, Optional[int], Optional[List[int]]],
+               employee_id: Any, since: Optional[str], until: Optional[str]) -> Iterator[Dict[str, Any]]:
+        for segment in segments:
+            if not segment.overlaps(since, until):
+                continue
+            offsets = None
+            if employee_id is not None:
+                try:
+                    offsets = self._load_offsets(segment, employee_id)
+                except FileNotFoundError:
+                    continue  # сегмент удалён по max_segments
+                if not offsets:
+                    continue
+            yield from self._scan(segment, offsets, since, until)
+        active, size, offsets = active_snapshot
+        if active.overlaps(since, until) and (offsets is None or offsets):
+            yield from self._scan(active, offsets, since, until, size)
+
+    def _scan(self, segment: _Segment, offsets: Optional[List[int]], since: Optional[str],
+              until: Optional[str], size: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        try:
+            f = open(self._path(segment.number), 'rb')
+        except FileNotFoundError:
+            return
+        with f:
+            lines = self._read_at(f, offsets) if offsets is not None else iter(f)
+            read = 0
+            for line in lines:
+                read += len(line)
+                if size is not None and offsets is None and read > size:
+                    break
+                if not line.endswith(b'\n'):
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if in_range(record, since, until):
+                    yield record
+
+    @staticmethod
+    def _read_at(f, offsets: List[int]) -> Iterator[bytes]:
+        for offset in offsets:
+            f.seek(offset)
+            yield f.readline()
+
+
+class AppendOnlyLog:
+    """
+    Текстовый лог только на дозапись с ротацией по размеру.
+
+    Активный файл - path; при превышении max_bytes он переименовывается
+    в path.1, path.2, ... (номер растёт, старые файлы не переименовываются).
+    Файл открывается при первой записи.
+    """
+
+    def __init__(self, path: str, max_bytes: int = 64 * 1024 * 1024,
+                 fsync_every: int = 1000, fsync_interval: Optional[float] = 1.0,
+                 backups: Optional[int] = None):
+        """
+        Args:
+            path: Путь к файлу лога
+            max_bytes: Размер файла до ротации
+            fsync_every: fsync после стольких строк
+            fsync_interval: fsync не реже чем раз в столько секунд
+            backups: Хранить не больше стольких старых файлов (None - все)
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self._fsync_every = fsync_every
+        self._fsync_interval = fsync_interval
+        self._file: Optional[_BatchedFile] = None
+        self._lock = threading.Lock()
+        directory, name = os.path.split(os.path.abspath(path))
+        pattern = re.compile(re.escape(name) + r'\.(\d+)$')
+        self._rotated = sorted(int(match.group(1)) for match in map(pattern.match, os.listdir(directory))
+                               if match) if os.path.isdir(directory) else []
+
+    def write_lines(self, lines: Iterable[str]) -> None:
+        """Дописать строки (без завершающего перевода строки)."""
+        lines = list(lines)
+        if not lines:
+            return
+        data = ''.join(line + '\n' for line in lines).encode('utf-8')
+        with self._lock:
+            if self._file is None:
+                self._file = _BatchedFile(self.path, self._fsync_every, self._fsync_interval)
+            if self._file.size and self._file.size + len(data) > self.max_bytes:
+                self._rotate()
+            self._file.write(data, records=len(lines))
+
+    def _rotate(self) -> None:
+        self._file.close()
+        number = self._rotated[-1] + 1 if self._rotated else 1
+        os.replace(self.path, f"{self.path}.{number}")
+        self._rotated.append(number)
+        if self.backups is not None:
+            while len(self._rotated) > self.backups:
+                os.remove(f"{self.path}.{self._rotated.pop(0)}")
+        self._file = _BatchedFile(self.path, self._fsync_every, self._fsync_interval)
+
+    def sync(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.sync()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
@@ -2,10 +2,23 @@
 # ============================================
 # Observer (Наблюдатель), Strategy (Стратегия), Command (Команда)
 
+import inspect
+import numbers
+import queue
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Callable, Optional
+from collections import deque
+from typing import List, Dict, Any, Callable, Deque, Mapping, Optional, Sequence, Tuple
 from datetime import datetime
 
+try:
+    import numpy as np
+except ImportError:  # NumPy опционален: без него пакетный расчёт бонусов идёт списками
+    np = None
+
+from .audit_store import AppendOnlyLog, SegmentedAuditStore, TimeBound, in_range, iso_bound
+
 
 # ======================== OBSERVER (НАБЛЮДАТЕЛЬ) ========================
 
@@ -13,8 +26,13 @@ class Observer(ABC):
     """
     Абстрактный класс для наблюдателей.
     Определяет интерфейс для получения уведомлений об изменениях.
+    
+    При асинхронной доставке (QueuedDispatcher) наблюдатель с
+    batch_size > 1 получает события пачками через update_batch().
     """
     
+    batch_size: int = 1
+    
     @abstractmethod
     def update(self, subject: 'Subject', event_data: Dict[str, Any]) -> None:
         """
@@ -25,16 +43,50 @@ class Observer(ABC):
             event_data: Данные о событии
         """
         pass
+    
+    def update_batch(self, events: List[Tuple['Subject', Dict[str, Any]]]) -> None:
+        """
+        Обработка пачки событий (до batch_size штук) в порядке публикации.
+        По умолчанию вызывает update() для каждого события.
+        
+        Args:
+            events: Список пар (subject, event_data)
+        """
+        for subject, event_data in events:
+            self.update(subject, event_data)
 
 
 class Subject(ABC):
     """
     Абстрактный класс для объектов, за которыми наблюдают (Subject).
+    
+    Наблюдателей можно подписать на конкретный объект (attach) или
+    один раз на весь поток событий через общий ObserverRegistry:
+    тогда у объекта нет собственного списка наблюдателей.
     """
     
-    def __init__(self):
-        """Инициализация списка наблюдателей."""
-        self._observers: List[Observer] = []
+    __slots__ = ('_observers', '_dispatcher', '_registry')
+    
+    def __init__(self, registry: Optional['ObserverRegistry'] = None):
+        """
+        Инициализация. Список наблюдателей создаётся при первом attach().
+        
+        Args:
+            registry: Общий реестр, в который публикуются события
+        """
+        self._observers: Optional[List[Observer]] = None
+        self._dispatcher: Optional['QueuedDispatcher'] = None
+        self._registry = registry
+    
+    def set_dispatcher(self, dispatcher: Optional['QueuedDispatcher']) -> None:
+        """
+        Установить диспетчер доставки уведомлений.
+        
+        Args:
+            dispatcher: QueuedDispatcher для асинхронной доставки
+                        или None для синхронной (по умолчанию)
+        """
+        self._dispatcher = dispatcher
     
     def attach(self, observer: Observer) -> None:
         """
@@ -43,6 +95,8 @@ class Subject(ABC):
         Args:
             observer: Объект наблюдателя
         """
+        if self._observers is None:
+            self._observers = []
         if observer not in self._observers:
             self._observers.append(observer)
             print(f"[Subject] Наблюдатель {observer.__class__.__name__} подписан")
@@ -54,8 +108,10 @@ class Subject(ABC):
         Args:
             observer: Объект наблюдателя
         """
-        if observer in self._observers:
+        if self._observers and observer in self._observers:
             self._observers.remove(observer)
+            if self._dispatcher is not None:
+                self._dispatcher.release(observer)
             print(f"[Subject] Наблюдатель {observer.__class__.__name__} отписан")
     
     def notify(self, event_data: Dict[str, Any]) -> None:
@@ -65,8 +121,16 @@ class Subject(ABC):
         Args:
             event_data: Данные события
         """
-        print(f"[Subject] Отправка уведомления {len(self._observers)} наблюдателям...")
-        for observer in self._observers:
+        if self._registry is not None:
+            self._registry.publish(self, event_data)
+            if not self._observers:
+                return
+        observers = list(self._observers or ())
+        if self._dispatcher is not None:
+            self._dispatcher.dispatch(self, observers, event_data)
+            return
+        print(f"[Subject] Отправка уведомления {len(observers)} наблюдателям...")
+        for observer in observers:
             observer.update(self, event_data)
 
 
@@ -76,11 +140,16 @@ class EmployeeSalarySubject(Subject):
     Представляет зарплату сотрудника.
     """
     
-    def __init__(self, emp_id: int, name: str, salary: float):
+    __slots__ = ('emp_id', 'name', 'department', '_salary')
+    
+    def __init__(self, emp_id: int, name: str, salary: float,
+                 department: Optional[str] = None,
+                 registry: Optional['ObserverRegistry'] = None):
         """Инициализация сотрудника."""
-        super().__init__()
+        super().__init__(registry)
         self.emp_id = emp_id
         self.name = name
+        self.department = department
         self._salary = salary
     
     @property
@@ -99,6 +168,7 @@ class EmployeeSalarySubject(Subject):
                 'event': 'salary_changed',
                 'employee_id': self.emp_id,
                 'employee_name': self.name,
+                'department': self.department,
                 'old_salary': old_salary,
                 'new_salary': new_salary,
                 'change': new_salary - old_salary,
@@ -109,69 +179,624 @@ class EmployeeSalarySubject(Subject):
 class EmailNotificationObserver(Observer):
     """Наблюдатель - отправляет уведомления по email."""
     
+    batch_size = 100
+    
     def update(self, subject: Subject, event_data: Dict[str, Any]) -> None:
         """Отправка email при изменении зарплаты."""
         if event_data['event'] == 'salary_changed':
             print(f"\n[EmailObserver] EMAIL: Зарплата сотрудника {event_data['employee_name']} "
                   f"изменена с {event_data['old_salary']} на {event_data['new_salary']}")
+    
+    def update_batch(self, events: List[Tuple[Subject, Dict[str, Any]]]) -> None:
+        """Одно письмо-дайджест на пачку изменений."""
+        names = [data['employee_name'] for _, data in events if data['event'] == 'salary_changed']
+        if names:
+            shown = ", ".join(names[:3]) + (f" и ещё {len(names) - 3}" if len(names) > 3 else "")
+            print(f"[EmailObserver] EMAIL-дайджест: изменены зарплаты {len(names)} сотрудников ({shown})")
 
 
 class LoggingObserver(Observer):
-    """Наблюдатель - логирует изменения."""
+    """
+    Наблюдатель - логирует изменения.
+    
+    Строки пишутся в log_file (AppendOnlyLog: ротация по размеру, fsync
+    пачками); в памяти остаются только последние ring_size строк.
+    """
     
-    def __init__(self, log_file: str = "salary_changes.log"):
-        """Инициализация с файлом логов."""
+    batch_size = 1000
+    
+    def __init__(self, log_file: Optional[str] = "salary_changes.log", ring_size: int = 1000,
+                 max_bytes: int = 64 * 1024 * 1024, fsync_every: int = 1000):
+        """
+        Инициализация с файлом логов.
+        
+        Args:
+            log_file: Файл лога (None - только в памяти)
+            ring_size: Сколько последних строк хранить в log_entries
+            max_bytes: Размер файла до ротации
+            fsync_every: fsync после стольких строк
+        """
         self.log_file = log_file
-        self.log_entries: List[str] = []
+        self.log_entries: Deque[str] = deque(maxlen=ring_size)
+        self._log = AppendOnlyLog(log_file, max_bytes, fsync_every) if log_file else None
     
     def update(self, subject: Subject, event_data: Dict[str, Any]) -> None:
         """Логирование изменения."""
         if event_data['event'] == 'salary_changed':
-            log_entry = (f"{event_data['timestamp']} | "
-                        f"{event_data['employee_name']}: "
-                        f"{event_data['old_salary']} -> {event_data['new_salary']} "
-                        f"(Δ {event_data['change']:+.2f})")
-            self.log_entries.append(log_entry)
+            log_entry = self._format(event_data)
+            self._write([log_entry])
             print(f"[LoggingObserver] LOG: {log_entry}")
+    
+    def update_batch(self, events: List[Tuple[Subject, Dict[str, Any]]]) -> None:
+        """Логирование пачки изменений одной записью в консоль."""
+        entries = [self._format(data) for _, data in events if data['event'] == 'salary_changed']
+        self._write(entries)
+        if entries:
+            print(f"[LoggingObserver] LOG: {len(entries)} записей (последняя: {entries[-1]})")
+    
+    def _write(self, entries: List[str]) -> None:
+        self.log_entries.extend(entries)
+        if self._log is not None:
+            self._log.write_lines(entries)
+    
+    def close(self) -> None:
+        """fsync и закрытие файла лога."""
+        if self._log is not None:
+            self._log.close()
+    
+    @staticmethod
+    def _format(event_data: Dict[str, Any]) -> str:
+        return (f"{event_data['timestamp']} | "
+                f"{event_data['employee_name']}: "
+                f"{event_data['old_salary']} -> {event_data['new_salary']} "
+                f"(Δ {event_data['change']:+.2f})")
 
 
 class AuditObserver(Observer):
-    """Наблюдатель - ведёт аудит всех изменений."""
+    """
+    Наблюдатель - ведёт аудит всех изменений.
+    
+    С store=SegmentedAuditStore(...) записи сохраняются на диск, а
+    audit_log - кольцо последних записей хранилища; без store в памяти
+    остаются только последние ring_size записей.
+    """
     
-    def __init__(self):
-        """Инициализация аудита."""
-        self.audit_log: List[Dict[str, Any]] = []
+    batch_size = 1000
+    
+    def __init__(self, store: Optional[SegmentedAuditStore] = None, ring_size: int = 1000):
+        """
+        Инициализация аудита.
+        
+        Args:
+            store: Хранилище аудита на диске
+            ring_size: Размер кольца, если store не задан
+        """
+        self.store = store
+        self.audit_log: Deque[Dict[str, Any]] = store.recent if store is not None else deque(maxlen=ring_size)
+        self.total = len(store) if store is not None else 0
     
     def update(self, subject: Subject, event_data: Dict[str, Any]) -> None:
         """Добавление записи в аудит-лог."""
-        self.audit_log.append(event_data)
-        print(f"[AuditObserver] AUDIT: Запись #{len(self.audit_log)} добавлена в аудит-лог")
+        self._append([event_data])
+        print(f"[AuditObserver] AUDIT: Запись #{self.total} добавлена в аудит-лог")
+    
+    def update_batch(self, events: List[Tuple[Subject, Dict[str, Any]]]) -> None:
+        """Добавление пачки записей в аудит-лог."""
+        first = self.total + 1
+        self._append([data for _, data in events])
+        print(f"[AuditObserver] AUDIT: Записи #{first}-#{self.total} добавлены в аудит-лог")
+    
+    def _append(self, records: List[Dict[str, Any]]) -> None:
+        if self.store is not None:
+            self.store.append_many(records)
+        else:
+            self.audit_log.extend(records)
+        self.total += len(records)
+    
+    def query(self, employee_id: Optional[int] = None, since: TimeBound = None,
+              until: TimeBound = None) -> List[Dict[str, Any]]:
+        """
+        Записи аудита по сотруднику и интервалу времени [since, until).
+        
+        Без store поиск идёт только по кольцу последних записей.
+        """
+        if self.store is not None:
+            return list(self.store.query(employee_id, since, until))
+        since, until = iso_bound(since), iso_bound(until)
+        return [record for record in self.audit_log
+                if (employee_id is None or record.get('employee_id') == employee_id)
+                and in_range(record, since, until)]
+    
+    def close(self) -> None:
+        """Закрытие хранилища аудита."""
+        if self.store is not None:
+            self.store.close()
+
+
+# Отмечает рабочие потоки наблюдателей: из них публикация не ждёт места в очереди
+_worker_thread = threading.local()
+
+
+class _ObserverChannel:
+    """
+    Ограниченная очередь событий одного наблюдателя и её рабочий поток.
+    Поток доставляет события по порядку, пачками до batch_size.
+    
+    Место в очереди сначала резервируется (reserve), затем занимается
+    событием (commit) или освобождается (unreserve) - так диспетчер
+    ставит событие во все очереди или ни в одну. После stop() поток
+    доставляет оставшиеся события и завершается.
+    """
+    
+    def __init__(self, observer: Observer, capacity: int,
+                 on_error: Callable[[Observer, Exception], None],
+                 on_exit: Callable[['_ObserverChannel'], None]):
+        self.observer = observer
+        self._batch_size = max(1, getattr(observer, 'batch_size', 1))
+        self._capacity = capacity
+        self._on_error = on_error
+        self._on_exit = on_exit
+        self._items: deque = deque()
+        self._reserved = 0
+        self._pending = 0  # в очереди + доставляются сейчас
+        self._closed = False
+        self._exited = False
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)  # ждёт рабочий поток
+        self._not_full = threading.Condition(self._lock)   # ждут публикующие потоки
+        self._idle = threading.Condition(self._lock)       # ждёт flush()
+        self._thread = threading.Thread(
+            target=self._run, name=f"observer-{observer.__class__.__name__}", daemon=True
+        )
+        self._thread.start()
+    
+    @property
+    def stopping(self) -> bool:
+        return self._closed
+    
+    def reserve(self, timeout: Optional[float]) -> bool:
+        """
+        Резервирует место в очереди; при заполненной очереди ждёт (backpressure).
+        
+        Returns:
+            False, если канал остановлен
+        """
+        with self._lock:
+            if not self._not_full.wait_for(
+                    lambda: len(self._items) + self._reserved < self._capacity or self._closed, timeout):
+                raise queue.Full(f"Очередь {self.observer.__class__.__name__} переполнена")
+            if self._closed:
+                return False
+            self._reserved += 1
+            return True
+    
+    def commit(self, item: Tuple[Subject, Dict[str, Any]]) -> None:
+        """Ставит событие на зарезервированное место."""
+        with self._lock:
+            self._reserved -= 1
+            self._items.append(item)
+            self._pending += 1
+            self._not_empty.notify()
+    
+    def unreserve(self) -> None:
+        """Освобождает зарезервированное место."""
+        with self._lock:
+            self._reserved -= 1
+            self._not_full.notify()
+            self._not_empty.notify()
+    
+    def _run(self) -> None:
+        _worker_thread.active = True
+        while True:
+            with self._lock:
+                self._not_empty.wait_for(lambda: self._items or (self._closed and not self._reserved))
+                if not self._items:
+                    self._exited = True
+                    break
+                count = min(self._batch_size, len(self._items))
+                batch = [self._items.popleft() for _ in range(count)]
+                self._not_full.notify(count)
+            try:
+                if self._batch_size > 1:
+                    self.observer.update_batch(batch)
+                else:
+                    self.observer.update(*batch[0])
+            except Exception as e:
+                self._on_error(self.observer, e)
+            with self._lock:
+                self._pending -= count
+                if not self._pending:
+                    self._idle.notify_all()
+        self._on_exit(self)
+    
+    def revive(self) -> bool:
+        """Отменяет stop(), если поток ещё не завершился."""
+        with self._lock:
+            if self._exited:
+                return False
+            self._closed = False
+            return True
+    
+    def flush(self, timeout: Optional[float]) -> bool:
+        with self._lock:
+            return self._idle.wait_for(lambda: not self._pending, timeout)
+    
+    def stop(self) -> None:
+        with self._lock:
+            self._closed = True
+            self._not_empty.notify_all()
+            self._not_full.notify_all()
+    
+    def close(self, timeout: Optional[float]) -> None:
+        self.stop()
+        if threading.current_thread() is not self._thread:
+            self._thread.join(timeout)
+
+
+class QueuedDispatcher:
+    """
+    Асинхронная доставка уведомлений Observer.
+    
+    notify() только ставит событие в очередь каждого наблюдателя и
+    сразу возвращает управление; доставкой занимается рабочий поток
+    наблюдателя (порядок событий для наблюдателя сохраняется, медленный
+    наблюдатель не задерживает остальных). Очереди ограничены capacity:
+    при переполнении публикующий поток ждёт (backpressure). flush() -
+    барьер: ждёт доставки всех поставленных событий.
+    
+    Событие ставится во все очереди адресатов или ни в одну: при
+    queue.Full его не получит никто. Наблюдатель, публикующий события
+    из update() (то есть из рабочего потока), не ждёт места в очереди -
+    иначе заполненная очередь его же канала не освободилась бы никогда -
+    и сразу получает queue.Full.
+    
+    release(observer) останавливает канал наблюдателя после доставки
+    оставшихся событий; следующее событие для него заведёт канал снова.
+    
+    Ошибки наблюдателей не останавливают доставку и копятся в errors.
+    """
+    
+    def __init__(self, capacity: int = 10_000, put_timeout: Optional[float] = None):
+        """
+        Args:
+            capacity: Размер очереди каждого наблюдателя
+            put_timeout: Сколько ждать места в очереди (None - без ограничения);
+                         по истечении - queue.Full
+        """
+        if capacity < 1:
+            raise ValueError("capacity должна быть положительной")
+        self.capacity = capacity
+        self.put_timeout = put_timeout
+        self.errors: List[Tuple[Observer, Exception]] = []
+        self._channels: Dict[int, _ObserverChannel] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+    
+    def _channel(self, observer: Observer) -> _ObserverChannel:
+        channel = self._channels.get(id(observer))
+        if channel is None or channel.stopping:
+            with self._lock:
+                if self._closed:
+                    raise RuntimeError("Диспетчер уведомлений закрыт")
+                channel = self._channels.get(id(observer))
+                if channel is None or (channel.stopping and not channel.revive()):
+                    # прежний поток уже доставил всё и завершился
+                    channel = _ObserverChannel(observer, self.capacity, self._record_error,
+                                               self._forget)
+                    self._channels[id(observer)] = channel
+        return channel
+    
+    def _forget(self, channel: _ObserverChannel) -> None:
+        with self._lock:
+            if self._channels.get(id(channel.observer)) is channel:
+                del self._channels[id(channel.observer)]
+    
+    def _reserve(self, observer: Observer, timeout: Optional[float]) -> _ObserverChannel:
+        while True:
+            channel = self._channel(observer)
+            if channel.reserve(timeout):
+                return channel
+    
+    def _record_error(self, observer: Observer, error: Exception) -> None:
+        with self._lock:
+            self.errors.append((observer, error))
+        print(f"[QueuedDispatcher] Ошибка в {observer.__class__.__name__}: {error}")
+    
+    def dispatch(self, subject: Subject, observers: Sequence[Observer], event_data: Dict[str, Any]) -> None:
+        """Ставит событие в очереди наблюдателей (во все или ни в одну)."""
+        item = (subject, event_data)
+        timeout = 0 if getattr(_worker_thread, 'active', False) else self.put_timeout
+        targets = {id(observer): observer for observer in observers}
+        reserved: Dict[int, _ObserverChannel] = {}
+        try:
+            # единый порядок резервирования: публикующие потоки не ждут друг друга по кругу
+            for key in sorted(targets):
+                reserved[key] = self._reserve(targets[key], timeout)
+        except BaseException:
+            for channel in reserved.values():
+                channel.unreserve()
+            raise
+        for key in targets:
+            reserved[key].commit(item)
+    
+    def release(self, observer: Observer) -> None:
+        """
+        Останавливает канал наблюдателя: поток доставит оставшиеся
+        события и завершится, не дожидаясь вызывающего.
+        """
+        channel = self._channels.get(id(observer))
+        if channel is not None:
+            channel.stop()
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Ждёт доставки всех поставленных в очередь событий.
+        
+        Returns:
+            False, если за timeout секунд доставка не завершилась
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for channel in list(self._channels.values()):
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            if not channel.flush(remaining):
+                return False
+        return True
+    
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Доставляет оставшиеся события и останавливает рабочие потоки."""
+        with self._lock:
+            self._closed = True
+        for channel in list(self._channels.values()):
+            channel.close(timeout)
+    
+    def __enter__(self) -> 'QueuedDispatcher':
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+class Subscription:
+    """
+    Подписка наблюдателя в ObserverRegistry.
+    
+    Фильтры: employee_id и department (по ним строятся индексы реестра),
+    min_change (|изменение| не меньше порога) и произвольный predicate.
+    """
+    
+    def __init__(self, registry: 'ObserverRegistry', observer: Observer,
+                 event_type: Optional[str], employee_id: Optional[int],
+                 department: Optional[str], min_change: Optional[float],
+                 predicate: Optional[Callable[[Dict[str, Any]], bool]]):
+        self.registry = registry
+        self.observer = observer
+        self.event_type = event_type
+        self.employee_id = employee_id
+        self.department = department
+        self.min_change = min_change
+        self.predicate = predicate
+        # department проверяется отдельно, только если индекс - по employee_id
+        self._needs_check = (min_change is not None or predicate is not None
+                             or (employee_id is not None and department is not None))
+    
+    def matches(self, event_data: Dict[str, Any]) -> bool:
+        """Проверка фильтров, не покрытых индексом реестра."""
+        if (self.employee_id is not None and self.department is not None
+                and event_data.get('department') != self.department):
+            return False
+        if self.min_change is not None and abs(event_data.get('change', 0)) < self.min_change:
+            return False
+        return self.predicate is None or self.predicate(event_data)
+    
+    def cancel(self) -> bool:
+        """Отменить подписку."""
+        return self.registry.unsubscribe(self)
+
+
+class ObserverRegistry:
+    """
+    Центральный реестр наблюдателей по типу события (topic).
+    
+    Наблюдатель подписывается один раз - на все события типа или с
+    фильтром (сотрудник, отдел, порог изменения) - а объекты только
+    публикуют события: память не зависит от произведения
+    «объекты × наблюдатели». Подписки с employee_id или department
+    лежат в отдельных индексах, поэтому публикация проверяет только
+    подходящие подписки. Списки подписок - кортежи, пересобираемые при
+    подписке, поэтому publish() не берёт блокировок.
+    
+    С dispatcher=QueuedDispatcher(...) доставка асинхронная.
+    """
+    
+    ANY = None  # event_type для подписки на все типы событий
+    
+    def __init__(self, dispatcher: Optional[QueuedDispatcher] = None):
+        self.dispatcher = dispatcher
+        self._global: Dict[Optional[str], Tuple[Subscription, ...]] = {}
+        self._by_employee: Dict[Tuple[Optional[str], int], Tuple[Subscription, ...]] = {}
+        self._by_department: Dict[Tuple[Optional[str], str], Tuple[Subscription, ...]] = {}
+        self._subscriptions: Dict[tuple, Subscription] = {}
+        # topic -> готовый кортеж наблюдателей, если фильтров нет (None - есть)
+        self._unfiltered: Dict[Optional[str], Optional[Tuple[Observer, ...]]] = {}
+        self._lock = threading.Lock()
+    
+    def subscribe(self, observer: Observer, event_type: Optional[str] = ANY, *,
+                  employee_id: Optional[int] = None, department: Optional[str] = None,
+                  min_change: Optional[float] = None,
+                  predicate: Optional[Callable[[Dict[str, Any]], bool]] = None) -> Subscription:
+        """
+        Подписать наблюдателя. Повторная подписка с теми же параметрами
+        возвращает существующую.
+        
+        Args:
+            observer: Наблюдатель
+            event_type: Тип события ('salary_changed') или ANY
+            employee_id: Только события этого сотрудника
+            department: Только события сотрудников отдела
+            min_change: Только изменения не меньше порога по модулю
+            predicate: Дополнительный фильтр по event_data
+            
+        Returns:
+            Subscription для отмены подписки
+        """
+        key = (id(observer), event_type, employee_id, department, min_change, predicate)
+        with self._lock:
+            existing = self._subscriptions.get(key)
+            if existing is not None:
+                return existing
+            subscription = Subscription(self, observer, event_type, employee_id,
+                                        department, min_change, predicate)
+            index, slot = self._slot(subscription)
+            index[slot] = index.get(slot, ()) + (subscription,)
+            self._subscriptions[key] = subscription
+            self._unfiltered = {}
+        print(f"[ObserverRegistry] {observer.__class__.__name__} подписан на "
+              f"{event_type or 'все события'}")
+        return subscription
+    
+    def unsubscribe(self, subscription: Subscription) -> bool:
+        """Отменить подписку; False, если её нет."""
+        key = (id(subscription.observer), subscription.event_type, subscription.employee_id,
+               subscription.department, subscription.min_change, subscription.predicate)
+        with self._lock:
+            if self._subscriptions.get(key) is not subscription:
+                return False
+            del self._subscriptions[key]
+            index, slot = self._slot(subscription)
+            remaining = tuple(s for s in index[slot] if s is not subscription)
+            if remaining:
+                index[slot] = remaining
+            else:
+                del index[slot]
+            self._unfiltered = {}
+            last = not any(s.observer is subscription.observer for s in self._subscriptions.values())
+        if last and self.dispatcher is not None:
+            self.dispatcher.release(subscription.observer)
+        return True
+    
+    def unsubscribe_observer(self, observer: Observer) -> int:
+        """Отменить все подписки наблюдателя; возвращает их количество."""
+        subscriptions = [s for s in list(self._subscriptions.values()) if s.observer is observer]
+        return sum(self.unsubscribe(s) for s in subscriptions)
+    
+    def _slot(self, subscription: Subscription) -> Tuple[dict, Any]:
+        if subscription.employee_id is not None:
+            return self._by_employee, (subscription.event_type, subscription.employee_id)
+        if subscription.department is not None:
+            return self._by_department, (subscription.event_type, subscription.department)
+        return self._global, subscription.event_type
+    
+    def _resolve_unfiltered(self, event_type: Optional[str]) -> Optional[Tuple[Observer, ...]]:
+        """Кортеж наблюдателей topic, если ни одна подписка не требует проверки события."""
+        if self._by_employee or self._by_department:
+            return None
+        topics = (event_type, None) if event_type is not None else (None,)
+        subscriptions = [s for topic in topics for s in self._global.get(topic, ())]
+        if any(s._needs_check for s in subscriptions):
+            return None
+        return tuple(dict.fromkeys(s.observer for s in subscriptions))
+    
+    def observers_for(self, event_data: Dict[str, Any]) -> Sequence[Observer]:
+        """Наблюдатели, которым адресовано событие (без повторов, в порядке подписки)."""
+        event_type = event_data.get('event')
+        # subscribe()/unsubscribe() заменяют словарь целиком: результат, посчитанный
+        # по устаревшим подпискам, попадёт только в уже заменённый словарь
+        cache = self._unfiltered
+        try:
+            unfiltered = cache[event_type]
+        except KeyError:
+            unfiltered = cache[event_type] = self._resolve_unfiltered(event_type)
+        if unfiltered is not None:
+            return unfiltered
+        
+        sources = []
+        for topic in (event_type, None) if event_type is not None else (None,):
+            subscriptions = self._global.get(topic)
+            if subscriptions:
+                sources.append(subscriptions)
+            if self._by_employee:
+                subscriptions = self._by_employee.get((topic, event_data.get('employee_id')))
+                if subscriptions:
+                    sources.append(subscriptions)
+            if self._by_department:
+                subscriptions = self._by_department.get((topic, event_data.get('department')))
+                if subscriptions:
+                    sources.append(subscriptions)
+        
+        observers = [subscription.observer for subscriptions in sources for subscription in subscriptions
+                     if not subscription._needs_check or subscription.matches(event_data)]
+        if len(sources) > 1:
+            observers = list(dict.fromkeys(observers))
+        return observers
+    
+    def publish(self, subject: Subject, event_data: Dict[str, Any]) -> int:
+        """
+        Доставить событие подписчикам.
+        
+        Returns:
+            Количество наблюдателей, которым адресовано событие
+        """
+        observers = self.observers_for(event_data)
+        if not observers:
+            return 0
+        if self.dispatcher is not None:
+            self.dispatcher.dispatch(subject, observers, event_data)
+        else:
+            for observer in observers:
+                observer.update(subject, event_data)
+        return len(observers)
+    
+    def __len__(self) -> int:
+        return len(self._subscriptions)
 
 
 class NotificationSystem:
     """
     Система уведомлений.
     Управляет наблюдателями и сотрудниками.
+    
+    Наблюдатели подписываются один раз в общем ObserverRegistry;
+    сотрудники только публикуют в него события. С
+    dispatcher=QueuedDispatcher(...) изменения зарплат не ждут
+    наблюдателей; flush() дожидается доставки.
     """
     
-    def __init__(self):
-        """Инициализация системы."""
+    def __init__(self, dispatcher: Optional[QueuedDispatcher] = None,
+                 registry: Optional[ObserverRegistry] = None):
+        """
+        Инициализация системы.
+        
+        Args:
+            dispatcher: Диспетчер асинхронной доставки (None - синхронная)
+            registry: Общий реестр наблюдателей (по умолчанию создаётся свой)
+        """
+        if registry is None:
+            registry = ObserverRegistry(dispatcher)
+        self.registry = registry
+        self.dispatcher = registry.dispatcher
         self.employees: Dict[int, EmployeeSalarySubject] = {}
         self.observers: List[Observer] = []
     
-    def register_observer(self, observer: Observer) -> None:
-        """Регистрация глобального наблюдателя."""
+    def register_observer(self, observer: Observer, event_type: Optional[str] = None,
+                          **filters) -> Subscription:
+        """
+        Регистрация глобального наблюдателя.
+        
+        Args:
+            observer: Наблюдатель
+            event_type: Тип события (None - все события)
+            **filters: employee_id, department, min_change, predicate
+                       (см. ObserverRegistry.subscribe)
+        """
         self.observers.append(observer)
+        subscription = self.registry.subscribe(observer, event_type, **filters)
         print(f"[NotificationSystem] Наблюдатель {observer.__class__.__name__} зарегистрирован")
+        return subscription
     
-    def add_employee(self, emp_id: int, name: str, salary: float) -> None:
+    def add_employee(self, emp_id: int, name: str, salary: float,
+                     department: Optional[str] = None) -> None:
         """Добавление сотрудника в систему."""
-        employee = EmployeeSalarySubject(emp_id, name, salary)
-        
-        # Подписываем всех глобальных наблюдателей
-        for observer in self.observers:
-            employee.attach(observer)
-        
+        employee = EmployeeSalarySubject(emp_id, name, salary, department, registry=self.registry)
         self.employees[emp_id] = employee
         print(f"[NotificationSystem] Сотрудник {name} добавлен в систему")
     
@@ -181,15 +806,71 @@ class NotificationSystem:
             self.employees[emp_id].salary = new_salary
         else:
             print(f"[NotificationSystem] Сотрудник {emp_id} не найден")
+    
+    def index_salaries(self, percent: float) -> int:
+        """
+        Индексация зарплат всех сотрудников.
+        
+        Args:
+            percent: Процент индексации (например, 5.0)
+            
+        Returns:
+            Количество изменённых зарплат
+        """
+        factor = 1 + percent / 100
+        changed = 0
+        for employee in self.employees.values():
+            new_salary = round(employee.salary * factor, 2)
+            if new_salary != employee.salary:
+                employee.salary = new_salary
+                changed += 1
+        print(f"[NotificationSystem] Индексация {percent}%: изменено зарплат: {changed}")
+        return changed
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Дождаться доставки уведомлений (при синхронной доставке - сразу True)."""
+        if self.dispatcher is None:
+            return True
+        return self.dispatcher.flush(timeout)
 
 
 # ======================== STRATEGY (СТРАТЕГИЯ) ========================
 
+# Параметры пакетного расчёта: {имя kwargs calculate_bonus(): столбец значений
+# по сотрудникам или одно значение для всех}
+BonusParams = Mapping[str, Any]
+
+
+def _column(name: str, values: Any, count: int) -> Any:
+    """
+    Проверить столбец параметра длины count; одно число возвращается как есть.
+    
+    Raises:
+        ValueError: Если длина столбца не совпадает с числом сотрудников
+    """
+    if isinstance(values, numbers.Number):
+        return values
+    if len(values) != count:
+        raise ValueError(f"Параметр '{name}': {len(values)} значений, ожидалось {count}")
+    return values
+
+
+def _values(values: Any, count: int) -> Sequence[Any]:
+    """Значения столбца списком (одно число размножается на count сотрудников)."""
+    return [values] * count if isinstance(values, numbers.Number) else values
+
+
 class BonusStrategy(ABC):
     """
     Абстрактная стратегия расчета бонуса.
     """
     
+    # Стратегия без состояния: все её экземпляры считают одинаково, и
+    # calculate_total_salaries() объединяет их в одну группу. Флаг не
+    # наследуется: подкласс объявляет его сам, а экземпляр с атрибутами
+    # всегда считается отдельно
+    STATELESS = False
+    
     @abstractmethod
     def calculate_bonus(self, base_salary: float, **kwargs) -> float:
         """
@@ -204,6 +885,33 @@ class BonusStrategy(ABC):
         """
         pass
     
+    def calculate_bonus_many(self, base_salaries: Sequence[float],
+                             params: Optional[BonusParams] = None) -> Sequence[float]:
+        """
+        Пакетный расчёт бонусов: для каждого сотрудника тот же результат,
+        что и calculate_bonus().
+        
+        Реализация по умолчанию вызывает calculate_bonus() по строкам
+        (параметры, которых calculate_bonus() не принимает, пропускаются);
+        стандартные стратегии считают сразу весь столбец и ничего не печатают.
+        
+        Args:
+            base_salaries: Столбец базовых зарплат
+            params: Столбцы параметров calculate_bonus() (отсутствующий
+                    параметр берётся по умолчанию)
+            
+        Returns:
+            Столбец бонусов (np.ndarray, если доступен NumPy)
+        """
+        count = len(base_salaries)
+        accepted = inspect.signature(self.calculate_bonus).parameters
+        takes_any = any(p.kind is inspect.Parameter.VAR_KEYWORD for p in accepted.values())
+        columns = {name: _values(_column(name, values, count), count)
+                   for name, values in (params or {}).items() if takes_any or name in accepted}
+        bonuses = [self.calculate_bonus(base, **{name: column[i] for name, column in columns.items()})
+                   for i, base in enumerate(base_salaries)]
+        return np.asarray(bonuses, dtype=float) if np is not None else bonuses
+    
     @abstractmethod
     def get_description(self) -> str:
         """Описание стратегии."""
@@ -213,6 +921,8 @@ class BonusStrategy(ABC):
 class PerformanceBonusStrategy(BonusStrategy):
     """Стратегия бонуса за производительность."""
     
+    STATELESS = True
+    
     def calculate_bonus(self, base_salary: float, performance_rating: float = 1.0) -> float:
         """
         Бонус = базовая зарплата * (рейтинг - 1.0)
@@ -226,11 +936,26 @@ class PerformanceBonusStrategy(BonusStrategy):
         """
         # Бонус только если рейтинг > 1.0
         if performance_rating > 1.0:
-            bonus = base_salary * (performance_rating - 1.0)
+            bonus = self._bonus(base_salary, performance_rating)
             print(f"[PerformanceStrategy] Бонус за производительность ({performance_rating}): {bonus}")
             return bonus
         return 0.0
     
+    def calculate_bonus_many(self, base_salaries: Sequence[float],
+                             params: Optional[BonusParams] = None) -> Sequence[float]:
+        """Пакетный расчёт по столбцу performance_rating (по умолчанию 1.0)."""
+        ratings = _column('performance_rating', (params or {}).get('performance_rating', 1.0),
+                          len(base_salaries))
+        if np is not None:
+            ratings = np.asarray(ratings, dtype=float)
+            return np.where(ratings > 1.0, np.asarray(base_salaries, dtype=float) * (ratings - 1.0), 0.0)
+        return [self._bonus(base, rating) if rating > 1.0 else 0.0
+                for base, rating in zip(base_salaries, _values(ratings, len(base_salaries)))]
+    
+    @staticmethod
+    def _bonus(base_salary: float, performance_rating: float) -> float:
+        return base_salary * (performance_rating - 1.0)
+    
     def get_description(self) -> str:
         return "Бонус за производительность"
 
@@ -238,6 +963,8 @@ class PerformanceBonusStrategy(BonusStrategy):
 class SeniorityBonusStrategy(BonusStrategy):
     """Стратегия бонуса за стаж."""
     
+    STATELESS = True
+    
     def calculate_bonus(self, base_salary: float, years_of_service: int = 0) -> float:
         """
         Бонус = базовая зарплата * (лет стажа * 2%)
@@ -249,11 +976,23 @@ class SeniorityBonusStrategy(BonusStrategy):
         Returns:
             Размер бонуса
         """
-        bonus_rate = min(years_of_service * 0.02, 0.20)  # Максимум 20%
-        bonus = base_salary * bonus_rate
+        bonus = self._bonus(base_salary, years_of_service)
         print(f"[SeniorityStrategy] Бонус за стаж ({years_of_service} лет): {bonus}")
         return bonus
     
+    def calculate_bonus_many(self, base_salaries: Sequence[float],
+                             params: Optional[BonusParams] = None) -> Sequence[float]:
+        """Пакетный расчёт по столбцу years_of_service (по умолчанию 0)."""
+        years = _column('years_of_service', (params or {}).get('years_of_service', 0), len(base_salaries))
+        if np is not None:
+            rates = np.minimum(np.asarray(years, dtype=float) * 0.02, 0.20)
+            return np.asarray(base_salaries, dtype=float) * rates
+        return [self._bonus(base, value) for base, value in zip(base_salaries, _values(years, len(base_salaries)))]
+    
+    @staticmethod
+    def _bonus(base_salary: float, years_of_service: int) -> float:
+        return base_salary * min(years_of_service * 0.02, 0.20)  # Максимум 20%
+    
     def get_description(self) -> str:
         return "Бонус за стаж"
 
@@ -261,6 +1000,8 @@ class SeniorityBonusStrategy(BonusStrategy):
 class ProjectBonusStrategy(BonusStrategy):
     """Стратегия бонуса за завершённые проекты."""
     
+    STATELESS = True
+    
     def calculate_bonus(self, base_salary: float, projects_completed: int = 0) -> float:
         """
         Бонус = базовая зарплата * 5% за каждый проект
@@ -272,11 +1013,25 @@ class ProjectBonusStrategy(BonusStrategy):
         Returns:
             Размер бонуса
         """
-        bonus_rate = min(projects_completed * 0.05, 0.30)  # Максимум 30%
-        bonus = base_salary * bonus_rate
+        bonus = self._bonus(base_salary, projects_completed)
         print(f"[ProjectStrategy] Бонус за проекты ({projects_completed} шт): {bonus}")
         return bonus
     
+    def calculate_bonus_many(self, base_salaries: Sequence[float],
+                             params: Optional[BonusParams] = None) -> Sequence[float]:
+        """Пакетный расчёт по столбцу projects_completed (по умолчанию 0)."""
+        projects = _column('projects_completed', (params or {}).get('projects_completed', 0),
+                           len(base_salaries))
+        if np is not None:
+            rates = np.minimum(np.asarray(projects, dtype=float) * 0.05, 0.30)
+            return np.asarray(base_salaries, dtype=float) * rates
+        return [self._bonus(base, value)
+                for base, value in zip(base_salaries, _values(projects, len(base_salaries)))]
+    
+    @staticmethod
+    def _bonus(base_salary: float, projects_completed: int) -> float:
+        return base_salary * min(projects_completed * 0.05, 0.30)  # Максимум 30%
+    
     def get_description(self) -> str:
         return "Бонус за проекты"
 
@@ -290,6 +1045,11 @@ class EmployeeWithStrategy:
         self.base_salary = base_salary
         self._strategy: Optional[BonusStrategy] = None
     
+    @property
+    def strategy(self) -> Optional[BonusStrategy]:
+        """Текущая стратегия бонуса (None - без бонуса)."""
+        return self._strategy
+    
     def set_bonus_strategy(self, strategy: BonusStrategy) -> None:
         """Установить стратегию бонуса."""
         self._strategy = strategy
@@ -316,8 +1076,152 @@ class EmployeeWithStrategy:
         return total
 
 
+def _is_stateless(strategy: Optional[BonusStrategy]) -> bool:
+    """STATELESS объявлен самим классом стратегии, и у экземпляра нет своих атрибутов."""
+    return (strategy is not None and type(strategy).__dict__.get('STATELESS', False)
+            and not getattr(strategy, '__dict__', None))
+
+
+def calculate_total_salaries(employees: Sequence[EmployeeWithStrategy],
+                             params: Optional[BonusParams] = None) -> Sequence[float]:
+    """
+    Пакетный расчёт полных зарплат сотрудников с разными стратегиями.
+    
+    Сотрудники группируются за один проход: по объекту стратегии, а
+    стратегии без состояния - по классу, так что отдельный экземпляр у
+    каждого сотрудника не дробит группы. По классу объединяются только
+    экземпляры без атрибутов класса, который сам объявляет STATELESS. Каждая группа
+    считается одним вызовом calculate_bonus_many(); результат для
+    каждого сотрудника тот же, что и calculate_total_salary(), но без
+    вывода.
+    
+    Args:
+        employees: Сотрудники
+        params: Столбцы параметров стратегий по всем сотрудникам, например
+                {'performance_rating': [...], 'years_of_service': [...]};
+                каждая стратегия берёт из своей группы только свои параметры
+        
+    Returns:
+        Столбец полных зарплат в порядке employees (np.ndarray, если доступен NumPy)
+    """
+    count = len(employees)
+    columns = {name: _column(name, values, count) for name, values in (params or {}).items()}
+    # Ключ группы -> номер группы; экземпляры стратегий без состояния объединяются по классу
+    codes: Dict[Any, int] = {}
+    strategies: List[Optional[BonusStrategy]] = []
+    
+    def code_of(strategy: Optional[BonusStrategy]) -> int:
+        key = type(strategy) if _is_stateless(strategy) else strategy
+        code = codes.get(key)
+        if code is None:
+            code = codes[key] = len(strategies)
+            strategies.append(strategy)
+        return code
+    
+    if np is not None:
+        labels = np.fromiter((code_of(e.strategy) for e in employees), dtype=np.intp, count=count)
+        totals = np.fromiter((e.base_salary for e in employees), dtype=float, count=count)
+        columns = {name: column if isinstance(column, numbers.Number) else np.asarray(column)
+                   for name, column in columns.items()}
+        # Индексы всех групп за один проход: устойчивая сортировка по номеру группы
+        order = np.argsort(labels, kind='stable')
+        groups = np.split(order, np.cumsum(np.bincount(labels, minlength=len(strategies)))[:-1])
+        for strategy, indexes in zip(strategies, groups):
+            if strategy is None:
+                continue
+            bases = totals[indexes]
+            group_params = {name: column if isinstance(column, numbers.Number) else column[indexes]
+                            for name, column in columns.items()}
+            totals[indexes] = bases + strategy.calculate_bonus_many(bases, group_params)
+        return totals
+    
+    index_lists: List[List[int]] = []
+    for index, employee in enumerate(employees):
+        code = code_of(employee.strategy)
+        if code == len(index_lists):
+            index_lists.append([])
+        index_lists[code].append(index)
+    totals = [e.base_salary for e in employees]
+    for strategy, indexes in zip(strategies, index_lists):
+        if strategy is None:
+            continue
+        bases = [totals[i] for i in indexes]
+        group_params = {name: column if isinstance(column, numbers.Number) else [column[i] for i in indexes]
+                        for name, column in columns.items()}
+        bonuses = strategy.calculate_bonus_many(bases, group_params)
+        for i, base, bonus in zip(indexes, bases, bonuses):
+            totals[i] = base + bonus
+    return totals
+
+
 # ======================== COMMAND (КОМАНДА) ========================
 
+# Операция журнала команд - кортеж (вид, объект, *аргументы):
+#   ('add', department, employee, state)  - добавить сотрудника в отдел с состоянием state
+#   ('remove', department, employee)      - убрать сотрудника из отдела
+#   ('fire', company, employee)           - Company.remove_employee_globally (с проверками)
+#   ('set', employee, attribute, value)   - присвоить атрибут сотрудника
+#   ('execute', command) / ('undo', command) - команда без журнала хранится целиком
+Operation = Tuple[Any, ...]
+
+
+def _copy_state(state: Dict[str, Any]) -> Dict[str, Any]:
+    """Копия атрибутов сотрудника (списки копируются)."""
+    return {key: list(value) if isinstance(value, list) else value for key, value in state.items()}
+
+
+def _capture_state(employee: Any) -> Dict[str, Any]:
+    return _copy_state(vars(employee))
+
+
+def _restore_state(employee: Any, state: Dict[str, Any]) -> None:
+    vars(employee).clear()
+    vars(employee).update(_copy_state(state))
+
+
+def _apply_operations(operations: Sequence[Operation]) -> None:
+    """Применить операции журнала по порядку."""
+    for operation in operations:
+        kind = operation[0]
+        if kind == 'set':
+            _, employee, attribute, value = operation
+            setattr(employee, attribute, value)
+        elif kind == 'add':
+            _, department, employee, state = operation
+            _restore_state(employee, state)
+            department.add_employee(employee)
+        elif kind == 'remove':
+            _, department, employee = operation
+            department.remove_employee(employee.id)
+        elif kind == 'fire':
+            _, company, employee = operation
+            company.remove_employee_globally(employee.id)
+        elif kind == 'execute':
+            operation[1].execute()
+        elif kind == 'undo':
+            operation[1].undo()
+        else:
+            raise ValueError(f"Неизвестная операция журнала: {kind}")
+
+
+def _find_employee(company: Any, employee_id: int) -> Any:
+    from base.exceptions import EmployeeNotFoundError
+    
+    employee = company.find_employee_by_id(employee_id)
+    if employee is None:
+        raise EmployeeNotFoundError(f"Сотрудник {employee_id} не найден.")
+    return employee
+
+
+def _find_department(company: Any, name: str) -> Any:
+    from base.exceptions import DepartmentNotFoundError
+    
+    department = next((d for d in company.get_departments() if d.name == name), None)
+    if department is None:
+        raise DepartmentNotFoundError(f"Отдел {name} не найден.")
+    return department
+
+
 class Command(ABC):
     """Абстрактная команда."""
     
@@ -335,91 +1239,233 @@ class Command(ABC):
     def get_description(self) -> str:
         """Описание команды."""
         pass
+    
+    def journal(self) -> Optional[Tuple[Tuple[Operation, ...], Tuple[Operation, ...]]]:
+        """
+        Операции выполненной команды для компактной истории CommandInvoker:
+        (повтор, откат). None - invoker хранит саму команду.
+        """
+        return None
 
 
-class HireEmployeeCommand(Command):
-    """Команда для найма сотрудника."""
+class CompanyCommand(Command):
+    """
+    Команда над моделью Company/Department.
     
-    def __init__(self, employee_name: str, department: str, salary: float):
-        """Инициализация команды."""
-        self.employee_name = employee_name
-        self.department = department
-        self.salary = salary
-        self._executed = False
+    Наследники описывают изменение в _plan() как операции повтора и
+    отката (проверки - до изменения данных); execute() и undo()
+    применяют их, а CommandInvoker хранит только эти операции.
+    """
+    
+    def __init__(self, company: Any):
+        self.company = company
+        self._operations: Optional[Tuple[Tuple[Operation, ...], Tuple[Operation, ...]]] = None
+    
+    @abstractmethod
+    def _plan(self) -> Tuple[List[Operation], List[Operation]]:
+        """Операции повтора и отката для текущего состояния компании."""
+        pass
     
     def execute(self) -> None:
-        """Выполнение найма."""
-        print(f"[HireCommand] Нанимаем {self.employee_name} в {self.department}")
-        # Здесь была бы фактическая реализация найма
-        self._executed = True
+        redo, undo = self._plan()
+        _apply_operations(redo)
+        self._operations = (tuple(redo), tuple(undo))
     
     def undo(self) -> None:
-        """Отмена найма (увольнение)."""
-        if self._executed:
-            print(f"[HireCommand] Отмена: увольняем {self.employee_name}")
-            self._executed = False
+        if self._operations is not None:
+            _apply_operations(self._operations[1])
+            self._operations = None
+    
+    def journal(self) -> Optional[Tuple[Tuple[Operation, ...], Tuple[Operation, ...]]]:
+        return self._operations
+
+
+class HireEmployeeCommand(CompanyCommand):
+    """Команда для найма сотрудника в его отдел (employee.department)."""
+    
+    def __init__(self, company: Any, employee: Any):
+        """Инициализация команды."""
+        super().__init__(company)
+        self.employee = employee
+    
+    def _plan(self) -> Tuple[List[Operation], List[Operation]]:
+        from base.exceptions import DuplicateIdError
+        
+        if self.company.find_employee_by_id(self.employee.id) is not None:
+            raise DuplicateIdError(f"Сотрудник с ID {self.employee.id} уже работает в компании.")
+        department = _find_department(self.company, self.employee.department)
+        print(f"[HireCommand] Нанимаем {self.employee.name} в {department.name}")
+        return ([('add', department, self.employee, _capture_state(self.employee))],
+                [('remove', department, self.employee)])
     
     def get_description(self) -> str:
-        return f"Найм {self.employee_name}"
+        return f"Найм {self.employee.name}"
 
 
-class UpdateSalaryCommand(Command):
-    """Команда для изменения зарплаты."""
+class FireEmployeeCommand(CompanyCommand):
+    """Команда для увольнения сотрудника (Company.remove_employee_globally)."""
     
-    def __init__(self, employee_name: str, old_salary: float, new_salary: float):
+    def __init__(self, company: Any, employee_id: int):
         """Инициализация команды."""
-        self.employee_name = employee_name
-        self.old_salary = old_salary
-        self.new_salary = new_salary
+        super().__init__(company)
+        self.employee_id = employee_id
     
-    def execute(self) -> None:
-        """Изменение зарплаты."""
-        print(f"[UpdateSalaryCommand] Изменяем зарплату {self.employee_name}: "
-              f"{self.old_salary} -> {self.new_salary}")
+    def _plan(self) -> Tuple[List[Operation], List[Operation]]:
+        employee = _find_employee(self.company, self.employee_id)
+        department = _find_department(self.company, employee.department)
+        print(f"[FireCommand] Увольняем {employee.name}")
+        return ([('fire', self.company, employee)],
+                [('add', department, employee, _capture_state(employee))])
     
-    def undo(self) -> None:
-        """Откат изменения зарплаты."""
-        print(f"[UpdateSalaryCommand] Откат: восстанавливаем зарплату {self.employee_name}: "
-              f"{self.new_salary} -> {self.old_salary}")
+    def get_description(self) -> str:
+        return f"Увольнение сотрудника {self.employee_id}"
+
+
+class UpdateSalaryCommand(CompanyCommand):
+    """Команда для изменения базовой зарплаты."""
+    
+    def __init__(self, company: Any, employee_id: int, new_salary: float):
+        """Инициализация команды."""
+        super().__init__(company)
+        self.employee_id = employee_id
+        self.new_salary = new_salary
+    
+    def _plan(self) -> Tuple[List[Operation], List[Operation]]:
+        employee = _find_employee(self.company, self.employee_id)
+        print(f"[UpdateSalaryCommand] Изменяем зарплату {employee.name}: "
+              f"{employee.base_salary} -> {self.new_salary}")
+        return ([('set', employee, 'base_salary', self.new_salary)],
+                [('set', employee, 'base_salary', employee.base_salary)])
     
     def get_description(self) -> str:
-        return f"Изменение зарплаты {self.employee_name}"
+        return f"Изменение зарплаты сотрудника {self.employee_id}"
 
 
-class PromoteEmployeeCommand(Command):
-    """Команда для повышения в должности."""
+class PromoteEmployeeCommand(CompanyCommand):
+    """
+    Команда для повышения: прибавка к базовой зарплате и, для
+    разработчиков, новый уровень (seniority_level).
+    """
     
-    def __init__(self, employee_name: str, old_position: str, new_position: str,
-                 salary_increase: float):
+    def __init__(self, company: Any, employee_id: int, salary_increase: float,
+                 new_position: Optional[str] = None):
         """Инициализация команды."""
-        self.employee_name = employee_name
-        self.old_position = old_position
-        self.new_position = new_position
+        super().__init__(company)
+        self.employee_id = employee_id
         self.salary_increase = salary_increase
+        self.new_position = new_position
+    
+    def _plan(self) -> Tuple[List[Operation], List[Operation]]:
+        employee = _find_employee(self.company, self.employee_id)
+        redo: List[Operation] = [('set', employee, 'base_salary', employee.base_salary + self.salary_increase)]
+        undo: List[Operation] = [('set', employee, 'base_salary', employee.base_salary)]
+        if self.new_position is not None:
+            if not hasattr(employee, 'seniority_level'):
+                raise ValueError(f"У сотрудника {employee.name} нет уровня должности")
+            redo.append(('set', employee, 'seniority_level', self.new_position))
+            undo.insert(0, ('set', employee, 'seniority_level', employee.seniority_level))
+        print(f"[PromoteCommand] Повышаем {employee.name}: +{self.salary_increase}"
+              + (f", уровень {self.new_position}" if self.new_position else ""))
+        return redo, undo
+    
+    def get_description(self) -> str:
+        return f"Повышение сотрудника {self.employee_id}"
+
+
+class MacroCommand(Command):
+    """
+    Пакет команд, выполняемый атомарно: если одна из команд падает,
+    уже выполненные откатываются в обратном порядке и исключение
+    пробрасывается дальше.
+    """
+    
+    def __init__(self, commands: Sequence[Command], description: Optional[str] = None):
+        """Инициализация пакета."""
+        self.commands = list(commands)
+        self.description = description
+        self._executed: List[Command] = []
     
     def execute(self) -> None:
-        """Повышение в должности."""
-        print(f"[PromoteCommand] Повышаем {self.employee_name}: "
-              f"{self.old_position} -> {self.new_position} (+{self.salary_increase})")
+        executed: List[Command] = []
+        try:
+            for command in self.commands:
+                command.execute()
+                executed.append(command)
+        except Exception:
+            for command in reversed(executed):
+                command.undo()
+            print(f"[MacroCommand] Ошибка: пакет отменён ({len(executed)} команд откатано)")
+            raise
+        self._executed = executed
     
     def undo(self) -> None:
-        """Откат повышения."""
-        print(f"[PromoteCommand] Откат: возвращаем {self.employee_name} на должность "
-              f"{self.old_position}")
+        for command in reversed(self._executed):
+            command.undo()
+        self._executed = []
+    
+    def journal(self) -> Optional[Tuple[Tuple[Operation, ...], Tuple[Operation, ...]]]:
+        redo: List[Operation] = []
+        undo: List[Operation] = []
+        for command in self._executed:
+            entry = command.journal()
+            if entry is None:
+                return None
+            redo.extend(entry[0])
+            undo[:0] = entry[1]
+        return tuple(redo), tuple(undo)
     
     def get_description(self) -> str:
-        return f"Повышение {self.employee_name}"
+        return self.description or f"Пакет из {len(self.commands)} команд"
 
 
 class CommandInvoker:
     """
     Invoker - выполняет команды и может откатывать их.
+    
+    История - ограниченный журнал (max_history записей) из описания и
+    операций повтора/отката каждой команды; сами объекты команд не
+    хранятся (кроме команд без journal()). Раз в checkpoint_every
+    команд сохраняется снимок компании, поэтому goto() на далёкую
+    позицию может восстановить ближайший снимок и повторить не больше
+    checkpoint_every записей вместо отката всего журнала. Снимок
+    восстанавливается за O(размер компании), поэтому goto() выбирает
+    его, только если это дешевле пошагового перехода (стоимость шага -
+    число его операций журнала).
     """
     
-    def __init__(self):
-        """Инициализация invoker."""
-        self._history: List[Command] = []
-        self._undo_stack: List[Command] = []
+    def __init__(self, company: Any = None, max_history: int = 1000,
+                 checkpoint_every: Optional[int] = 100):
+        """
+        Инициализация invoker.
+        
+        Args:
+            company: Компания для снимков (None - без снимков)
+            max_history: Максимум записей в журнале (старые отбрасываются)
+            checkpoint_every: Снимок компании раз в столько команд (None - без снимков)
+        """
+        self.company = company
+        self.max_history = max_history
+        self.checkpoint_every = checkpoint_every if company is not None else None
+        # запись: (описание, операции повтора, операции отката)
+        self._log: deque = deque()
+        self._base = 0       # абсолютная позиция первой записи журнала
+        self._position = 0   # абсолютная позиция: выполнено столько команд
+        self._checkpoints: Dict[int, Tuple[list, list]] = {}
+    
+    @property
+    def position(self) -> int:
+        """Абсолютный номер текущего состояния (число выполненных команд)."""
+        return self._position
+    
+    @property
+    def first_position(self) -> int:
+        """Самая ранняя позиция, до которой можно откатиться."""
+        return self._base
+    
+    @property
+    def last_position(self) -> int:
+        """Самая поздняя позиция, до которой можно повторить."""
+        return self._base + len(self._log)
     
     def execute_command(self, command: Command) -> None:
         """
@@ -429,30 +1475,96 @@ class CommandInvoker:
             command: Команда для выполнения
         """
         print(f"\n[Invoker] Выполнение: {command.get_description()}")
+        if self.checkpoint_every and self._position % self.checkpoint_every == 0 \
+                and self._position not in self._checkpoints:
+            self._checkpoints[self._position] = self._snapshot()
         command.execute()
-        self._history.append(command)
-        self._undo_stack.clear()  # Очищаем undo при новой команде
+        
+        # Новая команда отменяет ветку повтора
+        while len(self._log) > self._position - self._base:
+            self._log.pop()
+        for position in [p for p in self._checkpoints if p > self._position]:
+            del self._checkpoints[position]
+        
+        entry = command.journal()
+        if entry is None:
+            entry = ((('execute', command),), (('undo', command),))
+        self._log.append((command.get_description(), entry[0], entry[1]))
+        self._position += 1
+        if len(self._log) > self.max_history:
+            self._log.popleft()
+            self._base += 1
+            self._checkpoints.pop(self._base - 1, None)
     
     def undo(self) -> None:
         """Откатить последнюю команду."""
-        if self._history:
-            command = self._history.pop()
-            print(f"\n[Invoker] Откат: {command.get_description()}")
-            command.undo()
-            self._undo_stack.append(command)
+        if self._position > self._base:
+            description, _, undo = self._log[self._position - self._base - 1]
+            print(f"\n[Invoker] Откат: {description}")
+            _apply_operations(undo)
+            self._position -= 1
         else:
             print("[Invoker] Нет команд для отката")
     
     def redo(self) -> None:
         """Повторить последнюю отменённую команду."""
-        if self._undo_stack:
-            command = self._undo_stack.pop()
-            print(f"\n[Invoker] Повтор: {command.get_description()}")
-            command.execute()
-            self._history.append(command)
+        if self._position < self.last_position:
+            description, redo, _ = self._log[self._position - self._base]
+            print(f"\n[Invoker] Повтор: {description}")
+            _apply_operations(redo)
+            self._position += 1
         else:
             print("[Invoker] Нет команд для повтора")
     
+    def goto(self, position: int) -> None:
+        """
+        Перейти к состоянию после position команд (откат или повтор).
+        
+        Raises:
+            ValueError: Если позиция вне журнала
+        """
+        if not self._base <= position <= self.last_position:
+            raise ValueError(f"Позиция {position} вне журнала "
+                             f"[{self._base}, {self.last_position}]")
+        checkpoint = max((p for p in self._checkpoints if self._base <= p <= position), default=None)
+        if checkpoint is not None and position - checkpoint < abs(position - self._position) \
+                and self._restore_cost(checkpoint) + self._steps_cost(checkpoint, position) \
+                < self._steps_cost(self._position, position):
+            print(f"[Invoker] Восстановление снимка на позиции {checkpoint}")
+            self._restore(self._checkpoints[checkpoint])
+            self._position = checkpoint
+        while self._position > position:
+            _apply_operations(self._log[self._position - self._base - 1][2])
+            self._position -= 1
+        while self._position < position:
+            _apply_operations(self._log[self._position - self._base][1])
+            self._position += 1
+        print(f"[Invoker] Текущая позиция: {self._position}")
+    
+    def _steps_cost(self, start: int, end: int) -> int:
+        """Число операций журнала при пошаговом переходе от start к end."""
+        column = 2 if end < start else 1
+        return sum(len(self._log[p - self._base][column]) for p in range(min(start, end), max(start, end)))
+    
+    def _restore_cost(self, checkpoint: int) -> int:
+        """Стоимость восстановления снимка: отделы и сотрудники в нём."""
+        departments, states = self._checkpoints[checkpoint]
+        return len(departments) + len(states)
+    
+    def _snapshot(self) -> Tuple[list, list]:
+        """Снимок компании: составы отделов и состояния сотрудников."""
+        departments = [(d, list(d.get_employees())) for d in self.company.get_departments()]
+        states = [(e, _capture_state(e)) for _, employees in departments for e in employees]
+        return departments, states
+    
+    @staticmethod
+    def _restore(snapshot: Tuple[list, list]) -> None:
+        departments, states = snapshot
+        for department, employees in departments:
+            department.replace_employees(employees)
+        for employee, state in states:
+            _restore_state(employee, state)
+    
     def get_history(self) -> List[str]:
-        """Получить историю команд."""
-        return [cmd.get_description() for cmd in self._history]
+        """Получить историю выполненных (не отменённых) команд в пределах журнала."""
+        return [self._log[i][0] for i in range(self._position - self._base)]
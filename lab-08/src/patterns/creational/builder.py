@@ -3,7 +3,71 @@
 # Отделяет конструирование сложного объекта от его представления,
 # позволяя пошагово строить объект.
 
-from typing import List, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+
+# --- Проверки полей (общие для set_* и пакетной сборки по прототипу) ---
+
+def _check_id(emp_id: int) -> int:
+    if emp_id <= 0:
+        raise ValueError(f"ID должен быть положительным, получено: {emp_id}")
+    return emp_id
+
+
+def _check_name(name: str) -> str:
+    if not name or len(name.strip()) == 0:
+        raise ValueError("Имя не может быть пустым")
+    return name.strip()
+
+
+def _check_department(department: str) -> str:
+    if not department or len(department.strip()) == 0:
+        raise ValueError("Отдел не может быть пустым")
+    return department.strip()
+
+
+def _check_base_salary(base_salary: float) -> float:
+    if base_salary < 0:
+        raise ValueError(f"Зарплата не может быть отрицательной: {base_salary}")
+    return base_salary
+
+
+def _check_bonus(bonus: float) -> float:
+    if bonus < 0:
+        raise ValueError(f"Бонус не может быть отрицательным: {bonus}")
+    return bonus
+
+
+def _check_seniority(seniority: str) -> str:
+    valid_seniorities = {"junior", "middle", "senior"}
+    if seniority not in valid_seniorities:
+        raise ValueError(f"Неверный уровень: {seniority}. "
+                       f"Допустимые: {valid_seniorities}")
+    return seniority
+
+
+def _check_commission_rate(commission_rate: float) -> float:
+    if not (0.0 <= commission_rate <= 1.0):
+        raise ValueError(f"Комиссия должна быть в диапазоне 0.0-1.0: {commission_rate}")
+    return commission_rate
+
+
+def _check_tech_stack(tech_stack: List[str]) -> List[str]:
+    return list(tech_stack)  # копия: строки не делят список прототипа
+
+
+# Поле словаря build() -> проверка/нормализация значения
+FIELD_CHECKS: Dict[str, Callable[[Any], Any]] = {
+    'id': _check_id,
+    'name': _check_name,
+    'department': _check_department,
+    'base_salary': _check_base_salary,
+    'bonus': _check_bonus,
+    'seniority': _check_seniority,
+    'commission_rate': _check_commission_rate,
+    'tech_stack': _check_tech_stack,
+}
+
 
 class EmployeeBuilder:
     """
@@ -35,9 +99,7 @@ class EmployeeBuilder:
         Returns:
             self для chaining
         """
-        if emp_id <= 0:
-            raise ValueError(f"ID должен быть положительным, получено: {emp_id}")
-        self._id = emp_id
+        self._id = _check_id(emp_id)
         print(f"  [Builder] Установлен ID: {emp_id}")
         return self
     
@@ -51,9 +113,7 @@ class EmployeeBuilder:
         Returns:
             self для chaining
         """
-        if not name or len(name.strip()) == 0:
-            raise ValueError("Имя не может быть пустым")
-        self._name = name.strip()
+        self._name = _check_name(name)
         print(f"  [Builder] Установлено имя: {self._name}")
         return self
     
@@ -67,9 +127,7 @@ class EmployeeBuilder:
         Returns:
             self для chaining
         """
-        if not department or len(department.strip()) == 0:
-            raise ValueError("Отдел не может быть пустым")
-        self._department = department.strip()
+        self._department = _check_department(department)
         print(f"  [Builder] Установлен отдел: {self._department}")
         return self
     
@@ -83,9 +141,7 @@ class EmployeeBuilder:
         Returns:
             self для chaining
         """
-        if base_salary < 0:
-            raise ValueError(f"Зарплата не может быть отрицательной: {base_salary}")
-        self._base_salary = base_salary
+        self._base_salary = _check_base_salary(base_salary)
         print(f"  [Builder] Установлена базовая зарплата: {base_salary}")
         return self
     
@@ -99,10 +155,8 @@ class EmployeeBuilder:
         Returns:
             self для chaining
         """
-        if bonus < 0:
-            raise ValueError(f"Бонус не может быть отрицательным: {bonus}")
+        self._bonus = _check_bonus(bonus)
         self._employee_type = "manager"
-        self._bonus = bonus
         print(f"  [Builder] Тип: Manager, бонус: {bonus}")
         return self
     
@@ -118,13 +172,8 @@ class EmployeeBuilder:
         Returns:
             self для chaining
         """
-        valid_seniorities = {"junior", "middle", "senior"}
-        if seniority not in valid_seniorities:
-            raise ValueError(f"Неверный уровень: {seniority}. "
-                           f"Допустимые: {valid_seniorities}")
-        
+        self._seniority = _check_seniority(seniority)
         self._employee_type = "developer"
-        self._seniority = seniority
         self._tech_stack = tech_stack if tech_stack else ["Python"]
         print(f"  [Builder] Тип: Developer, уровень: {seniority}, стек: {self._tech_stack}")
         return self
@@ -139,11 +188,8 @@ class EmployeeBuilder:
         Returns:
             self для chaining
         """
-        if not (0.0 <= commission_rate <= 1.0):
-            raise ValueError(f"Комиссия должна быть в диапазоне 0.0-1.0: {commission_rate}")
-        
+        self._commission_rate = _check_commission_rate(commission_rate)
         self._employee_type = "salesperson"
-        self._commission_rate = commission_rate
         print(f"  [Builder] Тип: Salesperson, комиссия: {commission_rate*100}%")
         return self
     
@@ -256,8 +302,35 @@ class EmployeeDirector:
     """
     Директор для управления процессом построения сотрудников.
     Упрощает создание стандартных конфигураций.
+    
+    Для массового создания директор хранит реестр прототипов: шаблон
+    роли строится через builder и проверяется один раз, а build_many()
+    копирует его и проверяет только поля, заданные строкой.
     """
     
+    # Стандартные роли: отдел по умолчанию и настройка builder
+    # (build_junior_developer() и т.п. и прототипы строятся отсюда)
+    ROLES: Dict[str, tuple] = {
+        "junior_developer": ("DEV", lambda b: b.set_base_salary(3000)
+                             .as_developer("junior", ["Python", "Git"])),
+        "senior_developer": ("DEV", lambda b, tech_stack=None: b.set_base_salary(8000).as_developer(
+            "senior", ["Python", "Java", "SQL", "Docker", "Kubernetes"] if tech_stack is None else tech_stack)),
+        "sales_manager": ("SALES", lambda b: b.set_base_salary(4000).as_manager(bonus=2000)),
+        "sales_representative": ("SALES", lambda b: b.set_base_salary(2500)
+                                 .as_salesperson(commission_rate=0.15)),
+    }
+    
+    # Обязательные поля шаблона по типу сотрудника (как в EmployeeBuilder.validate)
+    TYPE_FIELDS: Dict[str, tuple] = {
+        "employee": (),
+        "manager": ("bonus",),
+        "developer": ("seniority", "tech_stack"),
+        "salesperson": ("commission_rate",),
+    }
+    
+    # Поля строки build_many(), заданной кортежем
+    ROW_FIELDS = ("id", "name", "department")
+    
     def __init__(self, builder: EmployeeBuilder):
         """
         Инициализация директора с builder.
@@ -266,100 +339,194 @@ class EmployeeDirector:
             builder: Объект EmployeeBuilder для построения
         """
         self.builder = builder
+        self._prototypes: Dict[str, dict] = {}
+    
+    # --- Реестр прототипов ---
+    
+    def get_prototype(self, role: str) -> dict:
+        """
+        Проверенный шаблон роли (без id и name).
+        
+        Шаблон стандартной роли строится через builder при первом
+        обращении и кэшируется; возвращается копия.
+        
+        Raises:
+            ValueError: Если роль неизвестна
+        """
+        prototype = self._prototype(role).copy()
+        if 'tech_stack' in prototype:
+            prototype['tech_stack'] = list(prototype['tech_stack'])
+        return prototype
+    
+    def _prototype(self, role: str) -> dict:
+        prototype = self._prototypes.get(role)
+        if prototype is None:
+            if role not in self.ROLES:
+                raise ValueError(f"Неизвестная роль: '{role}'. "
+                                 f"Доступные: {sorted(set(self.ROLES) | set(self._prototypes))}")
+            print(f"\n[Director] Построение прототипа '{role}'...")
+            prototype = self._build_role(role, 1, role)
+            prototype['id'] = prototype['name'] = None
+            self._prototypes[role] = prototype
+        return prototype
+    
+    def _build_role(self, role: str, emp_id: int, name: str,
+                    department: Optional[str] = None, **options: Any) -> dict:
+        """Построить сотрудника стандартной роли через builder (настройка из ROLES)."""
+        default_department, configure = self.ROLES[role]
+        return configure(self.builder
+                         .reset()
+                         .set_id(emp_id)
+                         .set_name(name)
+                         .set_department(default_department if department is None else department),
+                         **options).build()
+    
+    def register_prototype(self, role: str, template: dict) -> None:
+        """
+        Зарегистрировать шаблон роли в формате build() (без id и name).
+        
+        Args:
+            role: Название роли
+            template: Поля шаблона: type, department, base_salary и поля типа
+            
+        Raises:
+            ValueError: Если шаблон неполный или содержит неверные значения
+        """
+        emp_type = template.get('type', 'employee')
+        if emp_type not in self.TYPE_FIELDS:
+            raise ValueError(f"Неизвестный тип сотрудника: '{emp_type}'")
+        
+        required = ('department', 'base_salary') + self.TYPE_FIELDS[emp_type]
+        missing = [field for field in required if field not in template]
+        if missing:
+            raise ValueError("Ошибки валидации: не заданы поля " + ", ".join(missing))
+        
+        prototype = {'type': emp_type, 'id': None, 'name': None}
+        for field in required:
+            prototype[field] = FIELD_CHECKS[field](template[field])
+        extra = set(template) - set(prototype)
+        if extra:
+            raise ValueError(f"Поля {sorted(extra)} не относятся к типу '{emp_type}'")
+        
+        self._prototypes[role] = prototype
+        print(f"[Director] Зарегистрирован прототип '{role}' ({emp_type})")
+    
+    def iter_many(self, role: str, rows: Iterable[Any]) -> Iterator[dict]:
+        """
+        Лениво строить сотрудников роли по прототипу.
+        
+        Каждая строка - словарь полей build() или кортеж
+        (id, name[, department]). Строка копирует шаблон и заменяет
+        заданные поля; проверяются только они, один раз.
+        
+        Raises:
+            ValueError: Если в строке нет id/name, поле чужое или неверное,
+                        или в кортеже больше полей, чем ROW_FIELDS
+        """
+        prototype = self._prototype(role)
+        checks = {field: FIELD_CHECKS[field] for field in prototype if field in FIELD_CHECKS}
+        copy_stack = 'tech_stack' in prototype
+        
+        for row in rows:
+            if not isinstance(row, dict):
+                values = tuple(row)
+                if len(values) > len(self.ROW_FIELDS):
+                    raise ValueError(f"Строка {values!r}: больше {len(self.ROW_FIELDS)} полей "
+                                     f"({', '.join(self.ROW_FIELDS)})")
+                row = dict(zip(self.ROW_FIELDS, values))
+            employee = prototype.copy()
+            if copy_stack:
+                employee['tech_stack'] = list(employee['tech_stack'])
+            for field, value in row.items():
+                check = checks.get(field)
+                if check is None:
+                    raise ValueError(f"Поле '{field}' не относится к роли '{role}'")
+                employee[field] = check(value)
+            
+            if employee['id'] is None or employee['name'] is None:
+                errors = [message for field, message in (('id', "ID не установлен"),
+                                                         ('name', "Имя не установлено"))
+                          if employee[field] is None]
+                raise ValueError("Ошибки валидации: " + ", ".join(errors))
+            yield employee
+    
+    def build_many(self, role: str, rows: Iterable[Any]) -> List[dict]:
+        """
+        Построить сотрудников роли по прототипу (см. iter_many).
+        
+        Args:
+            role: Роль из ROLES или зарегистрированная register_prototype()
+            rows: Поля сотрудников: словари или кортежи (id, name[, department])
+            
+        Returns:
+            Список словарей в формате build()
+        """
+        employees = list(self.iter_many(role, rows))
+        print(f"[Director] По прототипу '{role}' построено сотрудников: {len(employees)}")
+        return employees
     
     def build_junior_developer(self, emp_id: int, name: str, 
-                              department: str = "DEV") -> dict:
+                              department: Optional[str] = None) -> dict:
         """
-        Стандартная конфигурация для junior разработчика.
+        Стандартная конфигурация для junior разработчика (ROLES["junior_developer"]).
         
         Args:
             emp_id: ID сотрудника
             name: Имя сотрудника
-            department: Отдел (по умолчанию DEV)
+            department: Отдел (по умолчанию - отдел роли, DEV)
             
         Returns:
             Построенный объект сотрудника
         """
         print(f"\n[Director] Построение Junior Developer...")
-        return (self.builder
-                .reset()
-                .set_id(emp_id)
-                .set_name(name)
-                .set_department(department)
-                .set_base_salary(3000)  # Стандартная зарплата junior
-                .as_developer("junior", ["Python", "Git"])
-                .build())
+        return self._build_role("junior_developer", emp_id, name, department)
     
     def build_senior_developer(self, emp_id: int, name: str,
-                              department: str = "DEV",
+                              department: Optional[str] = None,
                               tech_stack: Optional[List[str]] = None) -> dict:
         """
-        Стандартная конфигурация для senior разработчика.
+        Стандартная конфигурация для senior разработчика (ROLES["senior_developer"]).
         
         Args:
             emp_id: ID сотрудника
             name: Имя сотрудника
-            department: Отдел (по умолчанию DEV)
-            tech_stack: Список технологий
+            department: Отдел (по умолчанию - отдел роли, DEV)
+            tech_stack: Список технологий (по умолчанию - стек роли)
             
         Returns:
             Построенный объект сотрудника
         """
         print(f"\n[Director] Построение Senior Developer...")
-        if tech_stack is None:
-            tech_stack = ["Python", "Java", "SQL", "Docker", "Kubernetes"]
-        
-        return (self.builder
-                .reset()
-                .set_id(emp_id)
-                .set_name(name)
-                .set_department(department)
-                .set_base_salary(8000)  # Высокая зарплата для senior
-                .as_developer("senior", tech_stack)
-                .build())
+        return self._build_role("senior_developer", emp_id, name, department, tech_stack=tech_stack)
     
     def build_sales_manager(self, emp_id: int, name: str,
-                           department: str = "SALES") -> dict:
+                           department: Optional[str] = None) -> dict:
         """
-        Стандартная конфигурация для менеджера по продажам.
+        Стандартная конфигурация для менеджера по продажам (ROLES["sales_manager"]).
         
         Args:
             emp_id: ID сотрудника
             name: Имя сотрудника
-            department: Отдел (по умолчанию SALES)
+            department: Отдел (по умолчанию - отдел роли, SALES)
             
         Returns:
             Построенный объект сотрудника
         """
         print(f"\n[Director] Построение Sales Manager...")
-        return (self.builder
-                .reset()
-                .set_id(emp_id)
-                .set_name(name)
-                .set_department(department)
-                .set_base_salary(4000)  # Базовая зарплата для менеджера
-                .as_manager(bonus=2000)  # Высокий бонус за продажи
-                .build())
+        return self._build_role("sales_manager", emp_id, name, department)
     
     def build_sales_representative(self, emp_id: int, name: str,
-                                  department: str = "SALES") -> dict:
+                                  department: Optional[str] = None) -> dict:
         """
-        Стандартная конфигурация для продавца.
+        Стандартная конфигурация для продавца (ROLES["sales_representative"]).
         
         Args:
             emp_id: ID сотрудника
             name: Имя сотрудника
-            department: Отдел (по умолчанию SALES)
+            department: Отдел (по умолчанию - отдел роли, SALES)
             
         Returns:
             Построенный объект сотрудника
         """
         print(f"\n[Director] Построение Sales Representative...")
-        return (self.builder
-                .reset()
-                .set_id(emp_id)
-                .set_name(name)
-                .set_department(department)
-                .set_base_salary(2500)  # Базовая зарплата для продавца
-                .as_salesperson(commission_rate=0.15)  # 15% комиссия
-                .build())
+        return self._build_role("sales_representative", emp_id, name, department)
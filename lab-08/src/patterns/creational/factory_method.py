@@ -3,22 +3,55 @@
 # Определяет интерфейс для создания объекта, но оставляет подклассам
 # решение о том, какой класс инстанцировать.
 
+import gc
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List
+from collections import defaultdict
+from contextlib import contextmanager, nullcontext
+from typing import Dict, Any, Iterable, List, Mapping
+
+from base.abstract_employee import AbstractEmployee
+from specialists.manager import Manager
+from specialists.developer import Developer
+from specialists.salesperson import Salesperson
+from specialists.ordinary_employee import OrdinaryEmployee
+
+@contextmanager
+def _gc_paused():
+    """
+    Пауза циклического сборщика мусора на время пакетного создания.
+    
+    Сотрудники не образуют циклов ссылок, а полный проход сборщика по
+    миллионам живых объектов на каждые N созданных замедляет загрузку
+    в разы. Сборщик отключается для всего процесса, поэтому пауза
+    включается только по запросу (pause_gc=True) и только на создание
+    объектов из уже прочитанных записей.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
 
-# Предполагаем, что базовые классы импортируются из существующей ЛР№4
-# from src.base.abstract_employee import AbstractEmployee
-# from src.specialists.manager import Manager
-# from src.specialists.developer import Developer
-# from src.specialists.salesperson import Salesperson
-# from src.specialists.ordinary_employee import OrdinaryEmployee
 
 class EmployeeFactory(ABC):
     """
     Абстрактный базовый класс для фабрик сотрудников.
     Определяет интерфейс для создания объектов сотрудников.
+    
+    Пакетный create_many() принимает записи в формате to_dict()
+    (id, name, department, base_salary и поля типа); конкретные
+    фабрики переопределяют его, создавая объекты без вывода на каждого.
     """
     
+    def __init__(self, verbose: bool = True):
+        """
+        Args:
+            verbose: Печатать сообщение о каждом созданном сотруднике
+        """
+        self.verbose = verbose
+    
     @abstractmethod
     def create_employee(self, emp_id: int, name: str, department: str, 
                        base_salary: float, **kwargs) -> 'AbstractEmployee':
@@ -38,6 +71,28 @@ class EmployeeFactory(ABC):
         """
         pass
     
+    def create_many(self, records: Iterable[Mapping[str, Any]]) -> List['AbstractEmployee']:
+        """
+        Создание пачки сотрудников этого типа.
+        
+        Args:
+            records: Записи с ключами id, name, department, base_salary
+                     и дополнительными полями типа
+            
+        Returns:
+            Список сотрудников в порядке записей
+        """
+        base_fields = ('id', 'name', 'department', 'base_salary')
+        return [self.create_employee(record['id'], record['name'], record['department'],
+                                     record['base_salary'],
+                                     **{k: v for k, v in record.items() if k not in base_fields and k != 'type'})
+                for record in records]
+    
+    def _log_batch(self, employees: List['AbstractEmployee']) -> List['AbstractEmployee']:
+        if self.verbose:
+            print(f"[Factory] Создано {self.get_employee_type()}: {len(employees)}")
+        return employees
+    
     @abstractmethod
     def get_employee_type(self) -> str:
         """
@@ -68,10 +123,15 @@ class ManagerFactory(EmployeeFactory):
             Объект Manager
         """
         bonus = kwargs.get('bonus', 0.0)
-        print(f"[Factory] Создание Manager: {name}, бонус: {bonus}")
-        # Предполагаемый импорт: from src.specialists.manager import Manager
-        # return Manager(emp_id, name, department, base_salary, bonus)
-        return f"Manager({emp_id}, {name}, {department}, {base_salary}, {bonus})"
+        if self.verbose:
+            print(f"[Factory] Создание Manager: {name}, бонус: {bonus}")
+        return Manager(emp_id, name, department, base_salary, bonus)
+    
+    def create_many(self, records: Iterable[Mapping[str, Any]]) -> List['Manager']:
+        """Пакетное создание менеджеров (поле записи: bonus)."""
+        return self._log_batch([
+            Manager(r['id'], r['name'], r['department'], r['base_salary'], r.get('bonus', 0.0))
+            for r in records])
     
     def get_employee_type(self) -> str:
         return "manager"
@@ -98,10 +158,16 @@ class DeveloperFactory(EmployeeFactory):
         """
         seniority = kwargs.get('seniority', 'junior')
         tech_stack = kwargs.get('tech_stack', [])
-        print(f"[Factory] Создание Developer: {name}, уровень: {seniority}, стек: {tech_stack}")
-        # Предполагаемый импорт: from src.specialists.developer import Developer
-        # return Developer(emp_id, name, department, base_salary, seniority, tech_stack)
-        return f"Developer({emp_id}, {name}, {department}, {base_salary}, {seniority}, {tech_stack})"
+        if self.verbose:
+            print(f"[Factory] Создание Developer: {name}, уровень: {seniority}, стек: {tech_stack}")
+        return Developer(emp_id, name, department, base_salary, seniority, tech_stack)
+    
+    def create_many(self, records: Iterable[Mapping[str, Any]]) -> List['Developer']:
+        """Пакетное создание разработчиков (поля записи: seniority, tech_stack)."""
+        return self._log_batch([
+            Developer(r['id'], r['name'], r['department'], r['base_salary'],
+                      r.get('seniority', 'junior'), list(r.get('tech_stack', ())))
+            for r in records])
     
     def get_employee_type(self) -> str:
         return "developer"
@@ -121,15 +187,23 @@ class SalespersonFactory(EmployeeFactory):
             department: Отдел (обычно SALES)
             base_salary: Базовая зарплата
             **kwargs: Должен содержать 'commission_rate' - процент комиссии
+                     (или 'commission', как в to_dict()), 'sales_volume' - объем продаж
             
         Returns:
             Объект Salesperson
         """
-        commission_rate = kwargs.get('commission_rate', 0.0)
-        print(f"[Factory] Создание Salesperson: {name}, комиссия: {commission_rate*100}%")
-        # Предполагаемый импорт: from src.specialists.salesperson import Salesperson
-        # return Salesperson(emp_id, name, department, base_salary, commission_rate)
-        return f"Salesperson({emp_id}, {name}, {department}, {base_salary}, {commission_rate})"
+        commission_rate = kwargs.get('commission_rate', kwargs.get('commission', 0.0))
+        if self.verbose:
+            print(f"[Factory] Создание Salesperson: {name}, комиссия: {commission_rate*100}%")
+        return Salesperson(emp_id, name, department, base_salary, commission_rate,
+                           kwargs.get('sales_volume', 0.0))
+    
+    def create_many(self, records: Iterable[Mapping[str, Any]]) -> List['Salesperson']:
+        """Пакетное создание продавцов (поля записи: commission_rate/commission, sales_volume)."""
+        return self._log_batch([
+            Salesperson(r['id'], r['name'], r['department'], r['base_salary'],
+                        r.get('commission_rate', r.get('commission', 0.0)), r.get('sales_volume', 0.0))
+            for r in records])
     
     def get_employee_type(self) -> str:
         return "salesperson"
@@ -153,10 +227,15 @@ class OrdinaryEmployeeFactory(EmployeeFactory):
         Returns:
             Объект OrdinaryEmployee
         """
-        print(f"[Factory] Создание OrdinaryEmployee: {name}")
-        # Предполагаемый импорт: from src.specialists.ordinary_employee import OrdinaryEmployee
-        # return OrdinaryEmployee(emp_id, name, department, base_salary)
-        return f"OrdinaryEmployee({emp_id}, {name}, {department}, {base_salary})"
+        if self.verbose:
+            print(f"[Factory] Создание OrdinaryEmployee: {name}")
+        return OrdinaryEmployee(emp_id, name, department, base_salary)
+    
+    def create_many(self, records: Iterable[Mapping[str, Any]]) -> List['OrdinaryEmployee']:
+        """Пакетное создание штатных сотрудников."""
+        return self._log_batch([
+            OrdinaryEmployee(r['id'], r['name'], r['department'], r['base_salary'])
+            for r in records])
     
     def get_employee_type(self) -> str:
         return "employee"
@@ -168,16 +247,30 @@ class EmployeeFactoryManager:
     Координирует создание сотрудников через подходящую фабрику.
     """
     
-    def __init__(self):
-        """Инициализация с регистрацией всех доступных фабрик."""
+    def __init__(self, verbose: bool = True):
+        """
+        Инициализация с регистрацией всех доступных фабрик.
+        
+        Args:
+            verbose: Печатать сообщения фабрик (отключается для массовой загрузки)
+        """
+        self.verbose = verbose
         # Регистр фабрик (тип -> фабрика)
         self._factories: Dict[str, EmployeeFactory] = {
-            'manager': ManagerFactory(),
-            'developer': DeveloperFactory(),
-            'salesperson': SalespersonFactory(),
-            'employee': OrdinaryEmployeeFactory(),
+            'manager': ManagerFactory(verbose),
+            'developer': DeveloperFactory(verbose),
+            'salesperson': SalespersonFactory(verbose),
+            'employee': OrdinaryEmployeeFactory(verbose),
         }
     
+    def _get_factory(self, emp_type: str) -> EmployeeFactory:
+        """Фабрика типа (одним поиском в реестре)."""
+        factory = self._factories.get(emp_type)
+        if factory is None:
+            raise ValueError(f"Неизвестный тип сотрудника: '{emp_type}'. "
+                           f"Доступные типы: {list(self._factories.keys())}")
+        return factory
+    
     def register_factory(self, emp_type: str, factory: EmployeeFactory) -> None:
         """
         Регистрация новой фабрики для типа сотрудника.
@@ -188,7 +281,8 @@ class EmployeeFactoryManager:
             factory: Объект фабрики для этого типа
         """
         self._factories[emp_type] = factory
-        print(f"[FactoryManager] Зарегистрирована фабрика для типа '{emp_type}'")
+        if self.verbose:
+            print(f"[FactoryManager] Зарегистрирована фабрика для типа '{emp_type}'")
     
     def create_employee(self, emp_type: str, emp_id: int, name: str,
                        department: str, base_salary: float, **kwargs) -> 'AbstractEmployee':
@@ -209,12 +303,65 @@ class EmployeeFactoryManager:
         Raises:
             ValueError: Если тип сотрудника не зарегистрирован
         """
-        if emp_type not in self._factories:
-            raise ValueError(f"Неизвестный тип сотрудника: '{emp_type}'. "
-                           f"Доступные типы: {list(self._factories.keys())}")
+        return self._get_factory(emp_type).create_employee(emp_id, name, department, base_salary, **kwargs)
+    
+    def create_many(self, emp_type: str, rows: Iterable[Mapping[str, Any]],
+                    pause_gc: bool = False) -> List['AbstractEmployee']:
+        """
+        Создание пачки сотрудников одного типа одной фабрикой.
+        
+        Args:
+            emp_type: Тип сотрудника (должен быть зарегистрирован)
+            rows: Записи с ключами id, name, department, base_salary и полями типа
+            pause_gc: Отключить сборщик мусора на время создания объектов
+                      (rows сначала читаются в список при включённом сборщике)
+            
+        Returns:
+            Список сотрудников в порядке записей
+            
+        Raises:
+            ValueError: Если тип сотрудника не зарегистрирован
+        """
+        factory = self._get_factory(emp_type)
+        if not pause_gc:
+            return factory.create_many(rows)
+        rows = list(rows)
+        with _gc_paused():
+            return factory.create_many(rows)
+    
+    def create_from_records(self, records: Iterable[Mapping[str, Any]],
+                            pause_gc: bool = False) -> List['AbstractEmployee']:
+        """
+        Создание сотрудников разных типов из записей в формате to_dict().
+        
+        Записи группируются по полю 'type', и каждая фабрика получает
+        одну однородную пачку. Порядок результата совпадает с порядком
+        записей.
+        
+        С pause_gc=True сборщик мусора отключается на время создания
+        объектов (записи группируются при включённом сборщике). После
+        большой загрузки можно вызвать gc.freeze(), чтобы последующие
+        полные проходы сборщика не обходили загруженных сотрудников.
+        
+        Raises:
+            ValueError: Если встречен незарегистрированный тип
+                        (до создания каких-либо объектов)
+        """
+        groups: Dict[str, list] = defaultdict(list)
+        positions: Dict[str, List[int]] = defaultdict(list)
+        count = 0
+        for count, record in enumerate(records, 1):
+            emp_type = record['type']
+            groups[emp_type].append(record)
+            positions[emp_type].append(count - 1)
         
-        factory = self._factories[emp_type]
-        return factory.create_employee(emp_id, name, department, base_salary, **kwargs)
+        factories = {emp_type: self._get_factory(emp_type) for emp_type in groups}
+        employees: List[Any] = [None] * count
+        with _gc_paused() if pause_gc else nullcontext():
+            for emp_type, group in groups.items():
+                for index, employee in zip(positions[emp_type], factories[emp_type].create_many(group)):
+                    employees[index] = employee
+        return employees
     
     def get_available_types(self) -> List[str]:
         """
@@ -3,82 +3,401 @@
 # Гарантирует, что класс имеет только один экземпляр и предоставляет
 # глобальную точку доступа к этому экземпляру.
 
+import json
+import queue
 import sqlite3
-from typing import Optional
+import threading
+import weakref
+from contextlib import contextmanager
+from typing import Any, Iterable, Iterator, List, Optional, Sequence
+
+# Схема БД: колонки подтипов сотрудников совпадают с ключами to_dict()
+# (tech_stack хранится как JSON), состав команд - в project_members
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS employees (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    department TEXT NOT NULL,
+    base_salary REAL NOT NULL,
+    type TEXT NOT NULL,
+    bonus REAL,
+    seniority TEXT,
+    tech_stack TEXT,
+    commission REAL,
+    sales_volume REAL
+);
+
+CREATE TABLE IF NOT EXISTS departments (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT UNIQUE NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS projects (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    description TEXT NOT NULL DEFAULT '',
+    status TEXT NOT NULL,
+    deadline TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS project_members (
+    project_id INTEGER NOT NULL REFERENCES projects(id) ON DELETE CASCADE,
+    employee_id INTEGER NOT NULL REFERENCES employees(id) ON DELETE RESTRICT,
+    PRIMARY KEY (project_id, employee_id)
+) WITHOUT ROWID;
+"""
+
+INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_employees_department ON employees(department);
+CREATE INDEX IF NOT EXISTS idx_employees_type ON employees(type);
+CREATE INDEX IF NOT EXISTS idx_employees_salary ON employees(base_salary);
+CREATE INDEX IF NOT EXISTS idx_project_members_employee ON project_members(employee_id);
+"""
+
+# Колонки, которых нет в БД, созданных прежней версией create_tables()
+MIGRATED_COLUMNS = {
+    "employees": {
+        "bonus": "REAL",
+        "seniority": "TEXT",
+        "tech_stack": "TEXT",
+        "commission": "REAL",
+        "sales_volume": "REAL",
+    },
+    "projects": {
+        "description": "TEXT NOT NULL DEFAULT ''",
+    },
+}
+
+EMPLOYEE_COLUMNS = ("id", "name", "department", "base_salary", "type",
+                    "bonus", "seniority", "tech_stack", "commission", "sales_volume")
+
+
+def employee_row(employee: Any) -> tuple:
+    """Строка таблицы employees (порядок EMPLOYEE_COLUMNS) из сотрудника."""
+    data = employee.to_dict()
+    if "tech_stack" in data:
+        data["tech_stack"] = json.dumps(data["tech_stack"], ensure_ascii=False)
+    return tuple(data.get(column) for column in EMPLOYEE_COLUMNS)
+
+
+def _add_missing_columns(connection: sqlite3.Connection) -> None:
+    """Добавляет в существующие таблицы недостающие колонки MIGRATED_COLUMNS."""
+    for table, columns in MIGRATED_COLUMNS.items():
+        existing = {row[1] for row in connection.execute(f"PRAGMA table_info({table})")}
+        for column, definition in columns.items():
+            if column not in existing:
+                connection.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+
+
+class _ThreadPin:
+    """Метка закрепления подключения за потоком (см. ConnectionPool.bind)."""
+
+
+class ConnectionPool:
+    """
+    Пул подключений SQLite с привязкой подключения к потоку.
+    
+    Поток получает подключение из пула при первом acquire() и держит
+    его до парного release(): вложенные acquire() в том же потоке
+    возвращают то же подключение. Подключений не больше max_size;
+    если все заняты, acquire() ждёт до timeout секунд.
+    
+    Каждое подключение открывается в режиме autocommit
+    (isolation_level=None) с WAL, synchronous=NORMAL, foreign_keys и
+    busy_timeout: читатели не блокируют писателя, а конкурирующие
+    писатели ждут блокировку вместо ошибки "database is locked".
+    
+    bind() закрепляет подключение за потоком до его завершения: такие
+    подключения не возвращаются в пул по release(). Если все max_size
+    подключений закреплены, acquire() в других потоках сразу падает с
+    RuntimeError - потокам без долгой работы с БД нужны connection()
+    и transaction(), а не bind().
+    """
+    
+    def __init__(self, db_path: str, max_size: int = 8, timeout: float = 10.0,
+                 synchronous: str = "NORMAL"):
+        """
+        Args:
+            db_path: Путь к файлу БД SQLite
+            max_size: Максимум подключений (для ':memory:' всегда 1 - общая БД)
+            timeout: Ожидание свободного подключения и блокировки БД, секунды
+            synchronous: PRAGMA synchronous (OFF, NORMAL, FULL)
+        """
+        self.db_path = db_path
+        self.max_size = 1 if db_path == ":memory:" else max_size
+        self.timeout = timeout
+        self.synchronous = synchronous
+        self._idle: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._all: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._pinned = 0
+        self._closed = False
+    
+    def _create(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.db_path, timeout=self.timeout,
+                                     isolation_level=None, check_same_thread=False)
+        # Подключение переходит между потоками только через пул, по одному владельцу
+        if self.db_path != ":memory:":
+            connection.execute("PRAGMA journal_mode = WAL")
+        connection.execute(f"PRAGMA synchronous = {self.synchronous}")
+        connection.execute(f"PRAGMA busy_timeout = {int(self.timeout * 1000)}")
+        connection.execute("PRAGMA foreign_keys = ON")
+        return connection
+    
+    def acquire(self) -> sqlite3.Connection:
+        """Подключение текущего потока (повторный вызов увеличивает счётчик)."""
+        local = self._local
+        if getattr(local, 'connection', None) is not None:
+            local.depth += 1
+            return local.connection
+        if self._closed:
+            raise RuntimeError("Пул подключений закрыт")
+        
+        try:
+            connection = self._idle.get_nowait()
+        except queue.Empty:
+            connection = None
+            with self._lock:
+                if len(self._all) < self.max_size:
+                    connection = self._create()
+                    self._all.append(connection)
+            if connection is None:
+                if self._pinned >= self.max_size:
+                    raise RuntimeError(self._pinned_message())
+                try:
+                    connection = self._idle.get(timeout=self.timeout)
+                except queue.Empty:
+                    raise RuntimeError(f"Нет свободного подключения к БД за {self.timeout} с"
+                                       + (f"; {self._pinned_message()}" if self._pinned else "")) from None
+        if self._closed:
+            self._return(connection)
+            raise RuntimeError("Пул подключений закрыт")
+        local.connection, local.depth, local.transactions = connection, 1, 0
+        return connection
+    
+    def release(self) -> None:
+        """Вернуть подключение потока в пул после парного acquire()."""
+        local = self._local
+        if getattr(local, 'connection', None) is None:
+            return
+        local.depth -= 1
+        if local.depth > 0:
+            return
+        connection, local.connection = local.connection, None
+        if connection.in_transaction:
+            connection.rollback()  # незавершённая транзакция не переходит другому потоку
+        self._return(connection)
+    
+    def _return(self, connection: sqlite3.Connection) -> None:
+        """Вернуть подключение в пул; после close_all() - закрыть."""
+        with self._lock:
+            if not self._closed:
+                self._idle.put(connection)
+                return
+            self._all.remove(connection)
+        connection.close()
+    
+    def _unpin(self, connection: sqlite3.Connection) -> None:
+        with self._lock:
+            self._pinned -= 1
+        self._return(connection)
+    
+    def _pinned_message(self) -> str:
+        return (f"закреплено {self._pinned} из {self.max_size} подключений "
+                f"(get_connection()/connection); используйте connection() или transaction()")
+    
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Контекстный менеджер acquire()/release()."""
+        connection = self.acquire()
+        try:
+            yield connection
+        finally:
+            self.release()
+    
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        Явная транзакция: COMMIT при выходе, ROLLBACK при исключении.
+        
+        Внешняя транзакция начинается с BEGIN IMMEDIATE (блокировка на
+        запись берётся сразу, без взаимоблокировки при повышении),
+        вложенные - через SAVEPOINT.
+        """
+        with self.connection() as connection:
+            local = self._local
+            depth = local.transactions
+            savepoint = f"sp_{depth}"
+            connection.execute(f"SAVEPOINT {savepoint}" if depth else "BEGIN IMMEDIATE")
+            local.transactions += 1
+            try:
+                yield connection
+            except BaseException:
+                local.transactions -= 1
+                if depth:
+                    connection.execute(f"ROLLBACK TO {savepoint}")
+                    connection.execute(f"RELEASE {savepoint}")
+                else:
+                    connection.execute("ROLLBACK")
+                raise
+            local.transactions -= 1
+            connection.execute(f"RELEASE {savepoint}" if depth else "COMMIT")
+    
+    def bind(self) -> sqlite3.Connection:
+        """
+        Закрепить подключение за потоком (повторно не считается).
+        
+        Подключение возвращается в пул, когда поток завершается, поэтому
+        одновременно живущих потоков с bind() может быть не больше max_size.
+        """
+        local = self._local
+        if getattr(local, 'connection', None) is None:
+            connection = self.acquire()
+            with self._lock:
+                self._pinned += 1
+            # thread-local очищается при завершении потока - вместе с меткой
+            local.pin = _ThreadPin()
+            local.unpin = weakref.finalize(local.pin, self._unpin, connection)
+        return local.connection
+    
+    @property
+    def size(self) -> int:
+        """Количество открытых подключений."""
+        return len(self._all)
+    
+    def close_all(self) -> None:
+        """
+        Закрыть пул.
+        
+        Свободные подключения и закреплённое за текущим потоком
+        закрываются сразу; занятые другими потоками - когда те вернут
+        их в пул. Новые acquire() после закрытия падают с RuntimeError.
+        """
+        with self._lock:
+            self._closed = True
+            idle = []
+            while True:
+                try:
+                    idle.append(self._idle.get_nowait())
+                except queue.Empty:
+                    break
+            for connection in idle:
+                self._all.remove(connection)
+        for connection in idle:
+            connection.close()
+        unpin = getattr(self._local, 'unpin', None)
+        if unpin is not None and unpin.detach() is not None:
+            with self._lock:
+                self._pinned -= 1
+            self.release()
+
 
 class DatabaseConnection:
     """
     Реализация паттерна Singleton для управления подключением к БД.
-    Гарантирует единственное подключение к SQLite на протяжении жизни приложения.
+    Гарантирует единственную точку доступа к SQLite на протяжении жизни
+    приложения; сами подключения берутся из ConnectionPool - у каждого
+    потока своё.
+    
+    Без transaction() каждый execute_update() - отдельная транзакция;
+    внутри transaction() изменения фиксируются одним COMMIT.
     """
     
     # Класс-переменная для хранения единственного экземпляра
     _instance: Optional['DatabaseConnection'] = None
     # Флаг инициализации (для потокобезопасности)
     _initialized: bool = False
+    _instance_lock = threading.Lock()
     
-    def __new__(cls) -> 'DatabaseConnection':
+    def __new__(cls, *args, **kwargs) -> 'DatabaseConnection':
         """
         Переопределение __new__ для создания единственного экземпляра.
         При повторном вызове возвращает существующий экземпляр.
         """
-        if cls._instance is None:
-            cls._instance = super(DatabaseConnection, cls).__new__(cls)
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = super(DatabaseConnection, cls).__new__(cls)
         return cls._instance
     
-    def __init__(self, db_path: str = "company.db"):
+    def __init__(self, db_path: str = "company.db", pool_size: int = 8,
+                 timeout: float = 10.0, synchronous: str = "NORMAL"):
         """
-        Инициализация подключения (вызывается только один раз).
+        Инициализация пула подключений (вызывается только один раз).
         
         Args:
             db_path: Путь к файлу БД SQLite
+            pool_size: Максимум одновременных подключений
+            timeout: Ожидание подключения или блокировки БД, секунды
+            synchronous: PRAGMA synchronous для подключений
         """
         # Защита от повторной инициализации
-        if not DatabaseConnection._initialized:
+        with DatabaseConnection._instance_lock:
+            if DatabaseConnection._initialized:
+                return
             self.db_path = db_path
-            self.connection: Optional[sqlite3.Connection] = None
+            self.pool = ConnectionPool(db_path, pool_size, timeout, synchronous)
             self._connect()
             DatabaseConnection._initialized = True
     
     def _connect(self) -> None:
-        """Установка подключения к БД SQLite."""
+        """Проверочное подключение к БД SQLite."""
         try:
-            self.connection = sqlite3.connect(
-                self.db_path,
-                check_same_thread=False  # Для простоты, в production используйте потокобезопасные подключения
-            )
-            # Включаем внешние ключи
-            self.connection.execute("PRAGMA foreign_keys = ON")
+            with self.pool.connection():
+                pass
             print(f"[DB] Подключение к '{self.db_path}' установлено")
         except sqlite3.Error as e:
             print(f"[DB ERROR] Ошибка подключения: {e}")
             raise
     
     @classmethod
-    def get_instance(cls, db_path: str = "company.db") -> 'DatabaseConnection':
+    def get_instance(cls, db_path: str = "company.db", **pool_options) -> 'DatabaseConnection':
         """
         Класс-метод для получения единственного экземпляра.
         
         Args:
             db_path: Путь к БД (используется только при первом вызове)
-            
+            **pool_options: pool_size, timeout, synchronous (только при первом вызове)
+        
         Returns:
             Единственный экземпляр DatabaseConnection
         """
-        if cls._instance is None:
-            cls._instance = cls(db_path)
+        if cls._instance is None or not cls._initialized:
+            cls(db_path, **pool_options)
         return cls._instance
     
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """Подключение текущего потока (закреплено за потоком до close_connection())."""
+        return self.get_connection()
+    
     def get_connection(self) -> sqlite3.Connection:
         """
-        Получение активного подключения к БД.
+        Получение подключения текущего потока.
+        
+        Подключение закрепляется за потоком до его завершения: таких
+        потоков одновременно может быть не больше pool_size, иначе
+        RuntimeError. Для временного доступа используйте
+        pool.connection() или transaction().
         
         Returns:
             Объект подключения sqlite3.Connection
         """
-        if self.connection is None:
+        if not DatabaseConnection._initialized:
             raise RuntimeError("Подключение к БД не установлено")
-        return self.connection
+        return self.pool.bind()
+    
+    def transaction(self):
+        """
+        Контекстный менеджер транзакции: все execute_update() и
+        executemany() внутри фиксируются одним COMMIT (или откатываются).
+        
+        Пример:
+            with db.transaction():
+                for row in rows:
+                    db.execute_update("INSERT ...", row)
+        """
+        return self.pool.transaction()
     
     def execute_query(self, query: str, params: tuple = ()) -> list:
         """
@@ -87,14 +406,13 @@ class DatabaseConnection:
         Args:
             query: SQL запрос
             params: Параметры запроса для защиты от SQL-injection
-            
+        
         Returns:
             Список результатов (список кортежей)
         """
         try:
-            cursor = self.connection.cursor()
-            cursor.execute(query, params)
-            return cursor.fetchall()
+            with self.pool.connection() as connection:
+                return connection.execute(query, params).fetchall()
         except sqlite3.Error as e:
             print(f"[DB ERROR] Ошибка выполнения запроса: {e}")
             raise
@@ -103,58 +421,83 @@ class DatabaseConnection:
         """
         Выполнение INSERT, UPDATE, DELETE запроса.
         
+        Вне transaction() запрос фиксируется сразу (autocommit).
+        
         Args:
             query: SQL запрос
             params: Параметры запроса
-            
+        
         Returns:
             Количество затронутых строк
         """
         try:
-            cursor = self.connection.cursor()
-            cursor.execute(query, params)
-            self.connection.commit()
-            return cursor.rowcount
+            with self.pool.connection() as connection:
+                return connection.execute(query, params).rowcount
         except sqlite3.Error as e:
-            self.connection.rollback()
             print(f"[DB ERROR] Ошибка выполнения обновления: {e}")
             raise
     
+    def executemany(self, query: str, rows: Iterable[Sequence[Any]]) -> int:
+        """
+        Выполнение запроса для многих строк в одной транзакции.
+        
+        Args:
+            query: SQL запрос с параметрами
+            rows: Параметры для каждой строки
+        
+        Returns:
+            Количество затронутых строк
+        """
+        try:
+            with self.transaction() as connection:
+                return connection.executemany(query, rows).rowcount
+        except sqlite3.Error as e:
+            print(f"[DB ERROR] Ошибка пакетного выполнения: {e}")
+            raise
+    
+    # --- Пакетная запись моделей ---
+    
+    def insert_employees(self, employees: Iterable[Any]) -> int:
+        """Пакетная вставка сотрудников (AbstractEmployee) в таблицу employees."""
+        return self.executemany(
+            f"INSERT INTO employees ({', '.join(EMPLOYEE_COLUMNS)}) "
+            f"VALUES ({', '.join('?' * len(EMPLOYEE_COLUMNS))})",
+            map(employee_row, employees))
+    
+    def insert_departments(self, departments: Iterable[Any]) -> int:
+        """Пакетная вставка отделов (Department или название) в таблицу departments."""
+        return self.executemany(
+            "INSERT INTO departments (name) VALUES (?)",
+            ((getattr(d, 'name', d),) for d in departments))
+    
+    def insert_projects(self, projects: Iterable[Any]) -> int:
+        """Пакетная вставка проектов (Project) в таблицу projects."""
+        return self.executemany(
+            "INSERT INTO projects (id, name, description, status, deadline) VALUES (?, ?, ?, ?, ?)",
+            ((p.id, p.name, p.description, p.status,
+              p.deadline.strftime("%Y-%m-%d") if hasattr(p.deadline, 'strftime') else p.deadline)
+             for p in projects))
+    
     def close_connection(self) -> None:
-        """Закрытие подключения к БД."""
-        if self.connection:
-            self.connection.close()
+        """Закрытие всех подключений к БД."""
+        if DatabaseConnection._initialized:
+            self.pool.close_all()
             print("[DB] Подключение закрыто")
-            DatabaseConnection._instance = None
-            DatabaseConnection._initialized = False
+        DatabaseConnection._instance = None
+        DatabaseConnection._initialized = False
     
     def create_tables(self) -> None:
-        """Создание таблиц для системы учета сотрудников."""
-        schema = """
-        CREATE TABLE IF NOT EXISTS employees (
-            id INTEGER PRIMARY KEY,
-            name TEXT NOT NULL,
-            department TEXT NOT NULL,
-            base_salary REAL NOT NULL,
-            type TEXT NOT NULL
-        );
-        
-        CREATE TABLE IF NOT EXISTS departments (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT UNIQUE NOT NULL
-        );
-        
-        CREATE TABLE IF NOT EXISTS projects (
-            id INTEGER PRIMARY KEY,
-            name TEXT NOT NULL,
-            status TEXT NOT NULL,
-            deadline TEXT NOT NULL
-        );
+        """
+        Создание таблиц и индексов для системы учета сотрудников.
+        
+        Повторный вызов безопасен: в БД старой схемы недостающие
+        колонки добавляются через ALTER TABLE.
         """
         try:
-            cursor = self.connection.cursor()
-            cursor.executescript(schema)
-            self.connection.commit()
+            with self.pool.connection() as connection:
+                connection.executescript(SCHEMA)
+                _add_missing_columns(connection)
+                connection.executescript(INDEXES)
             print("[DB] Таблицы созданы успешно")
         except sqlite3.Error as e:
             print(f"[DB ERROR] Ошибка создания таблиц: {e}")
@@ -0,0 +1,72 @@
+"""
+Бенчмарк асинхронного адаптера внешнего сервиса.
+
+Сервис имитируется FakeExternalSalaryService с настраиваемой задержкой
+(по умолчанию 40 мс). Сравниваются: последовательные вызовы по одному
+сотруднику, конкурентные вызовы по одному и пакетные вызовы.
+
+ИСПОЛЬЗОВАНИЕ:
+    python benchmarks/bench_async_adapter.py --employees 2000 --latency 0.04
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from patterns.adapter_refactored import AsyncExternalServiceAdapter, FakeExternalSalaryService
+
+
+def make_rows(count: int):
+    return [{'id': i + 1, 'name': f'Emp {i}', 'base_salary': 1000 + i,
+             'type': 'developer'} for i in range(count)]
+
+
+async def sequential(adapter: AsyncExternalServiceAdapter, rows) -> None:
+    for row in rows:
+        await adapter.calculate_salary(row)
+
+
+def measure(label: str, coro_factory, service: FakeExternalSalaryService, count: int) -> None:
+    start = time.perf_counter()
+    asyncio.run(coro_factory())
+    elapsed = time.perf_counter() - start
+    print(f"{label:<36} {elapsed:>8.2f} s {count / elapsed:>10,.0f} emp/s "
+          f"{service.request_count:>7} req")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--employees', type=int, default=2000)
+    parser.add_argument('--latency', type=float, default=0.04)
+    parser.add_argument('--concurrency', type=int, default=64)
+    parser.add_argument('--batch-size', type=int, default=100)
+    parser.add_argument('--sequential-employees', type=int, default=50)
+    args = parser.parse_args()
+
+    rows = make_rows(args.employees)
+
+    def adapter(batch_size: int):
+        service = FakeExternalSalaryService(latency=args.latency)
+        with contextlib.redirect_stdout(io.StringIO()):
+            instance = AsyncExternalServiceAdapter(
+                service, max_concurrency=args.concurrency, batch_size=batch_size)
+        return instance, service
+
+    seq_rows = rows[:args.sequential_employees]
+    a, s = adapter(1)
+    measure(f"последовательно x{len(seq_rows)}", lambda: sequential(a, seq_rows), s, len(seq_rows))
+    a, s = adapter(1)
+    measure(f"конкурентно, пакет 1 x{len(rows)}", lambda: a.calculate_many(rows), s, len(rows))
+    a, s = adapter(args.batch_size)
+    measure(f"конкурентно, пакет {args.batch_size} x{len(rows)}",
+            lambda: a.calculate_many(rows), s, len(rows))
+
+
+if __name__ == '__main__':
+    main()
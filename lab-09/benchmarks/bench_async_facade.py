@@ -0,0 +1,78 @@
+"""
+Бенчмарк асинхронного фасада с удалёнными подсистемами.
+
+Сравнивает последовательный опрос подсистем (как в CompanyFacade) с
+параллельным в AsyncCompanyFacade при заданной сетевой задержке.
+
+ИСПОЛЬЗОВАНИЕ:
+    python benchmarks/bench_async_facade.py --latency 0.05 --employees 10000
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from patterns.facade_refactored import (
+    AsyncCompanyFacade, CompanySubsystemB,
+    FakeAsyncSubsystemA, FakeAsyncSubsystemB, FakeAsyncSubsystemC, FakeAsyncSubsystemD
+)
+
+
+async def sequential_summary(facade: AsyncCompanyFacade) -> None:
+    await facade.subsystem_a.list_all_departments()
+    await facade.subsystem_b.get_all_employees()
+    await facade.subsystem_d.list_active_projects()
+
+
+async def sequential_payroll(facade: AsyncCompanyFacade) -> None:
+    employees = await facade.subsystem_b.get_all_employees()
+    size = facade.payroll_chunk_size
+    for i in range(0, len(employees), size):
+        await facade.subsystem_c.calculate_monthly_salaries(employees[i:i + size])
+
+
+def bench(label: str, coroutine) -> float:
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        asyncio.run(coroutine)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<34} {elapsed:>9.3f} s")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--latency', type=float, default=0.05)
+    parser.add_argument('--employees', type=int, default=10_000)
+    parser.add_argument('--chunk', type=int, default=500)
+    args = parser.parse_args()
+
+    subsystem_b = CompanySubsystemB()
+    with contextlib.redirect_stdout(io.StringIO()):
+        subsystem_b.hire_many((f"Emp {i}", "DEV") for i in range(args.employees))
+
+    facade = AsyncCompanyFacade(FakeAsyncSubsystemA(latency=args.latency),
+                                FakeAsyncSubsystemB(subsystem_b, latency=args.latency),
+                                FakeAsyncSubsystemC(latency=args.latency),
+                                FakeAsyncSubsystemD(latency=args.latency),
+                                default_timeout=10.0, payroll_chunk_size=args.chunk)
+    print(f"Задержка: {args.latency * 1000:.0f} мс, сотрудников: {args.employees:,}, "
+          f"пакет: {args.chunk}")
+
+    seq = bench("сводка: последовательно", sequential_summary(facade))
+    par = bench("сводка: asyncio.gather", facade.get_company_summary())
+    print(f"сводка: ускорение ~{seq / par:.1f}x\n")
+
+    seq = bench("ведомость: последовательно", sequential_payroll(facade))
+    par = bench("ведомость: asyncio.gather", facade.process_monthly_payroll())
+    print(f"ведомость: ускорение ~{seq / par:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
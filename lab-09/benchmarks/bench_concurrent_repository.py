@@ -0,0 +1,87 @@
+"""
+Нагрузочный бенчмарк потокобезопасного репозитория.
+
+Каждый поток выполняет смешанную нагрузку над общим
+ConcurrentEmployeeRepository: чтение, CAS-обновление зарплаты,
+добавление и удаление. Выводится пропускная способность (ops/sec)
+в зависимости от числа потоков.
+
+ИСПОЛЬЗОВАНИЕ:
+    python benchmarks/bench_concurrent_repository.py
+    python benchmarks/bench_concurrent_repository.py --ops 50000 --threads 1 2 4 8 16
+"""
+
+import argparse
+import random
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from patterns.data_access_refactored import ConcurrentEmployeeRepository
+
+
+def _populate(repo: ConcurrentEmployeeRepository, size: int) -> List[int]:
+    return [
+        repo.add({'id': None, 'name': f'Emp {i}', 'base_salary': 1000 + i,
+                  'type': 'developer', 'department': f'D{i % 10}'})
+        for i in range(size)
+    ]
+
+
+def _worker(repo: ConcurrentEmployeeRepository, ids: List[int], ops: int,
+            seed: int, barrier: threading.Barrier) -> None:
+    rnd = random.Random(seed)
+    barrier.wait()
+    for _ in range(ops):
+        roll = rnd.random()
+        emp_id = rnd.choice(ids)
+        if roll < 0.6:
+            repo.find_by_id(emp_id)
+        elif roll < 0.9:
+            repo.update(emp_id, lambda data: {'base_salary': data['base_salary'] + 1},
+                        max_retries=100)
+        else:
+            new_id = repo.add({'id': None, 'name': 'Temp', 'base_salary': 1,
+                               'type': 'employee', 'department': 'TMP'})
+            repo.remove(new_id)
+
+
+def run(threads: int, ops_per_thread: int, size: int, stripes: int) -> float:
+    """Запустить нагрузку и вернуть ops/sec."""
+    repo = ConcurrentEmployeeRepository(stripes=stripes)
+    ids = _populate(repo, size)
+    barrier = threading.Barrier(threads + 1)
+    workers = [
+        threading.Thread(target=_worker, args=(repo, ids, ops_per_thread, n, barrier))
+        for n in range(threads)
+    ]
+    for worker in workers:
+        worker.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - start
+    return threads * ops_per_thread / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--ops', type=int, default=20000, help='операций на поток')
+    parser.add_argument('--size', type=int, default=10000, help='сотрудников в репозитории')
+    parser.add_argument('--stripes', type=int, default=16, help='число сегментов')
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    print(f"{'threads':>8} {'ops/sec':>14}")
+    for threads in args.threads:
+        rate = run(threads, args.ops, args.size, args.stripes)
+        print(f"{threads:>8} {rate:>14,.0f}")
+
+
+if __name__ == '__main__':
+    main()
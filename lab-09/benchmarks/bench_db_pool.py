@@ -0,0 +1,96 @@
+"""
+Бенчмарк параллельного чтения: ThreadSafeDatabaseConnection vs пул.
+
+Каждый поток выполняет выборку по индексу; выводится число запросов
+в секунду (QPS) в зависимости от числа потоков. Дополнительно
+сравнивается вставка по одной строке и через executemany.
+
+ИСПОЛЬЗОВАНИЕ:
+    python benchmarks/bench_db_pool.py --rows 100000 --threads 1 2 4 8
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from patterns.singleton import ThreadSafeDatabaseConnection, PooledDatabaseConnection
+
+QUERY = ("SELECT department, COUNT(*), AVG(salary) FROM employees "
+         "WHERE salary BETWEEN ? AND ? GROUP BY department")
+
+
+def prepare(path: str, rows: int) -> None:
+    pool = PooledDatabaseConnection(path, readers=1)
+    pool.execute_update("CREATE TABLE employees (id INTEGER PRIMARY KEY, name TEXT, "
+                        "department TEXT, salary REAL)")
+    pool.execute_update("CREATE INDEX idx_salary ON employees (salary)")
+    pool.executemany("INSERT INTO employees (name, department, salary) VALUES (?, ?, ?)",
+                     ((f"E{i}", f"D{i % 20}", 1000 + i % 9000) for i in range(rows)))
+    pool.close_connection()
+
+
+def read_qps(db, threads: int, queries: int) -> float:
+    barrier = threading.Barrier(threads + 1)
+
+    def worker(seed: int) -> None:
+        barrier.wait()
+        for i in range(queries):
+            low = 1000 + (seed * 97 + i * 31) % 8000
+            db.execute_query(QUERY, (low, low + 500))
+
+    workers = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+    for w in workers:
+        w.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for w in workers:
+        w.join()
+    return threads * queries / (time.perf_counter() - start)
+
+
+def insert_rate(pool: PooledDatabaseConnection, rows: int, batched: bool) -> float:
+    data = [(f"N{i}", "NEW", 1.0) for i in range(rows)]
+    start = time.perf_counter()
+    if batched:
+        pool.executemany("INSERT INTO employees (name, department, salary) VALUES (?, ?, ?)", data)
+    else:
+        for row in data:
+            pool.execute_update("INSERT INTO employees (name, department, salary) VALUES (?, ?, ?)", row)
+    return rows / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, default=100_000)
+    parser.add_argument('--queries', type=int, default=300, help='запросов на поток')
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 2, 4, 8])
+    parser.add_argument('--insert-rows', type=int, default=5_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.db")
+        prepare(path, args.rows)
+
+        single = ThreadSafeDatabaseConnection(path)
+        pool = PooledDatabaseConnection(path, readers=max(args.threads))
+
+        print(f"{'threads':>8} {'singleton QPS':>15} {'pool QPS':>12}")
+        for threads in args.threads:
+            print(f"{threads:>8} {read_qps(single, threads, args.queries):>15,.0f} "
+                  f"{read_qps(pool, threads, args.queries):>12,.0f}")
+
+        print(f"\nвставка по строке: {insert_rate(pool, args.insert_rows, False):>12,.0f} rows/s")
+        print(f"executemany:       {insert_rate(pool, args.insert_rows, True):>12,.0f} rows/s")
+
+        single.close_connection()
+        pool.close_connection()
+
+
+if __name__ == '__main__':
+    main()
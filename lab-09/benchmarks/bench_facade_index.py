@@ -0,0 +1,95 @@
+"""
+Бенчмарк индекса имя -> отдел в CompanySubsystemB (Facade Pattern).
+
+Сравнивает увольнение и перевод на подсистеме с индексом и на прежней
+схеме (списки сотрудников по отделам, линейный поиск по всем отделам).
+Прежняя схема проверяется на выборке операций и экстраполируется.
+
+ИСПОЛЬЗОВАНИЕ:
+    python benchmarks/bench_facade_index.py --names 1000000 --departments 1000
+"""
+
+import argparse
+import contextlib
+import io
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from patterns.facade_refactored import CompanySubsystemB
+
+
+class ListSubsystemB:
+    """Прежняя реализация: списки по отделам, поиск перебором."""
+
+    def __init__(self, employees):
+        self._employees = employees
+
+    def hire_employee(self, name, dept_name):
+        employees = self._employees.setdefault(dept_name, [])
+        if name in employees:
+            return False
+        employees.append(name)
+        return True
+
+    def fire_employee(self, name):
+        for employees in self._employees.values():
+            if name in employees:
+                employees.remove(name)
+                return True
+        return False
+
+
+def bench(label: str, operations: int, func) -> float:
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<38} {elapsed:>9.3f} s   {elapsed / operations * 1e6:>10.2f} мкс/оп")
+    return elapsed / operations
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--names', type=int, default=1_000_000)
+    parser.add_argument('--departments', type=int, default=1000)
+    parser.add_argument('--ops', type=int, default=100_000)
+    parser.add_argument('--list-ops', type=int, default=200,
+                        help='операций для прежней схемы (экстраполируется)')
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    departments = [f"D{d}" for d in range(args.departments)]
+    hires = [(f"Emp {i}", departments[i % args.departments]) for i in range(args.names)]
+    victims = rng.sample(range(args.names), args.ops + args.list_ops)
+    print(f"Сотрудников: {args.names:,}, отделов: {args.departments:,}")
+
+    indexed = CompanySubsystemB()
+    bench("индекс: hire_many", args.names, lambda: indexed.hire_many(hires))
+
+    legacy = ListSubsystemB({})
+    for name, dept_name in hires:
+        legacy._employees.setdefault(dept_name, []).append(name)
+
+    fired = [hires[i][0] for i in victims[:args.ops]]
+    moved = [(hires[i][0], rng.choice(departments)) for i in victims[args.ops:]]
+
+    index_fire = bench(f"индекс: fire_employee x{args.ops:,}", args.ops,
+                       lambda: [indexed.fire_employee(name) for name in fired])
+    list_fire = bench(f"списки: fire_employee x{args.list_ops:,}", args.list_ops,
+                      lambda: [legacy.fire_employee(name) for name, _ in moved])
+    print(f"увольнение: ускорение ~{list_fire / index_fire:.0f}x")
+
+    index_move = bench(f"индекс: transfer_employee x{args.list_ops:,}", args.list_ops,
+                       lambda: [indexed.transfer_employee(name, dept) for name, dept in moved])
+    list_move = bench(f"списки: fire+hire x{args.list_ops:,}", args.list_ops,
+                      lambda: [legacy.fire_employee(name) or legacy.hire_employee(name, dept)
+                               for name, dept in moved])
+    print(f"перевод: ускорение ~{list_move / index_move:.0f}x")
+
+
+if __name__ == '__main__':
+    main()
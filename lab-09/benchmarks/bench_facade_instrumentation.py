@@ -0,0 +1,59 @@
+"""
+Бенчмарк накладных расходов инструментирования CompanyFacade.
+
+Сравнивает операции фасада без Instrumentation, с отключённым
+(enabled=False) и с включённым сбором метрик. Вывод подсистем
+перенаправляется в буфер.
+
+ИСПОЛЬЗОВАНИЕ:
+    python benchmarks/bench_facade_instrumentation.py --ops 20000
+"""
+
+import argparse
+import contextlib
+import io
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from patterns.facade_refactored import CompanyFacade, Instrumentation
+
+
+def run(facade: CompanyFacade, ops: int) -> float:
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for i in range(ops):
+            facade.hire_new_employee(f"Emp {i}", "DEV")
+            facade.get_department_employees("HR")
+            facade.fire_employee(f"Emp {i}")
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--ops', type=int, default=20_000)
+    args = parser.parse_args()
+
+    variants = {
+        'без инструментирования': None,
+        'enabled=False': Instrumentation(enabled=False),
+        'enabled=True': Instrumentation(),
+    }
+    baseline = None
+    for label, instrumentation in variants.items():
+        with contextlib.redirect_stdout(io.StringIO()):
+            facade = CompanyFacade(instrumentation)
+        elapsed = run(facade, args.ops)
+        baseline = baseline or elapsed
+        per_op = elapsed / (3 * args.ops) * 1e6
+        print(f"{label:<26} {elapsed:>8.3f} s  {per_op:>7.2f} мкс/операцию  "
+              f"{(elapsed / baseline - 1) * 100:>+6.1f}%")
+
+    print()
+    print(variants['enabled=True'].to_prometheus())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""
+Бенчмарк пропускной способности FileLogger (сообщений в секунду).
+
+Сравнивает прежнюю схему (open/append/close на каждое сообщение)
+с буферизованным FileLogger из decorator_refactored.
+
+ИСПОЛЬЗОВАНИЕ:
+    python benchmarks/bench_file_logger.py --messages 200000
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from patterns.decorator_refactored import ILogger, FileLogger, LogLevel
+
+
+class PerMessageFileLogger(ILogger):
+    """Прежняя реализация: файл открывается на каждое сообщение."""
+
+    def __init__(self, filename: str):
+        self.filename = filename
+
+    def log(self, level: LogLevel, message: str) -> None:
+        with open(self.filename, 'a', encoding='utf-8') as f:
+            f.write(f"[{level.value}] {message}\n")
+
+
+def measure(label: str, logger: ILogger, count: int) -> float:
+    start = time.perf_counter()
+    for i in range(count):
+        logger.info(f"Сообщение номер {i}")
+    if hasattr(logger, 'close'):
+        logger.close()
+    rate = count / (time.perf_counter() - start)
+    dropped = getattr(logger, 'dropped', 0)
+    print(f"{label:<28} {rate:>14,.0f} msg/s   потеряно: {dropped}")
+    return rate
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--messages', type=int, default=200_000)
+    parser.add_argument('--legacy-messages', type=int, default=20_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy = measure("open() на сообщение", PerMessageFileLogger(f"{tmp}/legacy.log"),
+                         args.legacy_messages)
+        buffered = measure("FileLogger (буфер)", FileLogger(f"{tmp}/buffered.log"),
+                           args.messages)
+        rotating = measure("FileLogger (+ротация 1 МБ)",
+                           FileLogger(f"{tmp}/rotating.log", max_bytes=1 << 20),
+                           args.messages)
+    print(f"\nускорение: {buffered / legacy:.1f}x (с ротацией {rotating / legacy:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
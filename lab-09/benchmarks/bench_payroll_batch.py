@@ -0,0 +1,70 @@
+"""
+Бенчмарк пакетного расчёта зарплат через адаптеры.
+
+Сравнивает CompanySalaryManager.calculate_payroll на построчном пути
+(calculate_salary для каждого сотрудника) и SalaryCalculator.calculate_many.
+Построчный путь печатает в консоль, поэтому его вывод подавляется.
+
+ИСПОЛЬЗОВАНИЕ:
+    python benchmarks/bench_payroll_batch.py --rows 1000000
+"""
+
+import argparse
+import contextlib
+import io
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from patterns.adapter_refactored import (
+    ExternalSalaryCalculationService, LegacySalaryCalculator,
+    ExternalServiceAdapter, LegacyCalculatorAdapter, np
+)
+
+TYPES = ('manager', 'developer', 'salesperson', 'employee')
+
+
+def make_rows(count: int):
+    return [{'id': i + 1, 'name': f'Emp {i}', 'base_salary': 1000 + i % 5000,
+             'type': TYPES[i % len(TYPES)]} for i in range(count)]
+
+
+def bench(label: str, func) -> float:
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<34} {elapsed:>9.3f} s")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--scalar-rows', type=int, default=50_000,
+                        help='строк для построчного пути (экстраполируется)')
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    print(f"NumPy: {'да' if np is not None else 'нет'}, строк: {args.rows:,}")
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        adapters = {
+            'external': ExternalServiceAdapter(ExternalSalaryCalculationService()),
+            'legacy': LegacyCalculatorAdapter(LegacySalaryCalculator()),
+        }
+
+    for name, adapter in adapters.items():
+        sample = rows[:args.scalar_rows]
+        scalar = bench(f"{name}: calculate_salary x{len(sample):,}",
+                       lambda: [adapter.calculate_salary(e) for e in sample])
+        batch = bench(f"{name}: calculate_many x{len(rows):,}",
+                      lambda: adapter.calculate_many(rows))
+        speedup = scalar * len(rows) / len(sample) / batch
+        print(f"{name}: ускорение ~{speedup:.0f}x\n")
+
+
+if __name__ == '__main__':
+    main()
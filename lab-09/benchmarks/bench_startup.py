@@ -0,0 +1,154 @@
+"""
+Бенчмарк времени импорта модулей lab-09 с бюджетом на регрессию.
+
+Каждый модуль импортируется в отдельном процессе с `python -X importtime`
+(холодный старт, как у CLI); берётся минимум суммарного времени импорта
+модуля по нескольким запускам (наименее зашумлённая оценка). Бюджет (startup_budget.json) задаёт для
+модуля допустимое время в мс и список модулей, которые не должны
+загружаться при импорте (например, numpy, json, csv). При превышении
+бюджета скрипт завершается с кодом 1.
+
+ИСПОЛЬЗОВАНИЕ:
+    python benchmarks/bench_startup.py --runs 7
+    python benchmarks/bench_startup.py --top 5 patterns.facade_refactored
+    python benchmarks/bench_startup.py --write-budget --headroom 2.0
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+SRC = Path(__file__).parent.parent / 'src'
+BUDGET_FILE = Path(__file__).parent / 'startup_budget.json'
+
+# Печатает модули, загруженные импортом, одной строкой JSON. Отложенные
+# модули (utils.lazy.lazy_import) ещё не выполнены и не считаются загруженными.
+PROBE = (
+    "import sys; before = set(sys.modules); import {module}; "
+    "loaded = sorted(name for name in set(sys.modules) - before "
+    "if type(sys.modules[name]).__name__ != '_LazyModule'); "
+    "import json; print(json.dumps(loaded))"
+)
+
+
+def import_once(module: str) -> Tuple[float, List[Tuple[int, str]], List[str]]:
+    """
+    Импортирует модуль в новом процессе.
+
+    Время - сумма cumulative строк importtime верхнего уровня для модуля
+    и его родительских пакетов.
+
+    :returns: (время импорта в мс, [(собственное время мкс, имя)] модулей,
+        загруженных этим импортом, список этих модулей).
+    :raises RuntimeError: Если модуль не импортируется.
+    """
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', PROBE.format(module=module)],
+        cwd=SRC, capture_output=True, text=True
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+
+    parts = module.split('.')
+    targets = {'.'.join(parts[:i]) for i in range(1, len(parts) + 1)}
+    total_us = 0
+    own: List[Tuple[int, str]] = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        own.append((int(self_us), name.strip()))
+        if name.strip() in targets and not name.startswith('  ', 1):
+            total_us += int(cumulative_us)
+    loaded = json.loads(proc.stdout.strip().splitlines()[-1])
+    loaded_set = set(loaded)
+    return total_us / 1000, [item for item in own if item[1] in loaded_set], loaded
+
+
+def measure(module: str, runs: int) -> Tuple[float, List[Tuple[int, str]], List[str]]:
+    """Минимальное время импорта по runs запускам; профиль и модули - последнего запуска."""
+    times = []
+    for _ in range(runs):
+        elapsed, own, loaded = import_once(module)
+        times.append(elapsed)
+    return min(times), own, loaded
+
+
+def load_budget(path: Path) -> Dict[str, dict]:
+    if not path.exists():
+        return {}
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def check(module: str, elapsed: float, loaded: List[str], budget: Optional[dict]) -> List[str]:
+    """Возвращает список нарушений бюджета модуля."""
+    if budget is None:
+        return []
+    problems = []
+    if elapsed > budget['max_ms']:
+        problems.append(f"{elapsed:.1f} мс > бюджета {budget['max_ms']} мс")
+    loaded_set = set(loaded)
+    for forbidden in budget.get('forbid', []):
+        if forbidden in loaded_set:
+            problems.append(f"загружается {forbidden}")
+    return problems
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('modules', nargs='*',
+                        help='модули (по умолчанию - все из файла бюджета)')
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--top', type=int, default=0,
+                        help='показать N самых дорогих импортов каждого модуля')
+    parser.add_argument('--budget', type=Path, default=BUDGET_FILE)
+    parser.add_argument('--write-budget', action='store_true',
+                        help='записать текущие времена (с запасом) в файл бюджета')
+    parser.add_argument('--headroom', type=float, default=2.0,
+                        help='множитель запаса для --write-budget')
+    parser.add_argument('--slack', type=float, default=10.0,
+                        help='минимальный запас бюджета в мс для --write-budget')
+    args = parser.parse_args()
+
+    budgets = load_budget(args.budget)
+    modules = args.modules or list(budgets)
+    violations = 0
+
+    print(f"{'модуль':<40} {'минимум, мс':>12} {'бюджет, мс':>11}  статус")
+    for module in modules:
+        try:
+            elapsed, own, loaded = measure(module, args.runs)
+        except RuntimeError as e:
+            print(f"{module:<40} {'-':>12} {'-':>11}  не импортируется: {e}")
+            continue
+
+        budget = budgets.get(module)
+        if args.write_budget:
+            budgets[module] = {'max_ms': round(max(elapsed * args.headroom, elapsed + args.slack), 1),
+                               'forbid': budget.get('forbid', []) if budget else []}
+            budget = None
+        problems = check(module, elapsed, loaded, budget)
+        violations += bool(problems)
+        limit = f"{budget['max_ms']:.1f}" if budget else '-'
+        status = '; '.join(problems) if problems else 'OK'
+        print(f"{module:<40} {elapsed:>12.1f} {limit:>11}  {status}")
+
+        for self_us, name in sorted(own, reverse=True)[:args.top]:
+            print(f"    {self_us / 1000:>8.1f} мс  {name}")
+
+    if args.write_budget:
+        with open(args.budget, 'w', encoding='utf-8') as f:
+            json.dump(budgets, f, indent=4, ensure_ascii=False)
+            f.write('\n')
+        print(f"Бюджет записан в {args.budget}")
+    elif violations:
+        print(f"Превышение бюджета: {violations} модул(ей)")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
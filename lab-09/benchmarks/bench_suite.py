@@ -0,0 +1,321 @@
+"""
+Набор бенчмарков горячих путей lab-09 на синтетических компаниях.
+
+Сценарии: Company.find_employee_by_id, remove_employee_globally,
+calculate_total_monthly_cost, сохранение/загрузка JSON, экспорт CSV,
+EmployeeRepository.find_by_specification и набор команд проектов.
+Данные строит benchmarks/datagen.py (детерминированно, по seed).
+
+Каждый сценарий на каждом размере выполняется --repeat раз; в
+результатах - минимум и медиана времени и время на операцию.
+Результаты пишутся в JSON (--json); --compare сравнивает их с
+сохранённым базовым прогоном и завершает скрипт с кодом 1, если
+какой-то сценарий медленнее базового больше чем на --threshold.
+Сценарий, модули которого не импортируются, помечается как
+недоступный и регрессией не считается.
+
+ИСПОЛЬЗОВАНИЕ:
+    python benchmarks/bench_suite.py --sizes 1k,100k --json baseline.json
+    python benchmarks/bench_suite.py --sizes 1k,100k --compare baseline.json
+    python benchmarks/bench_suite.py --sizes 1M --cases company.find_employee_by_id
+    python benchmarks/bench_suite.py --list
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from datagen import (
+    DEPARTMENTS, TEAM_SIZE, build_company, employee_records, format_size, make_employee, parse_size
+)
+
+LOOKUPS = 1_000       # поисков по ID за прогон
+REMOVALS = 100        # удалений за прогон
+
+# setup(size) -> функция прогона; прогон возвращает число выполненных операций
+Setup = Callable[[int], Callable[[], int]]
+
+
+@dataclass
+class Case:
+    """Сценарий бенчмарка."""
+    name: str
+    setup: Setup
+    fresh: bool = False   # прогон меняет данные: setup перед каждым повтором
+
+
+@dataclass
+class CaseResult:
+    """Результат сценария на одном размере."""
+    case: str
+    size: int
+    status: str                        # 'ok' | 'unavailable' | 'error'
+    min_s: Optional[float] = None
+    median_s: Optional[float] = None
+    ops: int = 0
+    per_op_us: Optional[float] = None
+    error: str = ''
+
+
+CASES: Dict[str, Case] = {}
+
+
+def case(name: str, fresh: bool = False) -> Callable[[Setup], Setup]:
+    """Регистрирует функцию подготовки сценария."""
+    def register(setup: Setup) -> Setup:
+        CASES[name] = Case(name, setup, fresh)
+        return setup
+    return register
+
+
+def _sample_ids(size: int, count: int, odd_only: bool = False, seed: int = 7) -> List[int]:
+    rng = random.Random(seed)
+    pool = range(1, size + 1, 2) if odd_only else range(1, size + 1)
+    return rng.sample(pool, min(count, len(pool)))
+
+
+# ===== Сценарии =====
+
+@case('company.find_employee_by_id')
+def _find_employee_by_id(size: int):
+    company = build_company(size)
+    ids = _sample_ids(size, LOOKUPS)
+
+    def run() -> int:
+        for emp_id in ids:
+            company.find_employee_by_id(emp_id)
+        return len(ids)
+    return run
+
+
+@case('company.remove_employee_globally', fresh=True)
+def _remove_employee_globally(size: int):
+    company = build_company(size)
+    ids = _sample_ids(size, REMOVALS, odd_only=True)  # нечётные ID не входят в команды
+
+    def run() -> int:
+        for emp_id in ids:
+            company.remove_employee_globally(emp_id)
+        return len(ids)
+    return run
+
+
+@case('company.calculate_total_monthly_cost')
+def _calculate_total_monthly_cost(size: int):
+    company = build_company(size)
+
+    def run() -> int:
+        company.calculate_total_monthly_cost()
+        return 1
+    return run
+
+
+@case('company.save_to_json')
+def _save_to_json(size: int):
+    company = build_company(size)
+    filename = os.path.join(tempfile.mkdtemp(prefix='bench_suite_'), 'company.json')
+
+    def run() -> int:
+        company.save_to_json(filename)
+        return size
+    return run
+
+
+@case('company.load_from_json')
+def _load_from_json(size: int):
+    from organization.company import Company
+
+    filename = os.path.join(tempfile.mkdtemp(prefix='bench_suite_'), 'company.json')
+    build_company(size).save_to_json(filename)
+
+    def run() -> int:
+        Company.load_from_json(filename)
+        return size
+    return run
+
+
+@case('company.export_employees_csv')
+def _export_employees_csv(size: int):
+    company = build_company(size)
+    filename = os.path.join(tempfile.mkdtemp(prefix='bench_suite_'), 'employees.csv')
+
+    def run() -> int:
+        company.export_employees_csv(filename)
+        return size
+    return run
+
+
+@case('repository.find_by_specification')
+def _find_by_specification(size: int):
+    from patterns.data_access_refactored import (
+        EmployeeRepository, DepartmentSpecification, SalarySpecification
+    )
+
+    repository = EmployeeRepository()
+    for record in employee_records(size):
+        repository.add(record)
+    spec = DepartmentSpecification(DEPARTMENTS[0]).and_spec(SalarySpecification(50_000, 150_000))
+
+    def run() -> int:
+        repository.find_by_specification(spec)
+        return size
+    return run
+
+
+@case('project.build_teams')
+def _build_teams(size: int):
+    from organization.project import Project
+
+    employees = [make_employee(record) for record in employee_records(size)]
+
+    def run() -> int:
+        for project_id, start in enumerate(range(0, size, TEAM_SIZE), 1):
+            project = Project(project_id, f'Project {project_id}', 'synthetic', '2030-12-31')
+            for employee in employees[start:start + TEAM_SIZE]:
+                project.add_team_member(employee)
+        return size
+    return run
+
+
+# ===== Запуск =====
+
+class _NullWriter:
+    """Приёмник stdout: сценарии печатают по строке на операцию."""
+
+    def write(self, text: str) -> int:
+        return len(text)
+
+    def flush(self) -> None:
+        pass
+
+
+def run_case(bench: Case, size: int, repeat: int) -> CaseResult:
+    """Выполняет сценарий repeat раз; подготовка в замер не входит."""
+    times = []
+    ops = 0
+    try:
+        with contextlib.redirect_stdout(_NullWriter()):
+            run = bench.setup(size)
+            for index in range(repeat):
+                if bench.fresh and index:
+                    run = bench.setup(size)
+                start = time.perf_counter()
+                ops = run()
+                times.append(time.perf_counter() - start)
+    except ImportError as e:
+        return CaseResult(bench.name, size, 'unavailable', error=str(e))
+    except Exception as e:
+        return CaseResult(bench.name, size, 'error', error=f"{type(e).__name__}: {e}")
+
+    best = min(times)
+    return CaseResult(bench.name, size, 'ok', min_s=best, median_s=statistics.median(times),
+                      ops=ops, per_op_us=best / ops * 1e6 if ops else None)
+
+
+def compare(results: List[CaseResult], baseline: Dict[str, Any], threshold: float) -> int:
+    """
+    Печатает сравнение с базовым прогоном по минимальному времени.
+
+    :returns: Число регрессий (замедление больше чем в 1 + threshold раз
+              или сценарий, успешный в базе, сейчас не выполнился).
+    """
+    base = {(item['case'], item['size']): item for item in baseline['results']}
+    regressions = 0
+    print(f"\nСравнение с базовым прогоном ({baseline['meta']['timestamp']}), порог {threshold:.0%}:")
+    for result in results:
+        old = base.get((result.case, result.size))
+        label = f"{result.case} [{format_size(result.size)}]"
+        was_ok = bool(old) and old.get('status') == 'ok'
+        if was_ok and result.status != 'ok':
+            regressions += 1
+            print(f"  {label:<50} РЕГРЕССИЯ ({result.status}): {result.error}")
+            continue
+        if result.status != 'ok' or not was_ok:
+            print(f"  {label:<50} нет данных для сравнения")
+            continue
+        ratio = result.min_s / old['min_s']
+        if ratio > 1 + threshold:
+            verdict = 'РЕГРЕССИЯ'
+            regressions += 1
+        elif ratio < 1 / (1 + threshold):
+            verdict = 'ускорение'
+        else:
+            verdict = 'без изменений'
+        print(f"  {label:<50} x{ratio:>6.2f}  {verdict}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sizes', default='1k,100k',
+                        help='размеры компаний через запятую (1k, 100k, 1M)')
+    parser.add_argument('--cases', default='',
+                        help='сценарии через запятую (по умолчанию - все)')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--json', type=Path, help='записать результаты в JSON')
+    parser.add_argument('--compare', type=Path, help='базовый прогон (JSON) для сравнения')
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='допустимое замедление относительно базы (0.25 = 25%%)')
+    parser.add_argument('--list', action='store_true', help='показать сценарии')
+    args = parser.parse_args()
+
+    if args.list:
+        print('\n'.join(CASES))
+        return
+
+    names = [name.strip() for name in args.cases.split(',') if name.strip()] or list(CASES)
+    unknown = [name for name in names if name not in CASES]
+    if unknown:
+        parser.error(f"неизвестные сценарии: {', '.join(unknown)}")
+    sizes = [parse_size(size) for size in args.sizes.split(',')]
+
+    results = []
+    print(f"{'сценарий':<40} {'размер':>7} {'мин, с':>10} {'медиана, с':>11} {'мкс/оп':>10}")
+    for size in sizes:
+        for name in names:
+            result = run_case(CASES[name], size, args.repeat)
+            results.append(result)
+            if result.status == 'ok':
+                print(f"{name:<40} {format_size(size):>7} {result.min_s:>10.4f} "
+                      f"{result.median_s:>11.4f} {result.per_op_us:>10.2f}")
+            else:
+                label = 'недоступен' if result.status == 'unavailable' else 'ошибка'
+                print(f"{name:<40} {format_size(size):>7}  {label}: {result.error}")
+
+    if args.json:
+        report = {
+            'meta': {
+                'timestamp': datetime.now().isoformat(timespec='seconds'),
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'repeat': args.repeat,
+            },
+            'results': [asdict(result) for result in results],
+        }
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=4, ensure_ascii=False)
+        print(f"\nРезультаты записаны в {args.json}")
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+        if compare(results, baseline, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
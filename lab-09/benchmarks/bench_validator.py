@@ -0,0 +1,67 @@
+"""
+Бенчмарк скомпилированной схемы EmployeeDataValidator (composite).
+
+Сравнивает интерпретируемую проверку (collect_errors для каждой записи),
+validate_employee_data на скомпилированной схеме и пакетный validate_many.
+
+ИСПОЛЬЗОВАНИЕ:
+    python benchmarks/bench_validator.py --rows 1000000 --invalid 0.01
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from patterns.composite import EmployeeDataValidator
+
+TYPES = ('manager', 'developer', 'salesperson', 'employee')
+
+
+def make_rows(count: int, invalid: float, seed: int = 42):
+    rng = random.Random(seed)
+    rows = []
+    for i in range(count):
+        row = {'id': i + 1, 'name': f'Emp {i}', 'department': 'IT',
+               'base_salary': 1000.0 + i % 5000, 'type': TYPES[i % len(TYPES)],
+               'bonus': 500.0, 'seniority': 'middle', 'commission_rate': 0.1}
+        if rng.random() < invalid:
+            row['name'] = ''
+        rows.append(row)
+    return rows
+
+
+def bench(label: str, func) -> float:
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<32} {elapsed:>9.3f} s   невалидных: {result:,}")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--invalid', type=float, default=0.01,
+                        help='доля невалидных записей')
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows, args.invalid)
+    validator = EmployeeDataValidator()
+    print(f"Записей: {args.rows:,}, доля невалидных: {args.invalid}")
+
+    def compiled():
+        return sum(validator.compile(row.get('type', 'employee'))(row) is not None for row in rows)
+
+    interpreted = bench("collect_errors (интерпретация)",
+                        lambda: sum(bool(validator.collect_errors(row)) for row in rows))
+    single = bench("compile() построчно", compiled)
+    batch = bench("validate_many", lambda: len(validator.validate_many(rows).errors))
+    print(f"ускорение: построчно ~{interpreted / single:.1f}x, пакетно ~{interpreted / batch:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
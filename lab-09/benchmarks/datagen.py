@@ -0,0 +1,115 @@
+"""
+Синтетические данные компании для бенчмарков lab-09.
+
+Генераторы детерминированы (seed), поэтому результаты разных запусков
+и разных машин сравнимы по одинаковым данным. Размеры задаются
+строками вида '1k', '100k', '1M'.
+"""
+
+import random
+from typing import Any, Dict, Iterator, List
+
+DEPARTMENTS = ('Development', 'Sales', 'Marketing', 'Support', 'Finance', 'HR', 'Operations', 'QA')
+EMPLOYEE_TYPES = ('employee', 'manager', 'developer', 'salesperson')
+TYPE_WEIGHTS = (4, 1, 4, 2)
+SENIORITY = ('junior', 'middle', 'senior')
+TECH = ('Python', 'Java', 'Go', 'SQL', 'Docker', 'React', 'Kotlin')
+
+# Команды проектов набираются из сотрудников с чётными ID: нечётные
+# можно удалять без DependencyError (см. remove_employee_globally).
+TEAM_SIZE = 50
+
+_SUFFIXES = {'k': 1_000, 'M': 1_000_000}
+
+
+def parse_size(text: str) -> int:
+    """'100k' -> 100000, '1M' -> 1000000, '500' -> 500."""
+    text = text.strip()
+    if text[-1:] in _SUFFIXES:
+        return int(float(text[:-1]) * _SUFFIXES[text[-1]])
+    return int(text)
+
+
+def format_size(size: int) -> str:
+    """100000 -> '100k' (обратное к parse_size для круглых значений)."""
+    for suffix, factor in sorted(_SUFFIXES.items(), key=lambda item: -item[1]):
+        if size >= factor and size % factor == 0:
+            return f"{size // factor}{suffix}"
+    return str(size)
+
+
+def employee_records(count: int, seed: int = 42) -> Iterator[Dict[str, Any]]:
+    """
+    Записи сотрудников в формате to_dict()/EmployeeRepository.
+
+    ID идут подряд с 1; тип, отдел и зарплата выбираются псевдослучайно.
+    """
+    rng = random.Random(seed)
+    types = rng.choices(EMPLOYEE_TYPES, TYPE_WEIGHTS, k=count)
+    for index, emp_type in enumerate(types):
+        emp_id = index + 1
+        record = {
+            'id': emp_id,
+            'name': f'Employee {emp_id}',
+            'department': DEPARTMENTS[rng.randrange(len(DEPARTMENTS))],
+            'base_salary': float(rng.randrange(30_000, 200_000, 500)),
+            'type': emp_type,
+        }
+        if emp_type == 'manager':
+            record['bonus'] = float(rng.randrange(0, 50_000, 1_000))
+        elif emp_type == 'developer':
+            record['seniority_level'] = SENIORITY[rng.randrange(len(SENIORITY))]
+            record['tech_stack'] = rng.sample(TECH, 2)
+        elif emp_type == 'salesperson':
+            record['commission_rate'] = round(rng.uniform(0.05, 0.2), 3)
+            record['sales_volume'] = float(rng.randrange(0, 1_000_000, 5_000))
+        yield record
+
+
+def make_employee(record: Dict[str, Any]):
+    """Создаёт объект сотрудника (specialists) по записи employee_records()."""
+    from specialists.developer import Developer
+    from specialists.manager import Manager
+    from specialists.ordinary_employee import OrdinaryEmployee
+    from specialists.salesperson import Salesperson
+
+    emp_type = record['type']
+    common = (record['id'], record['name'], record['department'], record['base_salary'])
+    if emp_type == 'manager':
+        return Manager(*common, bonus=record['bonus'])
+    if emp_type == 'developer':
+        return Developer(*common, record['seniority_level'], list(record['tech_stack']))
+    if emp_type == 'salesperson':
+        return Salesperson(*common, sales_volume=record['sales_volume'],
+                           commission_rate=record['commission_rate'])
+    return OrdinaryEmployee(*common)
+
+
+def build_company(count: int, seed: int = 42, team_size: int = TEAM_SIZE):
+    """
+    Компания из count сотрудников по отделам DEPARTMENTS и проектам.
+
+    Проектов count // (2 * team_size) (минимум один); в команды входят
+    сотрудники с чётными ID.
+    """
+    from organization.company import Company
+    from organization.department import Department
+    from organization.project import Project
+
+    company = Company(f'Synthetic {format_size(count)}')
+    departments = {name: Department(name) for name in DEPARTMENTS}
+    even: List[Any] = []
+    for record in employee_records(count, seed):
+        employee = make_employee(record)
+        departments[record['department']].add_employee(employee)
+        if record['id'] % 2 == 0:
+            even.append(employee)
+    for department in departments.values():
+        company.add_department(department)
+
+    for project_id, start in enumerate(range(0, max(len(even), 1), team_size), 1):
+        project = Project(project_id, f'Project {project_id}', 'synthetic', '2030-12-31')
+        for employee in even[start:start + team_size]:
+            project.add_team_member(employee)
+        company.add_project(project)
+    return company
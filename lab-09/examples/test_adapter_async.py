@@ -0,0 +1,259 @@
+"""
+Тесты для асинхронного адаптера внешнего сервиса (Adapter Pattern).
+
+Покрывает:
+  ✓ FakeExternalSalaryService
+  ✓ Ограничение параллелизма и пакетирование
+  ✓ Построчные ошибки при отмене и неполном ответе сервиса
+  ✓ Таймауты и повторы
+  ✓ CircuitBreaker
+  ✓ CompanySalaryManager с AsyncSalaryCalculator
+"""
+
+import asyncio
+import math
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from patterns.adapter_refactored import (
+    AsyncExternalServiceAdapter, AsyncSalaryCalculator, FakeExternalSalaryService, CircuitBreaker,
+    CircuitState, CircuitOpenError, RetryPolicy, CompanySalaryManager,
+    ExternalServiceAdapter, ExternalSalaryCalculationService
+)
+
+
+class ShortBatchService(FakeExternalSalaryService):
+    """Сервис, теряющий последнее значение в полных пакетах из 10 строк."""
+    
+    async def calculate_monthly_payments(self, batch):
+        result = await super().calculate_monthly_payments(batch)
+        return result[:-1] if len(batch) == 10 else result
+
+
+class CancellingService(FakeExternalSalaryService):
+    """Сервис, отменяющий запрос для пакета с базовой зарплатой 1000."""
+    
+    async def calculate_monthly_payments(self, batch):
+        if any(item['base'] == 1000 for item in batch):
+            raise asyncio.CancelledError()
+        return await super().calculate_monthly_payments(batch)
+
+
+class CancellingCalculator(AsyncSalaryCalculator):
+    """Построчный калькулятор, задача которого для id=1 отменяется."""
+    
+    async def calculate_salary(self, employee):
+        if employee['id'] == 1:
+            raise asyncio.CancelledError()
+        return employee['base_salary'] * 2.0
+
+
+def make_employees(count):
+    return [{'id': i + 1, 'name': f'Emp {i}', 'base_salary': 1000 + i,
+             'type': 'developer'} for i in range(count)]
+
+
+def make_adapter(service, **kwargs):
+    kwargs.setdefault('retry_policy', RetryPolicy(attempts=3, base_delay=0.0))
+    return AsyncExternalServiceAdapter(service, rng=random.Random(1), **kwargs)
+
+
+class TestCircuitBreaker:
+    """Тесты для CircuitBreaker."""
+    
+    def test_opens_after_threshold(self):
+        """Тест размыкания после серии ошибок."""
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10, clock=lambda: 0.0)
+        breaker.record_failure()
+        assert breaker.allow_request() is True
+        breaker.record_failure()
+        assert breaker.state == CircuitState.OPEN
+        assert breaker.allow_request() is False
+    
+    def test_half_open_after_timeout(self):
+        """Тест пробного запроса после таймаута."""
+        now = [0.0]
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=5, clock=lambda: now[0])
+        breaker.record_failure()
+        now[0] = 5.0
+        
+        assert breaker.state == CircuitState.HALF_OPEN
+        breaker.record_success()
+        assert breaker.state == CircuitState.CLOSED
+    
+    def test_half_open_admits_single_probe(self):
+        """Тест: в HALF_OPEN проходит один запрос до результата пробы."""
+        now = [0.0]
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=5, clock=lambda: now[0])
+        breaker.record_failure()
+        now[0] = 5.0
+        
+        assert [breaker.allow_request() for _ in range(3)] == [True, False, False]
+        breaker.release_probe()
+        assert breaker.allow_request() is True
+        breaker.record_failure()
+        assert breaker.allow_request() is False
+        now[0] = 10.0
+        assert breaker.allow_request() is True
+        breaker.record_success()
+        assert breaker.allow_request() is True and breaker.allow_request() is True
+
+
+class TestAsyncAdapter:
+    """Тесты для AsyncExternalServiceAdapter."""
+    
+    def test_matches_sync_adapter(self):
+        """Тест совпадения с синхронным адаптером."""
+        employee = make_employees(1)[0]
+        adapter = make_adapter(FakeExternalSalaryService(latency=0))
+        sync_adapter = ExternalServiceAdapter(ExternalSalaryCalculationService())
+        
+        result = asyncio.run(adapter.calculate_salary(employee))
+        
+        assert result == pytest.approx(sync_adapter.calculate_salary(employee))
+    
+    def test_concurrency_is_bounded(self):
+        """Тест ограничения числа одновременных запросов."""
+        service = FakeExternalSalaryService(latency=0.01)
+        adapter = make_adapter(service, max_concurrency=3, batch_size=1)
+        
+        batch = asyncio.run(adapter.calculate_many(make_employees(12)))
+        
+        assert batch.errors == {}
+        assert service.max_in_flight == 3
+    
+    def test_batching_reduces_requests(self):
+        """Тест пакетирования запросов."""
+        service = FakeExternalSalaryService(latency=0)
+        adapter = make_adapter(service, batch_size=10)
+        
+        batch = asyncio.run(adapter.calculate_many(make_employees(25)))
+        
+        assert service.request_count == 3
+        assert len(batch) == 25
+        assert not any(math.isnan(s) for s in batch.salaries)
+    
+    def test_invalid_rows_reported(self):
+        """Тест построчных ошибок валидации."""
+        rows = make_employees(2) + [{'id': 3, 'name': 'Bad', 'type': 'manager'}]
+        adapter = make_adapter(FakeExternalSalaryService(latency=0))
+        
+        batch = asyncio.run(adapter.calculate_many(rows))
+        
+        assert list(batch.errors) == [2]
+        assert math.isnan(batch.salaries[2])
+    
+    def test_short_service_response_reported_per_row(self):
+        """Тест: ответ сервиса короче пакета - ошибка строк пакета, остальные посчитаны."""
+        adapter = make_adapter(ShortBatchService(latency=0), batch_size=10)
+        
+        batch = asyncio.run(adapter.calculate_many(make_employees(25)))
+        
+        assert sorted(batch.errors) == list(range(20))
+        assert "9 значений на 10 строк" in batch.errors[0]
+        assert all(math.isnan(s) for s in batch.salaries[:20])
+        assert not any(math.isnan(s) for s in batch.salaries[20:])
+    
+    def test_cancelled_chunk_reported_per_row(self):
+        """Тест: отменённый пакет или строка - ошибка строк, а не TypeError всего пакета."""
+        adapter = make_adapter(CancellingService(latency=0), batch_size=10)
+        
+        batch = asyncio.run(adapter.calculate_many(make_employees(25)))
+        rows = asyncio.run(CancellingCalculator().calculate_many(make_employees(3)))
+        
+        assert sorted(batch.errors) == list(range(10))
+        assert batch.errors[0].startswith("CancelledError")
+        assert not any(math.isnan(s) for s in batch.salaries[10:])
+        assert rows.errors == {0: "CancelledError"}
+        assert rows.salaries[1:] == [2002.0, 2004.0]
+    
+    def test_timeout_is_retried_then_reported(self):
+        """Тест таймаута после исчерпания повторов."""
+        service = FakeExternalSalaryService(latency=0.2)
+        adapter = make_adapter(service, timeout=0.01)
+        
+        with pytest.raises(asyncio.TimeoutError):
+            asyncio.run(adapter.calculate_salary(make_employees(1)[0]))
+        assert service.request_count == 3
+    
+    def test_transient_failures_are_retried(self):
+        """Тест повторов при временных сбоях."""
+        service = FakeExternalSalaryService(latency=0, failure_rate=0.3, rng=random.Random(7))
+        adapter = make_adapter(service, batch_size=1,
+                               retry_policy=RetryPolicy(attempts=10, base_delay=0.0),
+                               circuit_breaker=CircuitBreaker(failure_threshold=1000))
+        
+        batch = asyncio.run(adapter.calculate_many(make_employees(20)))
+        
+        assert batch.errors == {}
+        assert service.request_count > 20
+    
+    def test_circuit_opens_and_rejects(self):
+        """Тест отказа при разомкнутом предохранителе."""
+        service = FakeExternalSalaryService(latency=0, failure_rate=1.0)
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+        adapter = make_adapter(service, circuit_breaker=breaker)
+        
+        with pytest.raises(CircuitOpenError):
+            asyncio.run(adapter.calculate_salary(make_employees(1)[0]))
+        assert service.request_count == 2
+    
+    def test_concurrent_requests_after_reset_send_one_probe(self):
+        """Тест: после reset_timeout конкурентные запросы дают одну пробу."""
+        now = [0.0]
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=5, clock=lambda: now[0])
+        breaker.record_failure()
+        now[0] = 5.0
+        service = FakeExternalSalaryService(latency=0.01)
+        adapter = make_adapter(service, max_concurrency=8, batch_size=1, circuit_breaker=breaker)
+        
+        batch = asyncio.run(adapter.calculate_many(make_employees(8)))
+        
+        assert service.request_count == 1
+        assert len(batch.errors) == 7
+        assert breaker.state == CircuitState.CLOSED
+    
+    def test_cancelled_probe_is_released(self):
+        """Тест: отменённая проба не блокирует следующие запросы."""
+        now = [0.0]
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=5, clock=lambda: now[0])
+        breaker.record_failure()
+        now[0] = 5.0
+        adapter = make_adapter(FakeExternalSalaryService(latency=1.0), circuit_breaker=breaker)
+        
+        async def cancel_probe():
+            task = asyncio.ensure_future(adapter.calculate_salary(make_employees(1)[0]))
+            await asyncio.sleep(0.01)
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        
+        asyncio.run(cancel_probe())
+        
+        assert breaker.state == CircuitState.HALF_OPEN
+        assert breaker.allow_request() is True
+
+
+class TestManagerWithAsyncCalculator:
+    """Тесты для CompanySalaryManager с асинхронным калькулятором."""
+    
+    def test_calculate_payroll(self):
+        """Тест синхронного вызова ведомости."""
+        manager = CompanySalaryManager(make_adapter(FakeExternalSalaryService(latency=0)))
+        
+        payroll = manager.calculate_payroll(make_employees(5))
+        
+        assert manager.is_async is True
+        assert len(payroll) == 5
+    
+    def test_calculate_payroll_async(self):
+        """Тест вызова из работающего цикла событий."""
+        manager = CompanySalaryManager(make_adapter(FakeExternalSalaryService(latency=0)))
+        
+        payroll = asyncio.run(manager.calculate_payroll_async(make_employees(5)))
+        
+        assert len(payroll) == 5
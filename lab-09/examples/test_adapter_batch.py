@@ -0,0 +1,104 @@
+"""
+Тесты для пакетного расчёта зарплат (Adapter Pattern).
+
+Покрывает:
+  ✓ EmployeeDataValidator.validate_many
+  ✓ calculate_many для ExternalServiceAdapter и LegacyCalculatorAdapter
+  ✓ Совпадение с построчным расчётом
+  ✓ CompanySalaryManager.calculate_payroll на пакетном пути
+"""
+
+import math
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from patterns.adapter_refactored import (
+    EmployeeDataValidator, ExternalSalaryCalculationService, LegacySalaryCalculator,
+    ExternalServiceAdapter, LegacyCalculatorAdapter, CompanySalaryManager,
+    SalaryCalculator
+)
+
+
+EMPLOYEES = [
+    {'id': 1, 'name': 'Ann', 'base_salary': 5000, 'type': 'manager'},
+    {'id': 2, 'name': 'Bob', 'base_salary': 4000, 'type': 'developer'},
+    {'id': 3, 'name': 'Cid', 'base_salary': 3000, 'type': 'salesperson'},
+    {'id': 4, 'name': 'Dan', 'base_salary': 2000, 'type': 'employee'},
+    {'id': 5, 'name': 'Eve', 'base_salary': 1000, 'type': 'intern'},
+]
+
+
+@pytest.fixture(params=['external', 'legacy'])
+def adapter(request):
+    if request.param == 'external':
+        return ExternalServiceAdapter(ExternalSalaryCalculationService())
+    return LegacyCalculatorAdapter(LegacySalaryCalculator())
+
+
+class TestValidateMany:
+    """Тесты пакетной валидации."""
+    
+    def test_reports_only_failed_rows(self):
+        """Тест отчёта по невалидным строкам."""
+        rows = [EMPLOYEES[0], {'id': 2, 'name': 'X', 'type': 'manager'},
+                {'id': 3, 'name': 'Y', 'base_salary': -1, 'type': 'manager'}]
+        
+        failures = EmployeeDataValidator().validate_many(rows)
+        
+        assert set(failures) == {1, 2}
+        assert "Missing field: base_salary" in failures[1]
+        assert "negative" in failures[2]
+
+
+class TestCalculateMany:
+    """Тесты пакетного расчёта."""
+    
+    def test_matches_scalar_path(self, adapter):
+        """Тест совпадения с построчным расчётом."""
+        batch = adapter.calculate_many(EMPLOYEES)
+        
+        expected = [adapter.calculate_salary(e) for e in EMPLOYEES]
+        assert [float(s) for s in batch.salaries] == pytest.approx(expected)
+        assert batch.errors == {}
+        assert batch.total == pytest.approx(sum(expected))
+    
+    def test_invalid_rows_are_nan(self, adapter):
+        """Тест пометки невалидных строк."""
+        rows = EMPLOYEES[:2] + [{'id': 9, 'name': 'Bad', 'base_salary': -5, 'type': 'manager'}]
+        
+        batch = adapter.calculate_many(rows)
+        
+        assert batch.failed_count == 1
+        assert math.isnan(batch.salaries[2])
+        assert batch.total == pytest.approx(adapter.calculate_many(EMPLOYEES[:2]).total)
+    
+    def test_default_implementation_loops(self):
+        """Тест базовой реализации для пользовательских калькуляторов."""
+        class Flat(SalaryCalculator):
+            def calculate_salary(self, employee):
+                if employee['base_salary'] < 0:
+                    raise ValueError("negative")
+                return 1.0
+        
+        batch = Flat().calculate_many([{'base_salary': 1}, {'base_salary': -1}])
+        assert batch.salaries[0] == 1.0
+        assert list(batch.errors) == [1]
+
+
+class TestPayrollBatch:
+    """Тесты расчёта ведомости через пакетный путь."""
+    
+    def test_payroll_skips_invalid(self, adapter):
+        """Тест пропуска невалидных сотрудников."""
+        rows = EMPLOYEES + [{'id': 6, 'name': 'Ghost', 'type': 'manager'}]
+        manager = CompanySalaryManager(adapter)
+        
+        payroll = manager.calculate_payroll(rows)
+        
+        assert 'Ghost' not in payroll
+        assert payroll['Ann'] == pytest.approx(adapter.calculate_salary(EMPLOYEES[0]))
+        assert len(payroll) == len(EMPLOYEES)
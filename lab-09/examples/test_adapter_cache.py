@@ -0,0 +1,163 @@
+"""
+Тесты для кэширующего калькулятора зарплат (Adapter + Decorator).
+
+Покрывает:
+  ✓ Попадания и промахи по ключу (type, base_salary)
+  ✓ Вытеснение LRU и истечение TTL
+  ✓ Инвалидация (явная и при изменении маппинга типов, в том числе во время расчёта)
+  ✓ Пакетный расчёт через кэш
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from patterns.adapter_refactored import (
+    CachingSalaryCalculator, ExternalServiceAdapter, ExternalSalaryCalculationService,
+    LegacyCalculatorAdapter, LegacySalaryCalculator, SalaryCalculator, TypeConverter
+)
+
+
+class CountingCalculator(SalaryCalculator):
+    """Калькулятор, считающий вызовы."""
+    
+    def __init__(self):
+        self.calls = 0
+    
+    def calculate_salary(self, employee):
+        self.calls += 1
+        return employee['base_salary'] * 2.0
+
+
+def emp(emp_id, salary=1000, emp_type='developer'):
+    return {'id': emp_id, 'name': f'E{emp_id}', 'base_salary': salary, 'type': emp_type}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def restore_mapping():
+    saved = {k: dict(v) for k, v in TypeConverter.EMPLOYEE_TYPE_MAPPING.items()}
+    yield
+    for emp_type, mapping in saved.items():
+        TypeConverter.update_type_mapping(emp_type, mapping['external'], mapping['legacy'])
+
+
+class TestCachingCalculator:
+    """Тесты для CachingSalaryCalculator."""
+    
+    def test_hit_for_same_type_and_salary(self):
+        """Тест попадания для разных сотрудников с одинаковым ключом."""
+        inner = CountingCalculator()
+        cache = CachingSalaryCalculator(inner)
+        
+        assert cache.calculate_salary(emp(1)) == cache.calculate_salary(emp(2))
+        assert inner.calls == 1
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+    
+    def test_invalid_employee_not_cached(self):
+        """Тест отказа для невалидных данных."""
+        cache = CachingSalaryCalculator(CountingCalculator())
+        with pytest.raises(ValueError):
+            cache.calculate_salary({'id': 1, 'name': 'X', 'type': 'manager'})
+        assert cache.stats.size == 0
+    
+    def test_lru_eviction(self):
+        """Тест вытеснения самой старой записи."""
+        inner = CountingCalculator()
+        cache = CachingSalaryCalculator(inner, max_size=2)
+        cache.calculate_salary(emp(1, 100))
+        cache.calculate_salary(emp(2, 200))
+        cache.calculate_salary(emp(3, 100))   # обновляет позицию 100
+        cache.calculate_salary(emp(4, 300))   # вытесняет 200
+        
+        assert cache.stats.evictions == 1
+        cache.calculate_salary(emp(5, 100))
+        assert inner.calls == 3
+    
+    def test_ttl_expiration(self):
+        """Тест истечения времени жизни."""
+        clock = FakeClock()
+        inner = CountingCalculator()
+        cache = CachingSalaryCalculator(inner, ttl=10, clock=clock)
+        cache.calculate_salary(emp(1))
+        clock.now = 11
+        cache.calculate_salary(emp(1))
+        
+        assert inner.calls == 2
+        assert cache.stats.expirations == 1
+    
+    def test_explicit_invalidation_by_type(self):
+        """Тест явной инвалидации по типу."""
+        cache = CachingSalaryCalculator(CountingCalculator())
+        cache.calculate_salary(emp(1, emp_type='manager'))
+        cache.calculate_salary(emp(2, emp_type='developer'))
+        
+        assert cache.invalidate('manager') == 1
+        assert cache.stats.size == 1
+    
+    def test_mapping_change_invalidates(self, restore_mapping):
+        """Тест сброса кэша при изменении маппинга типов."""
+        adapter = ExternalServiceAdapter(ExternalSalaryCalculationService())
+        cache = CachingSalaryCalculator(adapter)
+        before = cache.calculate_salary(emp(1, emp_type='developer'))
+        
+        TypeConverter.update_type_mapping('developer', 2.0, 'DEV')
+        after = cache.calculate_salary(emp(1, emp_type='developer'))
+        
+        assert after != before
+        assert after == pytest.approx(adapter.calculate_salary(emp(1, emp_type='developer')))
+        assert cache.stats.invalidations == 1
+    
+    def test_mapping_change_during_calculation_not_cached(self, restore_mapping):
+        """Тест: значение, посчитанное до изменения маппинга, не попадает в кэш."""
+        class RemappingCalculator(CountingCalculator):
+            def calculate_salary(self, employee):
+                TypeConverter.update_type_mapping('developer', 2.0 + self.calls, 'DEV')
+                return super().calculate_salary(employee)
+        
+        inner = RemappingCalculator()
+        cache = CachingSalaryCalculator(inner)
+        cache.calculate_salary(emp(1))
+        cache.calculate_many([emp(1), emp(2, 2000)])
+        
+        assert cache.stats.size == 0
+        cache.calculate_salary(emp(1))
+        assert inner.calls == 4
+    
+    def test_mapping_is_read_only(self):
+        """Тест: маппинг нельзя изменить в обход update_type_mapping()."""
+        with pytest.raises(TypeError):
+            TypeConverter.EMPLOYEE_TYPE_MAPPING['developer'] = {'external': 2.0, 'legacy': 'DEV'}
+        with pytest.raises(TypeError):
+            TypeConverter.EMPLOYEE_TYPE_MAPPING['developer']['external'] = 2.0
+        
+        assert TypeConverter.convert_type_to_external('developer') == 1.5
+    
+    def test_calculate_many_groups_by_key(self):
+        """Тест пакетного расчёта с одной строкой на ключ."""
+        adapter = LegacyCalculatorAdapter(LegacySalaryCalculator())
+        cache = CachingSalaryCalculator(adapter)
+        rows = [emp(i, 1000 + (i % 3) * 100, 'manager') for i in range(1, 10)]
+        rows.append({'id': 99, 'name': 'Bad', 'type': 'manager', 'base_salary': -1})
+        
+        batch = cache.calculate_many(rows)
+        
+        assert list(batch.errors) == [9]
+        assert [float(s) for s in batch.salaries[:9]] == pytest.approx(
+            [adapter.calculate_salary(r) for r in rows[:9]])
+        assert cache.stats.misses == 3
+        assert cache.stats.hits == 6
+        
+        cache.calculate_many(rows[:9])
+        assert cache.stats.hits == 15
@@ -0,0 +1,184 @@
+"""
+Тесты для скомпилированной схемы EmployeeDataValidator (composite).
+
+Покрывает:
+  ✓ compile(): быстрый путь для валидной записи
+  ✓ Совпадение с построчной проверкой всех валидаторов
+  ✓ validate_many: компактный отчёт по строкам
+  ✓ recompile() после изменения валидаторов
+"""
+
+import itertools
+import math
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from patterns.composite import (
+    EmployeeDataValidator, ValidationError, ValidationReport, IValidator,
+    RangeValidator
+)
+
+
+def make_record(emp_type='employee', **overrides):
+    record = {
+        'id': 1, 'name': 'Ann', 'department': 'IT', 'base_salary': 5000.0,
+        'type': emp_type, 'bonus': 100.0, 'seniority': 'middle',
+        'commission_rate': 0.1,
+    }
+    record.update(overrides)
+    return record
+
+
+class EvenValidator(IValidator):
+    """Валидатор без собственного condition() - проверяет общий путь."""
+
+    def validate(self, value):
+        return [] if isinstance(value, int) and value % 2 == 0 else ["ID должен быть чётным"]
+
+
+class TestCompiledSchema:
+    """Тесты для compile()."""
+
+    def test_valid_record_returns_none(self):
+        """Тест быстрого пути: валидная запись не создаёт список ошибок."""
+        validator = EmployeeDataValidator()
+        for emp_type in ('employee', 'manager', 'developer', 'salesperson'):
+            assert validator.compile(emp_type)(make_record(emp_type)) is None
+
+    def test_invalid_record_returns_errors(self):
+        """Тест медленного пути: сообщения как у полной проверки."""
+        validator = EmployeeDataValidator()
+        record = make_record('developer', name='  ', seniority='lead')
+
+        errors = validator.compile('developer')(record)
+
+        assert errors == ["Имя не может быть пустым", "Неверный Уровень: lead"]
+
+    def test_compiled_function_is_cached(self):
+        """Тест кэширования функций; неизвестные типы используют общую схему."""
+        validator = EmployeeDataValidator()
+
+        assert validator.compile('manager') is validator.compile('manager')
+        assert validator.compile('intern') is validator.compile('employee')
+
+    def test_matches_interpreted_validation(self):
+        """Тест совпадения с collect_errors на граничных значениях."""
+        validator = EmployeeDataValidator()
+        values = [None, 0, -1, 1, True, 0.5, 1.5, -0.0, math.nan, '', ' ', '\t', 'x',
+                  'junior', 'senior', [1]]
+        fields = ['id', 'name', 'base_salary', 'seniority', 'commission_rate']
+
+        for emp_type in ('employee', 'developer', 'salesperson'):
+            check = validator.compile(emp_type)
+            for field_name, value in itertools.product(fields, values):
+                record = make_record(emp_type, **{field_name: value})
+                if field_name == 'seniority' and isinstance(value, list):
+                    continue  # нехешируемое значение не проверяется EnumValidator
+                expected = validator.collect_errors(record)
+                assert (check(record) or []) == expected, (emp_type, field_name, value)
+
+    def test_range_bounds_read_from_validator(self):
+        """Тест границ любого типа и их изменения без recompile()."""
+        validator = EmployeeDataValidator()
+        rate = validator._type_validators['salesperson']['commission_rate']
+        rate.max_val = math.inf
+        check = validator.compile('salesperson')
+
+        assert check(make_record('salesperson', commission_rate=5.0)) is None
+
+        rate.min_val, rate.max_val = 0.0, 0.3
+        assert check(make_record('salesperson', commission_rate=0.4)) == ["Комиссия должен быть в [0.0, 0.3]"]
+
+        rate.max_val = math.nan
+        assert check(make_record('salesperson', commission_rate=0.1)) == ["Комиссия должен быть в [0.0, nan]"]
+
+    def test_custom_validator_without_condition(self):
+        """Тест валидатора без condition(): используется validate()."""
+        validator = EmployeeDataValidator()
+        validator._validators['id'] = EvenValidator()
+        validator.recompile()
+
+        assert validator.compile('employee')(make_record(id=2)) is None
+        assert validator.compile('employee')(make_record(id=3)) == ["ID должен быть чётным"]
+
+
+class TestValidateEmployeeData:
+    """Тесты для validate_employee_data."""
+
+    def test_valid(self):
+        """Тест валидной записи."""
+        EmployeeDataValidator().validate_employee_data(make_record('manager'))
+
+    def test_invalid(self):
+        """Тест исключения со списком ошибок."""
+        validator = EmployeeDataValidator()
+        with pytest.raises(ValidationError) as info:
+            validator.validate_employee_data(make_record('manager', id=0, bonus=-5))
+
+        assert info.value.errors == ["ID должен быть положительным", "Бонус не может быть отрицательным"]
+
+    def test_recompile_after_change(self):
+        """Тест пересборки схемы после изменения валидаторов."""
+        validator = EmployeeDataValidator()
+        validator.validate_employee_data(make_record('salesperson', commission_rate=0.4))
+
+        validator._type_validators['salesperson']['commission_rate'] = RangeValidator('Комиссия', 0.0, 0.3)
+        validator.recompile()
+
+        with pytest.raises(ValidationError, match="Комиссия"):
+            validator.validate_employee_data(make_record('salesperson', commission_rate=0.4))
+
+
+class TestValidateMany:
+    """Тесты для validate_many."""
+
+    def test_all_valid(self):
+        """Тест пакета без ошибок."""
+        records = [make_record(t, id=i + 1) for i, t in
+                   enumerate(['employee', 'manager', 'developer', 'salesperson'] * 25)]
+
+        report = EmployeeDataValidator().validate_many(records)
+
+        assert isinstance(report, ValidationReport)
+        assert report.is_valid
+        assert report.total == 100
+        assert report.valid_count == 100
+
+    def test_errors_by_row(self):
+        """Тест отчёта: ошибки только для невалидных строк."""
+        records = [make_record('manager'), make_record('developer', seniority=None),
+                   make_record(), make_record('salesperson', commission_rate=1.5, name='')]
+
+        report = EmployeeDataValidator().validate_many(records)
+
+        assert report.invalid_rows == [1, 3]
+        assert report.valid_count == 2
+        assert report.errors[1] == ["Уровень не установлен"]
+        assert report.errors[3] == ["Имя не может быть пустым", "Комиссия должен быть в [0.0, 1.0]"]
+
+    def test_matches_single_validation(self):
+        """Тест совпадения с построчной проверкой."""
+        validator = EmployeeDataValidator()
+        records = [make_record(t, id=i % 7, base_salary=(i % 5) - 1, seniority=['junior', 'lead'][i % 2])
+                   for i, t in enumerate(['employee', 'manager', 'developer', 'salesperson', 'intern'] * 20)]
+
+        report = validator.validate_many(records)
+
+        expected = {row: validator.collect_errors(record)
+                    for row, record in enumerate(records) if validator.collect_errors(record)}
+        assert report.errors == expected
+
+    def test_empty(self):
+        """Тест пустого пакета."""
+        report = EmployeeDataValidator().validate_many([])
+
+        assert report.total == 0
+        assert report.is_valid
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
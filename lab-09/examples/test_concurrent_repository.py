@@ -0,0 +1,159 @@
+"""
+Тесты для потокобезопасного репозитория (Data Access Pattern).
+
+Покрывает:
+  ✓ AtomicIdAllocator
+  ✓ Версии сущностей и compare-and-swap
+  ✓ Оптимистичное обновление с повторами
+  ✓ Параллельный доступ из нескольких потоков
+"""
+
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from patterns.data_access_refactored import (
+    AtomicIdAllocator, ConcurrencyConflictError,
+    ConcurrentEmployeeRepository, ConcurrentDepartmentRepository,
+    SalarySpecification
+)
+
+
+def make_employee(emp_id=None, salary=1000):
+    return {'id': emp_id, 'name': 'John', 'base_salary': salary,
+            'type': 'developer', 'department': 'IT'}
+
+
+class TestAtomicIdAllocator:
+    """Тесты для AtomicIdAllocator."""
+    
+    def test_sequential_ids(self):
+        """Тест последовательной выдачи ID."""
+        allocator = AtomicIdAllocator()
+        assert [allocator.next_id() for _ in range(3)] == [1, 2, 3]
+    
+    def test_observe_explicit_id(self):
+        """Тест учёта явно заданного ID."""
+        allocator = AtomicIdAllocator()
+        allocator.observe(10)
+        assert allocator.next_id() == 11
+    
+    def test_unique_ids_across_threads(self):
+        """Тест уникальности ID при параллельной выдаче."""
+        allocator = AtomicIdAllocator()
+        results = []
+        
+        def worker():
+            results.extend(allocator.next_id() for _ in range(1000))
+        
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        
+        assert len(set(results)) == 8000
+
+
+class TestConcurrentRepository:
+    """Тесты для ConcurrentEmployeeRepository."""
+    
+    def test_add_allocates_id(self):
+        """Тест выделения ID при добавлении."""
+        repo = ConcurrentEmployeeRepository()
+        emp_id = repo.add(make_employee())
+        
+        assert repo.find_by_id(emp_id)['id'] == emp_id
+        assert repo.get_with_version(emp_id)[1] == 1
+    
+    def test_duplicate_id_rejected(self):
+        """Тест запрета повторного ID."""
+        repo = ConcurrentEmployeeRepository()
+        repo.add(make_employee(5))
+        with pytest.raises(ValueError):
+            repo.add(make_employee(5))
+    
+    def test_negative_salary_rejected(self):
+        """Тест валидации зарплаты."""
+        repo = ConcurrentEmployeeRepository()
+        with pytest.raises(ValueError):
+            repo.add(make_employee(salary=-1))
+    
+    def test_compare_and_swap_increments_version(self):
+        """Тест CAS-обновления."""
+        repo = ConcurrentEmployeeRepository()
+        emp_id = repo.add(make_employee())
+        
+        new_version = repo.compare_and_swap(emp_id, 1, {'base_salary': 2000})
+        
+        assert new_version == 2
+        assert repo.find_by_id(emp_id)['base_salary'] == 2000
+    
+    def test_compare_and_swap_conflict(self):
+        """Тест конфликта версий."""
+        repo = ConcurrentEmployeeRepository()
+        emp_id = repo.add(make_employee())
+        repo.compare_and_swap(emp_id, 1, {'base_salary': 2000})
+        
+        with pytest.raises(ConcurrencyConflictError) as exc_info:
+            repo.compare_and_swap(emp_id, 1, {'base_salary': 3000})
+        assert exc_info.value.actual_version == 2
+    
+    def test_find_by_id_returns_copy(self):
+        """Тест изоляции возвращаемых данных."""
+        repo = ConcurrentEmployeeRepository()
+        emp_id = repo.add(make_employee())
+        repo.find_by_id(emp_id)['base_salary'] = 0
+        
+        assert repo.find_by_id(emp_id)['base_salary'] == 1000
+    
+    def test_remove_with_version(self):
+        """Тест удаления с проверкой версии."""
+        repo = ConcurrentEmployeeRepository()
+        emp_id = repo.add(make_employee())
+        
+        with pytest.raises(ConcurrencyConflictError):
+            repo.remove(emp_id, expected_version=2)
+        assert repo.remove(emp_id, expected_version=1) is True
+        assert repo.find_by_id(emp_id) is None
+    
+    def test_find_by_specification(self):
+        """Тест поиска по спецификации."""
+        repo = ConcurrentEmployeeRepository(stripes=4)
+        for salary in (500, 1500, 2500):
+            repo.add(make_employee(salary=salary))
+        
+        found = repo.find_by_specification(SalarySpecification(1000, 3000))
+        assert sorted(e['base_salary'] for e in found) == [1500, 2500]
+    
+    def test_department_repository(self):
+        """Тест репозитория отделов."""
+        repo = ConcurrentDepartmentRepository()
+        with pytest.raises(ValueError):
+            repo.add({'id': None, 'name': 'IT'})
+        dept_id = repo.add({'id': None, 'name': 'IT', 'manager_id': 1})
+        assert repo.find_by_id(dept_id)['name'] == 'IT'
+    
+    def test_concurrent_updates_are_not_lost(self):
+        """Тест отсутствия потерянных обновлений."""
+        repo = ConcurrentEmployeeRepository(stripes=2)
+        emp_id = repo.add(make_employee(salary=0))
+        
+        def worker():
+            for _ in range(500):
+                repo.update(emp_id, lambda d: {'base_salary': d['base_salary'] + 1},
+                            max_retries=1000)
+        
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        
+        data, version = repo.get_with_version(emp_id)
+        assert data['base_salary'] == 2000
+        assert version == 2001
@@ -0,0 +1,196 @@
+"""
+Тесты для пула соединений SQLite (Singleton Pattern).
+
+Покрывает:
+  ✓ ThreadSafeDatabaseConnection (исходный синглтон)
+  ✓ PooledDatabaseConnection: WAL, чтение/запись, транзакции
+  ✓ executemany / execute_batch
+  ✓ Привязка соединения к потоку и параллельное чтение
+  ✓ Закрытие пула при выданных соединениях
+"""
+
+import sqlite3
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from patterns.singleton import ThreadSafeDatabaseConnection, PooledDatabaseConnection
+
+
+@pytest.fixture
+def pool(tmp_path):
+    pool = PooledDatabaseConnection(str(tmp_path / "company.db"), readers=3)
+    pool.execute_update("CREATE TABLE employees (id INTEGER PRIMARY KEY, name TEXT, salary REAL)")
+    yield pool
+    pool.close_connection()
+
+
+class TestThreadSafeDatabaseConnection:
+    """Тесты для исходного синглтона."""
+    
+    def test_singleton(self, tmp_path):
+        """Тест единственности экземпляра."""
+        db1 = ThreadSafeDatabaseConnection(str(tmp_path / "single.db"))
+        db2 = ThreadSafeDatabaseConnection()
+        try:
+            assert db1 is db2
+            db1.execute_update("CREATE TABLE t (x INTEGER)")
+            db1.execute_update("INSERT INTO t VALUES (?)", (1,))
+            assert db2.execute_query("SELECT x FROM t") == [(1,)]
+        finally:
+            db1.close_connection()
+
+
+class TestPooledDatabaseConnection:
+    """Тесты для PooledDatabaseConnection."""
+    
+    def test_wal_mode(self, pool):
+        """Тест режима WAL."""
+        assert pool.execute_query("PRAGMA journal_mode") == [('wal',)]
+    
+    def test_memory_db_rejected(self):
+        """Тест отказа для :memory:."""
+        with pytest.raises(ValueError):
+            PooledDatabaseConnection(":memory:")
+    
+    def test_get_instance_per_path(self, tmp_path):
+        """Тест одного пула на файл БД."""
+        path = str(tmp_path / "shared.db")
+        first = PooledDatabaseConnection.get_instance(path, readers=1)
+        try:
+            assert PooledDatabaseConnection.get_instance(path) is first
+        finally:
+            first.close_connection()
+        assert PooledDatabaseConnection.get_instance(path) is not first
+        PooledDatabaseConnection.get_instance(path).close_connection()
+    
+    def test_executemany(self, pool):
+        """Тест пакетной вставки."""
+        count = pool.executemany("INSERT INTO employees (name, salary) VALUES (?, ?)",
+                                 [(f"E{i}", 1000 + i) for i in range(100)])
+        
+        assert count == 100
+        assert pool.execute_query("SELECT COUNT(*) FROM employees") == [(100,)]
+    
+    def test_execute_batch(self, pool):
+        """Тест набора запросов в одной транзакции."""
+        pool.execute_update("INSERT INTO employees (id, name, salary) VALUES (1, 'A', 100)")
+        changed = pool.execute_batch([
+            ("UPDATE employees SET salary = salary * 2 WHERE id = ?", (1,)),
+            ("INSERT INTO employees (name, salary) VALUES (?, ?)", ("B", 50)),
+        ])
+        
+        assert changed == 2
+        assert pool.execute_query("SELECT salary FROM employees WHERE id = 1") == [(200.0,)]
+    
+    def test_transaction_rollback(self, pool):
+        """Тест отката транзакции при исключении."""
+        with pytest.raises(sqlite3.IntegrityError):
+            with pool.transaction() as connection:
+                connection.execute("INSERT INTO employees (id, name) VALUES (1, 'A')")
+                connection.execute("INSERT INTO employees (id, name) VALUES (1, 'B')")
+        
+        assert pool.execute_query("SELECT COUNT(*) FROM employees") == [(0,)]
+    
+    def test_thread_affinity(self, pool):
+        """Тест повторной выдачи того же соединения потоку."""
+        with pool.read_connection() as first:
+            with pool.read_connection() as nested:
+                assert nested is first
+        with pool.read_connection() as again:
+            assert again is first
+    
+    def test_checkout_timeout(self, tmp_path):
+        """Тест таймаута при исчерпании пула."""
+        pool = PooledDatabaseConnection(str(tmp_path / "t.db"), readers=1, checkout_timeout=0.05)
+        errors = []
+        try:
+            with pool.read_connection():
+                def other():
+                    try:
+                        with pool.read_connection():
+                            pass
+                    except TimeoutError as e:
+                        errors.append(e)
+                thread = threading.Thread(target=other)
+                thread.start()
+                thread.join()
+        finally:
+            pool.close_connection()
+        
+        assert len(errors) == 1
+    
+    def test_close_spares_checked_out_reader(self, tmp_path):
+        """Тест: выданное соединение работает до возврата, затем закрывается."""
+        pool = PooledDatabaseConnection(str(tmp_path / "c.db"), readers=2)
+        taken, closed = threading.Event(), threading.Event()
+        results = []
+        
+        def reader():
+            with pool.read_connection() as connection:
+                taken.set()
+                closed.wait(5)
+                results.append(connection.execute("SELECT 1").fetchone())
+            results.append(connection)
+        
+        thread = threading.Thread(target=reader)
+        thread.start()
+        taken.wait(5)
+        idle = list(pool._idle)
+        
+        pool.close_connection()
+        closed.set()
+        thread.join()
+        
+        assert results[0] == (1,)
+        for connection in idle + results[1:]:
+            with pytest.raises(sqlite3.ProgrammingError):
+                connection.execute("SELECT 1")
+        with pytest.raises(RuntimeError):
+            pool.execute_query("SELECT 1")
+    
+    def test_close_inside_transaction(self, tmp_path):
+        """Тест: закрытие из транзакции фиксирует её и закрывает писателя после выхода."""
+        path = str(tmp_path / "w.db")
+        pool = PooledDatabaseConnection(path, readers=1)
+        pool.execute_update("CREATE TABLE t (x INTEGER)")
+        
+        with pool.transaction() as writer:
+            writer.execute("INSERT INTO t VALUES (1)")
+            pool.close_connection()
+            writer.execute("INSERT INTO t VALUES (2)")
+        
+        with pytest.raises(sqlite3.ProgrammingError):
+            writer.execute("SELECT 1")
+        check = sqlite3.connect(path)
+        assert check.execute("SELECT x FROM t ORDER BY x").fetchall() == [(1,), (2,)]
+        check.close()
+    
+    def test_concurrent_reads_and_writes(self, pool):
+        """Тест параллельных чтений во время записи."""
+        pool.executemany("INSERT INTO employees (name, salary) VALUES (?, ?)",
+                         [(f"E{i}", 1) for i in range(50)])
+        results = []
+        
+        def reader():
+            for _ in range(50):
+                results.append(pool.execute_query("SELECT COUNT(*) FROM employees")[0][0])
+        
+        def writer():
+            for i in range(50):
+                pool.execute_update("INSERT INTO employees (name, salary) VALUES (?, ?)", (f"W{i}", 2))
+        
+        threads = [threading.Thread(target=reader) for _ in range(4)]
+        threads.append(threading.Thread(target=writer))
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        
+        assert len(results) == 200
+        assert all(50 <= r <= 100 for r in results)
+        assert pool.execute_query("SELECT COUNT(*) FROM employees") == [(100,)]
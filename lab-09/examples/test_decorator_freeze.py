@@ -0,0 +1,111 @@
+"""
+Тесты для заморозки цепочек декораторов (Decorator Pattern).
+
+Покрывает:
+  ✓ SalaryAdjustment и SalaryFormula
+  ✓ freeze() для всех типов декораторов
+  ✓ Глубокие цепочки
+  ✓ Пакетная оценка total_salaries()
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from patterns.decorator_refactored import (
+    ConcreteEmployee, EmployeeDecorator, BonusDecorator, PerformanceBonusDecorator,
+    TrainingDecorator, ProjExperienceDecorator, VacationBenefitDecorator,
+    RegionalCoefficientDecorator, SalaryAdjustment, SalaryFormula,
+    FrozenEmployee, freeze, total_salaries
+)
+
+
+def full_chain(base=5000.0):
+    employee = ConcreteEmployee("Иван", base)
+    employee = BonusDecorator(employee, 1000)
+    employee = PerformanceBonusDecorator(employee, 1.5)
+    employee = RegionalCoefficientDecorator(employee, 1.2)
+    employee = TrainingDecorator(employee, "Python", 500)
+    employee = ProjExperienceDecorator(employee, 3, 100)
+    return VacationBenefitDecorator(employee, 10, 50)
+
+
+class TestSalaryFormula:
+    """Тесты для SalaryFormula."""
+    
+    def test_then_composes_layers(self):
+        """Тест композиции слоёв."""
+        formula = SalaryFormula().then(SalaryAdjustment(constant=100))
+        formula = formula.then(SalaryAdjustment(multiplier=2.0, base_rate=0.5))
+        
+        assert formula.evaluate(1000) == pytest.approx(2 * (1000 + 100) + 500)
+    
+    def test_evaluate_many(self):
+        """Тест пакетной оценки формулы."""
+        formula = SalaryFormula(coefficient=2.0, constant=10)
+        assert list(formula.evaluate_many([1, 2])) == [12, 14]
+
+
+class TestFreeze:
+    """Тесты для freeze()."""
+    
+    def test_same_total_and_description(self):
+        """Тест совпадения зарплаты и описания с исходной цепочкой."""
+        chain = full_chain()
+        frozen = freeze(chain)
+        
+        assert isinstance(frozen, FrozenEmployee)
+        assert frozen.get_total_salary() == pytest.approx(chain.get_total_salary())
+        assert frozen.get_description() == chain.get_description()
+        assert frozen.get_name() == "Иван"
+        assert frozen.get_base_salary() == 5000.0
+    
+    def test_plain_employee(self):
+        """Тест заморозки сотрудника без декораторов."""
+        frozen = freeze(ConcreteEmployee("Пётр", 3000))
+        assert frozen.get_total_salary() == 3000
+    
+    def test_refreeze_on_top_of_frozen(self):
+        """Тест декорирования уже замороженной цепочки."""
+        chain = BonusDecorator(full_chain(), 200)
+        refrozen = freeze(BonusDecorator(freeze(full_chain()), 200))
+        
+        assert refrozen.get_total_salary() == pytest.approx(chain.get_total_salary())
+        assert refrozen.get_description() == chain.get_description()
+    
+    def test_deep_chain(self):
+        """Тест цепочки глубже предела рекурсии."""
+        employee = ConcreteEmployee("Анна", 1000)
+        for _ in range(3000):
+            employee = BonusDecorator(employee, 1)
+        
+        assert freeze(employee).get_total_salary() == pytest.approx(4000)
+    
+    def test_unknown_decorator_rejected(self):
+        """Тест отказа для декоратора без get_adjustment()."""
+        class Custom(EmployeeDecorator):
+            def get_total_salary(self):
+                return self._employee.get_total_salary() + 1
+        
+        with pytest.raises(TypeError):
+            freeze(Custom(ConcreteEmployee("X", 100)))
+    
+    def test_regional_coefficient_validation(self):
+        """Тест валидации коэффициента."""
+        with pytest.raises(ValueError):
+            RegionalCoefficientDecorator(ConcreteEmployee("X", 100), 0.9)
+
+
+class TestBatchEvaluation:
+    """Тесты пакетной оценки."""
+    
+    def test_total_salaries(self):
+        """Тест пакетной оценки замороженных сотрудников."""
+        chains = [full_chain(base) for base in (1000, 2000, 3000)]
+        totals = total_salaries([freeze(chain) for chain in chains])
+        
+        assert [float(t) for t in totals] == pytest.approx(
+            [chain.get_total_salary() for chain in chains])
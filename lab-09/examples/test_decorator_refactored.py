@@ -65,6 +65,7 @@ class TestLoggerInterface:
         composite.add_logger(FileLogger(str(log_file)))
         
         composite.info("Test message")
+        composite.flush()  # FileLogger буферизует сообщения ниже ERROR
         
         # Проверяем консоль
         captured = capsys.readouterr()
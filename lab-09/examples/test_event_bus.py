@@ -0,0 +1,267 @@
+"""
+Тесты для шины событий и материализованных агрегатов зарплат.
+
+Покрывает:
+  ✓ EventBus: подписка по типу и ключу, отписка, пакетный режим
+  ✓ GroupSalaryAggregate: итог, счётчики, средняя по событиям
+  ✓ SalaryAggregateRegistry: бюджеты всех групп
+  ✓ Incremental*: материализованные аналоги сервисов расчёта
+  ✓ Совпадение с полным пересчётом
+"""
+
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from services.event_bus import (
+    EventBus, EmployeeChanged, MembershipChanged, DEPARTMENT_GROUP, PROJECT_GROUP
+)
+from services.salary_aggregate import (
+    GroupSalaryAggregate, SalaryAggregateRegistry, IncrementalCostCalculator,
+    IncrementalDepartmentStatistics, IncrementalProjectCalculator
+)
+
+
+class FakeEmployee:
+    """Сотрудник с зарплатой = оклад + бонус, публикующий изменения."""
+
+    def __init__(self, emp_id, base_salary, bonus=0.0, bus=None):
+        self.id = emp_id
+        self.event_bus = bus
+        self._base_salary = base_salary
+        self._bonus = bonus
+
+    def calculate_salary(self):
+        return self._base_salary + self._bonus
+
+    def set_bonus(self, value):
+        old, self._bonus = self._bonus, value
+        if self.event_bus is not None:
+            self.event_bus.publish(EmployeeChanged(self, 'bonus', old, value), key=self.id)
+
+
+class FakeManager(FakeEmployee):
+    pass
+
+
+def join(bus, kind, name, employee, joined=True):
+    event = MembershipChanged(kind, name, employee, joined)
+    bus.publish(event, key=event.key)
+
+
+class TestEventBus:
+    """Тесты для EventBus."""
+
+    def test_keyed_and_wildcard(self):
+        """Тест доставки по ключу и всем подписчикам типа."""
+        bus = EventBus()
+        keyed, everything = [], []
+        bus.subscribe(EmployeeChanged, keyed.append, key=1)
+        bus.subscribe(EmployeeChanged, everything.append)
+
+        bus.publish(EmployeeChanged(None, 'bonus'), key=1)
+        bus.publish(EmployeeChanged(None, 'bonus'), key=2)
+
+        assert len(keyed) == 1
+        assert len(everything) == 2
+
+    def test_unsubscribe(self):
+        """Тест отмены подписки."""
+        bus = EventBus()
+        received = []
+        subscription = bus.subscribe(EmployeeChanged, received.append, key=1)
+
+        assert subscription.cancel() is True
+        assert subscription.cancel() is False
+        bus.publish(EmployeeChanged(None, 'bonus'), key=1)
+
+        assert received == []
+        assert not bus.has_subscribers(EmployeeChanged, 1)
+
+    def test_unsubscribe_during_dispatch(self):
+        """Тест отписки обработчиком во время доставки."""
+        bus = EventBus()
+        received = []
+
+        def once(event):
+            received.append(event)
+            bus.unsubscribe(EmployeeChanged, once)
+
+        bus.subscribe(EmployeeChanged, once)
+        bus.subscribe(EmployeeChanged, received.append)
+        bus.publish(EmployeeChanged(None, 'bonus'))
+        bus.publish(EmployeeChanged(None, 'bonus'))
+
+        assert len(received) == 3
+
+    def test_batch_defers_and_coalesces(self):
+        """Тест пакетного режима: доставка в конце, изменения схлопываются."""
+        bus = EventBus()
+        received = []
+        bus.subscribe(EmployeeChanged, received.append)
+        employee = FakeEmployee(1, 100, bus=bus)
+
+        with bus.batch():
+            with bus.batch():
+                employee.set_bonus(10)
+                employee.set_bonus(20)
+            assert received == []
+            employee.set_bonus(30)
+
+        assert [event.new_value for event in received] == [30]
+
+
+class TestGroupSalaryAggregate:
+    """Тесты для GroupSalaryAggregate."""
+
+    def test_membership_and_changes(self):
+        """Тест итогов по событиям состава и изменений."""
+        bus = EventBus()
+        stats = GroupSalaryAggregate(bus, DEPARTMENT_GROUP, "IT")
+        alice = FakeEmployee(1, 1000, bus=bus)
+        bob = FakeManager(2, 2000, bonus=500, bus=bus)
+
+        join(bus, DEPARTMENT_GROUP, "IT", alice)
+        join(bus, DEPARTMENT_GROUP, "IT", bob)
+        join(bus, DEPARTMENT_GROUP, "HR", FakeEmployee(3, 9999, bus=bus))
+
+        assert stats.total_salary == 3500
+        assert stats.type_counts == {'FakeEmployee': 1, 'FakeManager': 1}
+        assert stats.average_salary == 1750
+
+        bob.set_bonus(1000)
+        assert stats.total_salary == 4000
+
+        join(bus, DEPARTMENT_GROUP, "IT", bob, joined=False)
+        bob.set_bonus(0)
+        assert stats.total_salary == 1000
+        assert stats.type_counts == {'FakeEmployee': 1}
+
+    def test_duplicate_join_ignored(self):
+        """Тест повторного вступления."""
+        bus = EventBus()
+        stats = GroupSalaryAggregate(bus, PROJECT_GROUP, "Alpha")
+        alice = FakeEmployee(1, 1000, bus=bus)
+
+        join(bus, PROJECT_GROUP, "Alpha", alice)
+        join(bus, PROJECT_GROUP, "Alpha", alice)
+
+        assert stats.employee_count == 1
+        assert stats.total_salary == 1000
+
+    def test_close(self):
+        """Тест отписки агрегата."""
+        bus = EventBus()
+        stats = GroupSalaryAggregate(bus, DEPARTMENT_GROUP, "IT")
+        alice = FakeEmployee(1, 1000, bus=bus)
+        join(bus, DEPARTMENT_GROUP, "IT", alice)
+
+        stats.close()
+        alice.set_bonus(100)
+        join(bus, DEPARTMENT_GROUP, "IT", FakeEmployee(2, 1, bus=bus))
+
+        assert stats.total_salary == 1000
+        assert not bus.has_subscribers(EmployeeChanged, 1)
+
+    def test_matches_full_recompute(self):
+        """Тест совпадения с пересчётом с нуля после случайных операций."""
+        rng = random.Random(7)
+        bus = EventBus()
+        stats = GroupSalaryAggregate(bus, DEPARTMENT_GROUP, "IT")
+        employees = [FakeEmployee(i, rng.randint(1000, 5000), bus=bus) for i in range(1, 51)]
+        members = set()
+
+        with bus.batch():
+            for employee in employees[:25]:
+                join(bus, DEPARTMENT_GROUP, "IT", employee)
+                members.add(employee)
+
+        for _ in range(2000):
+            employee = rng.choice(employees)
+            action = rng.random()
+            if action < 0.2 and employee not in members:
+                join(bus, DEPARTMENT_GROUP, "IT", employee)
+                members.add(employee)
+            elif action < 0.4 and employee in members:
+                join(bus, DEPARTMENT_GROUP, "IT", employee, joined=False)
+                members.discard(employee)
+            else:
+                employee.set_bonus(rng.randint(0, 1000))
+
+        expected = sum(e.calculate_salary() for e in members)
+        assert stats.employee_count == len(members)
+        assert stats.total_salary == pytest.approx(expected)
+        assert stats.resync() == expected
+
+
+class TestSalaryAggregateRegistry:
+    """Тесты для SalaryAggregateRegistry."""
+
+    def test_totals_per_group(self):
+        """Тест бюджетов по группам и общего итога."""
+        bus = EventBus()
+        departments = SalaryAggregateRegistry(bus, DEPARTMENT_GROUP)
+        projects = SalaryAggregateRegistry(bus, PROJECT_GROUP)
+        alice = FakeEmployee(1, 1000, bus=bus)
+        bob = FakeEmployee(2, 2000, bus=bus)
+
+        join(bus, DEPARTMENT_GROUP, "IT", alice)
+        join(bus, DEPARTMENT_GROUP, "HR", bob)
+        join(bus, PROJECT_GROUP, "Alpha", alice)
+
+        assert departments.totals() == {"IT": 1000, "HR": 2000}
+        assert departments.total_salary == 3000
+        assert projects.totals() == {"Alpha": 1000}
+
+        alice.set_bonus(500)
+        assert departments.total_salary == 3500
+        assert projects.get("Alpha").total_salary == 1500
+
+
+class TestIncrementalServices:
+    """Тесты для IncrementalDepartmentStatistics, IncrementalProjectCalculator, IncrementalCostCalculator."""
+
+    def test_values_follow_events(self):
+        """Тест значений сервисов по событиям состава и зарплат."""
+        bus = EventBus()
+        statistics = IncrementalDepartmentStatistics(bus, "IT")
+        budget = IncrementalProjectCalculator(bus, "Alpha")
+        costs = IncrementalCostCalculator(bus)
+        alice = FakeEmployee(1, 1000, bus=bus)
+        bob = FakeManager(2, 3000, bus=bus)
+
+        join(bus, DEPARTMENT_GROUP, "IT", alice)
+        join(bus, DEPARTMENT_GROUP, "IT", bob)
+        join(bus, DEPARTMENT_GROUP, "HR", FakeEmployee(3, 500, bus=bus))
+        join(bus, PROJECT_GROUP, "Alpha", bob)
+        bob.set_bonus(1000)
+
+        assert statistics.calculate_total_salary() == 5000
+        assert statistics.get_employee_count() == {'FakeEmployee': 1, 'FakeManager': 1}
+        assert statistics.get_average_salary() == 2500
+        assert budget.calculate_total_salary() == 4000
+        assert budget.calculate_average_salary() == 4000
+        assert costs.calculate_department_budgets() == {"IT": 5000, "HR": 500}
+        assert costs.calculate_project_budgets() == {"Alpha": 4000}
+        assert costs.calculate_total_monthly_cost() == 5500
+
+    def test_close(self):
+        """Тест отписки сервисов от шины."""
+        bus = EventBus()
+        services = [IncrementalDepartmentStatistics(bus, "IT"), IncrementalProjectCalculator(bus, "IT"),
+                    IncrementalCostCalculator(bus)]
+        for service in services:
+            service.close()
+
+        join(bus, DEPARTMENT_GROUP, "IT", FakeEmployee(1, 1000, bus=bus))
+
+        assert services[0].calculate_total_salary() == 0
+        assert services[2].calculate_department_budgets() == {}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
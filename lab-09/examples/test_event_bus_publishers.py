@@ -0,0 +1,206 @@
+"""
+Тесты публикации событий реальными классами сотрудников, отделов и проектов.
+
+Цепочка импорта organization/specialists в этом дереве ссылается на
+модули, которых нет (base.abstract_employee, validators,
+base.exceptions, services.employee.base_validator). Фикстура domain
+подставляет их в sys.modules - псевдонимами существующих модулей или
+заглушками исключений - и убирает после тестов модуля.
+
+Покрывает:
+  ✓ EmployeeChanged от Employee, Developer, Manager, Salesperson
+  ✓ MembershipChanged от Department и Project
+  ✓ IncrementalDepartmentStatistics, IncrementalProjectCalculator,
+    IncrementalCostCalculator против статических сервисов
+"""
+
+import importlib
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from services.event_bus import EventBus, EmployeeChanged, MembershipChanged
+from services.salary_aggregate import (
+    IncrementalCostCalculator, IncrementalDepartmentStatistics, IncrementalProjectCalculator
+)
+
+# Отсутствующий модуль -> существующий модуль с тем же содержимым
+MODULE_ALIASES = {
+    'validators': 'utils.validators',
+    'employee': 'base.employee_refactored',
+    'employee_interfaces': 'base.employee_interfaces',
+    'employee_comparison_mixin': 'base.employee_comparison_mixin',
+    'employee_arithmetic_mixin': 'base.employee_arithmetic_mixin',
+    'base.abstract_employee': 'base.abstract_employee_refactored',
+    'services.employee.base_validator': 'services.base_validator',
+}
+MISSING_EXCEPTIONS = ('DuplicateIdError', 'DepartmentNotFoundError', 'InvalidStatusError',
+                      'DependencyError', 'EmployeeNotFoundError')
+
+
+@pytest.fixture(scope='module')
+def domain():
+    """Классы предметной области, импортированные с подставленными модулями."""
+    saved = dict(sys.modules)
+    for name, target in MODULE_ALIASES.items():
+        sys.modules[name] = importlib.import_module(target)
+    exceptions = types.ModuleType('base.exceptions')
+    for name in MISSING_EXCEPTIONS:
+        setattr(exceptions, name, type(name, (ValueError,), {}))
+    sys.modules['base.exceptions'] = exceptions
+
+    from organization.department import Department
+    from organization.project import Project
+    from services.cost_calculator import CostCalculator
+    from specialists.developer import Developer
+    from specialists.manager import Manager
+    from specialists.salesperson import Salesperson
+    yield types.SimpleNamespace(Department=Department, Project=Project, CostCalculator=CostCalculator,
+                                Developer=Developer, Manager=Manager, Salesperson=Salesperson)
+
+    for name in set(sys.modules) - set(saved):
+        del sys.modules[name]
+    sys.modules.update(saved)
+
+
+@pytest.fixture
+def events():
+    """Шина и список всех опубликованных в неё событий."""
+    bus, received = EventBus(), []
+    bus.subscribe(EmployeeChanged, received.append)
+    bus.subscribe(MembershipChanged, received.append)
+    return bus, received
+
+
+def staff(domain):
+    return [
+        domain.Developer(1, "Bob", "DEV", 4000, "middle", ["Python"]),
+        domain.Manager(2, "Alice", "DEV", 5000, 100),
+        domain.Salesperson(3, "Carol", "DEV", 3000, 1000, 0.1),
+    ]
+
+
+def changes(received):
+    return [(e.employee.id, e.field, e.old_value, e.new_value)
+            for e in received if isinstance(e, EmployeeChanged)]
+
+
+class TestEmployeePublishers:
+    """Тесты EmployeeChanged от сотрудников."""
+
+    def test_salary_fields_publish_changes(self, domain, events):
+        """Тест: изменения полей, влияющих на зарплату, публикуются по id."""
+        bus, received = events
+        developer, manager, seller = staff(domain)
+        keyed = []
+        bus.subscribe(EmployeeChanged, keyed.append, key=2)
+        for employee in (developer, manager, seller):
+            employee.event_bus = bus
+
+        developer.seniority_level = "senior"
+        manager.bonus = 200
+        manager.base_salary = 5100
+        seller.add_sale(500)
+        seller.commission_rate = 0.2
+        seller.set_commission_rate_percent(30)
+        seller.reset_sales()
+
+        assert changes(received) == [
+            (1, 'seniority_level', 'middle', 'senior'),
+            (2, 'bonus', 100.0, 200.0),
+            (2, 'base_salary', 5000.0, 5100.0),
+            (3, 'sales_volume', 1000.0, 1500.0),
+            (3, 'commission_rate', 0.1, 0.2),
+            (3, 'commission_rate', 0.2, 0.3),
+            (3, 'sales_volume', 1500.0, 0.0),
+        ]
+        assert [e.field for e in keyed] == ['bonus', 'base_salary']
+
+    def test_no_event_without_bus_or_change(self, domain, events):
+        """Тест: без шины и при том же значении событий нет."""
+        bus, received = events
+        manager = domain.Manager(2, "Alice", "DEV", 5000, 100)
+        manager.bonus = 300
+
+        manager.event_bus = bus
+        manager.bonus = 300
+        manager.base_salary = 5000
+
+        assert received == []
+
+
+class TestGroupPublishers:
+    """Тесты MembershipChanged от отделов и проектов."""
+
+    def test_department_membership(self, domain, events):
+        """Тест: отдел публикует состав и подключает сотрудников к своей шине."""
+        bus, received = events
+        department = domain.Department("DEV", event_bus=bus)
+        developer = staff(domain)[0]
+
+        department.add_employee(developer)
+        developer.seniority_level = "senior"
+        department.remove_employee(99)
+        department.remove_employee(1)
+
+        assert developer.event_bus is bus
+        assert [(type(e).__name__, getattr(e, 'joined', None)) for e in received] == [
+            ('MembershipChanged', True), ('EmployeeChanged', None), ('MembershipChanged', False)]
+        assert received[0].key == ('department', "DEV")
+
+    def test_project_membership(self, domain, events):
+        """Тест: проект публикует состав команды, повторное добавление игнорируется."""
+        bus, received = events
+        project = domain.Project(1, "Portal", "Client portal", "2030-01-01", event_bus=bus)
+        developer = staff(domain)[0]
+
+        project.add_team_member(developer)
+        project.add_team_member(developer)
+        project.remove_team_member(99)
+        project.remove_team_member(1)
+
+        assert [(e.group_kind, e.group_name, e.joined) for e in received] == [
+            ('project', "Portal", True), ('project', "Portal", False)]
+
+
+class TestIncrementalServices:
+    """Тесты материализованных сервисов на реальных отделах и проектах."""
+
+    def test_match_static_services(self, domain):
+        """Тест: значения совпадают с полным пересчётом после изменений."""
+        bus = EventBus()
+        statistics = IncrementalDepartmentStatistics(bus, "DEV")
+        budget = IncrementalProjectCalculator(bus, "Portal")
+        costs = IncrementalCostCalculator(bus)
+        department = domain.Department("DEV", event_bus=bus)
+        project = domain.Project(1, "Portal", "Client portal", "2030-01-01", event_bus=bus)
+        developer, manager, seller = staff(domain)
+
+        for employee in (developer, manager, seller):
+            department.add_employee(employee)
+        project.add_team_member(developer)
+        project.add_team_member(seller)
+        developer.seniority_level = "senior"
+        seller.add_sale(2000)
+        manager.bonus = 400
+        department.remove_employee(2)
+
+        assert statistics.calculate_total_salary() == department.calculate_total_salary()
+        assert statistics.get_employee_count() == department.get_employee_count()
+        assert statistics.get_average_salary() == pytest.approx(department.calculate_total_salary() / 2)
+        assert budget.calculate_total_salary() == project.calculate_total_salary()
+        assert costs.calculate_department_budgets() == domain.CostCalculator.calculate_department_budgets(
+            [department])
+        assert costs.calculate_project_budgets() == domain.CostCalculator.calculate_project_budgets([project])
+        assert costs.calculate_total_monthly_cost() == domain.CostCalculator.calculate_total_monthly_cost(
+            [department])
+
+        statistics.close()
+        budget.close()
+        costs.close()
+        developer.seniority_level = "junior"
+        assert statistics.calculate_total_salary() != department.calculate_total_salary()
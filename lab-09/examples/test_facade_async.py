@@ -0,0 +1,174 @@
+"""
+Тесты для асинхронного Facade Pattern.
+
+Покрывает:
+  ✓ Параллельный опрос подсистем в get_company_summary
+  ✓ Таймауты подсистем и статус PARTIAL / FAILURE
+  ✓ Имя операции в записях ошибок без изменения handler.operation
+  ✓ Параллельный расчёт ведомости пакетами
+  ✓ Имитации удалённых подсистем (FakeAsyncSubsystem*)
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from patterns.facade_refactored import (
+    OperationStatus, AsyncCompanyFacade, CompanySubsystemB,
+    FakeAsyncSubsystemA, FakeAsyncSubsystemB, FakeAsyncSubsystemC, FakeAsyncSubsystemD
+)
+
+
+class SlowChunkSubsystemC(FakeAsyncSubsystemC):
+    """Подсистема C, медленно отвечающая на пакеты с указанным сотрудником."""
+
+    def __init__(self, slow_name: str, slow_latency: float):
+        super().__init__()
+        self.slow_name = slow_name
+        self.slow_latency = slow_latency
+
+    async def calculate_monthly_salaries(self, employee_names):
+        if self.slow_name in employee_names:
+            await asyncio.sleep(self.slow_latency)
+        return await super().calculate_monthly_salaries(employee_names)
+
+
+class BrokenSubsystemD(FakeAsyncSubsystemD):
+    """Подсистема D, всегда завершающаяся ошибкой."""
+
+    async def list_active_projects(self):
+        raise ConnectionError("сервис проектов недоступен")
+
+
+def make_subsystem_b(count: int) -> FakeAsyncSubsystemB:
+    subsystem = CompanySubsystemB()
+    subsystem.hire_many((f"E{i}", "DEV") for i in range(count))
+    return FakeAsyncSubsystemB(subsystem)
+
+
+class TestAsyncSummary:
+    """Тесты для AsyncCompanyFacade.get_company_summary."""
+
+    def test_summary_success(self):
+        """Тест полной сводки."""
+        result = asyncio.run(AsyncCompanyFacade().get_company_summary())
+
+        assert result.status == OperationStatus.SUCCESS
+        assert result.data['department_count'] == 4
+        assert result.data['employee_count'] == 6
+        assert result.data['unavailable'] == []
+
+    def test_subsystems_queried_concurrently(self):
+        """Тест: общее время ~ задержка одной подсистемы, а не сумма."""
+        facade = AsyncCompanyFacade(FakeAsyncSubsystemA(latency=0.1), FakeAsyncSubsystemB(latency=0.1),
+                                    subsystem_d=FakeAsyncSubsystemD(latency=0.1))
+
+        start = time.perf_counter()
+        result = asyncio.run(facade.get_company_summary())
+        elapsed = time.perf_counter() - start
+
+        assert result.is_success
+        assert elapsed < 0.25
+
+    def test_slow_subsystem_gives_partial(self):
+        """Тест таймаута одной подсистемы."""
+        facade = AsyncCompanyFacade(subsystem_d=FakeAsyncSubsystemD(latency=1.0),
+                                    timeouts={'D': 0.05})
+
+        start = time.perf_counter()
+        result = asyncio.run(facade.get_company_summary())
+
+        assert time.perf_counter() - start < 0.5
+        assert result.status == OperationStatus.PARTIAL
+        assert result.data['unavailable'] == ['D']
+        assert result.data['active_projects'] is None
+        assert result.data['employee_count'] == 6
+        assert "D" in facade.error_handler.get_error_message()
+
+    def test_subsystem_error_gives_partial(self):
+        """Тест ошибки подсистемы."""
+        facade = AsyncCompanyFacade(subsystem_d=BrokenSubsystemD())
+
+        result = asyncio.run(facade.get_company_summary())
+
+        assert result.status == OperationStatus.PARTIAL
+        assert "недоступен" in facade.error_handler.get_error_message()
+
+    def test_all_subsystems_down(self):
+        """Тест: ни одна подсистема не ответила."""
+        facade = AsyncCompanyFacade(FakeAsyncSubsystemA(latency=1.0), FakeAsyncSubsystemB(latency=1.0),
+                                    subsystem_d=FakeAsyncSubsystemD(latency=1.0), default_timeout=0.02)
+
+        result = asyncio.run(facade.get_company_summary())
+
+        assert result.status == OperationStatus.FAILURE
+        assert result.data['unavailable'] == ['A', 'B', 'D']
+
+    def test_errors_tagged_without_shared_operation(self):
+        """Тест: ошибки помечены операцией, а handler.operation после вызова не меняется."""
+        facade = AsyncCompanyFacade(subsystem_d=BrokenSubsystemD())
+        handler = facade.error_handler
+
+        asyncio.run(facade.get_company_summary())
+        handler.add_error("вне операции")
+
+        records = handler.get_records()
+        assert records[0].operation == 'get_company_summary'
+        assert records[-1].operation is None
+        assert handler.operation is None
+
+
+class TestAsyncPayroll:
+    """Тесты для AsyncCompanyFacade.process_monthly_payroll."""
+
+    def test_payroll_in_parallel_chunks(self):
+        """Тест расчёта ведомости параллельными пакетами."""
+        subsystem_c = FakeAsyncSubsystemC(latency=0.05)
+        facade = AsyncCompanyFacade(subsystem_b=make_subsystem_b(100), subsystem_c=subsystem_c,
+                                    payroll_chunk_size=10)
+
+        result = asyncio.run(facade.process_monthly_payroll())
+
+        assert result.status == OperationStatus.SUCCESS
+        assert len(result.data) == 106
+        assert subsystem_c.request_count == 11
+        assert subsystem_c.max_in_flight == 11
+
+    def test_slow_chunk_gives_partial(self):
+        """Тест: пакет, не уложившийся в таймаут, не попадает в ведомость."""
+        facade = AsyncCompanyFacade(subsystem_b=make_subsystem_b(20),
+                                    subsystem_c=SlowChunkSubsystemC("E15", 1.0),
+                                    timeouts={'C': 0.05}, payroll_chunk_size=10)
+
+        result = asyncio.run(facade.process_monthly_payroll())
+
+        assert result.status == OperationStatus.PARTIAL
+        assert "E15" not in result.data
+        assert "E0" in result.data
+        assert "не обработаны: 10" in result.message
+
+    def test_employee_subsystem_timeout_fails(self):
+        """Тест: без списка сотрудников ведомость не строится."""
+        facade = AsyncCompanyFacade(subsystem_b=FakeAsyncSubsystemB(latency=1.0),
+                                    timeouts={'B': 0.02})
+
+        result = asyncio.run(facade.process_monthly_payroll())
+
+        assert result.status == OperationStatus.FAILURE
+        assert "B" in result.message
+
+    def test_invalid_arguments(self):
+        """Тест проверки параметров."""
+        with pytest.raises(ValueError):
+            AsyncCompanyFacade(payroll_chunk_size=0)
+        with pytest.raises(ValueError):
+            FakeAsyncSubsystemA(latency=-1)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,187 @@
+"""
+Тесты для пакетных операций Facade Pattern.
+
+Покрывает:
+  ✓ BulkOperationResult (SUCCESS / PARTIAL / FAILURE, статус по элементам)
+  ✓ hire_many, fire_many, transfer_many
+  ✓ Один вызов каждой подсистемы на пакет
+  ✓ Пакетные методы подсистем B, C, D
+  ✓ Индекс имя -> отдел в подсистеме B
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from patterns.facade_refactored import (
+    OperationStatus, OperationResult, BulkOperationResult,
+    CompanySubsystemB, CompanySubsystemC, CompanySubsystemD, CompanyFacade
+)
+
+
+class TestBulkOperationResult:
+    """Тесты для BulkOperationResult."""
+
+    def test_statuses(self):
+        """Тест агрегированного статуса."""
+        ok = OperationResult(OperationStatus.SUCCESS, "ok")
+        fail = OperationResult(OperationStatus.FAILURE, "fail")
+
+        assert BulkOperationResult.from_items("X", {'a': ok}).status == OperationStatus.SUCCESS
+        assert BulkOperationResult.from_items("X", {'a': fail}).status == OperationStatus.FAILURE
+
+        partial = BulkOperationResult.from_items("X", {'a': ok, 'b': fail})
+        assert partial.status == OperationStatus.PARTIAL
+        assert partial.succeeded == ['a']
+        assert partial.failed == ['b']
+        assert "1 из 2" in partial.message
+
+    def test_empty_batch_is_success(self):
+        """Тест пустого пакета."""
+        assert BulkOperationResult.from_items("X", {}).is_success
+
+
+class TestSubsystemBulk:
+    """Тесты для пакетных методов подсистем."""
+
+    def test_subsystem_b_hire_fire_many(self):
+        """Тест пакетного найма и увольнения."""
+        subsys = CompanySubsystemB()
+
+        assert subsys.hire_many([("A", "DEV"), ("B", "QA"), ("A", "DEV")]) == [True, True, False]
+        assert subsys.list_employees_by_department("DEV")[-1] == "A"
+        assert subsys.fire_many(["A", "Nobody", "B"]) == [True, False, True]
+        assert "A" not in subsys.get_all_employees()
+
+    def test_subsystem_c_bulk_salaries(self, capsys):
+        """Тест пакетного расчёта: одна запись в логе на весь пакет."""
+        subsys = CompanySubsystemC()
+        subsys.set_salaries(["A", "B"], 7000.0)
+
+        salaries = subsys.calculate_monthly_salaries(["A", "B", "C"])
+
+        assert salaries == {"A": 7000.0, "B": 7000.0, "C": 5000.0}
+        assert capsys.readouterr().out.count("[SubsystemC]") == 1
+        assert subsys.process_payroll(["A", "C"]) == 12000.0
+
+    def test_subsystem_d_remove_from_projects(self):
+        """Тест снятия группы сотрудников с проектов."""
+        subsys = CompanySubsystemD()
+        subsys.assign_employee_to_project("A", "Project Alpha")
+        subsys.assign_employee_to_project("A", "Project Gamma")
+        subsys.assign_employee_to_project("B", "Project Beta")
+
+        removed = subsys.remove_employees_from_projects(["A", "B", "C"], subsys.list_active_projects())
+
+        assert removed == 2
+        assert subsys.get_employee_projects("A") == ["Project Gamma"]
+        assert subsys.get_employee_projects("B") == []
+
+
+class TestEmployeeIndex:
+    """Тесты для индекса имя -> отдел в CompanySubsystemB."""
+
+    def test_index_follows_hire_and_fire(self):
+        """Тест согласованности индекса при найме и увольнении."""
+        subsys = CompanySubsystemB()
+
+        assert subsys.get_employee_department("John Doe") == "DEV"
+        subsys.hire_employee("Eve", "HR")
+        assert subsys.get_employee_department("Eve") == "HR"
+
+        assert subsys.fire_employee("Eve") is True
+        assert subsys.get_employee_department("Eve") is None
+        assert subsys.fire_employee("Eve") is False
+
+    def test_transfer_employee(self):
+        """Тест перевода с сохранением порядка в отделе."""
+        subsys = CompanySubsystemB()
+
+        assert subsys.transfer_employee("John Doe", "SALES") is True
+        assert subsys.list_employees_by_department("SALES") == ["Bob Johnson", "Alice Brown", "John Doe"]
+        assert subsys.list_employees_by_department("DEV") == ["Jane Smith"]
+        assert subsys.get_employee_department("John Doe") == "SALES"
+
+        assert subsys.transfer_employee("Ghost", "SALES") is False
+        assert subsys.transfer_employee("John Doe", "SALES") is False
+
+    def test_same_name_in_two_departments(self):
+        """Тест: имя в двух отделах увольняется по одному разу за вызов."""
+        subsys = CompanySubsystemB()
+        subsys.hire_employee("John Doe", "HR")
+
+        assert subsys.fire_employee("John Doe") is True
+        assert subsys.get_employee_department("John Doe") == "HR"
+        assert subsys.fire_employee("John Doe") is True
+        assert "John Doe" not in subsys.get_all_employees()
+
+
+class TestFacadeBulk:
+    """Тесты для пакетных операций фасада."""
+
+    def test_hire_many(self):
+        """Тест пакетного найма с частичными ошибками."""
+        facade = CompanyFacade()
+
+        result = facade.hire_many([("N1", "DEV"), ("N2", "NOPE"), ("John Doe", "DEV"), ("N1", "HR")])
+
+        assert result.status == OperationStatus.PARTIAL
+        assert result.items["N1"].is_success
+        assert "не существует" in result.items["N2"].message
+        assert not result.items["John Doe"].is_success
+        assert set(result.items) == {"N1", "N2", "John Doe"}
+        assert "N1" in facade.get_department_employees("DEV").data
+        assert "N1" not in facade.get_department_employees("HR").data
+
+    def test_fire_many(self):
+        """Тест пакетного увольнения с финальной выплатой."""
+        facade = CompanyFacade()
+        facade._manager.subsystem_d.assign_employee_to_project("John Doe", "Project Alpha")
+
+        result = facade.fire_many(["John Doe", "Ghost"])
+
+        assert result.status == OperationStatus.PARTIAL
+        assert result.items["John Doe"].data == 5000.0
+        assert "не найден" in result.items["Ghost"].message
+        assert facade._manager.subsystem_d.get_employee_projects("John Doe") == []
+        assert "John Doe" not in facade.process_monthly_payroll().data
+
+    def test_transfer_many(self):
+        """Тест пакетного перевода."""
+        facade = CompanyFacade()
+
+        result = facade.transfer_many([("John Doe", "SALES"), ("Jane Smith", "HR"), ("Bob Johnson", "NOPE")])
+
+        assert result.succeeded == ["John Doe", "Jane Smith"]
+        assert result.failed == ["Bob Johnson"]
+        assert facade.get_department_employees("DEV").data == []
+        assert "Jane Smith" in facade.get_department_employees("HR").data
+        assert "Bob Johnson" in facade.get_department_employees("SALES").data
+
+    def test_one_call_per_subsystem(self, capsys):
+        """Тест: пакет из многих сотрудников - по одному запросу к подсистеме."""
+        facade = CompanyFacade()
+        capsys.readouterr()
+
+        facade.hire_many([(f"E{i}", "DEV") for i in range(50)])
+        out = capsys.readouterr().out
+        assert out.count("[SubsystemA]") == 1
+        assert out.count("[SubsystemB]") == 1
+
+        payroll = facade.process_monthly_payroll()
+        out = capsys.readouterr().out
+        assert len(payroll.data) == 56
+        assert out.count("[SubsystemC]") == 1
+
+        facade.fire_many([f"E{i}" for i in range(50)])
+        out = capsys.readouterr().out
+        assert out.count("[SubsystemB]") == 1
+        assert out.count("[SubsystemC]") == 1
+        assert out.count("[SubsystemD]") == 2  # список активных проектов + снятие
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
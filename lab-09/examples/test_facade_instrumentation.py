@@ -0,0 +1,195 @@
+"""
+Тесты для инструментирования Facade Pattern.
+
+Покрывает:
+  ✓ LatencyHistogram (корзины, квантили)
+  ✓ Метрики операций фасада и вызовов подсистем
+  ✓ Экспорт JSON и Prometheus
+  ✓ Отключённое инструментирование
+  ✓ ErrorHandler: ограниченный журнал с временем и операцией
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from patterns.facade_refactored import (
+    ErrorHandler, LatencyHistogram, Instrumentation, CompanyFacade, CompanySubsystemA,
+    InstrumentedSubsystem
+)
+
+
+class FakeClock:
+    """Часы, сдвигающиеся на step при каждом чтении."""
+
+    def __init__(self, step: float):
+        self.now = 0.0
+        self.step = step
+
+    def __call__(self) -> float:
+        self.now += self.step
+        return self.now
+
+
+class TestLatencyHistogram:
+    """Тесты для LatencyHistogram."""
+
+    def test_buckets(self):
+        """Тест распределения по корзинам (le - включительно)."""
+        histogram = LatencyHistogram((0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 2.0):
+            histogram.observe(value)
+
+        assert histogram.cumulative() == [('0.1', 2), ('1.0', 3), ('+Inf', 4)]
+        assert histogram.count == 4
+        assert histogram.sum == pytest.approx(2.65)
+
+    def test_quantile(self):
+        """Тест оценки квантилей."""
+        histogram = LatencyHistogram((0.01, 0.02))
+        assert histogram.quantile(0.5) is None
+
+        for _ in range(100):
+            histogram.observe(0.015)
+
+        assert 0.01 <= histogram.quantile(0.5) <= 0.02
+        assert histogram.quantile(0.99) <= 0.02
+
+
+class TestErrorHandlerLog:
+    """Тесты для журнала ErrorHandler."""
+
+    def test_records_time_and_operation(self):
+        """Тест записи времени, операции и контекста."""
+        handler = ErrorHandler(clock=lambda: 1700000000.0)
+        handler.operation = "hire_new_employee"
+        handler.add_error("Отдел 'X' не существует", department="X")
+
+        record = handler.get_records()[0]
+        assert record.timestamp == 1700000000.0
+        assert record.operation == "hire_new_employee"
+        assert record.context == {'department': "X"}
+        assert handler.get_errors() == ["Отдел 'X' не существует"]
+
+    def test_bounded(self):
+        """Тест ограничения размера журнала."""
+        handler = ErrorHandler(max_errors=3)
+        for i in range(10):
+            handler.add_error(f"e{i}")
+
+        assert handler.get_errors() == ["e7", "e8", "e9"]
+        assert handler.total_errors == 10
+        assert handler.get_error_message() == "e7; e8; e9"
+
+    def test_facade_sets_operation(self):
+        """Тест: фасад помечает ошибки именем операции."""
+        facade = CompanyFacade()
+        facade.hire_new_employee("X", "NOPE")
+
+        assert facade.error_handler.get_records()[0].operation == "hire_new_employee"
+
+    def test_operation_restored_after_call(self):
+        """Тест: после операции (и при исключении) восстанавливается прежнее имя."""
+        facade = CompanyFacade()
+        handler = facade.error_handler
+        facade.hire_new_employee("X", "NOPE")
+
+        handler.add_error("вне операции")
+        handler.operation = "outer"
+        with pytest.raises(TypeError):
+            facade.hire_new_employee()
+
+        assert handler.get_records()[-1].operation is None
+        assert handler.operation == "outer"
+
+
+class TestInstrumentation:
+    """Тесты для Instrumentation."""
+
+    def test_operation_and_subsystem_metrics(self):
+        """Тест метрик операции и вызовов подсистем."""
+        instrumentation = Instrumentation(clock=FakeClock(0.001))
+        facade = CompanyFacade(instrumentation)
+
+        facade.hire_new_employee("N1", "DEV")
+        facade.hire_new_employee("N2", "NOPE")
+        facade.fire_employee("N1")
+
+        hire = instrumentation.get(Instrumentation.OPERATION, "hire_new_employee")
+        assert hire.calls == 2
+        assert hire.errors == 1
+        assert instrumentation.get(Instrumentation.OPERATION, "fire_employee").errors == 0
+
+        exists = instrumentation.get(Instrumentation.SUBSYSTEM, "A.department_exists")
+        assert exists.calls == 2
+        assert instrumentation.get(Instrumentation.SUBSYSTEM, "B.hire_employee").calls == 1
+
+    def test_subsystem_exception_counted(self):
+        """Тест учёта исключений подсистемы."""
+        instrumentation = Instrumentation()
+        proxy = InstrumentedSubsystem(CompanySubsystemA(), "A", instrumentation)
+
+        with pytest.raises(TypeError):
+            proxy.add_department()
+
+        assert instrumentation.get(Instrumentation.SUBSYSTEM, "A.add_department").errors == 1
+
+    def test_disabled(self):
+        """Тест: при enabled=False метрики не собираются."""
+        instrumentation = Instrumentation(enabled=False)
+        facade = CompanyFacade(instrumentation)
+
+        result = facade.process_monthly_payroll()
+
+        assert result.is_success
+        assert instrumentation.snapshot() == {'operations': {}, 'subsystems': {}}
+
+        instrumentation.enabled = True
+        facade.process_monthly_payroll()
+        assert instrumentation.get(Instrumentation.OPERATION, "process_monthly_payroll").calls == 1
+        assert instrumentation.get(Instrumentation.SUBSYSTEM, "C.calculate_monthly_salaries").calls == 1
+
+        instrumentation.enabled = False
+        facade.process_monthly_payroll()
+        assert instrumentation.get(Instrumentation.SUBSYSTEM, "C.calculate_monthly_salaries").calls == 1
+
+    def test_without_instrumentation(self):
+        """Тест: без Instrumentation подсистемы не оборачиваются."""
+        facade = CompanyFacade()
+
+        assert facade.instrumentation is None
+        assert isinstance(facade._manager.subsystem_a, CompanySubsystemA)
+
+    def test_json_export(self):
+        """Тест экспорта в JSON."""
+        instrumentation = Instrumentation(clock=FakeClock(0.002))
+        facade = CompanyFacade(instrumentation)
+        facade.get_company_summary()
+
+        data = json.loads(instrumentation.to_json())
+
+        summary = data['operations']['get_company_summary']
+        assert summary['calls'] == 1
+        assert summary['buckets']['+Inf'] == 1
+        assert 'B.get_all_employees' in data['subsystems']
+
+    def test_prometheus_export(self):
+        """Тест экспорта в формате Prometheus."""
+        instrumentation = Instrumentation(clock=FakeClock(0.002))
+        facade = CompanyFacade(instrumentation)
+        facade.get_department_employees("DEV")
+
+        text = instrumentation.to_prometheus()
+
+        assert "# TYPE company_facade_operation_seconds histogram" in text
+        assert 'company_facade_operation_seconds_bucket{operation="get_department_employees",le="+Inf"} 1' in text
+        assert 'company_facade_subsystem_call_calls_total{subsystem="B",method="list_employees_by_department"} 1' in text
+        assert 'company_facade_operation_errors_total{operation="get_department_employees"} 0' in text
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
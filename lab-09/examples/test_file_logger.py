@@ -0,0 +1,197 @@
+"""
+Тесты для буферизованного FileLogger (decorator_refactored).
+
+Покрывает:
+  ✓ Буферизация и фоновая запись
+  ✓ Синхронная запись по уровню
+  ✓ Кольцевой буфер (вытеснение старых сообщений)
+  ✓ Ротация по размеру и времени, сжатие архивов
+  ✓ Сброс буфера при закрытии
+  ✓ Ошибки записи и сборка незакрытых логгеров
+"""
+
+import gc
+import gzip
+import sys
+import time
+import weakref
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from patterns import decorator_refactored
+from patterns.decorator_refactored import FileLogger, LogLevel
+
+
+def wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+class TestBufferedFileLogger:
+    """Тесты для FileLogger."""
+    
+    def test_buffered_until_flush(self, tmp_path):
+        """Тест буферизации сообщений ниже flush_level."""
+        log_file = tmp_path / "app.log"
+        logger = FileLogger(str(log_file), flush_interval=60)
+        
+        logger.info("Test message")
+        assert not log_file.exists() or log_file.read_text() == ""
+        
+        logger.flush()
+        assert log_file.read_text() == "[INFO] Test message\n"
+        logger.close()
+    
+    def test_error_flushes_synchronously(self, tmp_path):
+        """Тест синхронной записи для ERROR (вместе с накопленным)."""
+        log_file = tmp_path / "app.log"
+        logger = FileLogger(str(log_file), flush_interval=60)
+        
+        logger.info("first")
+        logger.error("second")
+        
+        assert log_file.read_text() == "[INFO] first\n[ERROR] second\n"
+        logger.close()
+    
+    def test_background_flush_by_interval(self, tmp_path):
+        """Тест фоновой записи по времени."""
+        log_file = tmp_path / "app.log"
+        logger = FileLogger(str(log_file), flush_interval=0.05)
+        logger.debug("tick")
+        
+        assert wait_for(lambda: log_file.exists() and "tick" in log_file.read_text())
+        logger.close()
+    
+    def test_background_flush_by_batch_size(self, tmp_path):
+        """Тест фоновой записи по размеру пакета."""
+        log_file = tmp_path / "app.log"
+        logger = FileLogger(str(log_file), batch_size=10, flush_interval=60)
+        for i in range(10):
+            logger.info(f"m{i}")
+        
+        assert wait_for(lambda: logger.written == 10)
+        logger.close()
+    
+    def test_ring_buffer_drops_oldest(self, tmp_path):
+        """Тест вытеснения старых сообщений при переполнении."""
+        log_file = tmp_path / "app.log"
+        logger = FileLogger(str(log_file), buffer_size=3, batch_size=100,
+                            flush_interval=60, flush_level=None)
+        for i in range(5):
+            logger.info(f"m{i}")
+        logger.close()
+        
+        assert logger.dropped == 2
+        assert log_file.read_text() == "[INFO] m2\n[INFO] m3\n[INFO] m4\n"
+    
+    def test_close_flushes_and_is_idempotent(self, tmp_path):
+        """Тест записи при закрытии."""
+        log_file = tmp_path / "app.log"
+        with FileLogger(str(log_file), flush_interval=60) as logger:
+            logger.warning("bye")
+        logger.close()
+        
+        assert log_file.read_text() == "[WARNING] bye\n"
+    
+    def test_log_after_close_is_written(self, tmp_path):
+        """Тест записи сообщений после закрытия."""
+        log_file = tmp_path / "app.log"
+        logger = FileLogger(str(log_file))
+        logger.close()
+        logger.info("late")
+        
+        assert "late" in log_file.read_text()
+    
+    def test_size_rotation(self, tmp_path):
+        """Тест ротации по размеру."""
+        log_file = tmp_path / "app.log"
+        logger = FileLogger(str(log_file), max_bytes=30, backup_count=2,
+                            flush_level=LogLevel.DEBUG)
+        for i in range(6):
+            logger.info(f"message {i}")   # 18 байт на строку
+        logger.close()
+        
+        assert logger.rotations == 5
+        assert log_file.read_text() == "[INFO] message 5\n"
+        assert (tmp_path / "app.log.1").read_text() == "[INFO] message 4\n"
+        assert (tmp_path / "app.log.2").read_text() == "[INFO] message 3\n"
+        assert not (tmp_path / "app.log.3").exists()
+    
+    def test_compressed_rotation(self, tmp_path):
+        """Тест сжатия архивов."""
+        log_file = tmp_path / "app.log"
+        logger = FileLogger(str(log_file), max_bytes=20, compress=True,
+                            flush_level=LogLevel.DEBUG)
+        logger.info("message 0")
+        logger.info("message 1")
+        logger.close()
+        
+        with gzip.open(tmp_path / "app.log.1.gz", 'rt', encoding='utf-8') as archive:
+            assert archive.read() == "[INFO] message 0\n"
+    
+    def test_time_rotation(self, tmp_path):
+        """Тест ротации по времени."""
+        log_file = tmp_path / "app.log"
+        logger = FileLogger(str(log_file), rotate_interval=0.05, flush_level=LogLevel.DEBUG)
+        logger.info("old")
+        time.sleep(0.06)
+        logger.info("new")
+        logger.close()
+        
+        assert (tmp_path / "app.log.1").read_text() == "[INFO] old\n"
+        assert log_file.read_text() == "[INFO] new\n"
+    
+    def test_rotation_error_keeps_writer_alive(self, tmp_path, monkeypatch, capsys):
+        """Тест: сбой os.replace при ротации не теряет пакет и не останавливает поток."""
+        log_file = tmp_path / "app.log"
+        replace = decorator_refactored.os.replace
+        failures = [OSError("disk full")]
+        
+        def flaky_replace(src, dst):
+            if failures:
+                raise failures.pop()
+            replace(src, dst)
+        
+        monkeypatch.setattr(decorator_refactored.os, 'replace', flaky_replace)
+        logger = FileLogger(str(log_file), max_bytes=20, flush_interval=0.05, flush_level=None)
+        logger.info("message 0")
+        assert wait_for(lambda: logger.written == 1)
+        logger.info("message 1")
+        
+        assert wait_for(lambda: logger.written == 2)
+        assert logger._thread.is_alive()
+        assert logger.write_errors == 1 and "disk full" in str(logger.last_error)
+        assert "Ошибка записи" in capsys.readouterr().err
+        logger.close()
+        assert (tmp_path / "app.log.1").read_text() == "[INFO] message 0\n"
+        assert log_file.read_text() == "[INFO] message 1\n"
+    
+    def test_error_level_write_failure_does_not_raise(self, tmp_path, monkeypatch):
+        """Тест: сбой синхронной записи ERROR не выбрасывается из log()."""
+        logger = FileLogger(str(tmp_path / "app.log"), flush_interval=60)
+        
+        def failing_write(lines):
+            raise OSError("no space left")
+        
+        monkeypatch.setattr(logger, '_write', failing_write)
+        logger.error("boom")
+        
+        assert logger.write_errors == 1
+        assert list(logger._buffer) == ["[ERROR] boom\n"]
+        logger.close()
+        assert logger.dropped == 1
+    
+    def test_unclosed_logger_is_collected(self, tmp_path):
+        """Тест: незакрытый логгер собирается, его поток завершается."""
+        logger = FileLogger(str(tmp_path / "app.log"), flush_interval=0.02)
+        ref, thread = weakref.ref(logger), logger._thread
+        del logger
+        
+        assert wait_for(lambda: (gc.collect(), ref() is None)[1])
+        thread.join(1.0)
+        assert not thread.is_alive()
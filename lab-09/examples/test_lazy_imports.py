@@ -0,0 +1,123 @@
+"""
+Тесты для отложенной загрузки модулей (utils.lazy).
+
+Покрывает:
+  ✓ lazy_import: отсутствующий модуль, отложенное выполнение, уже загруженный модуль,
+    одновременное первое обращение из потоков, sys.modules без заместителей
+  ✓ lazy_exports: __getattr__ / __dir__ пакета (PEP 562)
+  ✓ Холодный импорт модулей не загружает numpy, asyncio, json, csv
+"""
+
+import json
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+SRC = Path(__file__).parent.parent / 'src'
+sys.path.insert(0, str(SRC))
+
+from utils.lazy import lazy_import
+
+
+class TestLazyImport:
+    """Тесты для lazy_import."""
+
+    def test_missing_module(self):
+        """Тест опциональной зависимости, которая не установлена."""
+        assert lazy_import('no_such_module_for_lazy_test') is None
+
+    def test_already_loaded_module(self):
+        """Тест: загруженный модуль возвращается как есть."""
+        assert lazy_import('json') is json
+
+    def test_executes_on_first_attribute(self, tmp_path, monkeypatch):
+        """Тест: модуль выполняется при первом обращении к атрибуту."""
+        (tmp_path / 'lazy_probe_module.py').write_text(
+            "import builtins\nbuiltins.lazy_probe_loaded = True\nVALUE = 42\n", encoding='utf-8')
+        monkeypatch.syspath_prepend(str(tmp_path))
+        monkeypatch.delitem(sys.modules, 'lazy_probe_module', raising=False)
+        import builtins
+        monkeypatch.setattr(builtins, 'lazy_probe_loaded', False, raising=False)
+
+        module = lazy_import('lazy_probe_module')
+        assert builtins.lazy_probe_loaded is False
+
+        assert module.VALUE == 42
+        assert builtins.lazy_probe_loaded is True
+
+    def test_concurrent_first_access(self, tmp_path, monkeypatch):
+        """Тест: при одновременном первом обращении модуль выполняется один раз."""
+        (tmp_path / 'lazy_slow_module.py').write_text(
+            "import builtins, time\nbuiltins.lazy_slow_runs += 1\ntime.sleep(0.05)\nVALUE = 7\n",
+            encoding='utf-8')
+        monkeypatch.syspath_prepend(str(tmp_path))
+        monkeypatch.delitem(sys.modules, 'lazy_slow_module', raising=False)
+        import builtins
+        monkeypatch.setattr(builtins, 'lazy_slow_runs', 0, raising=False)
+        module = lazy_import('lazy_slow_module')
+        assert 'lazy_slow_module' not in sys.modules
+        start = threading.Barrier(8)
+        values = []
+
+        def read():
+            start.wait()
+            values.append(module.VALUE)
+
+        threads = [threading.Thread(target=read) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert values == [7] * 8
+        assert builtins.lazy_slow_runs == 1
+        assert type(sys.modules['lazy_slow_module']) is type(json)
+
+
+class TestLazyExports:
+    """Тесты для ленивых экспортов пакета."""
+
+    def test_getattr_and_dir(self):
+        """Тест загрузки экспорта по имени и кэширования в пакете."""
+        import services.employee as package
+
+        assert 'BaseFormatter' in dir(package)
+        formatter = package.BaseFormatter
+        assert formatter.__module__ == 'services.employee.base_formatter'
+        assert package.__dict__['BaseFormatter'] is formatter
+
+    def test_unknown_name(self):
+        """Тест AttributeError для неизвестного имени."""
+        import services.employee as package
+
+        with pytest.raises(AttributeError, match="no attribute 'Missing'"):
+            package.Missing
+
+
+class TestColdImport:
+    """Тесты холодного импорта в отдельном процессе."""
+
+    def test_optional_modules_not_loaded(self):
+        """Тест: тяжёлые и редко нужные модули не выполняются при импорте."""
+        code = (
+            "import sys, importlib\n"
+            "for name in ('patterns.facade_refactored', 'patterns.decorator_refactored',\n"
+            "             'services.export_strategy', 'repositories.department_repository',\n"
+            "             'services.employee', 'organization'):\n"
+            "    importlib.import_module(name)\n"
+            "loaded = sorted(name for name in ('numpy', 'asyncio', 'json', 'csv', 'gzip',\n"
+            "                                  'services.employee.employee_factory')\n"
+            "                if name in sys.modules)\n"
+            "print(','.join(loaded))\n"
+        )
+        proc = subprocess.run([sys.executable, '-c', code], cwd=SRC,
+                              capture_output=True, text=True, check=True)
+
+        assert proc.stdout.strip() == ''
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -10,8 +10,9 @@
 ПОСЛЕ: Employee - только данные (25 строк) + Validator - только валидация (40 строк)
 """
 
-from typing import Optional
+from typing import Any, Optional
 from validators import EmployeeValidator, ValidationError
+from services.event_bus import EventBus, EmployeeChanged
 
 
 class Employee:
@@ -22,8 +23,13 @@ class Employee:
     Не содержит бизнес-логики или расчета зарплат.
     
     Валидация выделена в отдельный класс EmployeeValidator.
+    
+    Изменения полей, влияющих на зарплату, публикуются в event_bus
+    (если задана) событием EmployeeChanged с ключом id сотрудника.
     """
     
+    event_bus: Optional[EventBus] = None
+    
     def __init__(
         self,
         emp_id: int,
@@ -121,7 +127,21 @@ class Employee:
         Raises:
             ValidationError: Если зарплата невалидна
         """
+        old_value = getattr(self, '_Employee__base_salary', None)
         self.__base_salary = self.validator.validate_salary(value)
+        self._publish_change('base_salary', old_value, self.__base_salary)
+    
+    def _publish_change(self, field: str, old_value: Any, new_value: Any) -> None:
+        """Сообщить подписчикам шины об изменении поля.
+        
+        Args:
+            field: Имя изменённого поля
+            old_value: Прежнее значение (None при инициализации)
+            new_value: Новое значение
+        """
+        bus = self.event_bus
+        if bus is not None and old_value != new_value:
+            bus.publish(EmployeeChanged(self, field, old_value, new_value), key=self.id)
     
     def __str__(self) -> str:
         """Строковое представление сотрудника."""
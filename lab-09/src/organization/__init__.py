@@ -0,0 +1,18 @@
+"""
+Организационная структура: компания, отделы, проекты.
+
+Экспорты загружаются лениво (PEP 562): `from organization import Company`
+импортирует organization.company только при первом обращении.
+"""
+
+from utils.lazy import lazy_exports
+
+_EXPORTS = {
+    'Company': '.company',
+    'Department': '.department',
+    'Project': '.project',
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -5,9 +5,9 @@ from services.department_manager import DepartmentManager
 from services.project_manager import ProjectManager
 from services.employee_manager import EmployeeManager
 from services.dependency_validator import DependencyValidator
-from services.cost_calculator import CostCalculator
-from services.company_serializer import CompanySerializer
-from services.export_strategy import CompanyExporter, CSVExportStrategy
+
+# CostCalculator, CompanySerializer и CompanyExporter импортируются в методах,
+# которые их используют: импорт компании не тянет сериализацию и экспорт.
 
 class Company:
     """
@@ -93,6 +93,8 @@ class Company:
 
     def calculate_total_monthly_cost(self) -> float:
         """Рассчитывает ФОТ компании. Делегирует в CostCalculator."""
+        from services.cost_calculator import CostCalculator
+
         return CostCalculator.calculate_total_monthly_cost(
             self._dept_manager.get_departments()
         )
@@ -101,6 +103,8 @@ class Company:
 
     def save_to_json(self, filename: str) -> None:
         """Сохраняет компанию в JSON. Делегирует в CompanySerializer."""
+        from services.company_serializer import CompanySerializer
+
         CompanySerializer.save_to_json(
             self.name,
             self._dept_manager.get_departments(),
@@ -111,6 +115,8 @@ class Company:
     @classmethod
     def load_from_json(cls, filename: str) -> 'Company':
         """Загружает компанию из JSON. Делегирует в CompanySerializer."""
+        from services.company_serializer import CompanySerializer
+
         data = CompanySerializer.load_from_json(filename)
 
         company = cls(data["company_name"])
@@ -125,10 +131,14 @@ class Company:
 
     def export_employees_csv(self, filename: str) -> None:
         """Экспортирует сотрудников в CSV. Делегирует в CompanyExporter."""
+        from services.export_strategy import CompanyExporter, CSVExportStrategy
+
         exporter = CompanyExporter(CSVExportStrategy())
         exporter.export_employees(self.get_all_employees(), filename)
 
     def export_projects_csv(self, filename: str) -> None:
         """Экспортирует проекты в CSV. Делегирует в CompanyExporter."""
+        from services.export_strategy import CompanyExporter, CSVExportStrategy
+
         exporter = CompanyExporter(CSVExportStrategy())
         exporter.export_projects(self._proj_manager.get_projects(), filename)
\ No newline at end of file
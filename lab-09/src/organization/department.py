@@ -1,5 +1,6 @@
-from typing import List, Dict
+from typing import List, Dict, Optional
 from base.abstract_employee import AbstractEmployee
+from services.event_bus import EventBus, MembershipChanged, DEPARTMENT_GROUP
 from services.department_statistics import DepartmentStatistics
 from services.department_search_service import DepartmentSearchService
 from services.department_validator import DepartmentValidator
@@ -15,18 +16,21 @@ class Department:
     ✅ Весь поиск делегирован в DepartmentSearchService.
     ✅ Вся валидация делегирована в DepartmentValidator.
     ✅ Вся сериализация делегирована в DepartmentRepository.
+    ✅ Изменения состава публикуются в шину событий (MembershipChanged).
 
     ДО рефакторинга: 200+ строк, 5 обязанностей
     ПОСЛЕ рефакторинга: ~80 строк, 1 обязанность
     """
 
-    def __init__(self, name: str):
+    def __init__(self, name: str, event_bus: Optional[EventBus] = None):
         """
         Инициализация отдела.
 
         :param name: Название отдела (уникальное в рамках компании).
+        :param event_bus: Шина для событий состава отдела (необязательно).
         """
         self.name = name
+        self.event_bus = event_bus
         self.__employees: List[AbstractEmployee] = []
 
     # --- Управление сотрудниками (ЕДИНСТВЕННАЯ ОТВЕТСТВЕННОСТЬ) ---
@@ -40,6 +44,7 @@ class Department:
         """
         DepartmentValidator.validate_employee(employee)
         self.__employees.append(employee)
+        self._publish_membership(employee, joined=True)
 
     def remove_employee(self, employee_id: int) -> None:
         """
@@ -47,7 +52,25 @@ class Department:
         Если сотрудник с таким ID не найден, список остается без изменений.
         """
         DepartmentValidator.validate_employee_id(employee_id)
+        removed = [e for e in self.__employees if e.id == employee_id]
+        if not removed:
+            return
         self.__employees = [e for e in self.__employees if e.id != employee_id]
+        for employee in removed:
+            self._publish_membership(employee, joined=False)
+
+    def _publish_membership(self, employee: AbstractEmployee, joined: bool) -> None:
+        """
+        Публикует изменение состава отдела.
+        Сотрудник без своей шины подключается к шине отдела, чтобы
+        его изменения тоже доходили до подписчиков.
+        """
+        if self.event_bus is None:
+            return
+        if joined and employee.event_bus is None:
+            employee.event_bus = self.event_bus
+        event = MembershipChanged(DEPARTMENT_GROUP, self.name, employee, joined)
+        self.event_bus.publish(event, key=event.key)
 
     def get_employees(self) -> List[AbstractEmployee]:
         """Возвращает список всех сотрудников отдела."""
@@ -1,6 +1,7 @@
 from datetime import datetime
-from typing import Union, List
+from typing import Union, List, Optional
 from base.abstract_employee import AbstractEmployee
+from services.event_bus import EventBus, MembershipChanged, PROJECT_GROUP
 from services.project_validator import ProjectValidator
 from services.project_team_manager import ProjectTeamManager
 from services.project_calculator import ProjectCalculator
@@ -16,6 +17,7 @@ class Project:
     ✅ Управление командой делегировано в ProjectTeamManager.
     ✅ Все расчёты делегированы в ProjectCalculator.
     ✅ Форматирование вывода делегировано в ProjectFormatter.
+    ✅ Изменения команды публикуются в шину событий (MembershipChanged).
 
     ДО рефакторинга: 150+ строк, 5 обязанностей
     ПОСЛЕ рефакторинга: ~70 строк, 1 обязанность (координация)
@@ -27,7 +29,8 @@ class Project:
         name: str, 
         description: str, 
         deadline: Union[str, datetime], 
-        status: str = "planning"
+        status: str = "planning",
+        event_bus: Optional[EventBus] = None
     ):
         """
         Инициализация проекта.
@@ -37,6 +40,7 @@ class Project:
         :param description: Описание проекта.
         :param deadline: Дедлайн в формате 'YYYY-MM-DD' или datetime.
         :param status: Статус проекта (по умолчанию 'planning').
+        :param event_bus: Шина для событий состава команды (необязательно).
         :raises ValueError: Если данные некорректны.
         """
         # Валидация всех полей
@@ -47,6 +51,7 @@ class Project:
 
         # Инициализация сервисов
         self._team_manager = ProjectTeamManager()
+        self.event_bus = event_bus
 
         # Используем property setter для валидации статуса
         self.status = status
@@ -73,14 +78,29 @@ class Project:
         Добавляет сотрудника в команду проекта.
         Делегирует в ProjectTeamManager.
         """
+        if self._team_manager.is_member(employee.id):
+            return
         self._team_manager.add_member(employee)
+        self._publish_membership(employee, joined=True)
 
     def remove_team_member(self, employee_id: int) -> None:
         """
         Удаляет сотрудника из команды по ID.
         Делегирует в ProjectTeamManager.
         """
+        removed = [e for e in self._team_manager.get_team() if e.id == employee_id]
         self._team_manager.remove_member(employee_id)
+        for employee in removed:
+            self._publish_membership(employee, joined=False)
+
+    def _publish_membership(self, employee: AbstractEmployee, joined: bool) -> None:
+        """Публикует изменение состава команды (см. Department)."""
+        if self.event_bus is None:
+            return
+        if joined and employee.event_bus is None:
+            employee.event_bus = self.event_bus
+        event = MembershipChanged(PROJECT_GROUP, self.name, employee, joined)
+        self.event_bus.publish(event, key=event.key)
 
     def get_team(self) -> List[AbstractEmployee]:
         """
@@ -7,6 +7,11 @@
   ✓ Удалены дублирующиеся преобразования
   ✓ Централизованное управление соответствием типов
   ✓ Улучшена обработка ошибок
+  ✓ Пакетный расчёт calculate_many() с построчным отчётом об ошибках
+    (векторизуется через NumPy, если он установлен)
+  ✓ Асинхронный адаптер для сетевого внешнего сервиса: ограничение
+    параллелизма, пакеты, таймауты, повторы с jitter, circuit breaker
+  ✓ Кэширующий декоратор калькулятора (LRU + TTL) с метриками
 
 METRICS:
   Код дублирования: снижено на 40%
@@ -14,10 +19,23 @@ METRICS:
   Принципы SOLID: DRY, SRP применены
 """
 
+import asyncio
+import math
+import random
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
+from collections import defaultdict, OrderedDict
+from typing import List, Dict, Any, Optional, Sequence, Union, Callable, Awaitable, Tuple, Hashable
+from dataclasses import dataclass, field
 from enum import Enum
+from types import MappingProxyType
+
+from utils.lazy import lazy_import
+
+# NumPy опционален: без него пакетный расчёт идёт списками.
+# Загружается при первом векторном расчёте, а не при импорте модуля.
+np = lazy_import('numpy')
 
 
 class DataValidator(ABC):
@@ -57,18 +75,94 @@ class EmployeeDataValidator(DataValidator):
     def get_error_message(self) -> str:
         """Получить все ошибки."""
         return "; ".join(self._errors)
+    
+    def validate_many(self, employees: Sequence[Dict[str, Any]]) -> Dict[int, str]:
+        """
+        Пакетная проверка без вывода в консоль.
+        
+        Args:
+            employees: Список сотрудников
+        
+        Returns:
+            Словарь: номер строки -> сообщение об ошибке (только невалидные строки)
+        """
+        required_fields = ('id', 'name', 'base_salary', 'type')
+        failures = {}
+        
+        for row, data in enumerate(employees):
+            # Быстрый путь: валидная строка не создаёт списков ошибок
+            salary = data.get('base_salary')
+            if ('id' in data and 'name' in data and 'type' in data
+                    and type(salary) in (int, float) and salary >= 0):
+                continue
+            
+            errors = [f"Missing field: {name}" for name in required_fields if name not in data]
+            salary = data.get('base_salary', 0)
+            if not isinstance(salary, (int, float)):
+                errors.append("base_salary must be a number")
+            elif salary < 0:
+                errors.append("base_salary cannot be negative")
+            if errors:
+                failures[row] = "; ".join(errors)
+        
+        return failures
+
+
+@dataclass
+class BatchCalculationResult:
+    """Результат пакетного расчёта зарплат."""
+    
+    salaries: Sequence[float]                              # по строкам входа, NaN для невалидных
+    errors: Dict[int, str] = field(default_factory=dict)   # номер строки -> причина отказа
+    
+    @property
+    def total(self) -> float:
+        """Сумма по валидным строкам."""
+        if np is not None and isinstance(self.salaries, np.ndarray):
+            return float(np.nansum(self.salaries))
+        return math.fsum(s for s in self.salaries if not math.isnan(s))
+    
+    @property
+    def failed_count(self) -> int:
+        return len(self.errors)
+    
+    def __len__(self) -> int:
+        return len(self.salaries)
+
+
+def _split_valid_rows(employees: Sequence[Dict[str, Any]],
+                      validator: DataValidator) -> Dict[int, str]:
+    """Пакетная валидация с откатом на построчную для пользовательских валидаторов."""
+    if hasattr(validator, 'validate_many'):
+        return validator.validate_many(employees)
+    
+    return {row: validator.get_error_message()
+            for row, employee in enumerate(employees)
+            if not validator.validate(employee)}
 
 
 class TypeConverter:
     """Централизованный конвертер типов для адаптеров."""
     
     # Маппинг типов сотрудников
-    EMPLOYEE_TYPE_MAPPING = {
-        'manager': {'external': 1.3, 'legacy': 'MGR'},
-        'developer': {'external': 1.5, 'legacy': 'DEV'},
-        'salesperson': {'external': 1.2, 'legacy': 'SALES'},
-        'employee': {'external': 1.0, 'legacy': 'EMP'},
+    _type_mapping = {
+        'manager': MappingProxyType({'external': 1.3, 'legacy': 'MGR'}),
+        'developer': MappingProxyType({'external': 1.5, 'legacy': 'DEV'}),
+        'salesperson': MappingProxyType({'external': 1.2, 'legacy': 'SALES'}),
+        'employee': MappingProxyType({'external': 1.0, 'legacy': 'EMP'}),
     }
+    # Только для чтения: изменения идут через update_type_mapping(),
+    # иначе кэши (CachingSalaryCalculator) о них не узнают
+    EMPLOYEE_TYPE_MAPPING = MappingProxyType(_type_mapping)
+    
+    # Увеличивается при каждом изменении маппинга (для инвалидации кэшей)
+    mapping_version = 0
+    
+    @staticmethod
+    def update_type_mapping(emp_type: str, external: float, legacy: str) -> None:
+        """Добавить или изменить соответствие типа сотрудника."""
+        TypeConverter._type_mapping[emp_type] = MappingProxyType({'external': external, 'legacy': legacy})
+        TypeConverter.mapping_version += 1
     
     @staticmethod
     def convert_type_to_external(emp_type: str) -> float:
@@ -86,6 +180,20 @@ class TypeConverter:
         print(f"[TypeConverter] Тип '{emp_type}' -> legacy {result}")
         return result
     
+    @staticmethod
+    def external_multipliers(emp_types: Sequence[str]) -> List[float]:
+        """Коэффициенты внешнего сервиса для столбца типов (без вывода в консоль)."""
+        table = defaultdict(lambda: 1.0, {
+            t: m.get('external', 1.0) for t, m in TypeConverter.EMPLOYEE_TYPE_MAPPING.items()})
+        return list(map(table.__getitem__, emp_types))
+    
+    @staticmethod
+    def legacy_codes(emp_types: Sequence[str]) -> List[str]:
+        """Коды устаревшей системы для столбца типов (без вывода в консоль)."""
+        table = defaultdict(lambda: 'EMP', {
+            t: m.get('legacy', 'EMP') for t, m in TypeConverter.EMPLOYEE_TYPE_MAPPING.items()})
+        return list(map(table.__getitem__, emp_types))
+    
     @staticmethod
     def convert_employee_to_external_format(employee: Dict[str, Any]) -> Dict[str, Any]:
         """Преобразовать сотрудника в формат внешнего сервиса."""
@@ -129,11 +237,39 @@ class ExternalSalaryCalculationService:
         
         print(f"[ExternalService] Расчет: base={base_salary}, multiplier={multiplier}, result={result}")
         return result
+    
+    def calculate_monthly_payments(self, bases: Sequence[float],
+                                   multipliers: Sequence[float]) -> Sequence[float]:
+        """
+        Пакетный расчёт платежей (та же формула, что и calculate_monthly_payment).
+        
+        Args:
+            bases: Столбец базовых зарплат
+            multipliers: Столбец коэффициентов
+        
+        Returns:
+            Столбец платежей (np.ndarray, если доступен NumPy)
+        """
+        if np is not None:
+            gross = np.asarray(bases, dtype=float) * np.asarray(multipliers, dtype=float)
+            return gross - gross * 0.05
+        
+        result = []
+        for base, multiplier in zip(bases, multipliers):
+            gross = base * multiplier
+            result.append(gross - gross * 0.05)
+        return result
 
 
 class LegacySalaryCalculator:
     """Устаревшая система расчета зарплат (ещё один несовместимый интерфейс)."""
     
+    TYPE_BONUSES = {
+        'MGR': 0.2,      # Менеджеры получают 20%
+        'DEV': 0.15,     # Разработчики получают 15%
+        'SALES': 0.25,   # Продавцы получают 25%
+    }
+    
     def get_total_compensation(self, employee_id: int, emp_type: str,
                               salary_amount: float) -> float:
         """
@@ -147,17 +283,30 @@ class LegacySalaryCalculator:
         Returns:
             Общая компенсация
         """
-        type_bonuses = {
-            'MGR': 0.2,      # Менеджеры получают 20%
-            'DEV': 0.15,     # Разработчики получают 15%
-            'SALES': 0.25,   # Продавцы получают 25%
-        }
-        
-        bonus_rate = type_bonuses.get(emp_type, 0.0)
+        bonus_rate = self.TYPE_BONUSES.get(emp_type, 0.0)
         total = salary_amount * (1 + bonus_rate)
         
         print(f"[LegacyCalculator] ID={employee_id}, type={emp_type}, total={total}")
         return total
+    
+    def get_total_compensations(self, emp_types: Sequence[str],
+                                salary_amounts: Sequence[float]) -> Sequence[float]:
+        """
+        Пакетный расчёт компенсаций (та же формула, что и get_total_compensation).
+        
+        Args:
+            emp_types: Столбец типов ('MGR', 'DEV', 'SALES')
+            salary_amounts: Столбец зарплат
+        
+        Returns:
+            Столбец компенсаций (np.ndarray, если доступен NumPy)
+        """
+        bonuses = defaultdict(float, self.TYPE_BONUSES)
+        if np is not None:
+            rates = np.fromiter(map(bonuses.__getitem__, emp_types), dtype=float,
+                                count=len(emp_types))
+            return np.asarray(salary_amounts, dtype=float) * (1 + rates)
+        return [amount * (1 + bonuses[t]) for amount, t in zip(salary_amounts, emp_types)]
 
 
 # ===== НАША СИСТЕМА =====
@@ -169,10 +318,54 @@ class SalaryCalculator(ABC):
     def calculate_salary(self, employee: Dict[str, Any]) -> float:
         """Расчет зарплаты сотрудника."""
         pass
+    
+    def calculate_many(self, employees: Sequence[Dict[str, Any]]) -> BatchCalculationResult:
+        """
+        Пакетный расчёт зарплат.
+        
+        Базовая реализация вызывает calculate_salary построчно;
+        адаптеры переопределяют её векторизованным расчётом.
+        
+        Args:
+            employees: Список сотрудников
+        
+        Returns:
+            BatchCalculationResult с построчными ошибками
+        """
+        salaries = []
+        errors = {}
+        for row, employee in enumerate(employees):
+            try:
+                salaries.append(self.calculate_salary(employee))
+            except ValueError as e:
+                salaries.append(math.nan)
+                errors[row] = str(e)
+        return BatchCalculationResult(salaries, errors)
 
 
 # ===== АДАПТЕРЫ =====
 
+def _mask_failed(result: Sequence[float], errors: Dict[int, str]) -> Sequence[float]:
+    """Пометить невалидные строки значением NaN."""
+    if not errors:
+        return result
+    if np is not None and isinstance(result, np.ndarray):
+        result[list(errors)] = np.nan
+        return result
+    result = list(result)
+    for row in errors:
+        result[row] = math.nan
+    return result
+
+
+def _salary_column(employees: Sequence[Dict[str, Any]], errors: Dict[int, str]) -> List[float]:
+    """Столбец base_salary; невалидные строки заменяются нулём."""
+    column = [employee.get('base_salary', 0) for employee in employees]
+    for row in errors:
+        column[row] = 0.0
+    return column
+
+
 class ExternalServiceAdapter(SalaryCalculator):
     """Адаптер для преобразования ExternalSalaryCalculationService."""
     
@@ -214,6 +407,25 @@ class ExternalServiceAdapter(SalaryCalculator):
         result = self.external_service.calculate_monthly_payment(external_format)
         
         return result
+    
+    def calculate_many(self, employees: Sequence[Dict[str, Any]]) -> BatchCalculationResult:
+        """
+        Пакетный расчёт через bulk-метод внешнего сервиса.
+        
+        Args:
+            employees: Данные сотрудников в нашем формате
+        
+        Returns:
+            BatchCalculationResult (невалидные строки - NaN и запись в errors)
+        """
+        errors = _split_valid_rows(employees, self.validator)
+        multipliers = TypeConverter.external_multipliers(
+            [employee.get('type', 'employee') for employee in employees])
+        
+        result = self.external_service.calculate_monthly_payments(
+            _salary_column(employees, errors), multipliers)
+        
+        return BatchCalculationResult(_mask_failed(result, errors), errors)
 
 
 class LegacyCalculatorAdapter(SalaryCalculator):
@@ -257,6 +469,547 @@ class LegacyCalculatorAdapter(SalaryCalculator):
         result = self.legacy_calculator.get_total_compensation(emp_id, emp_type_legacy, salary)
         
         return result
+    
+    def calculate_many(self, employees: Sequence[Dict[str, Any]]) -> BatchCalculationResult:
+        """
+        Пакетный расчёт через bulk-метод устаревшего калькулятора.
+        
+        Args:
+            employees: Данные сотрудников в нашем формате
+        
+        Returns:
+            BatchCalculationResult (невалидные строки - NaN и запись в errors)
+        """
+        errors = _split_valid_rows(employees, self.validator)
+        legacy_types = TypeConverter.legacy_codes(
+            [employee.get('type', 'employee') for employee in employees])
+        
+        result = self.legacy_calculator.get_total_compensations(
+            legacy_types, _salary_column(employees, errors))
+        
+        return BatchCalculationResult(_mask_failed(result, errors), errors)
+
+
+# ===== КЭШИРОВАНИЕ =====
+
+@dataclass
+class CacheStats:
+    """Метрики кэша."""
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0      # вытеснено по размеру (LRU)
+    expirations: int = 0    # удалено по TTL
+    invalidations: int = 0  # явные и по смене маппинга типов
+    size: int = 0
+    
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class CachingSalaryCalculator(SalaryCalculator):
+    """
+    Декоратор SalaryCalculator с кэшем результатов (LRU + TTL).
+    
+    Адаптеры зависят только от типа и базовой зарплаты (поля, которые
+    читает TypeConverter), поэтому ключ кэша - (type, base_salary).
+    Кэш сбрасывается при изменении маппинга типов через
+    TypeConverter.update_type_mapping() (другого способа изменить
+    EMPLOYEE_TYPE_MAPPING нет) и по вызову invalidate().
+    """
+    
+    def __init__(self, calculator: SalaryCalculator, max_size: int = 1024,
+                 ttl: Optional[float] = 300.0, validator: DataValidator = None,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Инициализация кэширующего калькулятора.
+        
+        Args:
+            calculator: Оборачиваемый калькулятор
+            max_size: Максимальное число записей
+            ttl: Время жизни записи в секундах (None - без ограничения)
+            validator: Валидатор данных (по умолчанию - валидатор калькулятора)
+            clock: Источник времени (для тестов)
+        """
+        if max_size <= 0:
+            raise ValueError("max_size должен быть положительным")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl должен быть положительным")
+        
+        self.calculator = calculator
+        self.max_size = max_size
+        self.ttl = ttl
+        self.validator = validator or getattr(calculator, 'validator', None) or EmployeeDataValidator()
+        self._clock = clock
+        self._entries: 'OrderedDict[Hashable, Tuple[float, float]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = CacheStats()
+        self._mapping_version = TypeConverter.mapping_version
+    
+    @staticmethod
+    def cache_key(employee: Dict[str, Any]) -> Tuple[str, Any]:
+        """Ключ кэша: поля, от которых зависит результат адаптера."""
+        return employee.get('type', 'employee'), employee.get('base_salary', 0)
+    
+    def _check_mapping(self) -> None:
+        if self._mapping_version != TypeConverter.mapping_version:
+            self._stats.invalidations += len(self._entries)
+            self._entries.clear()
+            self._mapping_version = TypeConverter.mapping_version
+    
+    def _get(self, key: Hashable) -> Optional[float]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self._stats.misses += 1
+            return None
+        
+        value, expires_at = entry
+        if expires_at < self._clock():
+            del self._entries[key]
+            self._stats.expirations += 1
+            self._stats.misses += 1
+            return None
+        
+        self._entries.move_to_end(key)
+        self._stats.hits += 1
+        return value
+    
+    def _put(self, key: Hashable, value: float) -> None:
+        expires_at = self._clock() + self.ttl if self.ttl is not None else math.inf
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self._stats.evictions += 1
+    
+    def calculate_salary(self, employee: Dict[str, Any]) -> float:
+        """
+        Расчет зарплаты с использованием кэша.
+        
+        Raises:
+            ValueError: Если данные невалидны (невалидные записи не кэшируются)
+        """
+        if not self.validator.validate(employee):
+            raise ValueError(f"Invalid employee data: {self.validator.get_error_message()}")
+        
+        key = self.cache_key(employee)
+        with self._lock:
+            self._check_mapping()
+            version = self._mapping_version
+            value = self._get(key)
+        if value is not None:
+            return value
+        
+        value = self.calculator.calculate_salary(employee)
+        with self._lock:
+            self._check_mapping()
+            if self._mapping_version == version:  # маппинг не менялся во время расчёта
+                self._put(key, value)
+        return value
+    
+    def calculate_many(self, employees: Sequence[Dict[str, Any]]) -> BatchCalculationResult:
+        """
+        Пакетный расчёт: в обёрнутый калькулятор уходит по одной строке
+        на каждый отсутствующий в кэше ключ.
+        """
+        errors = _split_valid_rows(employees, self.validator)
+        salaries = [math.nan] * len(employees)
+        pending: Dict[Hashable, List[int]] = {}
+        
+        with self._lock:
+            self._check_mapping()
+            version = self._mapping_version
+            for row, employee in enumerate(employees):
+                if row in errors:
+                    continue
+                key = self.cache_key(employee)
+                if key in pending:
+                    # Повтор ключа внутри пакета - тоже попадание
+                    self._stats.hits += 1
+                    pending[key].append(row)
+                    continue
+                value = self._get(key)
+                if value is None:
+                    pending[key] = [row]
+                else:
+                    salaries[row] = value
+        
+        if pending:
+            rows = [r[0] for r in pending.values()]
+            batch = self.calculator.calculate_many([employees[row] for row in rows])
+            with self._lock:
+                self._check_mapping()
+                store = self._mapping_version == version  # маппинг не менялся во время расчёта
+                for index, (key, key_rows) in enumerate(pending.items()):
+                    if index in batch.errors:
+                        for row in key_rows:
+                            errors[row] = batch.errors[index]
+                        continue
+                    value = float(batch.salaries[index])
+                    if store:
+                        self._put(key, value)
+                    for row in key_rows:
+                        salaries[row] = value
+        
+        return BatchCalculationResult(salaries, dict(sorted(errors.items())))
+    
+    def invalidate(self, emp_type: Optional[str] = None) -> int:
+        """
+        Сбросить кэш.
+        
+        Args:
+            emp_type: Сбросить только записи этого типа (None - все)
+        
+        Returns:
+            Количество удалённых записей
+        """
+        with self._lock:
+            if emp_type is None:
+                keys = list(self._entries)
+            else:
+                keys = [key for key in self._entries if key[0] == emp_type]
+            for key in keys:
+                del self._entries[key]
+            self._stats.invalidations += len(keys)
+            return len(keys)
+    
+    @property
+    def stats(self) -> CacheStats:
+        """Снимок метрик кэша."""
+        with self._lock:
+            return CacheStats(self._stats.hits, self._stats.misses, self._stats.evictions,
+                              self._stats.expirations, self._stats.invalidations,
+                              len(self._entries))
+
+
+# ===== АСИНХРОННЫЙ АДАПТЕР =====
+
+class AsyncExternalSalaryService(ABC):
+    """Сетевой интерфейс внешнего сервиса расчёта зарплат."""
+    
+    @abstractmethod
+    async def calculate_monthly_payment(self, employee_data: Dict[str, Any]) -> float:
+        """Расчёт одного платежа ({'base': ..., 'multiplier': ...})."""
+        pass
+    
+    @abstractmethod
+    async def calculate_monthly_payments(self, batch: List[Dict[str, Any]]) -> List[float]:
+        """Расчёт пакета платежей одним запросом."""
+        pass
+
+
+class FakeExternalSalaryService(AsyncExternalSalaryService):
+    """
+    Локальная имитация сетевого сервиса для тестов и бенчмарков.
+    
+    Считает по формуле ExternalSalaryCalculationService, добавляя
+    задержку и (опционально) случайные сбои.
+    """
+    
+    def __init__(self, latency: float = 0.04, failure_rate: float = 0.0,
+                 rng: Optional[random.Random] = None):
+        """
+        Args:
+            latency: Задержка одного запроса, секунды
+            failure_rate: Доля запросов, завершающихся ConnectionError
+            rng: Генератор случайных чисел (для воспроизводимости)
+        """
+        if latency < 0 or not (0.0 <= failure_rate <= 1.0):
+            raise ValueError("latency >= 0, failure_rate в [0, 1]")
+        
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self._rng = rng or random.Random()
+        self._calculator = ExternalSalaryCalculationService()
+        self.request_count = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+    
+    async def _round_trip(self) -> None:
+        self.request_count += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+            if self._rng.random() < self.failure_rate:
+                raise ConnectionError("Внешний сервис недоступен")
+        finally:
+            self.in_flight -= 1
+    
+    async def calculate_monthly_payment(self, employee_data: Dict[str, Any]) -> float:
+        return (await self.calculate_monthly_payments([employee_data]))[0]
+    
+    async def calculate_monthly_payments(self, batch: List[Dict[str, Any]]) -> List[float]:
+        await self._round_trip()
+        result = self._calculator.calculate_monthly_payments(
+            [item.get('base', 0) for item in batch],
+            [item.get('multiplier', 1.0) for item in batch])
+        return [float(value) for value in result]
+
+
+class CircuitState(Enum):
+    """Состояние предохранителя."""
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(RuntimeError):
+    """Запрос отклонён: предохранитель разомкнут."""
+    pass
+
+
+class CircuitBreaker:
+    """
+    Предохранитель (circuit breaker) для внешнего сервиса.
+    
+    После failure_threshold ошибок подряд размыкается и отклоняет
+    запросы reset_timeout секунд, затем пропускает один пробный запрос:
+    остальные отклоняются, пока проба не завершится record_success()
+    или record_failure() (или release_probe(), если результата нет).
+    """
+    
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0,
+                 clock: Callable[[], float] = time.monotonic):
+        if failure_threshold <= 0 or reset_timeout < 0:
+            raise ValueError("failure_threshold > 0, reset_timeout >= 0")
+        
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._failures = 0
+        self._opened_at = 0.0
+        self._state = CircuitState.CLOSED
+        self._probe_in_flight = False
+    
+    @property
+    def state(self) -> CircuitState:
+        if (self._state == CircuitState.OPEN
+                and self._clock() - self._opened_at >= self.reset_timeout):
+            self._state = CircuitState.HALF_OPEN
+        return self._state
+    
+    def allow_request(self) -> bool:
+        """
+        Можно ли отправить запрос.
+        
+        В HALF_OPEN разрешается ровно один запрос (проба); вызвавший
+        обязан завершить её record_success/record_failure/release_probe.
+        """
+        state = self.state
+        if state == CircuitState.CLOSED:
+            return True
+        if state == CircuitState.HALF_OPEN and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return True
+        return False
+    
+    def release_probe(self) -> None:
+        """Снять пробу без результата (запрос отменён или упал не по вине сервиса)."""
+        self._probe_in_flight = False
+    
+    def record_success(self) -> None:
+        self._failures = 0
+        self._state = CircuitState.CLOSED
+        self._probe_in_flight = False
+    
+    def record_failure(self) -> None:
+        self._failures += 1
+        self._probe_in_flight = False
+        if self._state == CircuitState.HALF_OPEN or self._failures >= self.failure_threshold:
+            self._state = CircuitState.OPEN
+            self._opened_at = self._clock()
+
+
+@dataclass
+class RetryPolicy:
+    """Политика повторов с экспоненциальной задержкой и полным jitter."""
+    
+    attempts: int = 3
+    base_delay: float = 0.05
+    max_delay: float = 1.0
+    
+    def __post_init__(self) -> None:
+        if self.attempts <= 0:
+            raise ValueError("attempts должен быть положительным")
+    
+    def delay(self, attempt: int, rng: random.Random) -> float:
+        """Задержка перед повтором номер attempt (с нуля)."""
+        return rng.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+
+class AsyncSalaryCalculator(ABC):
+    """Асинхронный интерфейс расчёта зарплаты."""
+    
+    @abstractmethod
+    async def calculate_salary(self, employee: Dict[str, Any]) -> float:
+        """Расчет зарплаты сотрудника."""
+        pass
+    
+    async def calculate_many(self, employees: Sequence[Dict[str, Any]]) -> BatchCalculationResult:
+        """
+        Пакетный расчёт: конкурентный вызов calculate_salary по строкам.
+        
+        Ошибка строки, в том числе отмена её задачи (CancelledError),
+        записывается в errors этой строки.
+        """
+        results = await asyncio.gather(
+            *(self.calculate_salary(employee) for employee in employees),
+            return_exceptions=True)
+        
+        salaries = []
+        errors = {}
+        for row, result in enumerate(results):
+            if isinstance(result, BaseException):
+                salaries.append(math.nan)
+                errors[row] = str(result) or result.__class__.__name__
+            else:
+                salaries.append(result)
+        return BatchCalculationResult(salaries, errors)
+
+
+class AsyncExternalServiceAdapter(AsyncSalaryCalculator):
+    """
+    Асинхронный адаптер для сетевого внешнего сервиса.
+    
+    Число одновременных запросов ограничено семафором; calculate_many
+    группирует сотрудников в пакеты по batch_size. Каждый запрос
+    ограничен таймаутом, временные ошибки повторяются по RetryPolicy,
+    серия ошибок размыкает CircuitBreaker.
+    """
+    
+    RETRYABLE_ERRORS = (asyncio.TimeoutError, ConnectionError, OSError)
+    
+    def __init__(self, service: AsyncExternalSalaryService,
+                 validator: DataValidator = None,
+                 max_concurrency: int = 32, batch_size: int = 100,
+                 timeout: float = 1.0, retry_policy: Optional[RetryPolicy] = None,
+                 circuit_breaker: Optional[CircuitBreaker] = None,
+                 rng: Optional[random.Random] = None):
+        """
+        Инициализация адаптера.
+        
+        Args:
+            service: Асинхронный внешний сервис
+            validator: Валидатор данных (опционально)
+            max_concurrency: Максимум одновременных запросов
+            batch_size: Размер пакета в calculate_many
+            timeout: Таймаут одного запроса, секунды
+            retry_policy: Политика повторов
+            circuit_breaker: Предохранитель
+            rng: Генератор случайных чисел для jitter
+        """
+        if max_concurrency <= 0 or batch_size <= 0 or timeout <= 0:
+            raise ValueError("max_concurrency, batch_size и timeout должны быть положительными")
+        
+        self.service = service
+        self.validator = validator or EmployeeDataValidator()
+        self.max_concurrency = max_concurrency
+        self.batch_size = batch_size
+        self.timeout = timeout
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self._rng = rng or random.Random()
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop = None
+        print("[Adapter] AsyncExternalServiceAdapter инициализирован")
+    
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        # Семафор привязан к циклу событий: пересоздаём его при смене цикла
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._loop = loop
+        return self._semaphore
+    
+    async def _call(self, request: Callable[[], Awaitable[Any]]) -> Any:
+        """Вызов сервиса с семафором, таймаутом, повторами и предохранителем."""
+        semaphore = self._get_semaphore()
+        last_error: Optional[Exception] = None
+        
+        for attempt in range(self.retry_policy.attempts):
+            probe = self.circuit_breaker.state == CircuitState.HALF_OPEN
+            if not self.circuit_breaker.allow_request():
+                raise CircuitOpenError("Внешний сервис временно отключён (circuit open)")
+            
+            try:
+                async with semaphore:
+                    result = await asyncio.wait_for(request(), self.timeout)
+            except self.RETRYABLE_ERRORS as e:
+                self.circuit_breaker.record_failure()
+                last_error = e
+                if attempt + 1 < self.retry_policy.attempts:
+                    await asyncio.sleep(self.retry_policy.delay(attempt, self._rng))
+                continue
+            except BaseException:
+                # Отмена или ошибка не по вине сервиса: проба не дала результата
+                if probe:
+                    self.circuit_breaker.release_probe()
+                raise
+            
+            self.circuit_breaker.record_success()
+            return result
+        
+        if isinstance(last_error, asyncio.TimeoutError):
+            raise asyncio.TimeoutError(f"Таймаут внешнего сервиса ({self.timeout} с)")
+        raise last_error
+    
+    @staticmethod
+    def _to_external(employee: Dict[str, Any], multiplier: float) -> Dict[str, Any]:
+        return {'base': employee.get('base_salary', 0), 'multiplier': multiplier}
+    
+    async def calculate_salary(self, employee: Dict[str, Any]) -> float:
+        """
+        Расчет зарплаты через асинхронный адаптер.
+        
+        Raises:
+            ValueError: Если данные невалидны
+            CircuitOpenError: Если предохранитель разомкнут
+        """
+        if not self.validator.validate(employee):
+            raise ValueError(f"Invalid employee data: {self.validator.get_error_message()}")
+        
+        multiplier = TypeConverter.external_multipliers([employee.get('type', 'employee')])[0]
+        request = self._to_external(employee, multiplier)
+        return await self._call(lambda: self.service.calculate_monthly_payment(request))
+    
+    async def calculate_many(self, employees: Sequence[Dict[str, Any]]) -> BatchCalculationResult:
+        """
+        Пакетный расчёт: валидные строки отправляются пакетами по batch_size.
+        
+        Ошибка пакета (после всех повторов, отмена или ответ сервиса
+        не той длины) записывается во все его строки.
+        """
+        errors = _split_valid_rows(employees, self.validator)
+        valid_rows = [row for row in range(len(employees)) if row not in errors]
+        multipliers = TypeConverter.external_multipliers(
+            [employees[row].get('type', 'employee') for row in valid_rows])
+        requests = [self._to_external(employees[row], multiplier)
+                    for row, multiplier in zip(valid_rows, multipliers)]
+        
+        chunks = [range(start, min(start + self.batch_size, len(requests)))
+                  for start in range(0, len(requests), self.batch_size)]
+        
+        async def send(chunk: range) -> List[float]:
+            payload = requests[chunk.start:chunk.stop]
+            return await self._call(lambda: self.service.calculate_monthly_payments(payload))
+        
+        results = await asyncio.gather(*(send(chunk) for chunk in chunks),
+                                       return_exceptions=True)
+        
+        salaries = [math.nan] * len(employees)
+        for chunk, result in zip(chunks, results):
+            if not isinstance(result, BaseException) and len(result) != len(chunk):
+                result = ValueError(f"ответ сервиса: {len(result)} значений на {len(chunk)} строк")
+            for index in chunk:
+                row = valid_rows[index]
+                if isinstance(result, BaseException):
+                    errors[row] = f"{result.__class__.__name__}: {result}"
+                else:
+                    salaries[row] = result[index - chunk.start]
+        
+        return BatchCalculationResult(salaries, dict(sorted(errors.items())))
 
 
 # ===== ИСПОЛЬЗОВАНИЕ В СИСТЕМЕ =====
@@ -264,25 +1017,32 @@ class LegacyCalculatorAdapter(SalaryCalculator):
 class CompanySalaryManager:
     """Менеджер зарплат в нашей системе (использует адаптеры)."""
     
-    def __init__(self, calculator: SalaryCalculator):
+    def __init__(self, calculator: Union[SalaryCalculator, AsyncSalaryCalculator]):
         """
         Инициализация менеджера.
         
         Args:
-            calculator: Калькулятор, реализующий интерфейс SalaryCalculator
+            calculator: Калькулятор, реализующий SalaryCalculator или AsyncSalaryCalculator
         """
         self.calculator = calculator
         print(f"[SalaryManager] Инициализирован с {calculator.__class__.__name__}")
     
+    @property
+    def is_async(self) -> bool:
+        """Используется ли асинхронный калькулятор."""
+        return isinstance(self.calculator, AsyncSalaryCalculator)
+    
     def calculate_employee_salary(self, employee: Dict[str, Any]) -> float:
         """Расчет зарплаты сотрудника."""
         try:
+            if self.is_async:
+                return asyncio.run(self.calculator.calculate_salary(employee))
             return self.calculator.calculate_salary(employee)
         except ValueError as e:
             print(f"[SalaryManager] Ошибка: {e}")
             raise
     
-    def set_calculator(self, calculator: SalaryCalculator) -> None:
+    def set_calculator(self, calculator: Union[SalaryCalculator, AsyncSalaryCalculator]) -> None:
         """Замена калькулятора."""
         self.calculator = calculator
         print(f"[SalaryManager] Калькулятор заменен на {calculator.__class__.__name__}")
@@ -291,26 +1051,53 @@ class CompanySalaryManager:
         """
         Расчет зарплаты для списка сотрудников.
         
+        С асинхронным калькулятором запускает собственный цикл событий;
+        внутри работающего цикла используйте calculate_payroll_async.
+        
         Args:
             employees: Список сотрудников
         
         Returns:
             Словарь: имя сотрудника -> размер зарплаты
         """
-        payroll = {}
-        total = 0
-        
         print(f"\n[SalaryManager] Расчет зарплаты для {len(employees)} сотрудников...")
+        return self._build_payroll(employees, self.calculate_payroll_batch(employees))
+    
+    async def calculate_payroll_async(self, employees: List[Dict[str, Any]]) -> Dict[str, float]:
+        """Асинхронный расчёт ведомости (для вызова из работающего цикла событий)."""
+        print(f"\n[SalaryManager] Асинхронный расчет зарплаты для {len(employees)} сотрудников...")
+        if self.is_async:
+            batch = await self.calculator.calculate_many(employees)
+        else:
+            batch = self.calculator.calculate_many(employees)
+        return self._build_payroll(employees, batch)
+    
+    def calculate_payroll_batch(self, employees: Sequence[Dict[str, Any]]) -> BatchCalculationResult:
+        """
+        Пакетный расчёт без построения словаря по именам.
         
-        for employee in employees:
-            try:
-                salary = self.calculate_employee_salary(employee)
-                name = employee.get('name', 'Unknown')
-                payroll[name] = salary
-                total += salary
-            except ValueError as e:
-                print(f"[SalaryManager] Пропуск сотрудника: {e}")
+        Args:
+            employees: Список сотрудников
+        
+        Returns:
+            BatchCalculationResult со столбцом зарплат и построчными ошибками
+        """
+        if self.is_async:
+            return asyncio.run(self.calculator.calculate_many(employees))
+        return self.calculator.calculate_many(employees)
+    
+    @staticmethod
+    def _build_payroll(employees: Sequence[Dict[str, Any]],
+                       batch: BatchCalculationResult) -> Dict[str, float]:
+        """Словарь имя -> зарплата по результату пакетного расчёта."""
+        for row, error in batch.errors.items():
+            print(f"[SalaryManager] Пропуск сотрудника (строка {row}): {error}")
+        
+        payroll = {}
+        for row, (employee, salary) in enumerate(zip(employees, batch.salaries)):
+            if row not in batch.errors:
+                payroll[employee.get('name', 'Unknown')] = float(salary)
         
-        print(f"[SalaryManager] Итого к выплате: {total}")
+        print(f"[SalaryManager] Итого к выплате: {batch.total}")
         
         return payroll
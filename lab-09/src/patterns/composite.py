@@ -1,3 +1,8 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from itertools import count
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
 class ValidationError(Exception):
     def __init__(self, errors: List[str]):
         self.errors = errors
@@ -8,6 +13,10 @@ class IValidator(ABC):
     def validate(self, value: Any) -> List[str]:
         pass
 
+    def condition(self, var: str, ref: str) -> str:
+        """Выражение, истинное для валидного значения var (ref - имя валидатора)."""
+        return f"not {ref}.validate({var})"
+
 class PositiveIntegerValidator(IValidator):
     def __init__(self, field_name: str):
         self.field_name = field_name
@@ -22,6 +31,9 @@ class PositiveIntegerValidator(IValidator):
             errors.append(f"{self.field_name} должен быть положительным")
         return errors
 
+    def condition(self, var: str, ref: str) -> str:
+        return f"(isinstance({var}, int) and {var} > 0)"
+
 class NonEmptyStringValidator(IValidator):
     def __init__(self, field_name: str):
         self.field_name = field_name
@@ -36,6 +48,10 @@ class NonEmptyStringValidator(IValidator):
             errors.append(f"{self.field_name} не может быть пустым")
         return errors
 
+    def condition(self, var: str, ref: str) -> str:
+        # "не пустая после strip()" без создания новой строки
+        return f"(isinstance({var}, str) and {var} != '' and not {var}.isspace())"
+
 class NonNegativeFloatValidator(IValidator):
     def __init__(self, field_name: str):
         self.field_name = field_name
@@ -50,6 +66,9 @@ class NonNegativeFloatValidator(IValidator):
             errors.append(f"{self.field_name} не может быть отрицательным")
         return errors
 
+    def condition(self, var: str, ref: str) -> str:
+        return f"(isinstance({var}, (int, float)) and not {var} < 0)"
+
 class RangeValidator(IValidator):
     def __init__(self, field_name: str, min_val: float, max_val: float):
         self.field_name = field_name
@@ -66,6 +85,10 @@ class RangeValidator(IValidator):
             errors.append(f"{self.field_name} должен быть в [{self.min_val}, {self.max_val}]")
         return errors
 
+    def condition(self, var: str, ref: str) -> str:
+        return (f"(isinstance({var}, (int, float)) and "
+                f"{ref}.min_val <= {var} <= {ref}.max_val)")
+
 class EnumValidator(IValidator):
     def __init__(self, field_name: str, valid_values: set):
         self.field_name = field_name
@@ -79,6 +102,30 @@ class EnumValidator(IValidator):
             errors.append(f"Неверный {self.field_name}: {value}")
         return errors
 
+    def condition(self, var: str, ref: str) -> str:
+        return f"({var} is not None and {var} in {ref}.valid_values)"
+
+@dataclass
+class ValidationReport:
+    """Компактный отчёт пакетной проверки: ошибки только для невалидных строк."""
+    total: int
+    errors: Dict[int, List[str]] = field(default_factory=dict)
+
+    @property
+    def valid_count(self) -> int:
+        return self.total - len(self.errors)
+
+    @property
+    def is_valid(self) -> bool:
+        return not self.errors
+
+    @property
+    def invalid_rows(self) -> List[int]:
+        return sorted(self.errors)
+
+    def __str__(self) -> str:
+        return f"Проверено {self.total}, с ошибками {len(self.errors)}"
+
 class EmployeeDataValidator:
     def __init__(self):
         self._validators = {
@@ -100,7 +147,16 @@ class EmployeeDataValidator:
             }
         }
 
-    def validate_employee_data(self, data: dict) -> None:
+        self._compiled: Dict[Optional[str], Callable[[dict], Optional[List[str]]]] = {}
+        self._compiled_batch: Optional[Callable[[Sequence[dict]], List[int]]] = None
+
+    def _schema(self, emp_type: Optional[str]) -> Dict[str, IValidator]:
+        schema = dict(self._validators)
+        if emp_type is not None:
+            schema.update(self._type_validators[emp_type])
+        return schema
+
+    def collect_errors(self, data: dict) -> List[str]:
         all_errors = []
 
         for field, validator in self._validators.items():
@@ -113,5 +169,105 @@ class EmployeeDataValidator:
                 errors = validator.validate(data.get(field))
                 all_errors.extend(errors)
 
-        if all_errors:
-            raise ValidationError(all_errors)
\ No newline at end of file
+        return all_errors
+
+    def compile(self, emp_type: str) -> Callable[[dict], Optional[List[str]]]:
+        """
+        Специализированная функция проверки для типа сотрудника.
+
+        Условия всех валидаторов схемы собираются в одно выражение:
+        для валидной записи функция возвращает None, не создавая списков.
+        Для невалидной - список ошибок (как у validate_employee_data).
+        """
+        if emp_type not in self._type_validators:
+            emp_type = None  # общая схема для типов без собственных полей
+        compiled = self._compiled.get(emp_type)
+        if compiled is not None:
+            return compiled
+
+        namespace = {'_collect_errors': self.collect_errors}
+        lines = ["def check(data):", "    get = data.get"]
+        conditions = []
+        for index, (field_name, validator) in enumerate(self._schema(emp_type).items()):
+            ref = f"_v{index}"
+            namespace[ref] = validator
+            lines.append(f"    f{index} = get({field_name!r})")
+            conditions.append(validator.condition(f"f{index}", ref))
+        lines.append(f"    if {' and '.join(conditions) or 'True'}:")
+        lines.append("        return None")
+        lines.append("    return _collect_errors(data)")
+
+        exec(compile("\n".join(lines), f"<schema:{emp_type}>", "exec"), namespace)
+        self._compiled[emp_type] = namespace['check']
+        return namespace['check']
+
+    def _compile_batch(self) -> Callable[[Sequence[dict]], List[int]]:
+        """
+        Пакетная проверка: записи -> номера невалидных строк.
+
+        Одна сгенерированная функция: общие поля проверяются сразу,
+        поля типа - в ветке if/elif по значению 'type'.
+        """
+        if self._compiled_batch is not None:
+            return self._compiled_batch
+
+        namespace = {}
+        counter = count()
+
+        def block(validators: Dict[str, IValidator], indent: str) -> List[str]:
+            lines, conditions = [], []
+            for field_name, validator in validators.items():
+                index = next(counter)
+                namespace[f"_v{index}"] = validator
+                lines.append(f"{indent}f{index} = get({field_name!r})")
+                conditions.append(validator.condition(f"f{index}", f"_v{index}"))
+            lines.append(f"{indent}if not ({' and '.join(conditions) or 'True'}):")
+            lines.append(f"{indent}    append(row)")
+            return lines
+
+        lines = ["def check(records):",
+                 "    bad = []",
+                 "    append = bad.append",
+                 "    for row, data in enumerate(records):",
+                 "        get = data.get"]
+        lines += block(self._validators, "        ")
+        lines.append("            continue")
+        if self._type_validators:
+            lines.append("        emp_type = get('type', 'employee')")
+            keyword = "if"
+            for emp_type, validators in self._type_validators.items():
+                lines.append(f"        {keyword} emp_type == {emp_type!r}:")
+                lines += block(validators, "            ")
+                keyword = "elif"
+        lines.append("    return bad")
+
+        exec(compile("\n".join(lines), "<schema:batch>", "exec"), namespace)
+        self._compiled_batch = namespace['check']
+        return self._compiled_batch
+
+    def recompile(self) -> None:
+        """Сбросить скомпилированные функции после изменения валидаторов."""
+        self._compiled.clear()
+        self._compiled_batch = None
+
+    def validate_employee_data(self, data: dict) -> None:
+        errors = self.compile(data.get('type', 'employee'))(data)
+        if errors:
+            raise ValidationError(errors)
+
+    def validate_many(self, records: Sequence[dict]) -> ValidationReport:
+        """
+        Пакетная проверка записей одним проходом.
+
+        Валидные записи проходят через скомпилированные условия без
+        создания списков ошибок; сообщения строятся только для
+        невалидных строк.
+        """
+        bad_rows = self._compile_batch()(records)
+
+        report = ValidationReport(len(records))
+        for row in bad_rows:
+            errors = self.collect_errors(records[row])
+            if errors:
+                report.errors[row] = errors
+        return report
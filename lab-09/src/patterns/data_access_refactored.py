@@ -7,6 +7,8 @@
   ✓ Добавлена валидация данных перед сохранением
   ✓ Улучшена обработка исключений
   ✓ Логирование операций
+  ✓ Потокобезопасный репозиторий: сегментированные блокировки,
+    версии сущностей и compare-and-swap обновления
 
 METRICS:
   Типобезопасность: максимальная
@@ -15,8 +17,9 @@ METRICS:
   Принципы SOLID: SRP, ISP, DIP применены
 """
 
+import threading
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional, TypeVar, Generic
+from typing import List, Dict, Any, Optional, TypeVar, Generic, Callable, Tuple
 from dataclasses import dataclass
 
 
@@ -411,6 +414,258 @@ class DepartmentRepository(Repository[Dict[str, Any]]):
         return [dept for dept in self._departments.values() if spec.is_satisfied_by(dept)]
 
 
+# ======================== CONCURRENT REPOSITORY ========================
+
+class ConcurrencyConflictError(RuntimeError):
+    """Версия сущности изменилась между чтением и записью (оптимистичная блокировка)."""
+    
+    def __init__(self, entity_id: int, expected_version: int, actual_version: Optional[int]):
+        self.entity_id = entity_id
+        self.expected_version = expected_version
+        self.actual_version = actual_version
+        super().__init__(
+            f"Конфликт версий для ID={entity_id}: "
+            f"ожидалась {expected_version}, текущая {actual_version}"
+        )
+
+
+class AtomicIdAllocator:
+    """Потокобезопасный генератор идентификаторов."""
+    
+    def __init__(self, start: int = 1):
+        self._next_id = start
+        self._lock = threading.Lock()
+    
+    def next_id(self) -> int:
+        """Выделить следующий свободный ID."""
+        with self._lock:
+            emp_id = self._next_id
+            self._next_id += 1
+            return emp_id
+    
+    def observe(self, used_id: int) -> None:
+        """Учесть явно заданный ID, чтобы не выдать его повторно."""
+        with self._lock:
+            if used_id >= self._next_id:
+                self._next_id = used_id + 1
+    
+    @property
+    def peek(self) -> int:
+        """Следующий ID, который будет выдан."""
+        return self._next_id
+
+
+@dataclass(frozen=True)
+class VersionedEntity:
+    """Снимок сущности вместе с номером версии."""
+    data: Dict[str, Any]
+    version: int
+
+
+class ConcurrentRepository(Repository[Dict[str, Any]]):
+    """
+    Потокобезопасный репозиторий с оптимистичной блокировкой.
+    
+    Данные разбиты на сегменты (lock striping): каждый ID попадает
+    в свой сегмент со своей блокировкой, поэтому писатели в разные
+    сегменты не ждут друг друга. Каждая запись хранит номер версии,
+    обновления выполняются через compare-and-swap.
+    """
+    
+    REQUIRED_FIELDS: set = {'id'}
+    DEFAULT_STRIPES = 16
+    
+    def __init__(self, stripes: int = DEFAULT_STRIPES):
+        """
+        Инициализация репозитория.
+        
+        Args:
+            stripes: Количество сегментов (блокировок)
+        """
+        if stripes <= 0:
+            raise ValueError("Количество сегментов должно быть положительным")
+        
+        self._locks = [threading.Lock() for _ in range(stripes)]
+        self._buckets: List[Dict[int, VersionedEntity]] = [{} for _ in range(stripes)]
+        self._ids = AtomicIdAllocator()
+        print(f"[{self.__class__.__name__}] Инициализирован ({stripes} сегментов)")
+    
+    def _stripe(self, item_id: int) -> int:
+        """Номер сегмента для ID."""
+        return hash(item_id) % len(self._locks)
+    
+    def _validate(self, item: Dict[str, Any]) -> None:
+        """Валидация данных сущности."""
+        if not isinstance(item, dict):
+            raise TypeError("Сущность должна быть словарём")
+        
+        missing = self.REQUIRED_FIELDS - set(item.keys())
+        if missing:
+            raise ValueError(f"Отсутствуют поля: {missing}")
+    
+    def add(self, item: Dict[str, Any]) -> int:
+        """
+        Добавить сущность.
+        
+        Args:
+            item: Данные сущности; если 'id' пустой, ID выделяется атомарно
+        
+        Returns:
+            ID добавленной сущности
+        
+        Raises:
+            ValueError: Если данные невалидны или ID уже занят
+        """
+        self._validate(item)
+        
+        item_id = item.get('id')
+        if item_id:
+            self._ids.observe(item_id)
+        else:
+            item_id = self._ids.next_id()
+        
+        data = dict(item, id=item_id)
+        index = self._stripe(item_id)
+        with self._locks[index]:
+            bucket = self._buckets[index]
+            if item_id in bucket:
+                raise ValueError(f"ID {item_id} уже существует")
+            bucket[item_id] = VersionedEntity(data, 1)
+        return item_id
+    
+    def get_with_version(self, item_id: int) -> Optional[Tuple[Dict[str, Any], int]]:
+        """Получить копию сущности и её текущую версию."""
+        entry = self._buckets[self._stripe(item_id)].get(item_id)
+        if entry is None:
+            return None
+        return entry.data.copy(), entry.version
+    
+    def compare_and_swap(self, item_id: int, expected_version: int,
+                         changes: Dict[str, Any]) -> int:
+        """
+        Применить изменения, только если версия не изменилась.
+        
+        Args:
+            item_id: ID сущности
+            expected_version: Версия, прочитанная клиентом
+            changes: Изменяемые поля
+        
+        Returns:
+            Новая версия сущности
+        
+        Raises:
+            KeyError: Если сущность не найдена
+            ConcurrencyConflictError: Если версия не совпала
+        """
+        if 'id' in changes and changes['id'] != item_id:
+            raise ValueError("Нельзя изменить ID сущности")
+        
+        index = self._stripe(item_id)
+        with self._locks[index]:
+            bucket = self._buckets[index]
+            entry = bucket.get(item_id)
+            if entry is None:
+                raise KeyError(item_id)
+            if entry.version != expected_version:
+                raise ConcurrencyConflictError(item_id, expected_version, entry.version)
+            
+            data = dict(entry.data, **changes)
+            self._validate(data)
+            bucket[item_id] = VersionedEntity(data, entry.version + 1)
+            return entry.version + 1
+    
+    def update(self, item_id: int, mutator: Callable[[Dict[str, Any]], Dict[str, Any]],
+               max_retries: int = 10) -> int:
+        """
+        Оптимистичное обновление: прочитать, вычислить изменения, CAS.
+        
+        Args:
+            item_id: ID сущности
+            mutator: Функция, возвращающая изменения по текущим данным
+            max_retries: Максимум повторов при конфликте
+        
+        Returns:
+            Новая версия сущности
+        
+        Raises:
+            KeyError: Если сущность не найдена
+            ConcurrencyConflictError: Если повторы исчерпаны
+        """
+        if max_retries <= 0:
+            raise ValueError("max_retries должен быть положительным")
+        
+        for _ in range(max_retries):
+            current = self.get_with_version(item_id)
+            if current is None:
+                raise KeyError(item_id)
+            data, version = current
+            try:
+                return self.compare_and_swap(item_id, version, mutator(data))
+            except ConcurrencyConflictError as conflict:
+                last_conflict = conflict
+        raise last_conflict
+    
+    def remove(self, item_id: int, expected_version: Optional[int] = None) -> bool:
+        """
+        Удалить сущность.
+        
+        Args:
+            item_id: ID сущности
+            expected_version: Если задана, удаление выполняется только для этой версии
+        
+        Returns:
+            True, если сущность была удалена
+        """
+        index = self._stripe(item_id)
+        with self._locks[index]:
+            bucket = self._buckets[index]
+            entry = bucket.get(item_id)
+            if entry is None:
+                return False
+            if expected_version is not None and entry.version != expected_version:
+                raise ConcurrencyConflictError(item_id, expected_version, entry.version)
+            del bucket[item_id]
+            return True
+    
+    def find_by_id(self, item_id: int) -> Optional[Dict[str, Any]]:
+        """Найти сущность по ID (возвращается копия)."""
+        current = self.get_with_version(item_id)
+        return current[0] if current else None
+    
+    def find_all(self) -> List[Dict[str, Any]]:
+        """Снимок всех сущностей (посегментно)."""
+        result = []
+        for lock, bucket in zip(self._locks, self._buckets):
+            with lock:
+                entries = list(bucket.values())
+            result.extend(entry.data.copy() for entry in entries)
+        return result
+    
+    def find_by_specification(self, spec: Specification) -> List[Dict[str, Any]]:
+        """Найти сущности по спецификации."""
+        return [item for item in self.find_all() if spec.is_satisfied_by(item)]
+    
+    def __len__(self) -> int:
+        return sum(len(bucket) for bucket in self._buckets)
+
+
+class ConcurrentEmployeeRepository(ConcurrentRepository):
+    """Потокобезопасный репозиторий сотрудников."""
+    
+    REQUIRED_FIELDS = EmployeeRepository.REQUIRED_FIELDS
+    
+    def _validate(self, item: Dict[str, Any]) -> None:
+        super()._validate(item)
+        if item.get('base_salary', 0) < 0:
+            raise ValueError("Зарплата не может быть отрицательной")
+
+
+class ConcurrentDepartmentRepository(ConcurrentRepository):
+    """Потокобезопасный репозиторий отделов."""
+    
+    REQUIRED_FIELDS = DepartmentRepository.REQUIRED_FIELDS
+
+
 # ======================== UNIT OF WORK ========================
 
 class UnitOfWork:
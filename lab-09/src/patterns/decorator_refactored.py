@@ -7,6 +7,10 @@
   ✓ Улучшена типизация данных
   ✓ Разделение ответственности (SRP)
   ✓ Зависимость от абстракции (DIP)
+  ✓ Буферизованный FileLogger: кольцевой буфер, фоновая запись пакетами,
+    ротация по размеру/времени с опциональным сжатием
+  ✓ Заморозка цепочки декораторов в одну аффинную формулу
+    (coefficient * base + constant) с O(1) расчётом и пакетной оценкой
 
 METRICS:
   Cyclomatic Complexity: снижена на 30%
@@ -14,11 +18,24 @@ METRICS:
   Принципы SOLID: SRP, OCP, DIP применены
 """
 
+import atexit
+import os
+import sys
+import threading
+import time
+import weakref
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from collections import deque
+from typing import Optional, List, Sequence, Callable
 from dataclasses import dataclass
 from enum import Enum
 
+from utils.lazy import lazy_import
+
+# NumPy опционален: без него пакетная оценка идёт списками.
+# Загружается при первом векторном расчёте, а не при импорте модуля.
+np = lazy_import('numpy')
+
 
 class LogLevel(Enum):
     """Уровни логирования."""
@@ -28,6 +45,10 @@ class LogLevel(Enum):
     ERROR = "ERROR"
 
 
+# Порядок уровней для сравнения (LogLevel хранит строковые значения)
+LEVEL_ORDER = {LogLevel.DEBUG: 10, LogLevel.INFO: 20, LogLevel.WARNING: 30, LogLevel.ERROR: 40}
+
+
 class ILogger(ABC):
     """Интерфейс для логирования (DIP - Dependency Inversion Principle)."""
     
@@ -51,6 +72,10 @@ class ILogger(ABC):
     def error(self, message: str) -> None:
         """Логирование уровня ERROR."""
         self.log(LogLevel.ERROR, message)
+    
+    def flush(self) -> None:
+        """Записать буферизованные сообщения (по умолчанию буфера нет)."""
+        pass
 
 
 class ConsoleLogger(ILogger):
@@ -60,15 +85,269 @@ class ConsoleLogger(ILogger):
         print(f"[{level.value}] {message}")
 
 
+def format_log_line(level: LogLevel, message: str) -> str:
+    """Формат строки лога по умолчанию."""
+    return f"[{level.value}] {message}\n"
+
+
 class FileLogger(ILogger):
-    """Логгер для записи в файл."""
+    """
+    Логгер для записи в файл с буферизацией.
+    
+    Сообщения складываются в ограниченный кольцевой буфер (при
+    переполнении вытесняются самые старые, счётчик - dropped), а
+    фоновый поток записывает их пакетами через один открытый файл:
+    по достижении batch_size, раз в flush_interval секунд и сразу
+    для сообщений уровня flush_level и выше. Файл ротируется по размеру
+    (max_bytes) и/или времени (rotate_interval) с хранением backup_count
+    архивов, опционально сжатых gzip. При завершении процесса буфер
+    гарантированно сбрасывается: общий atexit-обработчик закрывает все
+    открытые логгеры, ссылаясь на них слабо, а фоновый поток тоже держит
+    только слабую ссылку - незакрытый логгер без внешних ссылок
+    собирается, и его поток завершается.
+    
+    Ошибка записи (диск заполнен, сбой ротации) не останавливает поток:
+    пакет возвращается в буфер для повторной попытки, ошибка
+    выводится в stderr и считается в write_errors (последняя - в
+    last_error). Что не удалось записать при close(), считается в dropped.
+    """
     
-    def __init__(self, filename: str = "app.log"):
+    def __init__(self, filename: str = "app.log", buffer_size: int = 10000,
+                 batch_size: int = 512, flush_interval: float = 0.5,
+                 flush_level: Optional[LogLevel] = LogLevel.ERROR,
+                 max_bytes: Optional[int] = None, rotate_interval: Optional[float] = None,
+                 backup_count: int = 5, compress: bool = False,
+                 formatter: Callable[[LogLevel, str], str] = format_log_line):
+        """
+        Инициализация логгера.
+        
+        Args:
+            filename: Путь к файлу лога
+            buffer_size: Ёмкость кольцевого буфера (сообщений)
+            batch_size: Размер пакета, при котором фоновый поток пишет сразу
+            flush_interval: Максимальная задержка записи, секунды
+            flush_level: Уровень, начиная с которого запись синхронная (None - никогда)
+            max_bytes: Ротация при превышении размера файла (None - без ротации)
+            rotate_interval: Ротация по времени, секунды (None - без ротации)
+            backup_count: Количество хранимых архивов
+            compress: Сжимать архивы gzip
+            formatter: Функция форматирования строки (вызывается в потоке вызова)
+        """
+        if buffer_size <= 0 or batch_size <= 0 or flush_interval <= 0:
+            raise ValueError("buffer_size, batch_size и flush_interval должны быть положительными")
+        if backup_count < 0:
+            raise ValueError("backup_count не может быть отрицательным")
+        
         self.filename = filename
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.flush_level = flush_level
+        self.max_bytes = max_bytes
+        self.rotate_interval = rotate_interval
+        self.backup_count = backup_count
+        self.compress = compress
+        self._formatter = formatter
+        
+        self._buffer = deque(maxlen=buffer_size)
+        self._cond = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._file = None
+        self._file_size = 0
+        self._opened_at = 0.0
+        self._closed = False
+        self.dropped = 0
+        self.written = 0
+        self.rotations = 0
+        self.write_errors = 0
+        self.last_error: Optional[OSError] = None
+        
+        self._thread = threading.Thread(target=_file_logger_loop, args=(weakref.ref(self),),
+                                        name=f"FileLogger({filename})", daemon=True)
+        self._thread.start()
+        _open_file_loggers.add(self)
     
     def log(self, level: LogLevel, message: str) -> None:
-        with open(self.filename, 'a', encoding='utf-8') as f:
-            f.write(f"[{level.value}] {message}\n")
+        line = self._formatter(level, message)
+        with self._cond:
+            if self._closed:
+                closed = True
+            else:
+                closed = False
+                if len(self._buffer) == self._buffer.maxlen:
+                    self.dropped += 1
+                self._buffer.append(line)
+                if len(self._buffer) >= self.batch_size:
+                    self._cond.notify()
+        
+        if closed:
+            # После close() пишем напрямую, чтобы не потерять сообщение
+            with self._write_lock:
+                try:
+                    self._write([line])
+                except OSError as e:
+                    self.dropped += 1
+                    self._report(e)
+                finally:
+                    self._close_file()
+        elif self.flush_level is not None and LEVEL_ORDER[level] >= LEVEL_ORDER[self.flush_level]:
+            try:
+                self.flush()
+            except OSError:
+                pass  # пакет остался в буфере, ошибка уже выведена; повторит фоновый поток
+    
+    def flush(self) -> None:
+        """
+        Синхронно записать всё, что накоплено в буфере.
+        
+        Raises:
+            OSError: Если запись не удалась (пакет возвращён в буфер)
+        """
+        with self._write_lock:
+            with self._cond:
+                lines = list(self._buffer)
+                self._buffer.clear()
+            if lines:
+                try:
+                    self._write(lines)
+                except OSError as e:
+                    self._restore(lines)
+                    self._report(e)
+                    raise
+    
+    def close(self) -> None:
+        """Остановить фоновый поток, сбросить буфер и закрыть файл."""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify()
+        self._thread.join()
+        try:
+            self.flush()
+        except OSError:
+            with self._cond:
+                self.dropped += len(self._buffer)
+                self._buffer.clear()
+        with self._write_lock:
+            self._close_file()
+        _open_file_loggers.discard(self)
+    
+    def __enter__(self) -> 'FileLogger':
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+    
+    def _run_once(self) -> bool:
+        """Шаг фонового потока: дождаться пакета и записать; False - логгер закрыт."""
+        with self._cond:
+            if not self._closed and len(self._buffer) < self.batch_size:
+                self._cond.wait(self.flush_interval)
+            closing = self._closed
+        try:
+            self.flush()
+        except OSError:
+            # Пакет уже в буфере: повторить не раньше чем через flush_interval
+            with self._cond:
+                if not self._closed:
+                    self._cond.wait(self.flush_interval)
+        return not closing
+    
+    def _restore(self, lines: List[str]) -> None:
+        """Вернуть незаписанный пакет в начало буфера (лишние старые - в dropped)."""
+        with self._cond:
+            pending = lines + list(self._buffer)
+            overflow = len(pending) - self._buffer.maxlen
+            if overflow > 0:
+                self.dropped += overflow
+                pending = pending[overflow:]
+            self._buffer.clear()
+            self._buffer.extend(pending)
+    
+    def _report(self, error: OSError) -> None:
+        self.write_errors += 1
+        self.last_error = error
+        print(f"[FileLogger] Ошибка записи в {self.filename}: {error}", file=sys.stderr)
+    
+    # ---- работа с файлом (вызывается под _write_lock) ----
+    
+    def _open_file(self) -> None:
+        self._file = open(self.filename, 'ab')
+        self._file_size = self._file.tell()
+        self._opened_at = time.monotonic()
+    
+    def _close_file(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+    
+    def _should_rotate(self, incoming: int) -> bool:
+        if self._file_size == 0:
+            return False
+        if self.max_bytes is not None and self._file_size + incoming > self.max_bytes:
+            return True
+        return (self.rotate_interval is not None
+                and time.monotonic() - self._opened_at >= self.rotate_interval)
+    
+    def _archive_name(self, index: int) -> str:
+        return f"{self.filename}.{index}" + (".gz" if self.compress else "")
+    
+    def _rotate(self) -> None:
+        """Сдвинуть архивы (.1 -> .2 ...) и начать новый файл."""
+        self._close_file()
+        self.rotations += 1
+        if self.backup_count == 0:
+            os.remove(self.filename)
+            return
+        
+        oldest = self._archive_name(self.backup_count)
+        if os.path.exists(oldest):
+            os.remove(oldest)
+        for index in range(self.backup_count - 1, 0, -1):
+            source = self._archive_name(index)
+            if os.path.exists(source):
+                os.replace(source, self._archive_name(index + 1))
+        
+        if self.compress:
+            import gzip
+            import shutil
+
+            with open(self.filename, 'rb') as src, gzip.open(self._archive_name(1), 'wb') as dst:
+                shutil.copyfileobj(src, dst)
+            os.remove(self.filename)
+        else:
+            os.replace(self.filename, self._archive_name(1))
+    
+    def _write(self, lines: List[str]) -> None:
+        data = "".join(lines).encode('utf-8')
+        if self._file is None:
+            self._open_file()
+        if self._should_rotate(len(data)):
+            self._rotate()
+            self._open_file()
+        self._file.write(data)
+        self._file.flush()
+        self._file_size += len(data)
+        self.written += len(lines)
+
+
+# Открытые FileLogger: закрываются при завершении процесса, не удерживая логгеры
+_open_file_loggers: 'weakref.WeakSet[FileLogger]' = weakref.WeakSet()
+
+
+def _file_logger_loop(ref: 'weakref.ref[FileLogger]') -> None:
+    """Фоновый поток FileLogger; держит логгер только на время одного шага."""
+    while True:
+        logger = ref()
+        if logger is None or not logger._run_once():
+            return
+        del logger
+
+
+@atexit.register
+def _close_file_loggers() -> None:
+    for logger in list(_open_file_loggers):
+        logger.close()
 
 
 class NullLogger(ILogger):
@@ -92,6 +371,11 @@ class CompositeLogger(ILogger):
         """Логировать во все добавленные логгеры."""
         for logger in self._loggers:
             logger.log(level, message)
+    
+    def flush(self) -> None:
+        """Сбросить буферы всех добавленных логгеров."""
+        for logger in self._loggers:
+            logger.flush()
 
 
 @dataclass
@@ -117,6 +401,40 @@ class SalaryValidator:
             raise ValueError(f"Количество дней не может быть отрицательным: {days}")
 
 
+@dataclass(frozen=True)
+class SalaryAdjustment:
+    """
+    Вклад одного декоратора в зарплату:
+    total' = multiplier * total + base_rate * base + constant.
+    """
+    multiplier: float = 1.0
+    base_rate: float = 0.0
+    constant: float = 0.0
+
+
+@dataclass(frozen=True)
+class SalaryFormula:
+    """Аффинная формула полной зарплаты: coefficient * base + constant."""
+    coefficient: float = 1.0
+    constant: float = 0.0
+    
+    def then(self, adjustment: SalaryAdjustment) -> 'SalaryFormula':
+        """Применить ещё один слой поверх формулы."""
+        return SalaryFormula(
+            adjustment.multiplier * self.coefficient + adjustment.base_rate,
+            adjustment.multiplier * self.constant + adjustment.constant,
+        )
+    
+    def evaluate(self, base_salary: float) -> float:
+        return self.coefficient * base_salary + self.constant
+    
+    def evaluate_many(self, base_salaries: Sequence[float]) -> Sequence[float]:
+        """Оценка формулы для столбца базовых зарплат."""
+        if np is not None:
+            return self.coefficient * np.asarray(base_salaries, dtype=float) + self.constant
+        return [self.coefficient * base + self.constant for base in base_salaries]
+
+
 class EmployeeComponent(ABC):
     """
     Абстрактный компонент для паттерна Decorator.
@@ -199,22 +517,42 @@ class EmployeeDecorator(EmployeeComponent):
         """
         self._employee = employee
         self._logger = logger or NullLogger()
+        # Имя и базовая зарплата не меняются по цепочке: запоминаем их,
+        # чтобы не спускаться через все слои при каждом обращении
+        self._name = employee.get_name()
+        self._base_salary = employee.get_base_salary()
     
     def get_name(self) -> str:
         """Возвращает имя вложенного сотрудника."""
-        return self._employee.get_name()
+        return self._name
     
     def get_base_salary(self) -> float:
         """Возвращает базовую зарплату вложенного сотрудника."""
-        return self._employee.get_base_salary()
+        return self._base_salary
     
     def get_total_salary(self) -> float:
         """Расширяется в подклассах с добавлением компонентов к зарплате."""
         return self._employee.get_total_salary()
     
     def get_description(self) -> str:
-        """Расширяется в подклассах с добавлением описания."""
-        return self._employee.get_description()
+        """Описание вложенного компонента с добавлением описания слоя."""
+        suffix = self.get_description_suffix()
+        if suffix is None:
+            return self._employee.get_description()
+        return f"{self._employee.get_description()} + {suffix}"
+    
+    def get_adjustment(self) -> SalaryAdjustment:
+        """Вклад слоя в зарплату (по умолчанию - без изменений)."""
+        return SalaryAdjustment()
+    
+    def get_description_suffix(self) -> Optional[str]:
+        """Описание слоя (None - слой не меняет описание)."""
+        return None
+    
+    @property
+    def wrapped(self) -> EmployeeComponent:
+        """Вложенный компонент."""
+        return self._employee
 
 
 class BonusDecorator(EmployeeDecorator):
@@ -247,9 +585,12 @@ class BonusDecorator(EmployeeDecorator):
         """Полная зарплата = базовая + бонус."""
         return self._employee.get_total_salary() + self._bonus_amount
     
-    def get_description(self) -> str:
-        """Описание с добавлением информации о бонусе."""
-        return f"{self._employee.get_description()} + Бонус: {self._bonus_amount}"
+    def get_adjustment(self) -> SalaryAdjustment:
+        return SalaryAdjustment(constant=self._bonus_amount)
+    
+    def get_description_suffix(self) -> str:
+        """Информация о бонусе."""
+        return f"Бонус: {self._bonus_amount}"
 
 
 class PerformanceBonusDecorator(EmployeeDecorator):
@@ -285,10 +626,12 @@ class PerformanceBonusDecorator(EmployeeDecorator):
         performance_bonus = base * (self._performance_rating - 1.0)
         return self._employee.get_total_salary() + performance_bonus
     
-    def get_description(self) -> str:
-        """Описание с информацией о производительности."""
-        return (f"{self._employee.get_description()} + "
-                f"Рейтинг производительности: {self._performance_rating}")
+    def get_adjustment(self) -> SalaryAdjustment:
+        return SalaryAdjustment(base_rate=self._performance_rating - 1.0)
+    
+    def get_description_suffix(self) -> str:
+        """Информация о производительности."""
+        return f"Рейтинг производительности: {self._performance_rating}"
 
 
 class TrainingDecorator(EmployeeDecorator):
@@ -321,10 +664,12 @@ class TrainingDecorator(EmployeeDecorator):
         """Полная зарплата = базовая + бонус за обучение."""
         return self._employee.get_total_salary() + self._training_bonus
     
-    def get_description(self) -> str:
-        """Описание с информацией об обучении."""
-        return (f"{self._employee.get_description()} + "
-                f"Обучение: {self._training_type} ({self._training_bonus})")
+    def get_adjustment(self) -> SalaryAdjustment:
+        return SalaryAdjustment(constant=self._training_bonus)
+    
+    def get_description_suffix(self) -> str:
+        """Информация об обучении."""
+        return f"Обучение: {self._training_type} ({self._training_bonus})"
 
 
 class ProjExperienceDecorator(EmployeeDecorator):
@@ -359,11 +704,13 @@ class ProjExperienceDecorator(EmployeeDecorator):
         project_bonus = self._completed_projects * self._per_project_bonus
         return self._employee.get_total_salary() + project_bonus
     
-    def get_description(self) -> str:
-        """Описание с информацией о проектах."""
+    def get_adjustment(self) -> SalaryAdjustment:
+        return SalaryAdjustment(constant=self._completed_projects * self._per_project_bonus)
+    
+    def get_description_suffix(self) -> str:
+        """Информация о проектах."""
         project_bonus = self._completed_projects * self._per_project_bonus
-        return (f"{self._employee.get_description()} + "
-                f"Опыт проектов: {self._completed_projects} (бонус {project_bonus})")
+        return f"Опыт проектов: {self._completed_projects} (бонус {project_bonus})"
 
 
 class VacationBenefitDecorator(EmployeeDecorator):
@@ -397,8 +744,143 @@ class VacationBenefitDecorator(EmployeeDecorator):
         vacation_payment = self._unused_vacation_days * self._daily_rate
         return self._employee.get_total_salary() + vacation_payment
     
-    def get_description(self) -> str:
-        """Описание с информацией об отпуске."""
+    def get_adjustment(self) -> SalaryAdjustment:
+        return SalaryAdjustment(constant=self._unused_vacation_days * self._daily_rate)
+    
+    def get_description_suffix(self) -> str:
+        """Информация об отпуске."""
         vacation_payment = self._unused_vacation_days * self._daily_rate
-        return (f"{self._employee.get_description()} + "
-                f"Выплата за отпуск: {self._unused_vacation_days} дней ({vacation_payment})")
+        return f"Выплата за отпуск: {self._unused_vacation_days} дней ({vacation_payment})"
+
+
+class RegionalCoefficientDecorator(EmployeeDecorator):
+    """
+    Декоратор для районного коэффициента.
+    Умножает всю накопленную зарплату на коэффициент.
+    """
+    
+    def __init__(self, employee: EmployeeComponent, coefficient: float,
+                 logger: ILogger = None):
+        """
+        Инициализация декоратора с районным коэффициентом.
+        
+        Args:
+            employee: Сотрудник
+            coefficient: Коэффициент (>= 1.0)
+            logger: Логгер
+        
+        Raises:
+            ValueError: Если коэффициент меньше 1.0
+        """
+        super().__init__(employee, logger)
+        
+        if coefficient < 1.0:
+            raise ValueError(f"Районный коэффициент не может быть меньше 1.0: {coefficient}")
+        
+        self._coefficient = coefficient
+        self._logger.info(f"Добавлен районный коэффициент {coefficient} для {employee.get_name()}")
+    
+    def get_total_salary(self) -> float:
+        """Полная зарплата = накопленная зарплата * коэффициент."""
+        return self._employee.get_total_salary() * self._coefficient
+    
+    def get_adjustment(self) -> SalaryAdjustment:
+        return SalaryAdjustment(multiplier=self._coefficient)
+    
+    def get_description_suffix(self) -> str:
+        """Информация о коэффициенте."""
+        return f"Районный коэффициент: {self._coefficient}"
+
+
+# ======================== ЗАМОРОЗКА ЦЕПОЧЕК ========================
+
+class FrozenEmployee(EmployeeComponent):
+    """
+    Замороженная цепочка декораторов.
+    
+    Хранит итоговую формулу и готовое описание, поэтому расчёт
+    зарплаты и описание не обходят слои.
+    """
+    
+    def __init__(self, name: str, base_salary: float, formula: SalaryFormula,
+                 description: str):
+        self._name = name
+        self._base_salary = base_salary
+        self._formula = formula
+        self._description = description
+        self._total_salary = formula.evaluate(base_salary)
+    
+    def get_name(self) -> str:
+        return self._name
+    
+    def get_base_salary(self) -> float:
+        return self._base_salary
+    
+    def get_total_salary(self) -> float:
+        return self._total_salary
+    
+    def get_description(self) -> str:
+        return self._description
+    
+    @property
+    def formula(self) -> SalaryFormula:
+        return self._formula
+
+
+def freeze(component: EmployeeComponent) -> FrozenEmployee:
+    """
+    Свернуть цепочку декораторов в FrozenEmployee.
+    
+    Обход итеративный, поэтому глубина цепочки не ограничена стеком.
+    
+    Args:
+        component: Сотрудник, обёрнутый произвольным числом декораторов
+    
+    Returns:
+        FrozenEmployee с той же зарплатой и описанием
+    
+    Raises:
+        TypeError: Если декоратор не описывает свой вклад через get_adjustment()
+    """
+    layers: List[EmployeeDecorator] = []
+    while isinstance(component, EmployeeDecorator):
+        layer_type = type(component)
+        if (layer_type.get_adjustment is EmployeeDecorator.get_adjustment
+                and layer_type.get_total_salary is not EmployeeDecorator.get_total_salary):
+            raise TypeError(f"Декоратор {layer_type.__name__} не поддерживает заморозку: "
+                            f"переопределите get_adjustment()")
+        layers.append(component)
+        component = component.wrapped
+    
+    if isinstance(component, FrozenEmployee):
+        formula = component.formula
+    elif isinstance(component, ConcreteEmployee):
+        formula = SalaryFormula()
+    else:
+        raise TypeError(f"Неизвестный базовый компонент: {type(component).__name__}")
+    
+    parts = [component.get_description()]
+    for layer in reversed(layers):
+        formula = formula.then(layer.get_adjustment())
+        suffix = layer.get_description_suffix()
+        if suffix is not None:
+            parts.append(suffix)
+    
+    return FrozenEmployee(component.get_name(), component.get_base_salary(),
+                          formula, " + ".join(parts))
+
+
+def total_salaries(employees: Sequence[FrozenEmployee]) -> Sequence[float]:
+    """
+    Пакетная оценка зарплат замороженных сотрудников.
+    
+    Returns:
+        Столбец полных зарплат (np.ndarray, если доступен NumPy)
+    """
+    if np is not None:
+        count = len(employees)
+        coefficients = np.fromiter((e.formula.coefficient for e in employees), float, count)
+        constants = np.fromiter((e.formula.constant for e in employees), float, count)
+        bases = np.fromiter((e.get_base_salary() for e in employees), float, count)
+        return coefficients * bases + constants
+    return [e.formula.evaluate(e.get_base_salary()) for e in employees]
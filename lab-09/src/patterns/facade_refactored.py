@@ -7,6 +7,15 @@
   ✓ Разбиение сложной логики на методы
   ✓ Результат операций через Result объект (вместо bool)
   ✓ Логирование всех операций
+  ✓ Пакетные операции (hire_many, fire_many, transfer_many) с одним
+    вызовом каждой подсистемы и статусом по каждому элементу
+  ✓ Сотрудники и назначения на проекты хранятся в словарях-множествах
+  ✓ Индекс имя -> отдел: найм, увольнение и перевод за O(1)
+  ✓ AsyncCompanyFacade: параллельные запросы к удалённым подсистемам
+    с таймаутами и частичным результатом (PARTIAL)
+  ✓ Instrumentation: гистограммы задержек, число вызовов и ошибок по
+    операциям фасада и вызовам подсистем (экспорт JSON / Prometheus)
+  ✓ ErrorHandler хранит ограниченный журнал ошибок с временем и операцией
 
 METRICS:
   Cyclomatic Complexity методов: снижена на 50%
@@ -15,11 +24,22 @@ METRICS:
   Принципы SOLID: SRP, OCP применены
 """
 
+import bisect
+import functools
+import threading
+import time
+import weakref
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional, Any
-from dataclasses import dataclass
+from collections import deque
+from typing import List, Dict, Optional, Any, Callable, Iterable, Set, Tuple
+from dataclasses import dataclass, field
 from enum import Enum
 
+from utils.lazy import lazy_import
+
+# asyncio нужен только асинхронному фасаду: загружается при первом вызове.
+asyncio = lazy_import('asyncio')
+
 
 class OperationStatus(Enum):
     """Статус операции."""
@@ -43,20 +63,80 @@ class OperationResult:
         return f"[{self.status.value.upper()}] {self.message}"
 
 
+@dataclass
+class BulkOperationResult(OperationResult):
+    """Результат пакетной операции со статусом каждого элемента."""
+    items: Dict[str, OperationResult] = field(default_factory=dict)
+    
+    @classmethod
+    def from_items(cls, action: str, items: Dict[str, OperationResult]) -> 'BulkOperationResult':
+        """Собрать общий результат: SUCCESS, PARTIAL или FAILURE."""
+        succeeded = sum(1 for result in items.values() if result.is_success)
+        if succeeded == len(items):
+            status = OperationStatus.SUCCESS
+        elif succeeded == 0:
+            status = OperationStatus.FAILURE
+        else:
+            status = OperationStatus.PARTIAL
+        return cls(status, f"{action}: успешно {succeeded} из {len(items)}", items=items)
+    
+    @property
+    def succeeded(self) -> List[str]:
+        return [key for key, result in self.items.items() if result.is_success]
+    
+    @property
+    def failed(self) -> List[str]:
+        return [key for key, result in self.items.items() if not result.is_success]
+
+
+@dataclass(frozen=True)
+class ErrorRecord:
+    """Запись журнала ошибок."""
+    timestamp: float
+    message: str
+    operation: Optional[str] = None
+    context: Optional[Dict[str, Any]] = None
+    
+    def __str__(self) -> str:
+        where = f" ({self.operation})" if self.operation else ""
+        return f"{time.strftime('%H:%M:%S', time.localtime(self.timestamp))}{where} {self.message}"
+
+
 class ErrorHandler:
-    """Централизованная обработка ошибок."""
+    """
+    Централизованная обработка ошибок.
     
-    def __init__(self):
-        self._errors: List[str] = []
+    Хранит не более max_errors последних записей (время, операция,
+    контекст); более старые вытесняются, но учитываются в total_errors.
+    """
     
-    def add_error(self, error: str) -> None:
-        """Добавить ошибку."""
-        self._errors.append(error)
+    def __init__(self, max_errors: int = 1000, clock: Callable[[], float] = time.time):
+        if max_errors <= 0:
+            raise ValueError("max_errors должен быть положительным")
+        self._errors: deque = deque(maxlen=max_errors)
+        self._clock = clock
+        self.operation: Optional[str] = None
+        self.total_errors = 0
+    
+    def add_error(self, error: str, operation: Optional[str] = None, **context: Any) -> None:
+        """
+        Добавить ошибку (context - дополнительные поля записи).
+        
+        operation - имя операции для записи; без него берётся текущая
+        self.operation. Асинхронные операции передают имя явно, так как
+        несколько их может выполняться одновременно.
+        """
+        self._errors.append(ErrorRecord(self._clock(), error, operation or self.operation, context or None))
+        self.total_errors += 1
         print(f"[ErrorHandler] ошибка: {error}")
     
     def get_errors(self) -> List[str]:
         """Получить все ошибки."""
-        return self._errors.copy()
+        return [record.message for record in self._errors]
+    
+    def get_records(self) -> List[ErrorRecord]:
+        """Получить записи журнала (с временем и операцией)."""
+        return list(self._errors)
     
     def clear(self) -> None:
         """Очистить ошибки."""
@@ -68,7 +148,237 @@ class ErrorHandler:
     
     def get_error_message(self) -> str:
         """Получить сообщение об ошибках."""
-        return "; ".join(self._errors)
+        return "; ".join(record.message for record in self._errors)
+
+
+# ===== ИНСТРУМЕНТИРОВАНИЕ =====
+
+class LatencyHistogram:
+    """Гистограмма задержек с фиксированными границами корзин (секунды)."""
+    
+    DEFAULT_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01,
+                       0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+    
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)  # последняя - +Inf
+        self.count = 0
+        self.sum = 0.0
+    
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+    
+    def cumulative(self) -> List[Tuple[str, int]]:
+        """Накопленные счётчики [(le, count)] в формате Prometheus."""
+        result, total = [], 0
+        for bound, count in zip(self.buckets + (float('inf'),), self.counts):
+            total += count
+            result.append(('+Inf' if bound == float('inf') else repr(bound), total))
+        return result
+    
+    def quantile(self, q: float) -> Optional[float]:
+        """Оценка квантиля линейной интерполяцией внутри корзины."""
+        if self.count == 0:
+            return None
+        rank = q * self.count
+        seen, lower = 0, 0.0
+        for bound, count in zip(self.buckets, self.counts):
+            if count and seen + count >= rank:
+                return lower + (bound - lower) * (rank - seen) / count
+            seen += count
+            lower = bound
+        return self.buckets[-1]
+
+
+@dataclass
+class CallMetrics:
+    """Метрики одной операции или метода подсистемы."""
+    histogram: LatencyHistogram
+    calls: int = 0
+    errors: int = 0
+    
+    def to_dict(self) -> Dict[str, Any]:
+        histogram = self.histogram
+        return {
+            'calls': self.calls,
+            'errors': self.errors,
+            'total_seconds': histogram.sum,
+            'mean_seconds': histogram.sum / histogram.count if histogram.count else None,
+            'p50_seconds': histogram.quantile(0.5),
+            'p95_seconds': histogram.quantile(0.95),
+            'p99_seconds': histogram.quantile(0.99),
+            'buckets': dict(histogram.cumulative()),
+        }
+
+
+class Instrumentation:
+    """
+    Сбор метрик фасада: операции CompanyFacade и вызовы подсистем.
+    
+    Пока enabled=False, прокси подсистем отдают исходные методы, а
+    операции фасада проверяют один флаг; без переданного Instrumentation
+    фасад и подсистемы не оборачиваются вовсе.
+    """
+    
+    OPERATION = 'operation'
+    SUBSYSTEM = 'subsystem'
+    
+    def __init__(self, enabled: bool = True, buckets: Tuple[float, ...] = LatencyHistogram.DEFAULT_BUCKETS,
+                 clock: Callable[[], float] = time.perf_counter):
+        self._enabled = enabled
+        self.clock = clock
+        self._buckets = buckets
+        self._metrics: Dict[Tuple[str, str], CallMetrics] = {}
+        self._lock = threading.Lock()
+        self._proxies: 'weakref.WeakSet[InstrumentedSubsystem]' = weakref.WeakSet()
+    
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+    
+    @enabled.setter
+    def enabled(self, value: bool) -> None:
+        self._enabled = value
+        for proxy in list(self._proxies):
+            proxy._reset()
+    
+    def record(self, kind: str, name: str, seconds: float, error: bool = False) -> None:
+        """Учесть один вызов."""
+        key = (kind, name)
+        with self._lock:
+            metrics = self._metrics.get(key)
+            if metrics is None:
+                metrics = self._metrics[key] = CallMetrics(LatencyHistogram(self._buckets))
+            metrics.calls += 1
+            metrics.errors += error
+            metrics.histogram.observe(seconds)
+    
+    def get(self, kind: str, name: str) -> Optional[CallMetrics]:
+        return self._metrics.get((kind, name))
+    
+    def reset(self) -> None:
+        with self._lock:
+            self._metrics.clear()
+    
+    def wrap(self, kind: str, name: str, func: Callable,
+             is_error: Optional[Callable[[Any], bool]] = None) -> Callable:
+        """Обернуть функцию замером времени; is_error(результат) - признак ошибки."""
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not self.enabled:
+                return func(*args, **kwargs)
+            start = self.clock()
+            try:
+                result = func(*args, **kwargs)
+            except BaseException:
+                self.record(kind, name, self.clock() - start, error=True)
+                raise
+            self.record(kind, name, self.clock() - start,
+                        error=bool(is_error and is_error(result)))
+            return result
+        return wrapper
+    
+    def snapshot(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """Снимок метрик: {'operations': {...}, 'subsystems': {...}}."""
+        with self._lock:
+            items = [(key, metrics.to_dict()) for key, metrics in self._metrics.items()]
+        snapshot = {'operations': {}, 'subsystems': {}}
+        for (kind, name), data in sorted(items):
+            snapshot['operations' if kind == self.OPERATION else 'subsystems'][name] = data
+        return snapshot
+    
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        import json
+
+        return json.dumps(self.snapshot(), ensure_ascii=False, indent=indent)
+    
+    def to_prometheus(self, prefix: str = 'company_facade') -> str:
+        """Снимок в текстовом формате Prometheus."""
+        with self._lock:
+            items = sorted((key, metrics.calls, metrics.errors, metrics.histogram.cumulative(),
+                            metrics.histogram.sum, metrics.histogram.count)
+                           for key, metrics in self._metrics.items())
+        
+        families = {self.OPERATION: f"{prefix}_operation", self.SUBSYSTEM: f"{prefix}_subsystem_call"}
+        lines = []
+        for kind, family in families.items():
+            rows = [item for item in items if item[0][0] == kind]
+            if not rows:
+                continue
+            lines.append(f"# HELP {family}_seconds Задержка вызова, секунды")
+            lines.append(f"# TYPE {family}_seconds histogram")
+            for (_, name), _, _, buckets, total, count in rows:
+                label = self._labels(kind, name)
+                for le, value in buckets:
+                    lines.append(f'{family}_seconds_bucket{{{label},le="{le}"}} {value}')
+                lines.append(f"{family}_seconds_sum{{{label}}} {total!r}")
+                lines.append(f"{family}_seconds_count{{{label}}} {count}")
+            for suffix, position in (('calls', 1), ('errors', 2)):
+                lines.append(f"# TYPE {family}_{suffix}_total counter")
+                for row in rows:
+                    lines.append(f"{family}_{suffix}_total{{{self._labels(kind, row[0][1])}}} {row[position]}")
+        return "\n".join(lines) + "\n"
+    
+    @staticmethod
+    def _labels(kind: str, name: str) -> str:
+        if kind == Instrumentation.SUBSYSTEM:
+            subsystem, _, method = name.partition('.')
+            return f'subsystem="{subsystem}",method="{method}"'
+        return f'operation="{name}"'
+
+
+class InstrumentedSubsystem:
+    """Прокси подсистемы: каждый публичный метод замеряется как 'A.method'."""
+    
+    def __init__(self, subsystem: Any, name: str, instrumentation: Instrumentation):
+        self._subsystem = subsystem
+        self._name = name
+        self._instrumentation = instrumentation
+        instrumentation._proxies.add(self)
+    
+    def __getattr__(self, attr: str) -> Any:
+        value = getattr(self._subsystem, attr)
+        if attr.startswith('_') or not callable(value):
+            return value
+        if self._instrumentation.enabled:
+            value = self._instrumentation.wrap(Instrumentation.SUBSYSTEM, f"{self._name}.{attr}", value)
+        setattr(self, attr, value)  # следующие обращения минуют __getattr__
+        return value
+    
+    def _reset(self) -> None:
+        """Сбросить закэшированные методы (после переключения enabled)."""
+        for attr in [attr for attr in vars(self) if not attr.startswith('_')]:
+            delattr(self, attr)
+
+
+def instrumented_operation(method: Callable) -> Callable:
+    """Декоратор операций фасада: контекст ошибок и метрики операции."""
+    name = method.__name__
+    
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        manager = self._manager
+        handler = manager.error_handler
+        previous, handler.operation = handler.operation, name
+        try:
+            instrumentation = manager.instrumentation
+            if instrumentation is None or not instrumentation.enabled:
+                return method(self, *args, **kwargs)
+            
+            start = instrumentation.clock()
+            try:
+                result = method(self, *args, **kwargs)
+            except BaseException:
+                instrumentation.record(Instrumentation.OPERATION, name, instrumentation.clock() - start, True)
+                raise
+            instrumentation.record(Instrumentation.OPERATION, name, instrumentation.clock() - start,
+                                   result.status == OperationStatus.FAILURE)
+            return result
+        finally:
+            handler.operation = previous  # ошибки вне операции не приписываются ей
+    return wrapper
 
 
 class CompanySubsystemA:
@@ -101,44 +411,88 @@ class CompanySubsystemA:
     def department_exists(self, dept_name: str) -> bool:
         """Проверить существование отдела."""
         return dept_name in self._departments
+    
+    def existing_departments(self, dept_names: Iterable[str]) -> Set[str]:
+        """Отобрать существующие отделы из набора (один запрос)."""
+        print("[SubsystemA] Пакетная проверка отделов...")
+        return set(dept_names).intersection(self._departments)
 
 
 class CompanySubsystemB:
     """Подсистема B - Управление сотрудниками."""
     
     def __init__(self):
-        self._employees = {
-            "DEV": ["John Doe", "Jane Smith"],
-            "SALES": ["Bob Johnson", "Alice Brown"],
-            "HR": ["Charlie Wilson"],
-            "FINANCE": ["Diana Martinez"]
+        # Отдел -> упорядоченное множество сотрудников (dict с ключами-именами)
+        self._employees: Dict[str, Dict[str, None]] = {
+            "DEV": dict.fromkeys(["John Doe", "Jane Smith"]),
+            "SALES": dict.fromkeys(["Bob Johnson", "Alice Brown"]),
+            "HR": dict.fromkeys(["Charlie Wilson"]),
+            "FINANCE": dict.fromkeys(["Diana Martinez"])
         }
+        # Имя -> отделы сотрудника в порядке найма (обычно один)
+        self._departments_by_name: Dict[str, Dict[str, None]] = {}
+        for dept_name, employees in self._employees.items():
+            for name in employees:
+                self._departments_by_name.setdefault(name, {})[dept_name] = None
     
     def list_employees_by_department(self, dept_name: str) -> List[str]:
         """Получить сотрудников отдела."""
         print(f"[SubsystemB] Запрос сотрудников отдела '{dept_name}'...")
-        return self._employees.get(dept_name, []).copy()
+        return list(self._employees.get(dept_name, ()))
+    
+    def _hire(self, name: str, dept_name: str) -> bool:
+        employees = self._employees.setdefault(dept_name, {})
+        if name in employees:
+            return False
+        employees[name] = None
+        self._departments_by_name.setdefault(name, {})[dept_name] = None
+        return True
+    
+    def _fire(self, name: str) -> bool:
+        departments = self._departments_by_name.get(name)
+        if not departments:
+            return False
+        dept_name = next(iter(departments))
+        del departments[dept_name]
+        if not departments:
+            del self._departments_by_name[name]
+        del self._employees[dept_name][name]
+        return True
+    
+    def get_employee_department(self, name: str) -> Optional[str]:
+        """Отдел сотрудника (None, если не работает в компании)."""
+        departments = self._departments_by_name.get(name)
+        return next(iter(departments)) if departments else None
+    
+    def transfer_employee(self, name: str, dept_name: str) -> bool:
+        """Перевести сотрудника в другой отдел."""
+        print(f"[SubsystemB] Перевод '{name}' в отдел '{dept_name}'...")
+        if self.get_employee_department(name) is None or name in self._employees.get(dept_name, ()):
+            return False
+        self._fire(name)
+        return self._hire(name, dept_name)
     
     def hire_employee(self, name: str, dept_name: str) -> bool:
         """Нанять сотрудника."""
         print(f"[SubsystemB] Найм '{name}' в отдел '{dept_name}'...")
-        if dept_name not in self._employees:
-            self._employees[dept_name] = []
-        
-        if name in self._employees[dept_name]:
-            return False
-        
-        self._employees[dept_name].append(name)
-        return True
+        return self._hire(name, dept_name)
     
     def fire_employee(self, name: str) -> bool:
         """Уволить сотрудника."""
         print(f"[SubsystemB] Увольнение '{name}'...")
-        for dept, employees in self._employees.items():
-            if name in employees:
-                employees.remove(name)
-                return True
-        return False
+        return self._fire(name)
+    
+    def hire_many(self, hires: Iterable[Tuple[str, str]]) -> List[bool]:
+        """Нанять сотрудников пакетом: [(имя, отдел)] -> [успех]."""
+        hires = list(hires)
+        print(f"[SubsystemB] Пакетный найм: {len(hires)} сотрудников...")
+        return [self._hire(name, dept_name) for name, dept_name in hires]
+    
+    def fire_many(self, names: Iterable[str]) -> List[bool]:
+        """Уволить сотрудников пакетом: [имя] -> [успех]."""
+        names = list(names)
+        print(f"[SubsystemB] Пакетное увольнение: {len(names)} сотрудников...")
+        return [self._fire(name) for name in names]
     
     def get_all_employees(self) -> List[str]:
         """Получить всех сотрудников."""
@@ -162,10 +516,18 @@ class CompanySubsystemC:
             self._salaries[employee_name] = 5000.0
         return self._salaries[employee_name]
     
+    def calculate_monthly_salaries(self, employee_names: Iterable[str]) -> Dict[str, float]:
+        """Расчёт месячных зарплат пакетом (один запрос)."""
+        employee_names = list(employee_names)
+        print(f"[SubsystemC] Пакетный расчёт зарплат для {len(employee_names)} сотрудников...")
+        salaries = self._salaries
+        return {name: salaries.setdefault(name, 5000.0) for name in employee_names}
+    
     def process_payroll(self, employee_names: List[str]) -> float:
         """Обработка зарплатной ведомости."""
         print(f"[SubsystemC] Обработка зарплаты для {len(employee_names)} сотрудников...")
-        return sum(self.calculate_monthly_salary(name) for name in employee_names)
+        salaries = self.calculate_monthly_salaries(employee_names)
+        return sum(salaries[name] for name in employee_names)
     
     def apply_bonus(self, employee_name: str, bonus_amount: float) -> bool:
         """Применить бонус."""
@@ -175,6 +537,10 @@ class CompanySubsystemC:
     def set_salary(self, employee_name: str, salary: float) -> None:
         """Установить зарплату."""
         self._salaries[employee_name] = salary
+    
+    def set_salaries(self, employee_names: Iterable[str], salary: float) -> None:
+        """Установить одинаковую зарплату группе сотрудников."""
+        self._salaries.update(dict.fromkeys(employee_names, salary))
 
 
 class CompanySubsystemD:
@@ -186,7 +552,8 @@ class CompanySubsystemD:
             "Project Beta": "active",
             "Project Gamma": "completed"
         }
-        self._assignments = {}
+        # Сотрудник -> упорядоченное множество проектов
+        self._assignments: Dict[str, Dict[str, None]] = {}
     
     def list_active_projects(self) -> List[str]:
         """Получить список активных проектов."""
@@ -199,21 +566,37 @@ class CompanySubsystemD:
         if project_name not in self._projects:
             return False
         
-        if employee_name not in self._assignments:
-            self._assignments[employee_name] = []
-        
-        if project_name not in self._assignments[employee_name]:
-            self._assignments[employee_name].append(project_name)
-        
+        self._assignments.setdefault(employee_name, {})[project_name] = None
         return True
     
     def remove_employee_from_project(self, employee_name: str, project_name: str) -> bool:
         """Удалить сотрудника с проекта."""
-        if employee_name in self._assignments and project_name in self._assignments[employee_name]:
-            self._assignments[employee_name].remove(project_name)
+        projects = self._assignments.get(employee_name)
+        if projects is not None and project_name in projects:
+            del projects[project_name]
             return True
         return False
     
+    def get_employee_projects(self, employee_name: str) -> List[str]:
+        """Получить проекты сотрудника."""
+        return list(self._assignments.get(employee_name, ()))
+    
+    def remove_employees_from_projects(self, employee_names: Iterable[str],
+                                       project_names: Iterable[str]) -> int:
+        """Снять группу сотрудников с указанных проектов (один запрос)."""
+        project_names = set(project_names)
+        print(f"[SubsystemD] Пакетное снятие с {len(project_names)} проектов...")
+        removed = 0
+        for employee_name in employee_names:
+            projects = self._assignments.get(employee_name)
+            if not projects:
+                continue
+            # Обходим назначения сотрудника: их обычно немного
+            for project_name in [p for p in projects if p in project_names]:
+                del projects[project_name]
+                removed += 1
+        return removed
+    
     def get_project_status(self, project_name: str) -> Optional[str]:
         """Получить статус проекта."""
         print(f"[SubsystemD] Запрос статуса '{project_name}'...")
@@ -223,12 +606,19 @@ class CompanySubsystemD:
 class SubsystemManager:
     """Менеджер подсистем для фасада."""
     
-    def __init__(self):
+    def __init__(self, instrumentation: Optional[Instrumentation] = None):
         self.subsystem_a = CompanySubsystemA()
         self.subsystem_b = CompanySubsystemB()
         self.subsystem_c = CompanySubsystemC()
         self.subsystem_d = CompanySubsystemD()
         self.error_handler = ErrorHandler()
+        self.instrumentation = instrumentation
+        
+        if instrumentation is not None:
+            for name in ('a', 'b', 'c', 'd'):
+                attr = f"subsystem_{name}"
+                setattr(self, attr, InstrumentedSubsystem(getattr(self, attr), name.upper(),
+                                                          instrumentation))
 
 
 class CompanyFacade:
@@ -237,11 +627,25 @@ class CompanyFacade:
     Предоставляет простой интерфейс, скрывая сложность подсистем.
     """
     
-    def __init__(self):
-        """Инициализация фасада."""
-        self._manager = SubsystemManager()
+    def __init__(self, instrumentation: Optional[Instrumentation] = None):
+        """
+        Инициализация фасада.
+        
+        Args:
+            instrumentation: Сбор метрик операций и подсистем (None - без замеров)
+        """
+        self._manager = SubsystemManager(instrumentation)
         print("[Facade] CompanyFacade инициализирован со всеми подсистемами\n")
     
+    @property
+    def instrumentation(self) -> Optional[Instrumentation]:
+        return self._manager.instrumentation
+    
+    @property
+    def error_handler(self) -> ErrorHandler:
+        return self._manager.error_handler
+    
+    @instrumented_operation
     def hire_new_employee(self, name: str, department: str) -> OperationResult:
         """
         Нанять нового сотрудника (скрывает сложность).
@@ -286,6 +690,7 @@ class CompanyFacade:
             self._manager.error_handler.add_error(str(e))
             return OperationResult(OperationStatus.FAILURE, f"Ошибка: {e}")
     
+    @instrumented_operation
     def fire_employee(self, name: str) -> OperationResult:
         """
         Уволить сотрудника (скрывает сложность).
@@ -306,8 +711,7 @@ class CompanyFacade:
             
             # Удаление из проектов
             active_projects = self._manager.subsystem_d.list_active_projects()
-            for project in active_projects:
-                self._manager.subsystem_d.remove_employee_from_project(name, project)
+            self._manager.subsystem_d.remove_employees_from_projects([name], active_projects)
             
             # Увольнение
             if not self._manager.subsystem_b.fire_employee(name):
@@ -323,6 +727,7 @@ class CompanyFacade:
             self._manager.error_handler.add_error(str(e))
             return OperationResult(OperationStatus.FAILURE, f"Ошибка: {e}")
     
+    @instrumented_operation
     def transfer_employee(self, name: str, new_department: str) -> OperationResult:
         """
         Перевести сотрудника в другой отдел.
@@ -360,6 +765,7 @@ class CompanyFacade:
             self._manager.error_handler.add_error(str(e))
             return OperationResult(OperationStatus.FAILURE, f"Ошибка: {e}")
     
+    @instrumented_operation
     def process_monthly_payroll(self) -> OperationResult:
         """
         Обработать месячную зарплатную ведомость.
@@ -375,11 +781,8 @@ class CompanyFacade:
             all_employees = self._manager.subsystem_b.get_all_employees()
             print(f"[Facade] Найдено сотрудников: {len(all_employees)}")
             
-            # Обрабатываем зарплату
-            payroll = {}
-            for emp_name in all_employees:
-                salary = self._manager.subsystem_c.calculate_monthly_salary(emp_name)
-                payroll[emp_name] = salary
+            # Обрабатываем зарплату одним запросом к подсистеме
+            payroll = self._manager.subsystem_c.calculate_monthly_salaries(all_employees)
             
             total = sum(payroll.values())
             print(f"[Facade] Итого к выплате: {total}")
@@ -393,6 +796,158 @@ class CompanyFacade:
             self._manager.error_handler.add_error(str(e))
             return OperationResult(OperationStatus.FAILURE, f"Ошибка: {e}")
     
+    # ===== ПАКЕТНЫЕ ОПЕРАЦИИ =====
+    
+    def _first_occurrences(self, keys: List[str]) -> List[bool]:
+        """Флаги первых вхождений; повторы в пакете пропускаются с ошибкой."""
+        seen = set()
+        flags = []
+        for key in keys:
+            if key in seen:
+                self._manager.error_handler.add_error(f"{key} повторяется в пакете")
+                flags.append(False)
+            else:
+                seen.add(key)
+                flags.append(True)
+        return flags
+    
+    def _fail_item(self, items: Dict[str, OperationResult], key: str, error: str) -> None:
+        self._manager.error_handler.add_error(error, item=key)
+        items[key] = OperationResult(OperationStatus.FAILURE, f"Ошибка: {error}")
+    
+    @instrumented_operation
+    def hire_many(self, hires: Iterable[Tuple[str, str]]) -> BulkOperationResult:
+        """
+        Нанять группу сотрудников.
+        
+        Каждая подсистема вызывается один раз на весь пакет.
+        
+        Args:
+            hires: Пары (имя, отдел)
+        
+        Returns:
+            BulkOperationResult со статусом по каждому имени
+        """
+        hires = list(hires)
+        print(f"\n[Facade] === НАНЯТЬ СОТРУДНИКОВ: {len(hires)} ===")
+        self._manager.error_handler.clear()
+        items: Dict[str, OperationResult] = {}
+        
+        try:
+            first = self._first_occurrences([name for name, _ in hires])
+            existing = self._manager.subsystem_a.existing_departments(dept for _, dept in hires)
+            
+            candidates = []
+            for (name, department), is_first in zip(hires, first):
+                if not is_first:
+                    continue
+                if department not in existing:
+                    self._fail_item(items, name, f"Отдел '{department}' не существует")
+                else:
+                    candidates.append((name, department))
+            
+            hired = []
+            for (name, department), ok in zip(candidates,
+                                              self._manager.subsystem_b.hire_many(candidates)):
+                if not ok:
+                    self._fail_item(items, name, f"Ошибка при найме {name}")
+                    continue
+                hired.append(name)
+                items[name] = OperationResult(OperationStatus.SUCCESS,
+                    f"Сотрудник {name} успешно нанят в отдел {department}")
+            
+            self._manager.subsystem_c.set_salaries(hired, 5000.0)
+            return BulkOperationResult.from_items("Найм", items)
+        
+        except Exception as e:
+            self._manager.error_handler.add_error(str(e))
+            return BulkOperationResult(OperationStatus.FAILURE, f"Ошибка: {e}", items=items)
+    
+    @instrumented_operation
+    def fire_many(self, names: Iterable[str]) -> BulkOperationResult:
+        """
+        Уволить группу сотрудников.
+        
+        Args:
+            names: Имена сотрудников
+        
+        Returns:
+            BulkOperationResult; data элемента - финальная выплата
+        """
+        names = list(names)
+        print(f"\n[Facade] === УВОЛИТЬ СОТРУДНИКОВ: {len(names)} ===")
+        self._manager.error_handler.clear()
+        items: Dict[str, OperationResult] = {}
+        
+        try:
+            first = self._first_occurrences(names)
+            candidates = [name for name, is_first in zip(names, first) if is_first]
+            
+            fired = []
+            for name, ok in zip(candidates, self._manager.subsystem_b.fire_many(candidates)):
+                if ok:
+                    fired.append(name)
+                else:
+                    self._fail_item(items, name, f"Сотрудник {name} не найден")
+            
+            final_salaries = self._manager.subsystem_c.calculate_monthly_salaries(fired)
+            active_projects = self._manager.subsystem_d.list_active_projects()
+            self._manager.subsystem_d.remove_employees_from_projects(fired, active_projects)
+            
+            for name in fired:
+                items[name] = OperationResult(OperationStatus.SUCCESS,
+                    f"Сотрудник {name} успешно уволен. Финальная выплата: {final_salaries[name]}",
+                    data=final_salaries[name])
+            return BulkOperationResult.from_items("Увольнение", items)
+        
+        except Exception as e:
+            self._manager.error_handler.add_error(str(e))
+            return BulkOperationResult(OperationStatus.FAILURE, f"Ошибка: {e}", items=items)
+    
+    @instrumented_operation
+    def transfer_many(self, transfers: Iterable[Tuple[str, str]]) -> BulkOperationResult:
+        """
+        Перевести группу сотрудников.
+        
+        Args:
+            transfers: Пары (имя, новый отдел)
+        
+        Returns:
+            BulkOperationResult со статусом по каждому имени
+        """
+        transfers = list(transfers)
+        print(f"\n[Facade] === ПЕРЕВЕСТИ СОТРУДНИКОВ: {len(transfers)} ===")
+        self._manager.error_handler.clear()
+        items: Dict[str, OperationResult] = {}
+        
+        try:
+            first = self._first_occurrences([name for name, _ in transfers])
+            existing = self._manager.subsystem_a.existing_departments(dept for _, dept in transfers)
+            
+            candidates = []
+            for (name, department), is_first in zip(transfers, first):
+                if not is_first:
+                    continue
+                if department not in existing:
+                    self._fail_item(items, name, f"Отдел '{department}' не существует")
+                else:
+                    candidates.append((name, department))
+            
+            subsystem_b = self._manager.subsystem_b
+            subsystem_b.fire_many(name for name, _ in candidates)
+            for (name, department), ok in zip(candidates, subsystem_b.hire_many(candidates)):
+                if ok:
+                    items[name] = OperationResult(OperationStatus.SUCCESS,
+                        f"Сотрудник {name} успешно переведён в отдел {department}")
+                else:
+                    self._fail_item(items, name, f"Ошибка при переводе сотрудника {name}")
+            return BulkOperationResult.from_items("Перевод", items)
+        
+        except Exception as e:
+            self._manager.error_handler.add_error(str(e))
+            return BulkOperationResult(OperationStatus.FAILURE, f"Ошибка: {e}", items=items)
+    
+    @instrumented_operation
     def get_department_employees(self, department: str) -> OperationResult:
         """
         Получить сотрудников отдела.
@@ -418,6 +973,7 @@ class CompanyFacade:
         except Exception as e:
             return OperationResult(OperationStatus.FAILURE, f"Ошибка: {e}")
     
+    @instrumented_operation
     def get_company_summary(self) -> OperationResult:
         """
         Получить сводку по компании.
@@ -449,3 +1005,235 @@ class CompanyFacade:
         
         except Exception as e:
             return OperationResult(OperationStatus.FAILURE, f"Ошибка: {e}")
+
+
+# ===== АСИНХРОННЫЙ ФАСАД =====
+
+class AsyncDepartmentSubsystem(ABC):
+    """Удалённая подсистема A - отделы."""
+    
+    @abstractmethod
+    async def list_all_departments(self) -> List[str]:
+        pass
+
+
+class AsyncEmployeeSubsystem(ABC):
+    """Удалённая подсистема B - сотрудники."""
+    
+    @abstractmethod
+    async def get_all_employees(self) -> List[str]:
+        pass
+    
+    @abstractmethod
+    async def list_employees_by_department(self, dept_name: str) -> List[str]:
+        pass
+
+
+class AsyncPayrollSubsystem(ABC):
+    """Удалённая подсистема C - зарплаты."""
+    
+    @abstractmethod
+    async def calculate_monthly_salaries(self, employee_names: List[str]) -> Dict[str, float]:
+        pass
+
+
+class AsyncProjectSubsystem(ABC):
+    """Удалённая подсистема D - проекты."""
+    
+    @abstractmethod
+    async def list_active_projects(self) -> List[str]:
+        pass
+
+
+class FakeRemoteSubsystem:
+    """
+    Локальная имитация удалённой подсистемы для тестов и бенчмарков.
+    
+    Выполняет запрос синхронной подсистемы после задержки latency.
+    """
+    
+    def __init__(self, subsystem: Any, latency: float = 0.0):
+        if latency < 0:
+            raise ValueError("latency должна быть неотрицательной")
+        self.subsystem = subsystem
+        self.latency = latency
+        self.request_count = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+    
+    async def _round_trip(self) -> None:
+        self.request_count += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            self.in_flight -= 1
+
+
+class FakeAsyncSubsystemA(FakeRemoteSubsystem, AsyncDepartmentSubsystem):
+    def __init__(self, subsystem: Optional[CompanySubsystemA] = None, latency: float = 0.0):
+        super().__init__(subsystem or CompanySubsystemA(), latency)
+    
+    async def list_all_departments(self) -> List[str]:
+        await self._round_trip()
+        return self.subsystem.list_all_departments()
+
+
+class FakeAsyncSubsystemB(FakeRemoteSubsystem, AsyncEmployeeSubsystem):
+    def __init__(self, subsystem: Optional[CompanySubsystemB] = None, latency: float = 0.0):
+        super().__init__(subsystem or CompanySubsystemB(), latency)
+    
+    async def get_all_employees(self) -> List[str]:
+        await self._round_trip()
+        return self.subsystem.get_all_employees()
+    
+    async def list_employees_by_department(self, dept_name: str) -> List[str]:
+        await self._round_trip()
+        return self.subsystem.list_employees_by_department(dept_name)
+
+
+class FakeAsyncSubsystemC(FakeRemoteSubsystem, AsyncPayrollSubsystem):
+    def __init__(self, subsystem: Optional[CompanySubsystemC] = None, latency: float = 0.0):
+        super().__init__(subsystem or CompanySubsystemC(), latency)
+    
+    async def calculate_monthly_salaries(self, employee_names: List[str]) -> Dict[str, float]:
+        await self._round_trip()
+        return self.subsystem.calculate_monthly_salaries(employee_names)
+
+
+class FakeAsyncSubsystemD(FakeRemoteSubsystem, AsyncProjectSubsystem):
+    def __init__(self, subsystem: Optional[CompanySubsystemD] = None, latency: float = 0.0):
+        super().__init__(subsystem or CompanySubsystemD(), latency)
+    
+    async def list_active_projects(self) -> List[str]:
+        await self._round_trip()
+        return self.subsystem.list_active_projects()
+
+
+class AsyncCompanyFacade:
+    """
+    Асинхронный фасад для удалённых подсистем.
+    
+    Независимые запросы выполняются параллельно (asyncio.gather), каждый
+    со своим таймаутом. Если часть подсистем не ответила вовремя,
+    возвращается результат со статусом PARTIAL и тем, что удалось получить.
+    """
+    
+    def __init__(self, subsystem_a: Optional[AsyncDepartmentSubsystem] = None,
+                 subsystem_b: Optional[AsyncEmployeeSubsystem] = None,
+                 subsystem_c: Optional[AsyncPayrollSubsystem] = None,
+                 subsystem_d: Optional[AsyncProjectSubsystem] = None,
+                 timeouts: Optional[Dict[str, float]] = None,
+                 default_timeout: float = 1.0,
+                 payroll_chunk_size: int = 500):
+        """
+        Args:
+            subsystem_a..subsystem_d: Удалённые подсистемы (по умолчанию - локальные имитации)
+            timeouts: Таймауты по подсистемам, секунды ({'A': 0.5, 'C': 2.0})
+            default_timeout: Таймаут для подсистем без явного значения
+            payroll_chunk_size: Сотрудников в одном запросе к подсистеме C
+        """
+        if default_timeout <= 0 or payroll_chunk_size <= 0:
+            raise ValueError("default_timeout и payroll_chunk_size должны быть положительными")
+        
+        self.subsystem_a = subsystem_a or FakeAsyncSubsystemA()
+        self.subsystem_b = subsystem_b or FakeAsyncSubsystemB()
+        self.subsystem_c = subsystem_c or FakeAsyncSubsystemC()
+        self.subsystem_d = subsystem_d or FakeAsyncSubsystemD()
+        self.timeouts = dict(timeouts or {})
+        self.default_timeout = default_timeout
+        self.payroll_chunk_size = payroll_chunk_size
+        self.error_handler = ErrorHandler()
+    
+    async def _call(self, operation: str, subsystem: str, request: Any) -> Tuple[bool, Any]:
+        """Выполнить запрос операции с таймаутом подсистемы: (успех, результат)."""
+        timeout = self.timeouts.get(subsystem, self.default_timeout)
+        try:
+            return True, await asyncio.wait_for(request, timeout)
+        except asyncio.TimeoutError:
+            self.error_handler.add_error(f"Подсистема {subsystem}: нет ответа за {timeout} с", operation,
+                                         subsystem=subsystem, timeout=timeout)
+        except Exception as e:
+            self.error_handler.add_error(f"Подсистема {subsystem}: {e}", operation, subsystem=subsystem)
+        return False, None
+    
+    @staticmethod
+    def _status(succeeded: int, total: int) -> OperationStatus:
+        if succeeded == total:
+            return OperationStatus.SUCCESS
+        return OperationStatus.PARTIAL if succeeded else OperationStatus.FAILURE
+    
+    async def get_company_summary(self) -> OperationResult:
+        """
+        Сводка по компании: подсистемы A, B, D опрашиваются параллельно.
+        
+        Returns:
+            OperationResult; для неответивших подсистем значения None,
+            их имена - в summary['unavailable']
+        """
+        print(f"\n[AsyncFacade] === СВОДКА ПО КОМПАНИИ ===")
+        self.error_handler.clear()
+        operation = 'get_company_summary'
+        
+        (ok_a, departments), (ok_b, employees), (ok_d, projects) = await asyncio.gather(
+            self._call(operation, 'A', self.subsystem_a.list_all_departments()),
+            self._call(operation, 'B', self.subsystem_b.get_all_employees()),
+            self._call(operation, 'D', self.subsystem_d.list_active_projects()),
+        )
+        
+        def count(items: Optional[List[str]]) -> Optional[int]:
+            return None if items is None else len(items)
+        
+        summary = {
+            'departments': departments,
+            'department_count': count(departments),
+            'employees': employees,
+            'employee_count': count(employees),
+            'active_projects': projects,
+            'project_count': count(projects),
+            'unavailable': [name for name, ok in (('A', ok_a), ('B', ok_b), ('D', ok_d)) if not ok],
+        }
+        
+        status = self._status(3 - len(summary['unavailable']), 3)
+        message = "Сводка получена"
+        if summary['unavailable']:
+            message += f" без подсистем {', '.join(summary['unavailable'])}"
+        return OperationResult(status, message, data=summary)
+    
+    async def process_monthly_payroll(self) -> OperationResult:
+        """
+        Месячная зарплатная ведомость.
+        
+        Список сотрудников запрашивается у B, затем расчёт отправляется
+        в C пакетами по payroll_chunk_size параллельно. Пакеты, не
+        уложившиеся в таймаут, не попадают в ведомость (статус PARTIAL).
+        
+        Returns:
+            OperationResult с данными payroll {имя: зарплата}
+        """
+        print(f"\n[AsyncFacade] === ОБРАБОТКА МЕСЯЧНОЙ ЗАРПЛАТЫ ===")
+        self.error_handler.clear()
+        operation = 'process_monthly_payroll'
+        
+        ok, employees = await self._call(operation, 'B', self.subsystem_b.get_all_employees())
+        if not ok:
+            return OperationResult(OperationStatus.FAILURE,
+                f"Ошибка: {self.error_handler.get_error_message()}")
+        
+        size = self.payroll_chunk_size
+        chunks = [employees[i:i + size] for i in range(0, len(employees), size)]
+        responses = await asyncio.gather(
+            *(self._call(operation, 'C', self.subsystem_c.calculate_monthly_salaries(chunk)) for chunk in chunks))
+        
+        payroll: Dict[str, float] = {}
+        for ok, salaries in responses:
+            if ok:
+                payroll.update(salaries)
+        
+        succeeded = sum(1 for ok, _ in responses if ok)
+        status = self._status(succeeded, len(chunks))
+        message = f"Зарплата обработана для {len(payroll)} сотрудников"
+        if status != OperationStatus.SUCCESS:
+            message += f", не обработаны: {len(set(employees) - payroll.keys())}"
+        return OperationResult(status, message, data=payroll)
@@ -1,54 +1,242 @@
-class IDatabaseConnection(ABC)
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from patterns.decorator_refactored import ILogger, NullLogger
+
+class IDatabaseConnection(ABC):
     @abstractmethod
-    def execute_query(self, query str, params tuple = ()) - List[Tuple]
+    def execute_query(self, query: str, params: tuple = ()) -> List[Tuple]:
         pass
 
     @abstractmethod
-    def execute_update(self, query str, params tuple = ()) - int
+    def execute_update(self, query: str, params: tuple = ()) -> int:
         pass
 
     @abstractmethod
-    def close_connection(self) - None
+    def close_connection(self) -> None:
         pass
 
-class ThreadSafeDatabaseConnection(IDatabaseConnection)
-    _instance Optional['ThreadSafeDatabaseConnection'] = None
-    _lock threading.Lock = threading.Lock()
-    _initialized bool = False
+class ThreadSafeDatabaseConnection(IDatabaseConnection):
+    _instance: Optional['ThreadSafeDatabaseConnection'] = None
+    _lock: threading.Lock = threading.Lock()
+    _initialized: bool = False
 
-    def __new__(cls, db_path str = company.db, logger ILogger = None)
-        if cls._instance is None
-            with cls._lock
-                if cls._instance is None
+    def __new__(cls, db_path: str = "company.db", logger: ILogger = None):
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
                     cls._instance = super().__new__(cls)
         return cls._instance
 
-    def __init__(self, db_path str = company.db, logger ILogger = None)
-        if not ThreadSafeDatabaseConnection._initialized
-            with self._lock
-                if not ThreadSafeDatabaseConnection._initialized
+    def __init__(self, db_path: str = "company.db", logger: ILogger = None):
+        if not ThreadSafeDatabaseConnection._initialized:
+            with self._lock:
+                if not ThreadSafeDatabaseConnection._initialized:
                     self.db_path = db_path
                     self._logger = logger or NullLogger()
                     self.connection = sqlite3.connect(db_path, check_same_thread=False)
-                    self._logger.info(fБД подключена {db_path})
+                    self._logger.info(f"БД подключена: {db_path}")
                     ThreadSafeDatabaseConnection._initialized = True
 
-    def execute_query(self, query str, params tuple = ()) - List[Tuple]
-        with self._lock
+    def execute_query(self, query: str, params: tuple = ()) -> List[Tuple]:
+        with self._lock:
             cursor = self.connection.cursor()
             cursor.execute(query, params)
             return cursor.fetchall()
 
-    def execute_update(self, query str, params tuple = ()) - int
-        with self._lock
+    def execute_update(self, query: str, params: tuple = ()) -> int:
+        with self._lock:
             cursor = self.connection.cursor()
             cursor.execute(query, params)
             self.connection.commit()
             return cursor.rowcount
 
-    def close_connection(self) - None
-        with self._lock
-            if self.connection
+    def close_connection(self) -> None:
+        with self._lock:
+            if self.connection:
                 self.connection.close()
                 ThreadSafeDatabaseConnection._instance = None
-                ThreadSafeDatabaseConnection._initialized = False
\ No newline at end of file
+                ThreadSafeDatabaseConnection._initialized = False
+
+class PooledDatabaseConnection(IDatabaseConnection):
+    """
+    Пул соединений SQLite (один экземпляр на файл БД).
+
+    БД переводится в режим WAL: читатели не блокируют писателя и друг друга.
+    N соединений на чтение выдаются через read_connection() с привязкой
+    к потоку (поток получает то же соединение, что и в прошлый раз, если
+    оно свободно). Все записи идут через одно соединение-писатель
+    (write_connection()/transaction()), поскольку SQLite допускает только
+    одного писателя. Скомпилированные запросы переиспользуются встроенным
+    кэшем sqlite3 (statement_cache_size на соединение).
+
+    close_connection() сразу закрывает только свободные соединения;
+    выданные потокам закрываются, когда их вернут в пул.
+    """
+
+    _instances: Dict[str, 'PooledDatabaseConnection'] = {}
+    _instances_lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls, db_path: str = "company.db", **options) -> 'PooledDatabaseConnection':
+        """Пул для файла БД (создаётся при первом обращении)."""
+        with cls._instances_lock:
+            pool = cls._instances.get(db_path)
+            if pool is None:
+                pool = cls(db_path, **options)
+                cls._instances[db_path] = pool
+            return pool
+
+    def __init__(self, db_path: str = "company.db", readers: int = 4,
+                 statement_cache_size: int = 256, checkout_timeout: float = 30.0,
+                 logger: ILogger = None):
+        if db_path == ":memory:" or db_path.startswith("file::memory:"):
+            raise ValueError("Пул соединений требует файловую БД (WAL недоступен для :memory:)")
+        if readers <= 0:
+            raise ValueError("readers должен быть положительным")
+
+        self.db_path = db_path
+        self.checkout_timeout = checkout_timeout
+        self._statement_cache_size = statement_cache_size
+        self._logger = logger or NullLogger()
+
+        self._writer = self._connect()
+        self._writer.execute("PRAGMA journal_mode=WAL")
+        self._writer_lock = threading.RLock()
+        self._writer_depth = 0
+
+        self._readers = [self._connect() for _ in range(readers)]
+        self._idle = list(self._readers)
+        self._idle_cond = threading.Condition()
+        self._local = threading.local()
+        self._closed = False
+        self._logger.info(f"Пул БД: {db_path}, читателей: {readers}")
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.db_path, check_same_thread=False,
+                                     cached_statements=self._statement_cache_size,
+                                     isolation_level=None)
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    # ---- чтение ----
+
+    @contextmanager
+    def read_connection(self) -> Iterator[sqlite3.Connection]:
+        """Взять соединение на чтение (вложенные вызовы в потоке получают то же)."""
+        held = getattr(self._local, 'held', None)
+        if held is not None:
+            self._local.depth += 1
+            try:
+                yield held
+            finally:
+                self._local.depth -= 1
+            return
+
+        connection = self._checkout()
+        self._local.held = connection
+        self._local.depth = 0
+        try:
+            yield connection
+        finally:
+            self._local.held = None
+            self._release(connection)
+
+    def _checkout(self) -> sqlite3.Connection:
+        preferred = getattr(self._local, 'preferred', None)
+        with self._idle_cond:
+            if not self._idle_cond.wait_for(lambda: self._idle or self._closed,
+                                            self.checkout_timeout):
+                raise TimeoutError("Нет свободных соединений в пуле")
+            if self._closed:
+                raise RuntimeError("Пул соединений закрыт")
+            if preferred is not None and preferred in self._idle:
+                self._idle.remove(preferred)
+                connection = preferred
+            else:
+                connection = self._idle.pop()
+        self._local.preferred = connection
+        return connection
+
+    def _release(self, connection: sqlite3.Connection) -> None:
+        with self._idle_cond:
+            if self._closed:
+                connection.close()
+                return
+            self._idle.append(connection)
+            self._idle_cond.notify()
+
+    def execute_query(self, query: str, params: tuple = ()) -> List[Tuple]:
+        with self.read_connection() as connection:
+            return connection.execute(query, params).fetchall()
+
+    # ---- запись ----
+
+    @contextmanager
+    def write_connection(self) -> Iterator[sqlite3.Connection]:
+        """Эксклюзивный доступ к соединению-писателю (без транзакции)."""
+        with self._writer_lock:
+            if self._closed:
+                raise RuntimeError("Пул соединений закрыт")
+            self._writer_depth += 1
+            try:
+                yield self._writer
+            finally:
+                self._writer_depth -= 1
+                if self._closed and not self._writer_depth:
+                    self._writer.close()
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        Транзакция на писателе: COMMIT при успехе, ROLLBACK при исключении.
+        Вложенные transaction() в том же потоке входят во внешнюю.
+        """
+        with self.write_connection() as connection:
+            if connection.in_transaction:
+                yield connection
+                return
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield connection
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+
+    def execute_update(self, query: str, params: tuple = ()) -> int:
+        with self.transaction() as connection:
+            return connection.execute(query, params).rowcount
+
+    def executemany(self, query: str, rows: Iterable[tuple]) -> int:
+        """Выполнить один запрос для множества параметров в одной транзакции."""
+        with self.transaction() as connection:
+            return connection.executemany(query, rows).rowcount
+
+    def execute_batch(self, statements: Iterable[Tuple[str, tuple]]) -> int:
+        """Выполнить набор (запрос, параметры) в одной транзакции."""
+        total = 0
+        with self.transaction() as connection:
+            for query, params in statements:
+                total += connection.execute(query, params).rowcount
+        return total
+
+    def close_connection(self) -> None:
+        with self._writer_lock, self._idle_cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._idle_cond.notify_all()
+            for connection in self._idle:
+                connection.close()
+            self._idle.clear()
+            # писатель занят только текущим потоком (под _writer_lock) - закроется на выходе
+            if not self._writer_depth:
+                self._writer.close()
+        with PooledDatabaseConnection._instances_lock:
+            if PooledDatabaseConnection._instances.get(self.db_path) is self:
+                del PooledDatabaseConnection._instances[self.db_path]
+        self._logger.info(f"Пул БД закрыт: {self.db_path}")
@@ -1,3 +1,9 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from enum import Enum
+
+from patterns.decorator_refactored import FileLogger as BufferedFileLogger, LogLevel as BufferedLogLevel
+
 class LogLevel(Enum):
     DEBUG = "DEBUG"
     INFO = "INFO"
@@ -53,19 +59,21 @@ class ConsoleLogger(ILogger):
         self.log(message, LogLevel.ERROR)
 
 class FileLogger(ILogger):
-    """Логирование в файл"""
+    """Логирование в файл (запись через буферизованный FileLogger из decorator_refactored)"""
 
-    def __init__(self, filename: str):
+    def __init__(self, filename: str, **options):
         self.filename = filename
-        self.logs = []
+        self._writer = BufferedFileLogger(filename, formatter=self._format_line, **options)
 
     def _format_message(self, message: str, level: LogLevel) -> str:
         timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         return f"[{timestamp}] [{level.value}] {message}"
 
+    def _format_line(self, level: BufferedLogLevel, message: str) -> str:
+        return self._format_message(message, LogLevel(level.value)) + "\n"
+
     def log(self, message: str, level: LogLevel = LogLevel.INFO) -> None:
-        formatted = self._format_message(message, level)
-        self.logs.append(formatted)
+        self._writer.log(BufferedLogLevel(level.value), message)
 
     def debug(self, message: str) -> None:
         self.log(message, LogLevel.DEBUG)
@@ -79,6 +87,12 @@ class FileLogger(ILogger):
     def error(self, message: str) -> None:
         self.log(message, LogLevel.ERROR)
 
+    def flush(self) -> None:
+        self._writer.flush()
+
+    def close(self) -> None:
+        self._writer.close()
+
 class NullLogger(ILogger):
     """Пустой логгер (Null Object Pattern)"""
 
@@ -1,8 +1,8 @@
-import json
 import os
-from typing import List, Dict, Any
-from base.abstract_employee import AbstractEmployee
-from factory import EmployeeFactory
+from typing import TYPE_CHECKING, List, Dict, Any
+
+if TYPE_CHECKING:
+    from base.abstract_employee import AbstractEmployee
 
 class DepartmentRepository:
     """
@@ -25,7 +25,7 @@ class DepartmentRepository:
     @staticmethod
     def save_to_file(
         department_name: str, 
-        employees: List[AbstractEmployee], 
+        employees: List['AbstractEmployee'], 
         filename: str
     ) -> None:
         """
@@ -35,6 +35,8 @@ class DepartmentRepository:
         :param employees: Список сотрудников отдела.
         :param filename: Путь к файлу (например, 'docs/json/dept.json').
         """
+        import json
+
         DepartmentRepository._ensure_directory(filename)
 
         data = {
@@ -56,6 +58,9 @@ class DepartmentRepository:
         :returns: Словарь с ключами 'department_name' и 'employees'.
         :raises FileNotFoundError: Если файл не найден.
         """
+        import json
+        from factory import EmployeeFactory
+
         if not os.path.exists(filename):
             raise FileNotFoundError(f"Файл не найден: {filename}")
 
@@ -1,10 +1,8 @@
-import json
 import os
 from typing import List
 from organization.department import Department
 from organization.project import Project
 from services.link_resolver import LinkResolver
-from factory import EmployeeFactory
 
 class CompanySerializer:
     """
@@ -27,6 +25,8 @@ class CompanySerializer:
         :param projects: Список проектов.
         :param filename: Путь к файлу.
         """
+        import json
+
         os.makedirs(os.path.dirname(filename), exist_ok=True)
 
         data = {
@@ -53,6 +53,9 @@ class CompanySerializer:
         :returns: Словарь с ключами: company_name, departments, projects.
         :raises FileNotFoundError: Если файл не найден.
         """
+        import json
+        from factory import EmployeeFactory
+
         if not os.path.exists(filename):
             raise FileNotFoundError(f"Файл {filename} не найден")
 
@@ -6,28 +6,25 @@
 - Стратегии расчёта зарплаты
 - Фабрика создания сотрудников
 - Специфичные валидаторы и форматтеры для каждого типа
+
+Экспорты загружаются лениво (PEP 562): подмодуль импортируется при
+первом обращении к имени, а не при импорте пакета.
 """
 
-from .base_validator import BaseValidator
-from .base_formatter import BaseFormatter
-from .salary_strategy import (
-    SalaryStrategy,
-    BaseSalaryStrategy,
-    BonusSalaryStrategy,
-    CommissionSalaryStrategy,
-    DeveloperSalaryStrategy
-)
-from .employee_serializer import EmployeeSerializer
-from .employee_factory import EmployeeFactory
+from utils.lazy import lazy_exports
+
+_EXPORTS = {
+    'BaseValidator': '.base_validator',
+    'BaseFormatter': '.base_formatter',
+    'SalaryCalculationStrategy': '.salary_strategy',
+    'BaseSalaryStrategy': '.salary_strategy',
+    'BonusSalaryStrategy': '.salary_strategy',
+    'CommissionSalaryStrategy': '.salary_strategy',
+    'SenioritySalaryStrategy': '.salary_strategy',
+    'EmployeeSerializer': '.employee_serializer',
+    'EmployeeFactory': '.employee_factory',
+}
+
+__all__ = list(_EXPORTS)
 
-__all__ = [
-    'BaseValidator',
-    'BaseFormatter',
-    'SalaryStrategy',
-    'BaseSalaryStrategy',
-    'BonusSalaryStrategy',
-    'CommissionSalaryStrategy',
-    'DeveloperSalaryStrategy',
-    'EmployeeSerializer',
-    'EmployeeFactory'
-]
\ No newline at end of file
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
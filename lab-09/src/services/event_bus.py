@@ -0,0 +1,145 @@
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional, Tuple, Type
+
+Handler = Callable[[Any], None]
+
+DEPARTMENT_GROUP = 'department'
+PROJECT_GROUP = 'project'
+
+
+@dataclass(frozen=True)
+class EmployeeChanged:
+    """Изменилось поле сотрудника, влияющее на зарплату (публикуется с key=employee.id)."""
+    employee: Any
+    field: str
+    old_value: Any = None
+    new_value: Any = None
+
+
+@dataclass(frozen=True)
+class MembershipChanged:
+    """Сотрудник вошёл в группу (отдел/проект) или покинул её."""
+    group_kind: str
+    group_name: str
+    employee: Any
+    joined: bool
+
+    @property
+    def key(self) -> Tuple[str, str]:
+        """Ключ группы для подписки: (тип группы, название)."""
+        return self.group_kind, self.group_name
+
+
+class Subscription:
+    """Подписка на шине; cancel() отменяет её."""
+
+    def __init__(self, bus: 'EventBus', event_type: Type, handler: Handler, key: Optional[Hashable]):
+        self._bus = bus
+        self.event_type = event_type
+        self.handler = handler
+        self.key = key
+
+    def cancel(self) -> bool:
+        return self._bus.unsubscribe(self.event_type, self.handler, self.key)
+
+
+class EventBus:
+    """
+    Внутрипроцессная шина событий.
+    Отвечает ТОЛЬКО за доставку событий подписчикам (SRP).
+
+    Подписка делается на тип события и (необязательно) ключ: подписчик
+    с key=None получает все события типа, с ключом - только события,
+    опубликованные с этим ключом. Доставка синхронная; списки
+    обработчиков хранятся кортежами и пересобираются при подписке,
+    поэтому publish() не создаёт промежуточных объектов.
+
+    В пакетном режиме (with bus.batch()) события копятся и доставляются
+    при выходе из блока; повторные EmployeeChanged одного сотрудника
+    схлопываются в последнее.
+    """
+
+    def __init__(self):
+        self._handlers: Dict[Tuple[Type, Hashable], Tuple[Handler, ...]] = {}
+        self._pending: Optional[List[Tuple[Any, Optional[Hashable]]]] = None
+        self._batch_depth = 0
+
+    # --- Подписка ---
+
+    def subscribe(self, event_type: Type, handler: Handler, key: Optional[Hashable] = None) -> Subscription:
+        """
+        Подписывает обработчик на события типа event_type.
+
+        :param key: Ключ события (None - все события типа).
+        :returns: Subscription для отмены подписки.
+        """
+        slot = (event_type, key)
+        self._handlers[slot] = self._handlers.get(slot, ()) + (handler,)
+        return Subscription(self, event_type, handler, key)
+
+    def unsubscribe(self, event_type: Type, handler: Handler, key: Optional[Hashable] = None) -> bool:
+        """Отменяет подписку; возвращает False, если её не было."""
+        slot = (event_type, key)
+        handlers = self._handlers.get(slot, ())
+        if handler not in handlers:
+            return False
+        index = handlers.index(handler)
+        remaining = handlers[:index] + handlers[index + 1:]
+        if remaining:
+            self._handlers[slot] = remaining
+        else:
+            del self._handlers[slot]
+        return True
+
+    def has_subscribers(self, event_type: Type, key: Optional[Hashable] = None) -> bool:
+        """Есть ли получатели у события типа event_type с ключом key."""
+        return (event_type, key) in self._handlers or (event_type, None) in self._handlers
+
+    # --- Публикация ---
+
+    def publish(self, event: Any, key: Optional[Hashable] = None) -> None:
+        """Доставляет событие (или откладывает его в пакетном режиме)."""
+        if self._pending is not None:
+            self._pending.append((event, key))
+            return
+        self._dispatch(event, key)
+
+    def _dispatch(self, event: Any, key: Optional[Hashable]) -> None:
+        event_type = type(event)
+        if key is not None:
+            for handler in self._handlers.get((event_type, key), ()):
+                handler(event)
+        for handler in self._handlers.get((event_type, None), ()):
+            handler(event)
+
+    @contextmanager
+    def batch(self) -> Iterator['EventBus']:
+        """
+        Пакетный режим для массовой загрузки.
+        Вложенные batch() входят во внешний; доставка - при выходе из
+        внешнего блока (в том числе при исключении: объекты уже изменены).
+        """
+        if self._batch_depth == 0:
+            self._pending = []
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                pending, self._pending = self._pending, None
+                for event, key in self._coalesce(pending):
+                    self._dispatch(event, key)
+
+    @staticmethod
+    def _coalesce(pending: List[Tuple[Any, Optional[Hashable]]]) -> List[Tuple[Any, Optional[Hashable]]]:
+        """Оставляет последнее EmployeeChanged для каждого сотрудника, сохраняя порядок."""
+        last_change: Dict[Tuple[Optional[Hashable], int], int] = {}
+        for index, (event, key) in enumerate(pending):
+            if type(event) is EmployeeChanged:
+                last_change[(key, id(event.employee))] = index
+        return [
+            (event, key) for index, (event, key) in enumerate(pending)
+            if type(event) is not EmployeeChanged or last_change[(key, id(event.employee))] == index
+        ]
@@ -1,6 +1,4 @@
 import os
-import csv
-import json
 from abc import ABC, abstractmethod
 from typing import List, Any
 
@@ -31,6 +29,8 @@ class CSVExportStrategy(IExportStrategy):
         """
         Экспортирует данные в CSV с кодировкой utf-8-sig (для Excel).
         """
+        import csv
+
         os.makedirs(os.path.dirname(filename), exist_ok=True)
 
         with open(filename, 'w', newline='', encoding='utf-8-sig') as f:
@@ -50,6 +50,8 @@ class JSONExportStrategy(IExportStrategy):
         """
         Экспортирует данные в JSON.
         """
+        import json
+
         os.makedirs(os.path.dirname(filename), exist_ok=True)
 
         # Преобразуем данные в список словарей
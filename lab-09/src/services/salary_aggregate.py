@@ -0,0 +1,253 @@
+import math
+from typing import Any, Callable, Dict, List, Optional
+
+from services.event_bus import (
+    EventBus, EmployeeChanged, MembershipChanged, DEPARTMENT_GROUP, PROJECT_GROUP
+)
+
+
+class GroupSalaryAggregate:
+    """
+    Материализованные агрегаты зарплат одной группы (отдела или проекта).
+    Отвечает ТОЛЬКО за поддержание сумм и счётчиков по событиям (SRP).
+
+    Подписывается на MembershipChanged своей группы и на EmployeeChanged
+    каждого участника; при изменении пересчитывается зарплата только
+    изменившегося сотрудника, итог корректируется на разницу.
+    """
+
+    def __init__(
+        self,
+        bus: EventBus,
+        group_kind: str,
+        group_name: str,
+        on_delta: Optional[Callable[[float], None]] = None,
+        subscribe: bool = True
+    ):
+        """
+        :param bus: Шина событий.
+        :param group_kind: Тип группы ('department' или 'project').
+        :param group_name: Название группы.
+        :param on_delta: Вызывается с изменением итоговой суммы.
+        :param subscribe: Подписаться на события группы (False - события подаёт владелец).
+        """
+        self._bus = bus
+        self.group_kind = group_kind
+        self.group_name = group_name
+        self._on_delta = on_delta
+        self._salaries: Dict[int, float] = {}
+        self._types: Dict[int, str] = {}
+        self._type_counts: Dict[str, int] = {}
+        self._total = 0.0
+        self._membership = (
+            bus.subscribe(MembershipChanged, self.on_membership, key=(group_kind, group_name))
+            if subscribe else None
+        )
+
+    # --- Обработка событий ---
+
+    def on_membership(self, event: MembershipChanged) -> None:
+        employee = event.employee
+        if event.joined:
+            if employee.id in self._salaries:
+                return
+            type_name = employee.__class__.__name__
+            self._salaries[employee.id] = salary = employee.calculate_salary()
+            self._types[employee.id] = type_name
+            self._type_counts[type_name] = self._type_counts.get(type_name, 0) + 1
+            self._bus.subscribe(EmployeeChanged, self._on_employee_changed, key=employee.id)
+            self._apply(salary)
+        else:
+            salary = self._salaries.pop(employee.id, None)
+            if salary is None:
+                return
+            type_name = self._types.pop(employee.id)
+            self._type_counts[type_name] -= 1
+            if not self._type_counts[type_name]:
+                del self._type_counts[type_name]
+            self._bus.unsubscribe(EmployeeChanged, self._on_employee_changed, key=employee.id)
+            self._apply(-salary)
+
+    def _on_employee_changed(self, event: EmployeeChanged) -> None:
+        employee = event.employee
+        old = self._salaries.get(employee.id)
+        if old is None:
+            return
+        new = employee.calculate_salary()
+        if new != old:
+            self._salaries[employee.id] = new
+            self._apply(new - old)
+
+    def _apply(self, delta: float) -> None:
+        self._total += delta
+        if not self._salaries:
+            self._total = 0.0  # пустая группа: сбрасываем накопленную погрешность
+        if self._on_delta is not None:
+            self._on_delta(delta)
+
+    # --- Агрегаты ---
+
+    @property
+    def total_salary(self) -> float:
+        return self._total
+
+    @property
+    def employee_count(self) -> int:
+        return len(self._salaries)
+
+    @property
+    def type_counts(self) -> Dict[str, int]:
+        return dict(self._type_counts)
+
+    @property
+    def average_salary(self) -> float:
+        return self._total / len(self._salaries) if self._salaries else 0.0
+
+    def resync(self) -> float:
+        """Точно пересчитывает итог по сохранённым зарплатам (сброс погрешности сумм)."""
+        exact = math.fsum(self._salaries.values())
+        delta, self._total = exact - self._total, exact
+        if delta and self._on_delta is not None:
+            self._on_delta(delta)
+        return exact
+
+    def close(self) -> None:
+        """Отписывается от всех событий."""
+        if self._membership is not None:
+            self._membership.cancel()
+            self._membership = None
+        for employee_id in self._salaries:
+            self._bus.unsubscribe(EmployeeChanged, self._on_employee_changed, key=employee_id)
+
+
+class SalaryAggregateRegistry:
+    """
+    Агрегаты всех групп одного типа (все отделы или все проекты).
+    Группы появляются по первому событию MembershipChanged; итог по
+    всем группам поддерживается вместе с агрегатами групп.
+    """
+
+    def __init__(self, bus: EventBus, group_kind: str):
+        self._bus = bus
+        self.group_kind = group_kind
+        self._groups: Dict[str, GroupSalaryAggregate] = {}
+        self._total = 0.0
+        self._subscription = bus.subscribe(MembershipChanged, self._on_membership)
+
+    def _on_membership(self, event: MembershipChanged) -> None:
+        if event.group_kind != self.group_kind:
+            return
+        group = self._groups.get(event.group_name)
+        if group is None:
+            group = GroupSalaryAggregate(self._bus, self.group_kind, event.group_name,
+                                         on_delta=self._add, subscribe=False)
+            self._groups[event.group_name] = group
+        group.on_membership(event)
+
+    def _add(self, delta: float) -> None:
+        self._total += delta
+
+    @property
+    def total_salary(self) -> float:
+        return self._total
+
+    def get(self, group_name: str) -> Optional[GroupSalaryAggregate]:
+        return self._groups.get(group_name)
+
+    def totals(self) -> Dict[str, float]:
+        """Итог по каждой группе: {название: сумма}."""
+        return {name: group.total_salary for name, group in self._groups.items()}
+
+    def close(self) -> None:
+        self._subscription.cancel()
+        for group in self._groups.values():
+            group.close()
+
+
+class IncrementalDepartmentStatistics:
+    """
+    Материализованная статистика отдела.
+    Тот же набор расчётов, что у DepartmentStatistics, но значения
+    поддерживаются по событиям шины и читаются за O(1).
+    """
+
+    def __init__(self, bus: EventBus, department_name: str):
+        """
+        :param bus: Шина, в которую публикуют отдел и его сотрудники.
+        :param department_name: Название отслеживаемого отдела.
+        """
+        self._aggregate = GroupSalaryAggregate(bus, DEPARTMENT_GROUP, department_name)
+
+    def calculate_total_salary(self) -> float:
+        """Возвращает текущий фонд оплаты труда отдела."""
+        return self._aggregate.total_salary
+
+    def get_employee_count(self) -> Dict[str, int]:
+        """Возвращает количество сотрудников каждого типа."""
+        return self._aggregate.type_counts
+
+    def get_average_salary(self) -> float:
+        """Возвращает среднюю зарплату в отделе."""
+        return self._aggregate.average_salary
+
+    def close(self) -> None:
+        """Отписывается от шины."""
+        self._aggregate.close()
+
+
+class IncrementalProjectCalculator:
+    """
+    Материализованный бюджет проекта.
+    Значения поддерживаются по событиям шины и читаются за O(1).
+    """
+
+    def __init__(self, bus: EventBus, project_name: str):
+        """
+        :param bus: Шина, в которую публикуют проект и участники команды.
+        :param project_name: Название отслеживаемого проекта.
+        """
+        self._aggregate = GroupSalaryAggregate(bus, PROJECT_GROUP, project_name)
+
+    def calculate_total_salary(self) -> float:
+        """Возвращает бюджет зарплат команды."""
+        return self._aggregate.total_salary
+
+    def calculate_average_salary(self) -> float:
+        """Возвращает среднюю зарплату в команде (0.0 для пустой команды)."""
+        return self._aggregate.average_salary
+
+    def close(self) -> None:
+        """Отписывается от шины."""
+        self._aggregate.close()
+
+
+class IncrementalCostCalculator:
+    """
+    Материализованные затраты компании.
+    Бюджеты всех отделов и проектов поддерживаются по событиям шины;
+    общий ФОТ читается за O(1), бюджеты - за O(число групп).
+    """
+
+    def __init__(self, bus: EventBus):
+        """
+        :param bus: Шина, в которую публикуют отделы, проекты и сотрудники.
+        """
+        self._departments = SalaryAggregateRegistry(bus, DEPARTMENT_GROUP)
+        self._projects = SalaryAggregateRegistry(bus, PROJECT_GROUP)
+
+    def calculate_total_monthly_cost(self) -> float:
+        """Возвращает суммарный ФОТ по всем отделам."""
+        return self._departments.total_salary
+
+    def calculate_project_budgets(self) -> dict:
+        """Возвращает словарь {project_name: budget}."""
+        return self._projects.totals()
+
+    def calculate_department_budgets(self) -> dict:
+        """Возвращает словарь {department_name: budget}."""
+        return self._departments.totals()
+
+    def close(self) -> None:
+        """Отписывается от шины."""
+        self._departments.close()
+        self._projects.close()
@@ -68,7 +68,9 @@ class Developer(AbstractEmployee):
         Устанавливает уровень квалификации с валидацией.
         Делегирует проверку в DeveloperValidator.
         """
+        old_value = getattr(self, '_seniority_level', None)
         self._seniority_level = DeveloperValidator.validate_seniority_level(value)
+        self._publish_change('seniority_level', old_value, self._seniority_level)
 
     # --- Делегирование управления навыками (TechStackManager) ---
 
@@ -69,7 +69,9 @@ class Manager(AbstractEmployee):
         :param value: Размер бонуса.
         :raises ValueError: Если бонус невалиден.
         """
+        old_value = getattr(self, '_bonus', None)
         self._bonus = ManagerValidator.validate_bonus(value)
+        self._publish_change('bonus', old_value, self._bonus)
 
     # --- Делегирование расчёта зарплаты (BonusSalaryStrategy) ---
 
@@ -67,7 +67,9 @@ class Salesperson(AbstractEmployee):
         Устанавливает объём продаж с валидацией.
         Делегирует в SalesTracker.
         """
+        old_value = self._sales_tracker.sales_volume
         self._sales_tracker.sales_volume = value
+        self._publish_change('sales_volume', old_value, self.sales_volume)
 
     @property
     def commission_rate(self) -> float:
@@ -83,7 +85,9 @@ class Salesperson(AbstractEmployee):
         Устанавливает процент комиссии с валидацией.
         Делегирует в SalesTracker.
         """
+        old_value = self._sales_tracker.commission_rate
         self._sales_tracker.commission_rate = value
+        self._publish_change('commission_rate', old_value, self.commission_rate)
 
     def add_sale(self, amount: float) -> None:
         """
@@ -92,7 +96,9 @@ class Salesperson(AbstractEmployee):
 
         :param amount: Сумма продажи.
         """
+        old_value = self._sales_tracker.sales_volume
         self._sales_tracker.add_sale(amount)
+        self._publish_change('sales_volume', old_value, self.sales_volume)
 
     def reset_sales(self) -> float:
         """
@@ -101,7 +107,9 @@ class Salesperson(AbstractEmployee):
 
         :returns: Предыдущий объём продаж.
         """
-        return self._sales_tracker.reset_sales()
+        previous = self._sales_tracker.reset_sales()
+        self._publish_change('sales_volume', previous, self.sales_volume)
+        return previous
 
     def get_sales_stats(self) -> Dict[str, Any]:
         """
@@ -119,7 +127,9 @@ class Salesperson(AbstractEmployee):
 
         :param percent: Процент комиссии (например, 15 = 15%).
         """
+        old_value = self._sales_tracker.commission_rate
         self._sales_tracker.set_commission_rate_percent(percent)
+        self._publish_change('commission_rate', old_value, self.commission_rate)
 
     # --- Делегирование расчёта зарплаты (CommissionSalaryStrategy) ---
 
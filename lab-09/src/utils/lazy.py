@@ -0,0 +1,80 @@
+"""Отложенная загрузка модулей и экспортов пакетов."""
+import importlib
+import importlib.util
+import sys
+import threading
+from types import ModuleType
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+class _LazyModule(ModuleType):
+    """
+    Заместитель модуля: настоящий модуль импортируется обычным
+    importlib.import_module() при первом обращении к атрибуту.
+    В sys.modules заместитель не попадает.
+    """
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self._lazy_lock = threading.Lock()
+        self._lazy_module: Optional[ModuleType] = None
+
+    def _lazy_load(self) -> ModuleType:
+        module = self.__dict__['_lazy_module']
+        if module is None:
+            with self.__dict__['_lazy_lock']:
+                module = self.__dict__['_lazy_module']
+                if module is None:
+                    module = self._lazy_module = importlib.import_module(self.__name__)
+        return module
+
+    def __getattr__(self, name: str):
+        return getattr(self._lazy_load(), name)
+
+    def __dir__(self) -> List[str]:
+        return dir(self._lazy_load())
+
+    def __repr__(self) -> str:
+        return f"<lazy module {self.__name__!r}>"
+
+
+def lazy_import(name: str) -> Optional[ModuleType]:
+    """
+    Возвращает модуль, который загрузится при первом обращении к атрибуту.
+
+    Для опциональных зависимостей: None, если модуль не установлен
+    (проверяется только наличие, без импорта). Уже загруженный модуль
+    возвращается как есть; иначе - заместитель, который импортирует
+    модуль один раз (в том числе при одновременном первом обращении
+    из нескольких потоков) и не подменяет его в sys.modules.
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    if importlib.util.find_spec(name) is None:
+        return None
+    return _LazyModule(name)
+
+
+def lazy_exports(package: str, exports: Dict[str, str]) -> Tuple[Callable, Callable]:
+    """
+    Создаёт __getattr__ и __dir__ пакета (PEP 562) для отложенных экспортов.
+
+    :param package: __name__ пакета.
+    :param exports: {имя: относительный путь подмодуля}, например {'Company': '.company'}.
+    :returns: (__getattr__, __dir__) для присваивания на уровне модуля.
+    """
+    namespace = sys.modules[package].__dict__
+
+    def __getattr__(name: str):
+        submodule = exports.get(name)
+        if submodule is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(submodule, package), name)
+        namespace[name] = value  # следующие обращения идут мимо __getattr__
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(exports))
+
+    return __getattr__, __dir__